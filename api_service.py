@@ -16,16 +16,34 @@ iLuminara API Service
 Flask-based API service providing:
 1. Voice processing endpoint (/process-voice) - FRENASA Engine
 2. Outbreak prediction endpoint (/predict) - Cloud Oracle
-3. Health monitoring endpoint (/health)
+3. Batch outbreak prediction endpoint (/predict/batch) - Cloud Oracle
+4. Health monitoring endpoint (/health)
 
 Integrates with Golden Thread, Sovereign Guardrail, and PubSub alerts.
+
+Serving modes:
+    API_WORKERS=1 (default)  single-process Flask development server
+    API_WORKERS=N            preload-then-fork: models are initialized once in
+                             the master, then N workers fork and share them
+                             copy-on-write (gunicorn when installed, otherwise
+                             a built-in pre-fork server); each worker warms up
+                             before accepting traffic.
+
+Request bodies sent with Content-Encoding: gzip are decompressed, and JSON
+responses are gzip-compressed for clients that accept it.
 """
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import gc
+import gzip
+import io
 import logging
+import signal
+import socket
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import sys
 
@@ -59,6 +77,58 @@ APP_VERSION = "1.0.0"
 NODE_ID = os.environ.get('NODE_ID', 'JOR-47')
 JURISDICTION = os.environ.get('JURISDICTION', 'GLOBAL_DEFAULT')
 
+# Serving configuration
+MAX_BATCH_SIZE = int(os.environ.get('API_MAX_BATCH_SIZE', 1000))
+COMPRESSION_MIN_BYTES = int(os.environ.get('API_COMPRESSION_MIN_BYTES', 1024))
+COMPRESSION_LEVEL = int(os.environ.get('API_COMPRESSION_LEVEL', 5))
+
+
+class GzipRequestMiddleware:
+    """WSGI middleware that transparently inflates gzip-encoded request bodies."""
+    
+    def __init__(self, wsgi_app, max_inflated_bytes: int = 64 * 1024 * 1024):
+        self.wsgi_app = wsgi_app
+        self.max_inflated_bytes = max_inflated_bytes
+    
+    def __call__(self, environ, start_response):
+        if environ.get('HTTP_CONTENT_ENCODING', '').lower() == 'gzip':
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            compressed = environ['wsgi.input'].read(length) if length else environ['wsgi.input'].read()
+            try:
+                with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as inflater:
+                    body = inflater.read(self.max_inflated_bytes + 1)
+            except (OSError, EOFError):
+                start_response('400 Bad Request', [('Content-Type', 'application/json')])
+                return [b'{"status": "error", "error": "invalid_gzip_body"}']
+            if len(body) > self.max_inflated_bytes:
+                start_response('413 Payload Too Large', [('Content-Type', 'application/json')])
+                return [b'{"status": "error", "error": "payload_too_large"}']
+            environ['wsgi.input'] = io.BytesIO(body)
+            environ['CONTENT_LENGTH'] = str(len(body))
+            del environ['HTTP_CONTENT_ENCODING']
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON responses for clients that send Accept-Encoding: gzip."""
+    if (response.direct_passthrough
+            or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype != 'application/json'
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=COMPRESSION_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -78,6 +148,7 @@ def health_check():
         "endpoints": {
             "voice_processing": "/process-voice",
             "outbreak_prediction": "/predict",
+            "batch_outbreak_prediction": "/predict/batch",
             "health": "/health"
         }
     }), 200
@@ -220,39 +291,14 @@ def predict_outbreak():
                 "message": "Content-Type must be application/json"
             }), 400
         
-        data = request.get_json()
+        prediction_request, error = _parse_prediction_request(request.get_json())
+        if error:
+            return jsonify(error), 400
         
-        # Validate required fields
-        if 'location' not in data:
-            return jsonify({
-                "status": "error",
-                "error": "missing_location",
-                "message": "Location is required (lat, lng)"
-            }), 400
-        
-        if 'symptoms' not in data or not isinstance(data['symptoms'], list):
-            return jsonify({
-                "status": "error",
-                "error": "missing_symptoms",
-                "message": "Symptoms list is required"
-            }), 400
-        
-        location = data['location']
-        symptoms = data['symptoms']
-        population = data.get('population')
-        historical_data = data.get('historical_data')
-        
-        # Validate location format
-        if 'lat' not in location or 'lng' not in location:
-            # Try 'lon' as alternative to 'lng'
-            if 'lon' in location:
-                location['lng'] = location['lon']
-            else:
-                return jsonify({
-                    "status": "error",
-                    "error": "invalid_location",
-                    "message": "Location must have 'lat' and 'lng' fields"
-                }), 400
+        location = prediction_request['location']
+        symptoms = prediction_request['symptoms']
+        population = prediction_request['population']
+        historical_data = prediction_request['historical_data']
         
         # Perform outbreak prediction
         logger.info(f"Predicting outbreak: location={location}, symptoms={symptoms}")
@@ -285,6 +331,149 @@ def predict_outbreak():
         }), 500
 
 
+@app.route('/predict/batch', methods=['POST'])
+def predict_outbreak_batch():
+    """
+    Batch outbreak prediction across many locations.
+    
+    One sovereignty check and one predictor call cover the whole batch;
+    invalid items are reported individually without failing the batch.
+    
+    Request:
+        - Content-Type: application/json (optionally Content-Encoding: gzip)
+        - Body: {"requests": [<same body as /predict>, ...]}
+    
+    Returns:
+        JSON response with one result per request, in request order
+    """
+    try:
+        try:
+            guardrail.validate_action(
+                action_type='Outbreak_Analysis',
+                payload={
+                    'data_type': 'Health_Analytics',
+                    'processing_location': 'Cloud_Oracle',
+                    'consent_token': 'PUBLIC_HEALTH_SURVEILLANCE',
+                    'consent_scope': 'population_health_analytics'
+                },
+                jurisdiction=JURISDICTION
+            )
+        except SovereigntyViolationError as e:
+            logger.error(f"Sovereignty violation: {e}")
+            return jsonify({
+                "status": "error",
+                "error": "sovereignty_violation",
+                "message": str(e)
+            }), 403
+        
+        if not request.is_json:
+            return jsonify({
+                "status": "error",
+                "error": "invalid_content_type",
+                "message": "Content-Type must be application/json"
+            }), 400
+        
+        data = request.get_json()
+        items = data.get('requests') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                "status": "error",
+                "error": "missing_requests",
+                "message": "Body must contain a non-empty 'requests' list"
+            }), 400
+        if len(items) > MAX_BATCH_SIZE:
+            return jsonify({
+                "status": "error",
+                "error": "batch_too_large",
+                "message": f"At most {MAX_BATCH_SIZE} requests per batch"
+            }), 413
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        valid_indexes = []
+        valid_requests = []
+        for index, item in enumerate(items):
+            prediction_request, error = _parse_prediction_request(item)
+            if error:
+                results[index] = error
+            else:
+                valid_indexes.append(index)
+                valid_requests.append(prediction_request)
+        
+        for index, result in zip(valid_indexes, outbreak_predictor.predict_batch(valid_requests)):
+            results[index] = result
+            if result.get('risk_level') in ['CRITICAL', 'HIGH']:
+                try:
+                    alert_publisher.publish_outbreak_alert(result)
+                except Exception as pub_error:
+                    logger.warning(f"Failed to publish alert: {pub_error}")
+        
+        return jsonify({
+            "status": "success",
+            "count": len(results),
+            "failed": len(items) - len(valid_requests),
+            "results": results
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"Error in batch outbreak prediction: {str(e)}", exc_info=True)
+        return jsonify({
+            "status": "error",
+            "error": "prediction_failed",
+            "message": str(e)
+        }), 500
+
+
+def _parse_prediction_request(data: Any) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Validate one outbreak prediction request body.
+    
+    Returns:
+        (prediction_request, None) when valid, otherwise (None, error_body)
+    """
+    if not isinstance(data, dict) or 'location' not in data:
+        return None, {
+            "status": "error",
+            "error": "missing_location",
+            "message": "Location is required (lat, lng)"
+        }
+    
+    if 'symptoms' not in data or not isinstance(data['symptoms'], list):
+        return None, {
+            "status": "error",
+            "error": "missing_symptoms",
+            "message": "Symptoms list is required"
+        }
+    
+    # Symptoms are matched by name (and hashed per batch), so each must be a string
+    if not all(isinstance(symptom, str) for symptom in data['symptoms']):
+        return None, {
+            "status": "error",
+            "error": "invalid_symptoms",
+            "message": "Each symptom must be a string"
+        }
+    
+    location = data['location']
+    
+    # Validate location format
+    if not isinstance(location, dict) or 'lat' not in location or 'lng' not in location:
+        # Try 'lon' as alternative to 'lng'
+        if isinstance(location, dict) and 'lat' in location and 'lon' in location:
+            location['lng'] = location['lon']
+        else:
+            return None, {
+                "status": "error",
+                "error": "invalid_location",
+                "message": "Location must have 'lat' and 'lng' fields"
+            }
+    
+    return {
+        'location': location,
+        'symptoms': data['symptoms'],
+        'population': data.get('population'),
+        'historical_data': data.get('historical_data')
+    }, None
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
@@ -292,7 +481,7 @@ def not_found(error):
         "status": "error",
         "error": "not_found",
         "message": "Endpoint not found",
-        "available_endpoints": ["/health", "/process-voice", "/predict"]
+        "available_endpoints": ["/health", "/process-voice", "/predict", "/predict/batch"]
     }), 404
 
 
@@ -312,11 +501,131 @@ def create_app():
     return app
 
 
+# ═════════════════════════════════════════════════════════════════════════════
+# Multi-worker serving (preload-then-fork)
+# ═════════════════════════════════════════════════════════════════════════════
+
+def warm_up():
+    """
+    Per-worker warm-up, run once after fork and before accepting traffic.
+    
+    Exercises the prediction path and JSON serialization so the first real
+    request does not pay for lazy initialization.
+    """
+    started = time.perf_counter()
+    sample = [{
+        'location': {'lat': 0.512, 'lng': 40.3129},
+        'symptoms': ['diarrhea', 'vomiting', 'fever'],
+        'population': None,
+        'historical_data': None
+    }]
+    outbreak_predictor.predict_batch(sample)
+    with app.test_request_context('/health'):
+        jsonify({"warm": True})
+    logger.info(f"Worker {os.getpid()} warmed up in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+def _preload():
+    """Finish master-side initialization and freeze the heap before forking."""
+    # Objects allocated so far are shared with workers copy-on-write; freezing
+    # them keeps the cyclic GC from touching (and thereby copying) those pages
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+
+def _serve_gunicorn(host: str, port: int, workers: int, threads: int) -> bool:
+    """Serve with gunicorn (preload_app=True). Returns False if gunicorn is unavailable."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+    
+    class PreloadedApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{host}:{port}")
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('preload_app', True)
+            self.cfg.set('post_fork', lambda server, worker: warm_up())
+        
+        def load(self):
+            return app
+    
+    _preload()
+    PreloadedApplication().run()
+    return True
+
+
+def _serve_prefork(host: str, port: int, workers: int, threads: int):
+    """
+    Built-in pre-fork server: the master binds the socket, forks workers that
+    each run a threaded WSGI server on the shared socket, and respawns any
+    worker that exits until it receives SIGTERM/SIGINT.
+    """
+    from werkzeug.serving import make_server
+    
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(1024)
+    listener.set_inheritable(True)
+    _preload()
+    
+    def spawn() -> int:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            warm_up()
+            server = make_server(host, port, app, threaded=threads > 1, fd=listener.fileno())
+            server.serve_forever()
+            os._exit(0)
+        return pid
+    
+    children = {spawn() for _ in range(workers)}
+    stopping = False
+    
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info(f"Pre-fork master {os.getpid()} serving {host}:{port} with {workers} workers")
+    
+    while children:
+        try:
+            pid, _status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            logger.warning(f"Worker {pid} exited; respawning")
+            children.add(spawn())
+    listener.close()
+
+
+def serve(host: str, port: int, workers: int, threads: int = 4):
+    """Run the multi-worker server (gunicorn if installed, else built-in pre-fork)."""
+    if not _serve_gunicorn(host, port, workers, threads):
+        _serve_prefork(host, port, workers, threads)
+
+
 if __name__ == '__main__':
     # Get configuration from environment
     host = os.environ.get('API_HOST', '0.0.0.0')
     port = int(os.environ.get('API_PORT', 8080))
     debug = os.environ.get('DEBUG', 'False').lower() == 'true'
+    workers = int(os.environ.get('API_WORKERS', 1))
+    threads = int(os.environ.get('API_THREADS', 4))
     
     logger.info("=" * 80)
     logger.info("iLuminara API Service Starting")
@@ -326,12 +635,17 @@ if __name__ == '__main__':
     logger.info(f"Jurisdiction: {JURISDICTION}")
     logger.info(f"Host: {host}:{port}")
     logger.info(f"Debug Mode: {debug}")
+    logger.info(f"Workers: {workers} x {threads} threads")
     logger.info("=" * 80)
     logger.info("Available Endpoints:")
     logger.info("  GET  /health         - Health check")
     logger.info("  POST /process-voice  - Voice processing (audio/wav)")
     logger.info("  POST /predict        - Outbreak prediction (JSON)")
+    logger.info("  POST /predict/batch  - Batch outbreak prediction (JSON)")
     logger.info("=" * 80)
     
     # Run the application
-    app.run(host=host, port=port, debug=debug)
+    if workers > 1 and not debug:
+        serve(host, port, workers, threads)
+    else:
+        app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,274 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Request Execution Layer
+══════════════════════════════════════════════════════════════════════════════
+
+Keeps the FastAPI event loop free of CPU-bound work:
+
+- Worker offload: blocking calls run on a managed thread pool (stateful
+  services) or process pool (pure CPU work), never on the event loop.
+- Per-route limits: each route has a concurrency cap and a bounded wait
+  queue; once the queue is full new requests are rejected (503) instead of
+  piling up, which keeps tail latency bounded.
+- Request coalescing: identical in-flight queries share one computation.
+- Metrics: per-route latency histograms and counters rendered in the
+  Prometheus text exposition format.
+"""
+
+import asyncio
+import bisect
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from core.utils.process_context import worker_context
+
+
+# Prometheus default buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, float("inf"))
+
+
+class RouteSaturated(Exception):
+    """Raised when a route's concurrency slots and wait queue are both full."""
+
+    def __init__(self, route: str, retry_after: int = 1):
+        super().__init__(f"Route {route} is saturated")
+        self.route = route
+        self.retry_after = retry_after
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram for one route."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class RouteLimiter:
+    """Concurrency cap plus bounded wait queue for one route."""
+
+    def __init__(self, route: str, max_concurrency: int, max_queue: int):
+        self.route = route
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        if self._semaphore is None:
+            # Created lazily so it binds to the server's running loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            raise RouteSaturated(self.route)
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+class ExecutionLayer:
+    """
+    Managed worker pools, per-route limits, coalescing and metrics.
+
+    Usage:
+        execution = ExecutionLayer(route_limits={"/hstpu/map": (4, 16)})
+        result = await execution.run("/hstpu/map", forecaster.generate_hstpu_map, "Kenya",
+                                     coalesce_key=("Kenya",))
+    """
+
+    def __init__(
+        self,
+        route_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        default_limit: Tuple[int, int] = (8, 32),
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            route_limits: route -> (max_concurrency, max_queue)
+            default_limit: Limit for routes not listed in route_limits
+            thread_workers: Thread pool size (default: min(32, cpu + 4))
+            process_workers: Process pool size (default: cpu count)
+        """
+        self.route_limits = dict(route_limits or {})
+        self.default_limit = default_limit
+        self.thread_workers = thread_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.process_workers = process_workers or (os.cpu_count() or 1)
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        self.limiters: Dict[str, RouteLimiter] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.responses: Dict[Tuple[str, int], int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.coalesced: Dict[str, int] = {}
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Worker pools
+    # ─────────────────────────────────────────────────────────────────────
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(self.thread_workers, thread_name_prefix="api-worker")
+            return self._thread_pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._process_pool is None:
+                # The server process runs threads; fork-started workers could inherit held locks
+                self._process_pool = ProcessPoolExecutor(self.process_workers, mp_context=worker_context())
+            return self._process_pool
+
+    def shutdown(self):
+        """Stop the worker pools (call from the app's shutdown hook)."""
+        with self._pool_lock:
+            for pool in (self._thread_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = self._process_pool = None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Execution
+    # ─────────────────────────────────────────────────────────────────────
+
+    def limiter(self, route: str) -> RouteLimiter:
+        limiter = self.limiters.get(route)
+        if limiter is None:
+            max_concurrency, max_queue = self.route_limits.get(route, self.default_limit)
+            limiter = self.limiters[route] = RouteLimiter(route, max_concurrency, max_queue)
+        return limiter
+
+    async def run(
+        self,
+        route: str,
+        func: Callable[..., Any],
+        *args: Any,
+        cpu_bound: bool = False,
+        coalesce_key: Optional[Hashable] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a blocking call off the event loop under the route's limits.
+
+        Args:
+            route: Route name (limits and metrics are keyed by it)
+            func: Blocking callable; must be picklable when cpu_bound=True
+            cpu_bound: Use the process pool instead of the thread pool
+            coalesce_key: Identical keys on the same route share one in-flight call
+
+        Raises:
+            RouteSaturated: The route's wait queue is full
+        """
+        if coalesce_key is None:
+            return await self._execute(route, func, args, kwargs, cpu_bound)
+
+        key = (route, coalesce_key)
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced[route] = self.coalesced.get(route, 0) + 1
+            # Shield so one caller disconnecting does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._execute(route, func, args, kwargs, cpu_bound))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _execute(self, route: str, func: Callable[..., Any], args: tuple, kwargs: dict, cpu_bound: bool) -> Any:
+        try:
+            async with self.limiter(route):
+                pool: Executor = self.process_pool if cpu_bound else self.thread_pool
+                return await asyncio.get_running_loop().run_in_executor(pool, partial(func, *args, **kwargs))
+        except RouteSaturated:
+            self.rejected[route] = self.rejected.get(route, 0) + 1
+            raise
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Metrics
+    # ─────────────────────────────────────────────────────────────────────
+
+    def observe(self, route: str, status_code: int, seconds: float):
+        """Record one completed request (called from the HTTP middleware)."""
+        histogram = self.histograms.get(route)
+        if histogram is None:
+            histogram = self.histograms[route] = LatencyHistogram()
+        histogram.observe(seconds)
+        self.responses[(route, status_code)] = self.responses.get((route, status_code), 0) + 1
+
+    async def timed(self, route: str, call_next: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call_next() and record its latency and status under route."""
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next()
+            status_code = getattr(response, "status_code", 200)
+            return response
+        finally:
+            self.observe(route, status_code, time.perf_counter() - started)
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = [
+            "# HELP iluminara_http_request_duration_seconds Request latency by route.",
+            "# TYPE iluminara_http_request_duration_seconds histogram",
+        ]
+        for route, histogram in sorted(self.histograms.items()):
+            cumulative = 0
+            for bound, bucket in zip(histogram.buckets, histogram.counts):
+                cumulative += bucket
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'iluminara_http_request_duration_seconds_bucket{{route="{route}",le="{le}"}} {cumulative}')
+            lines.append(f'iluminara_http_request_duration_seconds_sum{{route="{route}"}} {histogram.total}')
+            lines.append(f'iluminara_http_request_duration_seconds_count{{route="{route}"}} {histogram.count}')
+
+        lines += ["# HELP iluminara_http_responses_total Responses by route and status code.",
+                  "# TYPE iluminara_http_responses_total counter"]
+        for (route, status_code), count in sorted(self.responses.items()):
+            lines.append(f'iluminara_http_responses_total{{route="{route}",status="{status_code}"}} {count}')
+
+        gauges = (
+            ("iluminara_route_in_flight", "Requests executing per route.", "gauge",
+             {route: limiter.in_flight for route, limiter in self.limiters.items()}),
+            ("iluminara_route_queue_depth", "Requests waiting for a slot per route.", "gauge",
+             {route: limiter.waiting for route, limiter in self.limiters.items()}),
+            ("iluminara_route_rejected_total", "Requests rejected with 503 per route.", "counter", self.rejected),
+            ("iluminara_route_coalesced_total", "Requests served by an in-flight duplicate.", "counter", self.coalesced),
+        )
+        for name, help_text, metric_type, values in gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            lines += [f'{name}{{route="{route}"}} {value}' for route, value in sorted(values.items())]
+        return "\n".join(lines) + "\n"
@@ -15,17 +15,36 @@ FastAPI Backend Service
 
 Main API service for iLuminara GCP prototype.
 Exposes endpoints for voice processing, HSTPU forecasting, and ethical validation.
+
+Blocking service calls run through the ExecutionLayer (see execution.py):
+HSTPU forecasting goes to a process pool, stateful services (voice, ethics)
+to a thread pool, each route is capped with a bounded wait queue (503 when
+saturated), identical in-flight map/hotspot queries are coalesced, and
+GET /metrics exposes per-route latency histograms for Prometheus.
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 import json
+import os
 
 from .voice_processor import VoiceProcessor
 from .hstpu_forecast import HstpuForecaster
 from .ethical_engine import EthicalEngine, ActionType
+from .execution import ExecutionLayer, RouteSaturated
+
+# Per-route (max_concurrency, max_queue); requests beyond both get a 503
+ROUTE_LIMITS = {
+    "/voice/process": (4, 16),
+    "/voice/simulate": (4, 16),
+    "/hstpu/map": (2, 32),
+    "/hstpu/forecast": (4, 32),
+    "/hstpu/hotspots": (2, 32),
+    "/ethics/evaluate": (8, 64),
+}
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -48,6 +67,38 @@ voice_processor = VoiceProcessor(use_mock=True)
 hstpu_forecaster = HstpuForecaster(use_mock=True)
 ethical_engine = EthicalEngine(jurisdiction="GLOBAL_DEFAULT")
 
+execution = ExecutionLayer(
+    route_limits=ROUTE_LIMITS,
+    thread_workers=int(os.getenv("API_THREAD_WORKERS", "0")) or None,
+    process_workers=int(os.getenv("API_PROCESS_WORKERS", "0")) or None,
+)
+
+
+def _hstpu_call(method: str, *args: Any) -> Any:
+    """Process-pool entry point: run a forecaster method in the worker's own instance."""
+    return getattr(hstpu_forecaster, method)(*args)
+
+
+@app.middleware("http")
+async def record_route_metrics(request: Request, call_next):
+    """Per-route latency histogram; unknown paths share one label to bound cardinality."""
+    route = request.url.path if request.url.path in _ROUTE_PATHS else "other"
+    return await execution.timed(route, lambda: call_next(request))
+
+
+@app.exception_handler(RouteSaturated)
+async def route_saturated_handler(request: Request, exc: RouteSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"{exc.route} is at capacity, retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_execution_layer():
+    execution.shutdown()
+
 
 # Pydantic models for request/response
 class VoiceMetadata(BaseModel):
@@ -114,13 +165,15 @@ async def process_voice(
             meta = json.loads(metadata)
         
         # Process audio
-        result = voice_processor.process_audio(audio_data, meta)
+        result = await execution.run("/voice/process", voice_processor.process_audio, audio_data, meta)
         
         return {
             "success": True,
             "data": result
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -135,13 +188,15 @@ async def simulate_voice_report(metadata: Optional[VoiceMetadata] = None):
     try:
         # Process mock audio
         meta_dict = metadata.dict() if metadata else None
-        result = voice_processor.process_audio(b"mock_audio", meta_dict)
+        result = await execution.run("/voice/simulate", voice_processor.process_audio, b"mock_audio", meta_dict)
         
         return {
             "success": True,
             "data": result
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -154,13 +209,18 @@ async def get_hstpu_map(region: str = "Kenya"):
     Returns hierarchical spatiotemporal visualization data.
     """
     try:
-        map_data = hstpu_forecaster.generate_hstpu_map(region)
+        map_data = await execution.run(
+            "/hstpu/map", _hstpu_call, "generate_hstpu_map", region,
+            cpu_bound=True, coalesce_key=region
+        )
         
         return {
             "success": True,
             "data": map_data
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -177,13 +237,18 @@ async def forecast_outbreak(request: ForecastRequest):
             "region": request.region
         }
         
-        forecast = hstpu_forecaster.forecast_outbreak_trajectory(location)
+        forecast = await execution.run(
+            "/hstpu/forecast", _hstpu_call, "forecast_outbreak_trajectory", location,
+            cpu_bound=True
+        )
         
         return {
             "success": True,
             "data": forecast
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -197,7 +262,10 @@ async def get_hotspots(threshold: float = 2.0):
         threshold: Minimum Z-score threshold (default: 2.0)
     """
     try:
-        hotspots = hstpu_forecaster.get_active_hotspots(threshold)
+        hotspots = await execution.run(
+            "/hstpu/hotspots", _hstpu_call, "get_active_hotspots", threshold,
+            cpu_bound=True, coalesce_key=threshold
+        )
         
         return {
             "success": True,
@@ -208,6 +276,8 @@ async def get_hotspots(threshold: float = 2.0):
             }
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -234,13 +304,18 @@ async def evaluate_action(request: EthicalActionRequest):
             ActionType.PREDICTIVE_ANALYSIS
         )
         
-        evaluation = ethical_engine.evaluate_action(action_type, request.payload)
+        # Thread pool: the engine's decision log must stay in this process
+        evaluation = await execution.run(
+            "/ethics/evaluate", ethical_engine.evaluate_action, action_type, request.payload
+        )
         
         return {
             "success": True,
             "data": evaluation
         }
     
+    except RouteSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -284,6 +359,15 @@ async def get_ethics_statistics():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint: per-route latency histograms, in-flight, queue depth, 503s."""
+    return PlainTextResponse(execution.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+_ROUTE_PATHS = {route.path for route in app.routes if hasattr(route, "path")}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
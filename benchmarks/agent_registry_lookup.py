@@ -0,0 +1,127 @@
+"""
+Agent Registry Lookup Benchmark
+- Registers N agents with random capabilities, tags and statuses
+- Compares indexed lookups (capability / tag / status / type / multi-criteria)
+  with the previous linear scans over every agent
+- Reports least-loaded routing latency and snapshot/restore time against
+  re-registering every agent
+Usage: python benchmarks/agent_registry_lookup.py --agents 10000 --queries 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from edge_node.ai_agents import AgentCapability, AgentRegistry, AgentStatus, OfflineAgent
+
+CAPABILITIES = list(AgentCapability)
+STATUSES = list(AgentStatus)
+TAGS = [f"site_{i}" for i in range(50)] + ["health", "remote", "lab"]
+
+# Previous implementation: a full scan per query
+def scan_capabilities(registry, required):
+    required = set(required)
+    return [a for a in registry.agents.values() if required.issubset(set(a.get_capabilities()))]
+
+def scan_tags(registry, tags):
+    tags = set(tags)
+    return [a for a in registry.agents.values() if tags.intersection(set(a.metadata.tags))]
+
+def scan_status(registry, status):
+    return [a for a in registry.agents.values() if a.status == status]
+
+def scan_type(registry, agent_type):
+    return [a for a in registry.agents.values() if type(a) is agent_type]
+
+def scan_advanced(registry, capabilities, tags, status):
+    return [a for a in scan_capabilities(registry, capabilities)
+            if set(tags).intersection(a.metadata.tags) and a.status == status]
+
+def timed(fn, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def build(n, rng):
+    registry = AgentRegistry()
+    agents = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(n):
+            agent = OfflineAgent(name=f"Agent {i}", capabilities=rng.sample(CAPABILITIES, rng.randint(1, 4)),
+                                 tags=rng.sample(TAGS, 2))
+            agent._status = rng.choice(STATUSES)
+            agents.append(agent)
+        start = time.perf_counter()
+        for agent in agents:
+            registry.register(agent)
+        register_s = time.perf_counter() - start
+    return registry, agents, register_s
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--agents", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    registry, agents, register_s = build(args.agents, rng)
+    print(f"[*] {args.agents} agents registered in {register_s:.2f} s")
+
+    cap_queries = [(rng.sample(CAPABILITIES, 2),) for _ in range(args.queries)]
+    tag_queries = [(rng.sample(TAGS, 1),) for _ in range(args.queries)]
+    status_queries = [(rng.choice(STATUSES),) for _ in range(args.queries)]
+    adv_queries = [(rng.sample(CAPABILITIES, 2), rng.sample(TAGS, 1), rng.choice(STATUSES))
+                   for _ in range(args.queries)]
+    cases = [
+        ("capabilities (all of 2)", registry.search_by_capabilities, scan_capabilities, cap_queries),
+        ("tag", registry.search_by_tags, scan_tags, tag_queries),
+        ("status", registry.search_by_status, scan_status, status_queries),
+        ("type", registry.search_by_type, scan_type, [(OfflineAgent,)] * 20),
+        ("advanced (caps+tag+status)", lambda c, t, s: registry.advanced_search(capabilities=c, tags=t, status=s),
+         scan_advanced, adv_queries),
+    ]
+    for label, indexed, scan, queries in cases:
+        for q in queries[:5]:
+            a = indexed(*q)
+            b = scan(registry, *q)
+            assert [x.metadata.agent_id for x in a] == [x.metadata.agent_id for x in b], label
+        indexed_us = timed(indexed, queries)
+        scan_us = timed(lambda *q: scan(registry, *q), queries)
+        print(f"    {label:28s} indexed {indexed_us:9.1f} us | linear scan {scan_us:9.1f} us | "
+              f"{scan_us / indexed_us:6.1f}x")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        flips = rng.sample(agents, 1000)
+        start = time.perf_counter()
+        for agent in flips:
+            agent.set_status(rng.choice(STATUSES))
+        status_us = (time.perf_counter() - start) * 1e6 / len(flips)
+    for agent in agents:
+        registry.report_load(agent.metadata.agent_id, rng.randint(0, 50))
+    routes = [(rng.sample(CAPABILITIES, 1),) for _ in range(args.queries)]
+    scan_route_us = timed(lambda caps: min(scan_capabilities(registry, caps),
+                                           key=lambda a: registry.loads[a.metadata.agent_id]), routes)
+    route_us = timed(lambda caps: registry.select_least_loaded(caps), routes)
+    print(f"    status change incl. index update {status_us:7.1f} us")
+    print(f"    least-loaded routing: heap {route_us:7.1f} us | scan + min {scan_route_us:9.1f} us")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "registry.json")
+        start = time.perf_counter()
+        registry.snapshot(path)
+        snapshot_ms = (time.perf_counter() - start) * 1000
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            AgentRegistry.restore(path, live_agents=agents)
+            restore_ms = (time.perf_counter() - start) * 1000
+            _, _, reregister_s = build(args.agents, random.Random(1))
+    print(f"    snapshot {snapshot_ms:7.1f} ms | restore {restore_ms:7.1f} ms | "
+          f"re-register all {reregister_s * 1000:7.1f} ms")
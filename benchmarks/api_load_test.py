@@ -0,0 +1,218 @@
+"""
+API Service Load Test (locust-style)
+- Simulated users run weighted tasks (health, /predict, /predict/batch) over
+  keep-alive connections for a fixed duration
+- Reports requests/s, locations/s and p50/p95/p99 latency per task
+- Optionally spawns api_service.py locally with API_WORKERS=N
+- --record writes a throughput baseline; --baseline compares against one
+- --sweep-workers 1,2,4 spawns one server per worker count and reports each
+  against the single-worker run (the case for API_WORKERS pre-fork mode)
+Usage: python benchmarks/api_load_test.py --spawn-server --workers 4 --users 32 --duration 30
+       python benchmarks/api_load_test.py --sweep-workers 1,2,4 --record baselines/api_service_workers.json
+"""
+
+import argparse
+import gzip
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SYMPTOM_SETS = [
+    ["fever", "headache"],
+    ["diarrhea", "vomiting", "dehydration"],
+    ["fever", "cough", "rash"],
+    ["fever", "headache", "body_ache", "diarrhea"],
+    ["cough"],
+]
+
+def random_request(rng):
+    return {
+        "location": {"lat": 0.512 + rng.uniform(-0.5, 0.5), "lng": 40.3129 + rng.uniform(-0.5, 0.5)},
+        "symptoms": rng.choice(SYMPTOM_SETS),
+    }
+
+class ApiUser:
+    """One simulated client with a persistent connection and weighted tasks."""
+
+    def __init__(self, host, port, batch_size, use_gzip, seed):
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+        self.batch_size = batch_size
+        self.use_gzip = use_gzip
+        self.rng = random.Random(seed)
+        self.tasks = [(self.health, 1), (self.predict, 6), (self.predict_batch, 3)]
+
+    def _request(self, method, path, body=None):
+        headers = {"Accept-Encoding": "gzip"} if self.use_gzip else {}
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+            if self.use_gzip and len(payload) > 1024:
+                payload = gzip.compress(payload)
+                headers["Content-Encoding"] = "gzip"
+        else:
+            payload = None
+        self.conn.request(method, path, body=payload, headers=headers)
+        response = self.conn.getresponse()
+        data = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"{path} -> HTTP {response.status}")
+        return data
+
+    def health(self):
+        self._request("GET", "/health")
+        return "GET /health", 1
+
+    def predict(self):
+        self._request("POST", "/predict", random_request(self.rng))
+        return "POST /predict", 1
+
+    def predict_batch(self):
+        self._request("POST", "/predict/batch",
+                      {"requests": [random_request(self.rng) for _ in range(self.batch_size)]})
+        return "POST /predict/batch", self.batch_size
+
+    def run_once(self):
+        task = self.rng.choices([t for t, _ in self.tasks], weights=[w for _, w in self.tasks])[0]
+        return task()
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.locations = {}
+        self.failures = {}
+
+    def record(self, name, seconds, locations):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            self.locations[name] = self.locations.get(name, 0) + locations
+
+    def fail(self, name):
+        with self.lock:
+            self.failures[name] = self.failures.get(name, 0) + 1
+
+    def summary(self, elapsed):
+        rows = {}
+        for name, samples in sorted(self.latencies.items()):
+            samples.sort()
+            pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+            rows[name] = {
+                "requests": len(samples),
+                "failures": self.failures.get(name, 0),
+                "rps": len(samples) / elapsed,
+                "locations_per_s": self.locations[name] / elapsed,
+                "p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99),
+            }
+        total = sum(r["requests"] for r in rows.values())
+        return {"total_rps": total / elapsed, "tasks": rows}
+
+def run_load(host, port, users, duration, batch_size, use_gzip):
+    stats = Stats()
+    deadline = time.monotonic() + duration
+
+    def user_loop(seed):
+        user = ApiUser(host, port, batch_size, use_gzip, seed)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                name, locations = user.run_once()
+                stats.record(name, time.perf_counter() - started, locations)
+            except Exception as e:
+                stats.fail(type(e).__name__)
+                user.conn.close()
+
+    threads = [threading.Thread(target=user_loop, args=(seed,), daemon=True) for seed in range(users)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats.summary(time.monotonic() - started)
+
+def spawn_server(port, workers):
+    env = dict(os.environ, API_PORT=str(port), API_HOST="127.0.0.1", API_WORKERS=str(workers))
+    server = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "api_service.py")], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("api_service.py did not become healthy")
+
+def run_sweep(args, worker_counts):
+    """Spawn a server per worker count; returns {workers: summary}"""
+    runs = {}
+    for workers in worker_counts:
+        server = spawn_server(args.port, workers)
+        try:
+            summary = run_load(args.host, args.port, args.users, args.duration, args.batch_size, not args.no_gzip)
+        finally:
+            server.terminate()
+            server.wait()
+        runs[str(workers)] = summary
+        print_summary(f"{workers} worker(s), {args.users} users", summary, runs.get(str(worker_counts[0])))
+    return runs
+
+def print_summary(label, summary, baseline=None):
+    print(f"[*] {label}: {summary['total_rps']:.1f} req/s total")
+    for name, row in summary["tasks"].items():
+        line = (f"    {name:<22} {row['rps']:8.1f} req/s {row['locations_per_s']:9.1f} loc/s | "
+                f"p50 {row['p50_ms']:6.1f} p95 {row['p95_ms']:6.1f} p99 {row['p99_ms']:6.1f} ms | "
+                f"fail {row['failures']}")
+        if baseline and name in baseline.get("tasks", {}):
+            line += f" | {row['rps'] / baseline['tasks'][name]['rps']:.2f}x baseline"
+        print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--no-gzip", action="store_true")
+    parser.add_argument("--spawn-server", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--record", help="write this run's summary as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against a recorded JSON baseline")
+    parser.add_argument("--sweep-workers", help="comma-separated worker counts, e.g. 1,2,4 (implies spawning)")
+    args = parser.parse_args()
+    config = {"users": args.users, "duration_s": args.duration, "batch_size": args.batch_size,
+              "gzip": not args.no_gzip, "cpus": os.cpu_count()}
+
+    if args.sweep_workers:
+        worker_counts = [int(n) for n in args.sweep_workers.split(",")]
+        sweep = {"runs": run_sweep(args, worker_counts), "config": config}
+        if args.record:
+            with open(args.record, "w") as f:
+                json.dump(sweep, f, indent=2)
+            print(f"[*] Sweep written to {args.record}")
+        sys.exit(0)
+
+    server = spawn_server(args.port, args.workers) if args.spawn_server else None
+    try:
+        summary = run_load(args.host, args.port, args.users, args.duration, args.batch_size, not args.no_gzip)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    summary["config"] = dict(config, workers=args.workers)
+    baseline = json.load(open(args.baseline)) if args.baseline else None
+    print_summary(f"{args.workers} worker(s), {args.users} users", summary, baseline)
+    if args.record:
+        with open(args.record, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"[*] Baseline written to {args.record}")
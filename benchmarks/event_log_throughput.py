@@ -0,0 +1,101 @@
+"""
+Event Log Throughput Benchmark
+- Appends N STATE_CHANGE events with the segmented log and with the previous
+  one-JSON-file-per-event layout
+- Reports append throughput, files created, full replay time and the latency
+  of replaying the last 100 events from an offset
+- Reports the size reduction from compacting superseded keys
+Usage: python benchmarks/event_log_throughput.py --events 10000 100000 --workdir /mnt/sdcard/bench
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from core.sync.event_log import EventLog
+
+def legacy_append(directory, event_type, payload):
+    event = {
+        "event_id": str(uuid.uuid4()),
+        "type": event_type,
+        "timestamp": datetime.utcnow().isoformat(),
+        "payload": payload,
+    }
+    with open(directory / f"{event['event_id']}.json", "w") as f:
+        json.dump(event, f, indent=2)
+
+def legacy_replay(directory):
+    events = []
+    for path in directory.glob("*.json"):
+        with open(path) as f:
+            events.append(json.load(f))
+    return sorted(events, key=lambda e: e["timestamp"])
+
+def payload(i, keys):
+    return {"key": f"facility_{i % keys}.stock_level", "value": i}
+
+def benchmark_legacy(workdir, events, keys):
+    directory = Path(workdir) / f"legacy-{events}"
+    directory.mkdir()
+    start = time.perf_counter()
+    for i in range(events):
+        legacy_append(directory, "STATE_CHANGE", payload(i, keys))
+    append_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    replayed = legacy_replay(directory)
+    full_ms = (time.perf_counter() - start) * 1000
+    # Replaying the tail still needs every file listed, read and sorted
+    start = time.perf_counter()
+    tail = legacy_replay(directory)[-100:]
+    tail_ms = (time.perf_counter() - start) * 1000
+    assert len(replayed) == events and len(tail) == 100
+    print(f"    one file per event: append {events / append_s:9.0f} ev/s | files {events:>7} | "
+          f"full replay {full_ms:8.1f} ms | last 100 {tail_ms:8.1f} ms")
+
+def benchmark_segmented(workdir, events, keys):
+    directory = Path(workdir) / f"segmented-{events}"
+    log = EventLog(directory)
+    start = time.perf_counter()
+    for i in range(events):
+        log.append("STATE_CHANGE", payload(i, keys))
+    log.flush(fsync=True)
+    append_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    replayed = sum(1 for _ in log.replay())
+    full_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    tail = sum(1 for _ in log.replay(log.next_offset - 100))
+    tail_ms = (time.perf_counter() - start) * 1000
+    assert replayed == events and tail == 100
+
+    files = len(os.listdir(directory))
+    size_before = log.stats()["size_bytes"]
+    start = time.perf_counter()
+    compacted = log.compact()
+    compact_ms = (time.perf_counter() - start) * 1000
+    size_after = log.stats()["size_bytes"]
+    print(f"    segmented log:      append {events / append_s:9.0f} ev/s | files {files:>7} | "
+          f"full replay {full_ms:8.1f} ms | last 100 {tail_ms:8.1f} ms")
+    print(f"    compaction: {compacted['records_dropped']} superseded events dropped in {compact_ms:.0f} ms, "
+          f"{size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB")
+    log.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--keys", type=int, default=500, help="distinct state keys (compaction fold factor)")
+    parser.add_argument("--workdir", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        for events in args.events:
+            print(f"[*] {events} events, {args.keys} keys")
+            benchmark_legacy(workdir, events, args.keys)
+            benchmark_segmented(workdir, events, args.keys)
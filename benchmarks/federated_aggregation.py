@@ -0,0 +1,124 @@
+"""
+Federated Aggregation Benchmark
+- Streams N client updates of D parameters into StreamingAggregator (weighted,
+  float64) and reports aggregation time and peak RSS
+- Runs the previous np.mean-over-a-list approach where it fits in memory,
+  otherwise reports the N x D array it would need
+- Runs a pairwise-masked secure round with dropouts and reports per-client
+  masking time and server aggregation/unmasking time
+Each mode runs in its own process so peak RSS figures are independent.
+Usage: python benchmarks/federated_aggregation.py --clients 1000 --params 10000000 --source npy --workdir /mnt/bench
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+POOL = 4  # distinct update vectors cycled through, so generation does not dominate
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def make_pool(params, source, workdir):
+    rng = np.random.default_rng(0)
+    pool = [rng.standard_normal(params, dtype=np.float32) for _ in range(POOL)]
+    if source == "npy":
+        paths = []
+        for i, update in enumerate(pool):
+            paths.append(os.path.join(workdir, f"client_{i}.npy"))
+            np.save(paths[-1], update)
+        return paths
+    return pool
+
+def run_stream(args):
+    from ml_ops.federated.aggregation_engine import StreamingAggregator
+    pool = make_pool(args.params, args.source, args.workdir)
+    baseline_rss = peak_rss_mb()
+    aggregator = StreamingAggregator(dimension=args.params)
+    start = time.perf_counter()
+    for i in range(args.clients):
+        aggregator.add(pool[i % POOL], weight=float(50 + i % 200))
+    result = aggregator.result()
+    elapsed = time.perf_counter() - start
+    print(f"    streaming ({args.source}): {elapsed:8.1f} s | {args.clients / elapsed:7.1f} clients/s | "
+          f"peak RSS {peak_rss_mb():8.0f} MB (update pool {baseline_rss:.0f} MB) | checksum {result[:4].sum():+.4f}")
+
+def run_baseline(args):
+    needed_gb = args.clients * args.params * 4 / 1e9
+    available_gb = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1e9
+    if needed_gb > 0.7 * available_gb:
+        print(f"    np.mean over list: skipped, needs a {args.clients} x {args.params} array "
+              f"({needed_gb:.1f} GB float32, {available_gb:.1f} GB available)")
+        return
+    rng = np.random.default_rng(0)
+    pool = [rng.standard_normal(args.params, dtype=np.float32) for _ in range(POOL)]
+    updates = [pool[i % POOL].copy() for i in range(args.clients)]
+    start = time.perf_counter()
+    result = np.mean(updates, axis=0)
+    elapsed = time.perf_counter() - start
+    print(f"    np.mean over list: {elapsed:8.1f} s | unweighted | peak RSS {peak_rss_mb():8.0f} MB | "
+          f"checksum {result[:4].sum():+.4f}")
+
+def run_secure(args):
+    from ml_ops.federated.aggregation_engine import MaskingClient, SecureAggregationRound
+    clients, params = args.secure_clients, args.secure_params
+    ids = [f"clinic_{i:04d}" for i in range(clients)]
+    rng = np.random.default_rng(1)
+    update = rng.standard_normal(params, dtype=np.float32)
+    round_ = SecureAggregationRound("bench", ids, params, mask_degree=args.mask_degree)
+    members = {cid: MaskingClient(cid, "bench") for cid in ids}
+    keys = {cid: member.public_key() for cid, member in members.items()}
+    for cid, member in members.items():
+        member.agree(keys, round_.graph[cid])
+    survivors = ids[:int(clients * (1 - args.dropout))]
+
+    mask_s = submit_s = 0.0
+    for cid in survivors:
+        start = time.perf_counter()
+        chunks = list(members[cid].mask(update))
+        mask_s += time.perf_counter() - start
+        start = time.perf_counter()
+        round_.submit(cid, chunks)
+        submit_s += time.perf_counter() - start
+    start = time.perf_counter()
+    for cid in survivors:
+        round_.recover(cid, members[cid].reveal(round_.dropped()))
+    result = round_.result()
+    unmask_s = time.perf_counter() - start
+    error = np.abs(result - update.astype(np.float64)).max()
+    print(f"    secure round: {len(survivors)}/{clients} survivors, degree {args.mask_degree} | "
+          f"mask {mask_s / len(survivors) * 1000:7.1f} ms/client | server sum {submit_s:6.1f} s + "
+          f"unmask {unmask_s:6.1f} s | max error {error:.1e} | peak RSS {peak_rss_mb():6.0f} MB")
+
+MODES = {"stream": run_stream, "baseline": run_baseline, "secure": run_secure}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--params", type=int, default=10_000_000)
+    parser.add_argument("--source", choices=["memory", "npy"], default="memory")
+    parser.add_argument("--secure-clients", type=int, default=100)
+    parser.add_argument("--secure-params", type=int, default=1_000_000)
+    parser.add_argument("--mask-degree", type=int, default=8)
+    parser.add_argument("--dropout", type=float, default=0.1)
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--mode", choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", default=None)
+    args = parser.parse_args()
+
+    if args.mode:
+        MODES[args.mode](args)
+        sys.exit(0)
+
+    print(f"[*] {args.clients} clients x {args.params} parameters")
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        forwarded = [f"--{name.replace('_', '-')}={value}" for name, value in vars(args).items()
+                     if name not in ("modes", "mode", "workdir")]
+        for mode in args.modes:
+            subprocess.run([sys.executable, __file__, *forwarded, "--mode", mode, "--workdir", workdir], check=True)
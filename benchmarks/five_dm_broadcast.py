@@ -0,0 +1,116 @@
+"""
+5DM Broadcast Fan-Out Benchmark
+- Fans one alert out to N recipients split across SMS / WhatsApp / USSD fake
+  gateways with configurable latency, per-recipient failure rate, outage rate
+  and per-gateway rate limits
+- Reports time until 50/90/99/100% of recipients are delivered, retries,
+  gateway calls and duplicate sends (must be 0)
+- Compares with the previous per-recipient serial loop, extrapolated from a
+  timed sample of one-recipient sends
+- Re-broadcasts the same alert id to show idempotent skips
+Usage: python benchmarks/five_dm_broadcast.py --recipients 500000 --latency 0.08 --failure-rate 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import tempfile
+import time
+
+from edge_node.frenasa_engine.broadcast_engine import BroadcastEngine, FakeGateway
+
+CHANNEL_SHARE = {"sms": 0.7, "whatsapp": 0.2, "ussd": 0.1}
+
+class TimedGateway(FakeGateway):
+    """Records when each recipient is delivered."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.progress = []  # (monotonic time, cumulative delivered)
+
+    async def send_batch(self, alert_id, recipients, message):
+        failed = await super().send_batch(alert_id, recipients, message)
+        self.progress.append((time.monotonic(), len(recipients) - len(failed)))
+        return failed
+
+def build_recipients(n):
+    recipients = []
+    start = 0
+    for gateway, share in CHANNEL_SHARE.items():
+        count = int(n * share) if gateway != "ussd" else n - start
+        recipients.extend((f"+2547{start + i:08d}", gateway) for i in range(count))
+        start += count
+    return recipients
+
+def percentile_times(gateways, started, total):
+    events = sorted(event for g in gateways.values() for event in g.progress)
+    marks, delivered, out = [0.5, 0.9, 0.99, 1.0], 0, {}
+    for t, count in events:
+        delivered += count
+        while marks and delivered >= marks[0] * total:
+            out[marks.pop(0)] = t - started
+    return out
+
+async def serial_sample(latency, samples):
+    gateway = FakeGateway("serial", latency=latency)
+    start = time.perf_counter()
+    for i in range(samples):
+        await gateway.send_batch("SERIAL", [f"+2547{i:08d}"], "alert")
+    return (time.perf_counter() - start) / samples
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipients", type=int, default=500000)
+    parser.add_argument("--latency", type=float, default=0.08, help="seconds per gateway call")
+    parser.add_argument("--failure-rate", type=float, default=0.02, help="per-recipient failure probability")
+    parser.add_argument("--outage-rate", type=float, default=0.01, help="whole-call failure probability")
+    parser.add_argument("--rate", type=float, default=50000.0, help="per-gateway messages/second")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=16, help="workers per gateway")
+    parser.add_argument("--max-in-flight", type=int, default=48)
+    parser.add_argument("--serial-samples", type=int, default=50)
+    args = parser.parse_args()
+
+    gateways = {
+        name: TimedGateway(name, latency=args.latency, failure_rate=args.failure_rate,
+                           outage_rate=args.outage_rate, seed=i)
+        for i, name in enumerate(CHANNEL_SHARE)
+    }
+    recipients = build_recipients(args.recipients)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = BroadcastEngine(
+            gateways, os.path.join(tmp, "ledger.sqlite"),
+            rate_limits={name: (args.rate, args.rate) for name in gateways},
+            batch_size=args.batch_size, workers_per_gateway=args.workers,
+            max_in_flight=args.max_in_flight, backoff_base=0.25, backoff_cap=5.0, seed=7,
+        )
+        started = time.monotonic()
+        report = asyncio.run(engine.broadcast("BENCH-ALERT", "Cholera outbreak: boil drinking water.", recipients))
+        marks = percentile_times(gateways, started, args.recipients)
+
+        start = time.perf_counter()
+        again = asyncio.run(engine.broadcast("BENCH-ALERT", "Cholera outbreak: boil drinking water.", recipients))
+        rebroadcast = time.perf_counter() - start
+        engine.close()
+
+    per_send = asyncio.run(serial_sample(args.latency, args.serial_samples))
+    serial_estimate = per_send * args.recipients
+
+    print(f"Recipients: {args.recipients:,}   latency {args.latency * 1000:.0f} ms/call   "
+          f"failure {args.failure_rate:.1%}   outage {args.outage_rate:.1%}   rate {args.rate:,.0f}/s per gateway")
+    print(f"status {report.status}: delivered {report.delivered:,}  failed {report.failed:,}  "
+          f"retries {report.retries:,}  wall {report.seconds:.2f}s")
+    print("time to deliver: " + "  ".join(f"p{int(q * 100)}={t:.2f}s" for q, t in marks.items()))
+    for name, gateway in gateways.items():
+        stats = report.gateways[name]
+        print(f"  {name:<9} delivered {stats['delivered']:>8,}  calls {gateway.calls:>5}  "
+              f"max concurrency {gateway.max_concurrency:>3}  duplicates {gateway.duplicates}")
+    print(f"re-broadcast same alert id: skipped {again.skipped:,}, delivered {again.delivered}, {rebroadcast:.2f}s")
+    print(f"serial per-recipient loop (extrapolated): {serial_estimate:,.0f}s "
+          f"({serial_estimate / report.seconds:,.0f}x slower)")
+    print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Agent Orchestrator Parallel Execution Benchmark
+- Builds a synthetic case window (N records around outbreak foci, with a recent
+  EMR tail that reaches the early warning agent)
+- Times the previous serial run_full_analysis (per-disease rescans of the
+  window) against the execution plan run serially and in parallel
+- Reports per-agent task time, wall clock, summed task time and the critical
+  path (the wall clock bound with one core per independent agent)
+Usage: python benchmarks/orchestrator_parallel.py --cases 1000000 --foci 40
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from edge_node.ai_agents import AgentOrchestrator
+from edge_node.ai_agents.epidemiological_forecasting_agent import ForecastModel
+from edge_node.ai_agents.spatiotemporal_analysis_agent import SpatialScale, TemporalScale
+
+DISEASE_FIELDS = [("disease", "Cholera"), ("diagnosis", "malaria"), ("symptom", "fever and chills"),
+                  ("symptom", "diarrhea"), ("disease", "measles")]
+DISEASES = ["cholera", "malaria", "measles"]
+
+def build_window(n, foci, recent, rng):
+    now = datetime.utcnow()
+    centres = [(rng.uniform(-3.5, 3.5), rng.uniform(34.0, 41.0)) for _ in range(foci)]
+    cases = []
+    for i in range(n):
+        lat, lon = centres[i % foci]
+        field, value = DISEASE_FIELDS[rng.randrange(len(DISEASE_FIELDS))]
+        age = rng.randint(0, 10) if i >= n - recent else rng.randint(15, 90)
+        record = {
+            "lat": rng.gauss(lat, 0.01),
+            "lon": rng.gauss(lon, 0.01),
+            "timestamp": (now - timedelta(days=age)).isoformat(),
+            "cases": rng.randint(1, 8),
+            field: value,
+        }
+        if i >= n - recent:
+            record["source"] = "EMR"
+        cases.append(record)
+    return cases
+
+def legacy_serial(orchestrator, spatial_scale):
+    # Previous run_full_analysis body: agents one after another, one rescan of the window per disease
+    timings = {}
+    start = time.perf_counter()
+    alerts = orchestrator.early_warning_agent.check_and_generate_alerts()
+    timings["alerts"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spatial = orchestrator.spatial_agent.analyze(case_data=orchestrator.case_data_buffer,
+                                                 spatial_scale=spatial_scale,
+                                                 temporal_scale=TemporalScale.WEEKLY)
+    timings["spatial_analysis"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    forecasts = []
+    for disease in DISEASES:
+        data = [r for r in orchestrator.case_data_buffer if orchestrator._matches_disease(r, disease)]
+        if data:
+            forecasts.append(orchestrator.forecasting_agent.forecast_outbreak(
+                disease=disease, historical_data=data, forecast_horizon_days=14, model=ForecastModel.SEIR))
+    timings["forecasts"] = time.perf_counter() - start
+    return orchestrator._generate_summary(forecasts, spatial, alerts), timings
+
+def report(label, wall, timings, extra=""):
+    tasks = "  ".join(f"{name}={seconds:.2f}s" for name, seconds in timings.items())
+    print(f"{label:<16} wall {wall:7.2f}s   {tasks}{extra}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=1000000)
+    parser.add_argument("--foci", type=int, default=40)
+    parser.add_argument("--recent", type=int, default=2000, help="trailing EMR records fed to early warning")
+    parser.add_argument("--scale", default="DISTRICT", choices=[s.name for s in SpatialScale])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    spatial_scale = SpatialScale[args.scale]
+    print(f"Building {args.cases:,} cases around {args.foci} foci ({args.recent} recent EMR records)...")
+    orchestrator = AgentOrchestrator("Kenya", enable_compliance_checking=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        orchestrator.ingest_case_data(build_window(args.cases, args.foci, args.recent, rng))
+    print(f"cpu count: {os.cpu_count()}   early warning EMR buffer: {len(orchestrator.early_warning_agent.emr_buffer)}")
+
+    start = time.perf_counter()
+    legacy_summary, legacy_timings = legacy_serial(orchestrator, spatial_scale)
+    legacy_wall = time.perf_counter() - start
+    report("legacy serial", legacy_wall, legacy_timings)
+
+    runs = {}
+    for label, parallel in (("plan serial", False), ("plan parallel", True)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = orchestrator.run_full_analysis(diseases=DISEASES, spatial_scale=spatial_scale, parallel=parallel)
+        execution = result.metadata["execution"]
+        runs[label] = (result, execution)
+        timings = {name: task["seconds"] for name, task in execution["tasks"].items()}
+        report(label, execution["wall_seconds"], timings,
+               f"   critical path {execution['critical_path_seconds']:.2f}s")
+
+    for label, (result, _) in runs.items():
+        assert result.summary == legacy_summary, f"{label} summary differs from the legacy run"
+
+    parallel = runs["plan parallel"][1]
+    print(f"\nparallel wall / legacy serial wall: {parallel['wall_seconds'] / legacy_wall:.2f}x")
+    print(f"summed task time (serial schedule):  {parallel['serial_seconds']:.2f}s")
+    print(f"critical path (one core per agent): {parallel['critical_path_seconds']:.2f}s "
+          f"({legacy_wall / parallel['critical_path_seconds']:.2f}x vs legacy)")
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,14 @@ PQC Latency Benchmark under Simulated Solar Power Throttling
 - Measures ML-KEM keygen/encaps/decaps
 - Uses stress-ng + cpulimit to simulate power-constrained edge
 - Hook for real cuPQC on Jetson (detects NVIDIA GPU)
+- Session throughput at 1 / 100 / 10k messages per ML-KEM handshake
 """
 
+import os
 import time
 import subprocess
 from crypto.post_quantum.ml_kem import SovereignMLKEM
+from crypto.post_quantum.pqc_session import PQCSessionManager
 
 def benchmark_pqc(operations=100):
     kem = SovereignMLKEM()
@@ -24,9 +27,40 @@ def benchmark_pqc(operations=100):
     print(f"Average round-trip latency: {avg:.2f} ms")
     return avg
 
+def benchmark_session_throughput(messages_per_handshake=(1, 100, 10_000), payload_bytes=256,
+                                 total_messages=10_000, max_handshakes=200):
+    """Seal + open throughput when one handshake is amortised over N messages."""
+    kem = SovereignMLKEM()
+    pk, sk = kem.generate_keypair()
+    payload = os.urandom(payload_bytes)
+
+    results = {}
+    for per_handshake in messages_per_handshake:
+        rounds = max(1, min(max_handshakes, total_messages // per_handshake))
+        sender = PQCSessionManager(kem=kem)
+        receiver = PQCSessionManager(kem=kem)
+        batch = [payload] * per_handshake
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            sender.drop("dadaab")  # force one fresh handshake per batch
+            handshake, buffer = sender.seal_many("dadaab", pk, batch)
+            receiver.accept("nairobi", sk, handshake)
+            assert len(receiver.open_many(buffer)) == per_handshake
+        elapsed = time.perf_counter() - start
+
+        messages = rounds * per_handshake
+        results[per_handshake] = messages / elapsed
+        print(f"{per_handshake:>6} msgs/handshake: {messages / elapsed:>10.1f} msgs/s "
+              f"({messages * payload_bytes / elapsed / 1e6:.2f} MB/s, {sender.handshakes} handshakes)")
+    return results
+
 if __name__ == "__main__":
     print("Pure-Python ML-KEM baseline:")
     benchmark_pqc()
+
+    print("\nHybrid session throughput (seal + open, 256-byte payloads):")
+    benchmark_session_throughput()
     
     # Simulate solar throttling (50% CPU via stress-ng background)
     print("\nUnder simulated solar throttling (50% CPU):")
@@ -0,0 +1,64 @@
+"""
+SovereignBus Write-Behind Benchmark
+- Applies 10k set() calls against a state of --keys entries
+- Compares the previous full-file rewrite per set with debounced
+  write-behind (with and without the change journal)
+- Reports sets per second and bytes written per 10k updates
+Usage: python benchmarks/state_bus_write_behind.py --updates 10000 --keys 200 --debounce 0.5
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from core.state.sovereign_bus import SovereignBus
+
+class RewriteEverySetBus:
+    """The previous behaviour: set() rewrites the whole state file."""
+
+    def __init__(self, state_file):
+        self.state_file = state_file
+        self._state = {}
+        self.bytes_written = 0
+
+    def set(self, key, value):
+        self._state[key] = value
+        data = json.dumps(self._state, indent=2)
+        self.state_file.write_text(data)
+        self.bytes_written += len(data.encode("utf-8"))
+
+def seed(bus, keys):
+    for i in range(keys):
+        bus.set(f"agent_{i}.status", {"state": "idle", "queue_depth": 0, "heartbeat": i})
+
+def run(label, bus, updates, keys, bytes_written):
+    seed(bus, keys)
+    before = bytes_written()
+    start = time.perf_counter()
+    for i in range(updates):
+        bus.set(f"agent_{i % keys}.status", {"state": "busy", "queue_depth": i % 17, "heartbeat": i})
+    if hasattr(bus, "flush"):
+        bus.flush()
+    elapsed = time.perf_counter() - start
+    written = bytes_written() - before
+    print(f"    {label:<28} {updates / elapsed:10.0f} sets/s | {written / 1e6:8.2f} MB written "
+          f"({written / updates:8.1f} B/update)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=10_000)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--debounce", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        print(f"[*] {args.updates} updates over {args.keys} keys")
+        old = RewriteEverySetBus(workdir / "old.json")
+        run("rewrite on every set", old, args.updates, args.keys, lambda: old.bytes_written)
+        for journal in (False, True):
+            bus = SovereignBus(workdir / f"new-{journal}.json", debounce=args.debounce, journal=journal)
+            label = f"write-behind{' + journal' if journal else ''}"
+            run(label, bus, args.updates, args.keys, lambda: bus.stats["bytes_written"])
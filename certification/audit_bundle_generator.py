@@ -34,6 +34,15 @@ import asyncio
 import threading
 import time
 
+from certification.audit_export import (
+    ContentStore,
+    StreamedArray,
+    StreamingAuditExporter,
+    package_id_for,
+    streaming_json_hash,
+    write_json_document,
+)
+
 # Import iLuminara modules for evidence collection
 try:
     from certification.living_compliance import LivingCertificationEngine
@@ -105,12 +114,15 @@ class LivingEvidenceBundle:
 class AuditBundleGenerator:
     """Autonomous agent for generating living evidence bundles."""
 
-    def __init__(self, repository_root: str = "/workspaces/iLuminara-Core"):
+    def __init__(self, repository_root: str = "/workspaces/iLuminara-Core",
+                 evidence_store_path: Optional[str] = None):
         self.repository_root = Path(repository_root)
         self.evidence_patterns = self._initialize_evidence_patterns()
         self.active_bundles: Dict[str, LivingEvidenceBundle] = {}
         self.evidence_cache: Dict[str, EvidenceArtifact] = {}
         self.scanning_active = False
+        # Content-addressed blob store shared by all exported bundles
+        self.evidence_store_path = evidence_store_path or str(self.repository_root / "certification" / "evidence_store")
 
     def _initialize_evidence_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Initialize patterns for evidence collection."""
@@ -606,52 +618,64 @@ class AuditBundleGenerator:
 
         return bundle_id
 
-    def export_bundle_for_audit(self, bundle_id: str, output_path: str):
-        """Export bundle in audit-ready format."""
+    def export_bundle_for_audit(self, bundle_id: str, output_path: str, format: str = "json",
+                                base_export: Optional[str] = None, export_timestamp: Optional[str] = None):
+        """
+        Export bundle in audit-ready format.
+
+        Args:
+            format: "json" (single document), "jsonl" (streamed records) or
+                "tar" (streamed records plus deduplicated evidence blobs)
+            base_export: Previous full package; writes a delta package
+            export_timestamp: Fixed export time (ISO 8601) for reproducible output
+        """
 
         if bundle_id not in self.active_bundles:
             raise ValueError(f"Bundle {bundle_id} not found")
 
         bundle = self.active_bundles[bundle_id]
-
-        # Prepare export data
-        export_data = {
-            "bundle_metadata": {
-                "bundle_id": bundle.bundle_id,
-                "version": bundle.bundle_version,
-                "creation_timestamp": bundle.creation_timestamp.isoformat(),
-                "target_standards": bundle.target_standards,
-                "status": bundle.status.value,
-                "integrity_hash": bundle.integrity_hash,
-                "export_timestamp": datetime.datetime.utcnow().isoformat()
-            },
-            "compliance_summary": bundle.compliance_summary,
-            "validation_results": bundle.validation_results,
-            "evidence_inventory": [
-                {
-                    "artifact_id": artifact.artifact_id,
-                    "evidence_type": artifact.evidence_type.value,
-                    "source_file": artifact.source_file,
-                    "collection_timestamp": artifact.collection_timestamp.isoformat(),
-                    "content_hash": artifact.content_hash,
-                    "relevance_score": artifact.relevance_score,
-                    "iso_mapping": artifact.iso_mapping,
-                    "verification_status": artifact.verification_status,
-                    "classification": artifact.classification
-                }
-                for artifact in bundle.evidence_artifacts
-            ],
-            "auditor_access_log": bundle.auditor_access_log,
-            "export_integrity_hash": None  # Will be calculated after export
+        export_timestamp = export_timestamp or datetime.datetime.utcnow().isoformat()
+        bundle_metadata = {
+            "bundle_id": bundle.bundle_id,
+            "version": bundle.bundle_version,
+            "creation_timestamp": bundle.creation_timestamp.isoformat(),
+            "target_standards": bundle.target_standards,
+            "status": bundle.status.value,
+            "integrity_hash": bundle.integrity_hash,
+            "export_timestamp": export_timestamp
         }
 
-        # Calculate export integrity hash
-        export_content = json.dumps(export_data, sort_keys=True, default=str)
-        export_data["export_integrity_hash"] = hashlib.sha256(export_content.encode()).hexdigest()
+        if format != "json":
+            exporter = StreamingAuditExporter(self.repository_root, ContentStore(self.evidence_store_path))
+            export_integrity_hash = exporter.export(
+                output_path,
+                header=dict(bundle_metadata, package_id=package_id_for(bundle.bundle_id, export_timestamp)),
+                artifact_records=(self._artifact_export_record(a) for a in bundle.evidence_artifacts),
+                sections={
+                    "compliance_summary": bundle.compliance_summary,
+                    "validation_results": bundle.validation_results,
+                    "auditor_access_log": bundle.auditor_access_log
+                },
+                fmt=format,
+                base_export=base_export
+            )
+        else:
+            # Prepare export data
+            export_data = {
+                "bundle_metadata": bundle_metadata,
+                "compliance_summary": bundle.compliance_summary,
+                "validation_results": bundle.validation_results,
+                "evidence_inventory": StreamedArray(
+                    lambda: (self._artifact_export_record(a) for a in bundle.evidence_artifacts)),
+                "auditor_access_log": bundle.auditor_access_log,
+                "export_integrity_hash": None  # Will be calculated after export
+            }
+
+            # Calculate export integrity hash (streamed through the encoder, no intermediate string)
+            export_integrity_hash = export_data["export_integrity_hash"] = streaming_json_hash(export_data)
 
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            # Write to file, one inventory entry at a time
+            write_json_document(output_path, export_data)
 
         logger.info(f"Exported bundle {bundle_id} to {output_path}")
 
@@ -660,10 +684,25 @@ class AuditBundleGenerator:
             "timestamp": datetime.datetime.utcnow().isoformat(),
             "action": "bundle_export",
             "export_path": output_path,
+            "export_format": format,
+            "delta_base": base_export,
             "exported_by": "system"
         })
 
-        return export_data["export_integrity_hash"]
+        return export_integrity_hash
+
+    def _artifact_export_record(self, artifact: EvidenceArtifact) -> Dict[str, Any]:
+        return {
+            "artifact_id": artifact.artifact_id,
+            "evidence_type": artifact.evidence_type.value,
+            "source_file": artifact.source_file,
+            "collection_timestamp": artifact.collection_timestamp.isoformat(),
+            "content_hash": artifact.content_hash,
+            "relevance_score": artifact.relevance_score,
+            "iso_mapping": artifact.iso_mapping,
+            "verification_status": artifact.verification_status,
+            "classification": artifact.classification
+        }
 
     def get_bundle_status(self, bundle_id: str) -> Dict[str, Any]:
         """Get status of a specific bundle."""
@@ -0,0 +1,464 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Streaming Audit Package Export
+
+Shared by LivingEvidenceEngine and AuditBundleGenerator. Audit packages are
+written record by record, so memory stays flat regardless of evidence volume:
+
+- "jsonl": one JSON record per line (header, artifacts, removals, sections,
+  trailer). A SHA-256 over every byte written is carried along and recorded
+  in the trailer as the export integrity hash.
+- "tar": evidence blobs under blobs/sha256/<aa>/<digest> plus manifest.jsonl
+  (same records as above). Blobs are streamed from a content-addressed store.
+- "json": the legacy single document, written by write_json_document one
+  inventory entry at a time (StreamedArray) instead of via json.dump.
+
+Evidence blobs live in a ContentStore keyed by SHA-256, so evidence shared
+between bundles is stored once. A delta export against a previous package
+lists only added/changed artifacts and removals, and omits blobs already
+shipped in the base package.
+
+Output is deterministic: records are ordered by (source_file, content_hash)
+through a bounded external merge sort, JSON is canonical and tar members
+carry fixed metadata, so the same evidence and export timestamp give
+byte-identical packages.
+"""
+
+import hashlib
+import heapq
+import io
+import json
+import logging
+import os
+import tarfile
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT_VERSION = 1
+EXPORT_FORMATS = ("json", "jsonl", "tar")
+MANIFEST_MEMBER = "manifest.jsonl"
+COPY_BUFFER_SIZE = 1 << 20
+SORT_CHUNK_SIZE = 10000
+
+
+def canonical_json(record: Dict[str, Any]) -> bytes:
+    """Canonical single-line JSON encoding used for every exported record."""
+    return json.dumps(record, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class StreamedArray:
+    """
+    JSON array encoded one item at a time by iterencode_document.
+
+    Takes a factory rather than an iterator so the same document can be
+    encoded twice (integrity hash, then file) without holding the items.
+    """
+
+    def __init__(self, items: Callable[[], Iterable[Any]]):
+        self._items = items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items())
+
+
+def iterencode_document(document: Dict[str, Any], indent: Optional[int] = None,
+                        sort_keys: bool = False) -> Iterator[str]:
+    """
+    Encode a top-level dict like json.dumps(document, indent, sort_keys, default=str).
+
+    StreamedArray values are encoded item by item; other values are encoded
+    whole, so only one inventory entry is held as text at a time.
+    """
+    encoder = json.JSONEncoder(indent=indent, sort_keys=sort_keys, default=str)
+    keys = sorted(document) if sort_keys else list(document)
+    if not keys:
+        yield "{}"
+        return
+
+    if indent is None:
+        item_separator, newline, nested_newline, closing = ", ", "", "", ""
+    else:
+        item_separator = ","
+        newline = "\n" + " " * indent
+        nested_newline = newline + " " * indent
+        closing = "\n"
+
+    yield "{"
+    for position, key in enumerate(keys):
+        yield (item_separator if position else "") + newline + json.dumps(key) + ": "
+        value = document[key]
+        if not isinstance(value, StreamedArray):
+            yield encoder.encode(value).replace("\n", newline)
+            continue
+        empty = True
+        for item in value:
+            yield ("[" if empty else item_separator) + nested_newline + encoder.encode(item).replace("\n", nested_newline)
+            empty = False
+        yield "[]" if empty else newline + "]"
+    yield closing + "}"
+
+
+def write_json_document(output_path: str, document: Dict[str, Any], indent: int = 2):
+    """Write a single-document export without materializing it (see iterencode_document)."""
+    with open(output_path, "w") as f:
+        for chunk in iterencode_document(document, indent=indent):
+            f.write(chunk)
+
+
+def streaming_json_hash(data: Any) -> str:
+    """SHA-256 of json.dumps(data, sort_keys=True, default=str) without building the string."""
+    hasher = hashlib.sha256()
+    if isinstance(data, dict):
+        chunks = iterencode_document(data, sort_keys=True)
+    else:
+        chunks = json.JSONEncoder(sort_keys=True, default=str).iterencode(data)
+    for chunk in chunks:
+        hasher.update(chunk.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def package_id_for(bundle_id: str, export_timestamp: str) -> str:
+    """Deterministic package id for a bundle export."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"iluminara-audit:{bundle_id}:{export_timestamp}"))
+
+
+class ContentStore:
+    """
+    Content-addressed blob store (blobs/<aa>/<sha256>) shared across bundles.
+
+    Files are ingested through a temporary file and renamed into place under
+    their actual digest, so a blob's name always matches its bytes.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        return self.path_for(digest).is_file()
+
+    def ingest(self, source: Path, expected_digest: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Copy a file into the store unless its expected digest is already present.
+
+        Returns:
+            (digest, size) of the stored blob
+        """
+        if expected_digest and self.has(expected_digest):
+            return expected_digest, self.path_for(expected_digest).stat().st_size
+
+        staging = self.root / "staging"
+        staging.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=staging)
+        try:
+            with os.fdopen(fd, "wb") as out, open(source, "rb") as src:
+                buffer = bytearray(COPY_BUFFER_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+                    out.write(view[:n])
+                    size += n
+            digest = hasher.hexdigest()
+            target = self.path_for(digest)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return digest, size
+
+
+class HashingWriter:
+    """Line writer that keeps a rolling SHA-256 over everything written."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.hasher = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write_record(self, record: Dict[str, Any]):
+        line = canonical_json(record) + b"\n"
+        self.hasher.update(line)
+        self.stream.write(line)
+        self.bytes_written += len(line)
+
+    def hexdigest(self) -> str:
+        return self.hasher.hexdigest()
+
+
+def load_export_index(path: str) -> Tuple[Dict[str, str], Optional[str]]:
+    """
+    Read a previous audit package (jsonl, tar or legacy json).
+
+    Returns:
+        ({source_file: content_hash}, export integrity hash)
+    """
+    if tarfile.is_tarfile(path):
+        with tarfile.open(path, "r") as tar:
+            member = tar.extractfile(MANIFEST_MEMBER)
+            return _index_from_lines(io.TextIOWrapper(member, encoding="utf-8"))
+
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        f.seek(0)
+        try:
+            is_jsonl = json.loads(first).get("record_type") == "header"
+        except ValueError:
+            is_jsonl = False
+        if is_jsonl:
+            return _index_from_lines(f)
+
+        # Legacy single-document export
+        data = json.load(f)
+    index = {item["source_file"]: item["content_hash"] for item in data.get("evidence_inventory", [])}
+    integrity = data.get("export_integrity_hash") or data.get("audit_package", {}).get("export_integrity_hash")
+    return index, integrity
+
+
+def _index_from_lines(lines: Iterable[str]) -> Tuple[Dict[str, str], Optional[str]]:
+    index: Dict[str, str] = {}
+    integrity = None
+    for line in lines:
+        record = json.loads(line)
+        record_type = record.get("record_type")
+        if record_type == "artifact":
+            index[record["source_file"]] = record["content_hash"]
+        elif record_type == "removed":
+            index.pop(record["source_file"], None)
+        elif record_type == "header" and record.get("delta_base"):
+            # A delta package is applied on top of its own base index
+            raise ValueError("Delta packages cannot be used as a delta base; export a full package first")
+        elif record_type == "trailer":
+            integrity = record.get("export_integrity_hash")
+    return index, integrity
+
+
+class StreamingAuditExporter:
+    """
+    Writes an audit package record by record.
+
+    Usage:
+        exporter = StreamingAuditExporter(repository_root, ContentStore(store_dir))
+        digest = exporter.export(output_path, header, artifact_records, sections, fmt="tar")
+
+    artifact_records must carry "source_file" and "content_hash"; they are
+    written in (source_file, content_hash) order. At most SORT_CHUNK_SIZE
+    records are held in memory: larger inventories are sorted in chunks
+    spilled to temporary files and merged.
+    """
+
+    def __init__(self, repository_root: Path, content_store: Optional[ContentStore] = None,
+                 sort_chunk_size: int = SORT_CHUNK_SIZE):
+        self.repository_root = Path(repository_root)
+        self.content_store = content_store
+        self.sort_chunk_size = sort_chunk_size
+        self.last_export_stats: Dict[str, Any] = {}
+
+    def export(self,
+               output_path: str,
+               header: Dict[str, Any],
+               artifact_records: Iterable[Dict[str, Any]],
+               sections: Dict[str, Any],
+               fmt: str = "jsonl",
+               base_export: Optional[str] = None) -> str:
+        """
+        Export a package and return its export integrity hash.
+
+        Args:
+            output_path: Destination file
+            header: Package metadata (bundle id, timestamps, standards, ...)
+            artifact_records: Evidence inventory entries
+            sections: Named summary sections written after the inventory
+            fmt: "jsonl" or "tar"
+            base_export: Previous full package; produces a delta package
+        """
+        if fmt not in ("jsonl", "tar"):
+            raise ValueError(f"Unsupported streaming export format: {fmt}")
+        if fmt == "tar" and self.content_store is None:
+            raise ValueError("tar export requires a content store")
+
+        base_index: Dict[str, str] = {}
+        header = dict(header, record_type="header", format_version=EXPORT_FORMAT_VERSION, delta_base=None)
+        if base_export:
+            base_index, base_hash = load_export_index(base_export)
+            header["delta_base"] = {"export_integrity_hash": base_hash, "artifact_count": len(base_index)}
+
+        records = _ordered_records(artifact_records, self.sort_chunk_size)
+        if fmt == "jsonl":
+            with open(output_path, "wb") as out:
+                writer = HashingWriter(out)
+                digest = self._write_manifest(writer, header, records, sections, base_index, blob_sink=None)
+        else:
+            digest = self._write_tar(output_path, header, records, sections, base_index)
+
+        logger.info(f"Exported audit package {output_path} ({fmt}): {self.last_export_stats}")
+        return digest
+
+    def _write_manifest(self, writer: HashingWriter, header: Dict[str, Any], records: Iterable[Dict[str, Any]],
+                        sections: Dict[str, Any], base_index: Dict[str, str], blob_sink) -> str:
+        stats = {"artifacts": 0, "unchanged_skipped": 0, "removed": 0, "blobs_written": 0,
+                 "blobs_deduplicated": 0, "blobs_missing": 0}
+        writer.write_record(header)
+
+        # Records arrive in source order, so removals fall out of a merge walk over the base sources
+        base_sources = iter(sorted(base_index))
+        next_base = next(base_sources, None)
+        removed: List[str] = []
+        shipped_blobs = set(base_index.values())
+        for record in records:
+            while next_base is not None and next_base < record["source_file"]:
+                removed.append(next_base)
+                next_base = next(base_sources, None)
+            if next_base == record["source_file"]:
+                next_base = next(base_sources, None)
+            if base_index.get(record["source_file"]) == record["content_hash"]:
+                stats["unchanged_skipped"] += 1
+                continue
+            record = dict(record, record_type="artifact")
+            if self.content_store is not None:
+                record["blob"] = self._store_blob(record, shipped_blobs, blob_sink, stats)
+            writer.write_record(record)
+            stats["artifacts"] += 1
+
+        if next_base is not None:
+            removed.append(next_base)
+            removed.extend(base_sources)
+        for source_file in removed:
+            writer.write_record({"record_type": "removed", "source_file": source_file,
+                                 "content_hash": base_index[source_file]})
+            stats["removed"] += 1
+
+        for name in sorted(sections):
+            writer.write_record({"record_type": "section", "name": name, "data": sections[name]})
+
+        digest = writer.hexdigest()
+        writer.write_record(dict(stats, record_type="trailer", export_integrity_hash=digest,
+                                 bytes_hashed=writer.bytes_written))
+        self.last_export_stats = stats
+        return digest
+
+    def _store_blob(self, record: Dict[str, Any], shipped_blobs: set, blob_sink, stats: Dict[str, int]) -> Optional[str]:
+        """Ingest the artifact's file into the store; returns the blob digest or None."""
+        expected = record["content_hash"]
+        if not self.content_store.has(expected):
+            source = self.repository_root / record["source_file"]
+            try:
+                digest, _size = self.content_store.ingest(source, expected)
+            except OSError:
+                stats["blobs_missing"] += 1
+                return None
+            if digest != expected:
+                # File changed after collection: the stored blob no longer matches the evidence hash
+                logger.warning(f"Evidence changed since collection: {record['source_file']}")
+                stats["blobs_missing"] += 1
+                return None
+
+        if expected in shipped_blobs:
+            stats["blobs_deduplicated"] += 1
+        else:
+            shipped_blobs.add(expected)
+            if blob_sink is not None:
+                blob_sink(expected)
+            stats["blobs_written"] += 1
+        return f"sha256:{expected}"
+
+    def _write_tar(self, output_path: str, header: Dict[str, Any], records: Iterable[Dict[str, Any]],
+                   sections: Dict[str, Any], base_index: Dict[str, str]) -> str:
+        with tarfile.open(output_path, "w", format=tarfile.PAX_FORMAT) as tar, \
+                tempfile.SpooledTemporaryFile(max_size=8 << 20) as manifest:
+
+            def add_blob(digest: str):
+                path = self.content_store.path_for(digest)
+                with open(path, "rb") as blob:
+                    tar.addfile(_tar_info(f"blobs/sha256/{digest[:2]}/{digest}", path.stat().st_size), blob)
+
+            writer = HashingWriter(manifest)
+            digest = self._write_manifest(writer, header, records, sections, base_index, blob_sink=add_blob)
+            size = manifest.tell()
+            manifest.seek(0)
+            tar.addfile(_tar_info(MANIFEST_MEMBER, size), manifest)
+        return digest
+
+
+def _record_order(record: Dict[str, Any]) -> Tuple[str, str]:
+    return record["source_file"], record["content_hash"]
+
+
+def _ordered_records(records: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield records in export order, holding at most chunk_size of them in memory."""
+    chunk: List[Dict[str, Any]] = []
+    runs = []
+    try:
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                chunk.sort(key=_record_order)
+                runs.append(_spill_run(chunk))
+                chunk = []
+        chunk.sort(key=_record_order)
+        if not runs:
+            yield from chunk
+            return
+        # heapq.merge prefers earlier runs on ties, which keeps the order stable like sorted()
+        yield from heapq.merge(*(_read_run(run) for run in runs), chunk, key=_record_order)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _spill_run(records: List[Dict[str, Any]]):
+    run = tempfile.TemporaryFile()
+    for record in records:
+        run.write(canonical_json(record) + b"\n")
+    run.seek(0)
+    return run
+
+
+def _read_run(run) -> Iterator[Dict[str, Any]]:
+    for line in run:
+        yield json.loads(line)
+
+
+def _tar_info(name: str, size: int) -> tarfile.TarInfo:
+    """Tar member header with fixed metadata for reproducible archives."""
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mode = 0o644
+    info.mtime = 0
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def iter_package_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the records of a jsonl or tar package (for auditors and tests)."""
+    if tarfile.is_tarfile(path):
+        with tarfile.open(path, "r") as tar:
+            for line in io.TextIOWrapper(tar.extractfile(MANIFEST_MEMBER), encoding="utf-8"):
+                yield json.loads(line)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
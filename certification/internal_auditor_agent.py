@@ -15,14 +15,26 @@ Autonomous Non-Conformity Detection and Remediation System
 
 This module implements an intelligent agent that continuously monitors
 ISO compliance, detects non-conformities, and triggers automated remediation.
+
+Scheduled audits are driven by a min-heap of next-due times, and each due
+audit runs on its own runner so a long monthly audit never delays the daily
+checks. Within an audit, independent checks run concurrently on a bounded
+pool with per-check timeouts; checks whose input files are unchanged reuse
+their previous findings. Findings are persisted in an indexed SQLite store.
 """
 
 import asyncio
+import heapq
 import json
 import datetime
 import hashlib
+import os
+import sqlite3
+import stat as stat_module
 import uuid
-from typing import Dict, List, Any, Optional, Tuple
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
@@ -87,6 +99,17 @@ class AuditFinding:
             data['remediation_deadline'] = self.remediation_deadline.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditFinding":
+        """Rebuild a finding from to_dict() output."""
+        data = dict(data)
+        data['severity'] = AuditSeverity(data['severity'])
+        data['remediation_status'] = RemediationStatus(data['remediation_status'])
+        data['detection_timestamp'] = datetime.datetime.fromisoformat(data['detection_timestamp'])
+        if data.get('remediation_deadline'):
+            data['remediation_deadline'] = datetime.datetime.fromisoformat(data['remediation_deadline'])
+        return cls(**data)
+
 @dataclass
 class AuditReport:
     """Represents a complete audit report."""
@@ -114,20 +137,241 @@ class AuditReport:
         data['findings'] = [finding.to_dict() for finding in self.findings]
         return data
 
+class FindingsStore(MutableMapping):
+    """
+    SQLite-backed findings store, indexed by severity and remediation status.
+
+    Behaves like the former in-memory dict of finding_id -> AuditFinding
+    (assignment replaces a finding). Re-recording a known finding through
+    record() only refreshes last_seen, so remediation status updates made
+    through update_status() are preserved.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS findings (
+                    finding_id TEXT PRIMARY KEY,
+                    check_name TEXT,
+                    severity TEXT NOT NULL,
+                    remediation_status TEXT NOT NULL,
+                    category TEXT,
+                    iso_standard TEXT,
+                    detection_timestamp TEXT,
+                    last_seen TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_findings_severity_status ON findings (severity, remediation_status);
+                CREATE INDEX IF NOT EXISTS idx_findings_status ON findings (remediation_status);
+                CREATE INDEX IF NOT EXISTS idx_findings_check ON findings (check_name);
+            """)
+
+    def record(self, findings: List[AuditFinding], check_name: Optional[str] = None):
+        """Insert new findings; refresh last_seen on known ones."""
+        now = datetime.datetime.now().isoformat()
+        rows = [
+            (f.finding_id, check_name, f.severity.value, f.remediation_status.value, f.category,
+             f.iso_standard, f.detection_timestamp.isoformat(), now, json.dumps(f.to_dict()))
+            for f in findings
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(finding_id) DO UPDATE SET last_seen = excluded.last_seen",
+                rows
+            )
+
+    def update_status(self, finding_id: str, status: RemediationStatus) -> bool:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT data FROM findings WHERE finding_id = ?", (finding_id,)).fetchone()
+            if row is None:
+                return False
+            data = json.loads(row[0])
+            data['remediation_status'] = status.value
+            self._conn.execute(
+                "UPDATE findings SET remediation_status = ?, data = ? WHERE finding_id = ?",
+                (status.value, json.dumps(data), finding_id)
+            )
+        return True
+
+    def __getitem__(self, finding_id: str) -> AuditFinding:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM findings WHERE finding_id = ?", (finding_id,)).fetchone()
+        if row is None:
+            raise KeyError(finding_id)
+        return AuditFinding.from_dict(json.loads(row[0]))
+
+    def __setitem__(self, finding_id: str, finding: AuditFinding):
+        f = finding
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO findings VALUES (?, "
+                "(SELECT check_name FROM findings WHERE finding_id = ?), ?, ?, ?, ?, ?, ?, ?)",
+                (finding_id, finding_id, f.severity.value, f.remediation_status.value, f.category, f.iso_standard,
+                 f.detection_timestamp.isoformat(), datetime.datetime.now().isoformat(), json.dumps(f.to_dict()))
+            )
+
+    def __delitem__(self, finding_id: str):
+        with self._lock, self._conn:
+            if self._conn.execute("DELETE FROM findings WHERE finding_id = ?", (finding_id,)).rowcount == 0:
+                raise KeyError(finding_id)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            ids = [row[0] for row in self._conn.execute("SELECT finding_id FROM findings ORDER BY rowid")]
+        return iter(ids)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+
+    def __contains__(self, finding_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM findings WHERE finding_id = ?",
+                                      (finding_id,)).fetchone() is not None
+
+    def query(self,
+              severities: Optional[List[AuditSeverity]] = None,
+              statuses: Optional[List[RemediationStatus]] = None,
+              limit: Optional[int] = None) -> List[AuditFinding]:
+        """Findings filtered by severity and/or remediation status, newest first."""
+        sql = "SELECT data FROM findings"
+        clauses, params = [], []
+        if severities:
+            clauses.append(f"severity IN ({','.join('?' * len(severities))})")
+            params += [s.value for s in severities]
+        if statuses:
+            clauses.append(f"remediation_status IN ({','.join('?' * len(statuses))})")
+            params += [s.value for s in statuses]
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY detection_timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [AuditFinding.from_dict(json.loads(row[0])) for row in rows]
+
+    def counts(self) -> Dict[Tuple[str, str], int]:
+        """Finding counts keyed by (severity, remediation_status)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT severity, remediation_status, COUNT(*) FROM findings GROUP BY severity, remediation_status"
+            ).fetchall()
+        return {(severity, status): count for severity, status, count in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class AuditScheduler:
+    """
+    Cron-like scheduler: a min-heap of (next_due, frequency).
+
+    Fire times match the audit calendar (daily 06:00, weekly Monday 07:00,
+    monthly 1st 08:00, quarterly 1st of Jan/Apr/Jul/Oct 09:00); "continuous"
+    fires immediately and then every five minutes.
+    """
+
+    CONTINUOUS_INTERVAL = datetime.timedelta(minutes=5)
+
+    def __init__(self, frequencies: List[str], now: Optional[datetime.datetime] = None):
+        now = now or datetime.datetime.now()
+        self._heap: List[Tuple[datetime.datetime, str]] = []
+        for frequency in frequencies:
+            first = now if frequency == "continuous" else self.next_run_after(frequency, now)
+            heapq.heappush(self._heap, (first, frequency))
+
+    @classmethod
+    def next_run_after(cls, frequency: str, after: datetime.datetime) -> datetime.datetime:
+        """First fire time of `frequency` strictly after `after`."""
+        if frequency == "continuous":
+            return after + cls.CONTINUOUS_INTERVAL
+
+        if frequency == "daily":
+            candidate = after.replace(hour=6, minute=0, second=0, microsecond=0)
+            return candidate if candidate > after else candidate + datetime.timedelta(days=1)
+
+        if frequency == "weekly":
+            candidate = after.replace(hour=7, minute=0, second=0, microsecond=0)
+            candidate += datetime.timedelta(days=(0 - candidate.weekday()) % 7)
+            return candidate if candidate > after else candidate + datetime.timedelta(days=7)
+
+        if frequency in ("monthly", "quarterly"):
+            hour, months = (8, range(1, 13)) if frequency == "monthly" else (9, (1, 4, 7, 10))
+            year, month = after.year, after.month
+            while True:
+                if month in months:
+                    candidate = datetime.datetime(year, month, 1, hour)
+                    if candidate > after:
+                        return candidate
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        raise ValueError(f"Unknown audit frequency: {frequency}")
+
+    def pop_due(self, now: datetime.datetime) -> List[str]:
+        """Frequencies due at `now`; each is rescheduled to its next fire time."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, frequency = heapq.heappop(self._heap)
+            due.append(frequency)
+            heapq.heappush(self._heap, (self.next_run_after(frequency, now), frequency))
+        return due
+
+    def seconds_until_next(self, now: datetime.datetime) -> float:
+        if not self._heap:
+            return float(self.CONTINUOUS_INTERVAL.total_seconds())
+        return max(0.0, (self._heap[0][0] - now).total_seconds())
+
+    def upcoming(self) -> List[Tuple[datetime.datetime, str]]:
+        return sorted(self._heap)
+
 class InternalAuditorAgent:
     """
     Autonomous internal auditor that continuously monitors compliance
     and triggers remediation for non-conformities.
     """
 
-    def __init__(self, repository_root: Path):
+    REQUIRED_EVIDENCE_FILES = (
+        "AI_Ethics_Policy.md",
+        "SoA.csv",
+        "PIA_template.md",
+        "Risk_Treatment_Plan.md",
+        "living_evidence.py",
+        "standard_extensions.py"
+    )
+
+    FULL_AUDIT_CHECKS = (
+        "evidence_integrity",
+        "access_controls",
+        "iso_27001_compliance",
+        "iso_42001_compliance",
+        "iso_13485_validation",
+        "iso_14971_review"
+    )
+
+    def __init__(self, repository_root: Path, max_workers: int = 4, check_timeout: float = 300.0):
         self.repository_root = repository_root
         self.audit_reports_dir = repository_root / "certification" / "audit_reports"
         self.audit_reports_dir.mkdir(exist_ok=True)
 
-        self.findings_db: Dict[str, AuditFinding] = {}
+        self.findings_db = FindingsStore(self.audit_reports_dir / "findings.sqlite")
         self.active_audits: Dict[str, AuditReport] = {}
 
+        # Bounded pool for check execution; check_cache maps check -> (input fingerprint, findings)
+        self.max_workers = max_workers
+        self.check_timeout = check_timeout
+        self._check_pool: Optional[ThreadPoolExecutor] = None
+        # Timed-out checks still occupying a thread; at most max_workers are tolerated
+        self._hung_checks: List[Future] = []
+        self._check_cache: Dict[str, Tuple[Tuple, List[AuditFinding]]] = {}
+        self._cache_lock = threading.Lock()
+        self.check_stats: Dict[str, Dict[str, float]] = {}
+
         # Compliance rules database
         self.compliance_rules = self._load_compliance_rules()
 
@@ -142,6 +386,17 @@ class InternalAuditorAgent:
         # Start background monitoring
         self.monitoring_active = False
         self.monitoring_thread = None
+        self.scheduler: Optional[AuditScheduler] = None
+        self._stop_event = threading.Event()
+        self._audit_runner: Optional[ThreadPoolExecutor] = None
+        self._running_audits: Dict[str, Any] = {}
+
+    @property
+    def check_pool(self) -> ThreadPoolExecutor:
+        with self._cache_lock:
+            if self._check_pool is None:
+                self._check_pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="audit-check")
+            return self._check_pool
 
     def _load_compliance_rules(self) -> Dict[str, Dict]:
         """Load compliance rules for automated checking."""
@@ -150,49 +405,60 @@ class InternalAuditorAgent:
                 "description": "Verify evidence artifact integrity",
                 "check_function": self._check_evidence_integrity,
                 "frequency": "daily",
-                "severity": AuditSeverity.HIGH
+                "severity": AuditSeverity.HIGH,
+                "inputs": ["certification"] + [f"certification/{name}" for name in self.REQUIRED_EVIDENCE_FILES]
             },
             "access_controls": {
                 "description": "Verify access control implementation",
                 "check_function": self._check_access_controls,
                 "frequency": "daily",
-                "severity": AuditSeverity.CRITICAL
+                "severity": AuditSeverity.CRITICAL,
+                "inputs": ["security.txt", "SECURITY.md"]
             },
             "iso_27001_compliance": {
                 "description": "Check ISO 27001 control implementation",
                 "check_function": self._check_iso_27001_compliance,
                 "frequency": "weekly",
-                "severity": AuditSeverity.HIGH
+                "severity": AuditSeverity.HIGH,
+                "inputs": ["certification/SoA.csv"]
             },
             "iso_42001_compliance": {
                 "description": "Check ISO 42001 AI ethics compliance",
                 "check_function": self._check_iso_42001_compliance,
                 "frequency": "weekly",
-                "severity": AuditSeverity.HIGH
+                "severity": AuditSeverity.HIGH,
+                "inputs": ["certification/AI_Ethics_Policy.md"]
             },
             "iso_13485_validation": {
                 "description": "Validate ISO 13485 medical device compliance",
                 "check_function": self._check_iso_13485_compliance,
                 "frequency": "monthly",
-                "severity": AuditSeverity.CRITICAL
+                "severity": AuditSeverity.CRITICAL,
+                "inputs": ["fhir_bundle.json", "simulated_outbreak.json"]
             },
             "iso_14971_review": {
                 "description": "Review ISO 14971 risk management",
                 "check_function": self._check_iso_14971_compliance,
                 "frequency": "monthly",
-                "severity": AuditSeverity.HIGH
+                "severity": AuditSeverity.HIGH,
+                "inputs": ["certification/Risk_Treatment_Plan.md"]
             },
             "full_compliance_audit": {
                 "description": "Comprehensive compliance audit",
                 "check_function": self._run_full_compliance_audit,
                 "frequency": "monthly",
-                "severity": AuditSeverity.CRITICAL
+                "severity": AuditSeverity.CRITICAL,
+                # Expanded into its member checks so they run in parallel and share the cache
+                "composite_of": list(self.FULL_AUDIT_CHECKS)
             }
         }
 
     async def start_monitoring(self):
         """Start continuous compliance monitoring."""
         self.monitoring_active = True
+        self._stop_event.clear()
+        self.scheduler = AuditScheduler(list(self.audit_schedule) + ["continuous"])
+        self._audit_runner = ThreadPoolExecutor(len(self.audit_schedule) + 1, thread_name_prefix="audit-runner")
         logger.info("Starting Internal Auditor Agent monitoring...")
 
         # Start background monitoring thread
@@ -203,43 +469,37 @@ class InternalAuditorAgent:
     def stop_monitoring(self):
         """Stop continuous monitoring."""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join()
+        if self._audit_runner:
+            self._audit_runner.shutdown(wait=True)
+            self._audit_runner = None
         logger.info("Internal Auditor Agent monitoring stopped.")
 
     def _monitoring_loop(self):
-        """Background monitoring loop."""
+        """Background monitoring loop: sleep until the next due audit, then dispatch it."""
         while self.monitoring_active:
             try:
-                # Run scheduled audits
-                current_time = datetime.datetime.now()
-
-                # Daily checks at 6 AM
-                if current_time.hour == 6 and current_time.minute < 5:
-                    asyncio.run(self._run_scheduled_audit("daily"))
-
-                # Weekly checks on Monday at 7 AM
-                elif (current_time.weekday() == 0 and current_time.hour == 7
-                      and current_time.minute < 5):
-                    asyncio.run(self._run_scheduled_audit("weekly"))
-
-                # Monthly checks on 1st at 8 AM
-                elif (current_time.day == 1 and current_time.hour == 8
-                      and current_time.minute < 5):
-                    asyncio.run(self._run_scheduled_audit("monthly"))
-
-                # Quarterly checks on 1st of Jan/Apr/Jul/Oct at 9 AM
-                elif (current_time.day == 1 and current_time.month in [1, 4, 7, 10]
-                      and current_time.hour == 9 and current_time.minute < 5):
-                    asyncio.run(self._run_scheduled_audit("quarterly"))
-
-                # Continuous monitoring every 5 minutes
-                asyncio.run(self._run_continuous_monitoring())
-
+                for frequency in self.scheduler.pop_due(datetime.datetime.now()):
+                    self._dispatch_scheduled(frequency)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
 
-            time.sleep(300)  # Sleep for 5 minutes
+            self._stop_event.wait(self.scheduler.seconds_until_next(datetime.datetime.now()))
+
+    def _dispatch_scheduled(self, frequency: str):
+        """Run a due audit on its own runner thread; skip it if the previous run is still going."""
+        running = self._running_audits.get(frequency)
+        if running is not None and not running.done():
+            logger.warning(f"Skipping {frequency} audit: previous run still in progress")
+            return
+
+        if frequency == "continuous":
+            job = self._run_continuous_monitoring
+        else:
+            job = lambda: self._run_scheduled_audit(frequency)
+        self._running_audits[frequency] = self._audit_runner.submit(asyncio.run, job())
 
     async def _run_scheduled_audit(self, frequency: str):
         """Run scheduled audit for given frequency."""
@@ -295,37 +555,10 @@ class InternalAuditorAgent:
 
         self.active_audits[audit_id] = audit_report
 
-        findings = []
-
-        # Run checks for each scope item
-        for check_name in scope:
-            if check_name in self.compliance_rules:
-                rule = self.compliance_rules[check_name]
-                try:
-                    check_findings = await rule["check_function"]()
-                    findings.extend(check_findings)
-                    logger.info(f"Completed check: {check_name} - {len(check_findings)} findings")
-                except Exception as e:
-                    logger.error(f"Error running check {check_name}: {e}")
-                    # Create error finding
-                    error_finding = AuditFinding(
-                        finding_id=f"ERROR-{uuid.uuid4().hex[:8]}",
-                        title=f"Check Execution Error: {check_name}",
-                        description=f"Failed to execute compliance check: {str(e)}",
-                        severity=AuditSeverity.HIGH,
-                        category="System Error",
-                        iso_standard="N/A",
-                        evidence_location="internal_auditor_agent.py",
-                        detection_timestamp=datetime.datetime.now(),
-                        remediation_deadline=datetime.datetime.now() + datetime.timedelta(days=1),
-                        remediation_status=RemediationStatus.NOT_STARTED,
-                        remediation_actions=["Investigate error", "Fix check implementation"],
-                        risk_impact="Audit reliability compromised",
-                        compliance_impact="Unable to verify compliance",
-                        assigned_owner="System Administrator",
-                        verification_status="pending"
-                    )
-                    findings.append(error_finding)
+        # Run independent checks concurrently (composite rules expand into their members)
+        check_names = self._expand_scope(scope)
+        results = await asyncio.gather(*(self._run_check(name) for name in check_names))
+        findings = [finding for check_findings in results for finding in check_findings]
 
         # Calculate compliance score
         compliance_score = self._calculate_compliance_score(findings)
@@ -346,6 +579,112 @@ class InternalAuditorAgent:
 
         return audit_report
 
+    def _expand_scope(self, scope: List[str]) -> List[str]:
+        """Known checks in scope order, composites expanded, duplicates dropped."""
+        expanded: List[str] = []
+        for check_name in scope:
+            rule = self.compliance_rules.get(check_name)
+            if rule is None:
+                continue
+            for name in rule.get("composite_of", [check_name]):
+                if name not in expanded:
+                    expanded.append(name)
+        return expanded
+
+    def _input_fingerprint(self, rule: Dict[str, Any]) -> Optional[Tuple]:
+        """(path, mtime_ns, size) of each declared input; None when the rule declares none."""
+        if "inputs" not in rule:
+            return None
+        fingerprint = []
+        for relative in rule["inputs"]:
+            try:
+                stat = os.stat(self.repository_root / relative)
+                if stat_module.S_ISDIR(stat.st_mode):
+                    # Directory inputs only matter for existence; their mtime churns with unrelated files
+                    fingerprint.append((relative, "dir", None))
+                else:
+                    fingerprint.append((relative, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append((relative, None, None))
+        return tuple(fingerprint)
+
+    async def _run_check(self, check_name: str) -> List[AuditFinding]:
+        """Run one check on the pool with a timeout, reusing cached findings for unchanged inputs."""
+        rule = self.compliance_rules[check_name]
+        stats = self.check_stats.setdefault(check_name, {"runs": 0, "cache_hits": 0, "timeouts": 0, "last_duration_s": 0.0})
+        fingerprint = self._input_fingerprint(rule)
+        with self._cache_lock:
+            cached = self._check_cache.get(check_name)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            stats["cache_hits"] += 1
+            logger.info(f"Completed check: {check_name} - {len(cached[1])} findings (inputs unchanged)")
+            return list(cached[1])
+
+        timeout = rule.get("timeout", self.check_timeout)
+        with self._cache_lock:
+            self._hung_checks = [future for future in self._hung_checks if not future.done()]
+            hung = len(self._hung_checks)
+        if hung >= self.max_workers:
+            logger.error(f"Not running check {check_name}: {hung} earlier checks are still hung")
+            return [self._check_error_finding(check_name, f"{hung} earlier checks still hung")]
+
+        started = time.perf_counter()
+        check_function = rule["check_function"]
+        # The check coroutines do blocking file I/O, so each runs on its own loop in a pool thread
+        future = self.check_pool.submit(lambda: asyncio.run(check_function()))
+        try:
+            check_findings = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            logger.error(f"Check {check_name} timed out after {timeout}s")
+            if not future.done():
+                self._retire_check_pool(future)
+            return [self._check_error_finding(check_name, f"timed out after {timeout}s")]
+        except Exception as e:
+            logger.error(f"Error running check {check_name}: {e}")
+            return [self._check_error_finding(check_name, str(e))]
+        finally:
+            stats["runs"] += 1
+            stats["last_duration_s"] = round(time.perf_counter() - started, 3)
+
+        if fingerprint is not None:
+            with self._cache_lock:
+                self._check_cache[check_name] = (fingerprint, list(check_findings))
+        logger.info(f"Completed check: {check_name} - {len(check_findings)} findings")
+        return check_findings
+
+    def _retire_check_pool(self, hung: Future):
+        """
+        A thread cannot be interrupted, so a hung check keeps its worker. Hand
+        later checks a fresh pool; the old one finishes its queue and its
+        threads exit when their checks return.
+        """
+        with self._cache_lock:
+            self._hung_checks.append(hung)
+            pool, self._check_pool = self._check_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _check_error_finding(self, check_name: str, error: str) -> AuditFinding:
+        """Finding recorded when a check fails to execute."""
+        return AuditFinding(
+            finding_id=f"ERROR-{uuid.uuid4().hex[:8]}",
+            title=f"Check Execution Error: {check_name}",
+            description=f"Failed to execute compliance check: {error}",
+            severity=AuditSeverity.HIGH,
+            category="System Error",
+            iso_standard="N/A",
+            evidence_location="internal_auditor_agent.py",
+            detection_timestamp=datetime.datetime.now(),
+            remediation_deadline=datetime.datetime.now() + datetime.timedelta(days=1),
+            remediation_status=RemediationStatus.NOT_STARTED,
+            remediation_actions=["Investigate error", "Fix check implementation"],
+            risk_impact="Audit reliability compromised",
+            compliance_impact="Unable to verify compliance",
+            assigned_owner="System Administrator",
+            verification_status="pending"
+        )
+
     async def _check_evidence_integrity(self) -> List[AuditFinding]:
         """Check evidence artifact integrity."""
         findings = []
@@ -373,16 +712,7 @@ class InternalAuditorAgent:
             return findings
 
         # Check for required evidence files
-        required_files = [
-            "AI_Ethics_Policy.md",
-            "SoA.csv",
-            "PIA_template.md",
-            "Risk_Treatment_Plan.md",
-            "living_evidence.py",
-            "standard_extensions.py"
-        ]
-
-        for filename in required_files:
+        for filename in self.REQUIRED_EVIDENCE_FILES:
             file_path = evidence_dir / filename
             if not file_path.exists():
                 findings.append(AuditFinding(
@@ -637,23 +967,11 @@ class InternalAuditorAgent:
 
     async def _run_full_compliance_audit(self) -> List[AuditFinding]:
         """Run comprehensive compliance audit."""
-        findings = []
-
         # Combine findings from all checks
-        all_checks = [
-            self._check_evidence_integrity(),
-            self._check_access_controls(),
-            self._check_iso_27001_compliance(),
-            self._check_iso_42001_compliance(),
-            self._check_iso_13485_compliance(),
-            self._check_iso_14971_compliance()
-        ]
-
-        for check_coro in all_checks:
-            check_findings = await check_coro
-            findings.extend(check_findings)
-
-        return findings
+        results = await asyncio.gather(*(
+            self.compliance_rules[name]["check_function"]() for name in self.FULL_AUDIT_CHECKS
+        ))
+        return [finding for check_findings in results for finding in check_findings]
 
     async def _check_new_evidence(self):
         """Check for new evidence files."""
@@ -725,14 +1043,13 @@ class InternalAuditorAgent:
         return recommendations
 
     async def _trigger_remediation(self, audit_report: AuditReport):
-        """Trigger remediation for critical findings."""
-        critical_findings = [f for f in audit_report.findings if f.severity == AuditSeverity.CRITICAL]
+        """Persist the audit's findings and trigger remediation for critical ones."""
+        self.findings_db.record(audit_report.findings)
 
-        for finding in critical_findings:
-            logger.info(f"Triggering remediation for critical finding: {finding.finding_id}")
-            # In a real implementation, this would trigger automated remediation workflows
-            # For now, just log the finding
-            self.findings_db[finding.finding_id] = finding
+        for finding in audit_report.findings:
+            if finding.severity == AuditSeverity.CRITICAL:
+                logger.info(f"Triggering remediation for critical finding: {finding.finding_id}")
+                # In a real implementation, this would trigger automated remediation workflows
 
     def _save_audit_report(self, audit_report: AuditReport):
         """Save audit report to file."""
@@ -760,15 +1077,13 @@ class InternalAuditorAgent:
         audit_history.sort(key=lambda x: x.get('start_timestamp', ''), reverse=True)
         return audit_history
 
-    def get_active_findings(self) -> List[AuditFinding]:
-        """Get active findings that need remediation."""
-        active_findings = []
-
-        for finding_id, finding in self.findings_db.items():
-            if finding.remediation_status in [RemediationStatus.NOT_STARTED, RemediationStatus.IN_PROGRESS]:
-                active_findings.append(finding)
-
-        return active_findings
+    def get_active_findings(self, severities: Optional[List[AuditSeverity]] = (AuditSeverity.CRITICAL,)
+                            ) -> List[AuditFinding]:
+        """Get active findings that need remediation: critical ones by default, None for every severity."""
+        return self.findings_db.query(
+            severities=severities,
+            statuses=[RemediationStatus.NOT_STARTED, RemediationStatus.IN_PROGRESS]
+        )
 
     async def run_manual_audit(self, audit_type: str, scope: List[str]) -> str:
         """Run a manual audit and return the audit ID."""
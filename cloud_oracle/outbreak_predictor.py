@@ -95,6 +95,64 @@ class OutbreakPredictor:
         # Identify potential diseases based on symptoms
         disease_matches = self._match_disease_signatures(symptoms)
         
+        result = self._build_prediction(
+            location, symptoms, population, historical_data, disease_matches, prediction_start
+        )
+        
+        logger.info(f"Outbreak prediction: Z-score {result['z_score']:.2f}, "
+                    f"Risk: {result['risk_level']}, Bond: {result['bond_status']}")
+        
+        return result
+    
+    def predict_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Predict outbreak risk for many locations in one call.
+        
+        Each request holds the keyword arguments of predict() (location,
+        symptoms, population, historical_data). Disease-signature matching is
+        shared between requests reporting the same symptom set, and logging
+        happens once per batch instead of once per location.
+        
+        Args:
+            requests: List of prediction requests
+        
+        Returns:
+            Predictions in request order (same schema as predict())
+        """
+        batch_start = datetime.utcnow()
+        match_cache: Dict[frozenset, List[Dict[str, Any]]] = {}
+        results = []
+        
+        for item in requests:
+            item_start = datetime.utcnow()
+            symptoms = item['symptoms']
+            key = frozenset(symptoms)
+            if key not in match_cache:
+                match_cache[key] = self._match_disease_signatures(symptoms)
+            # Copy so callers mutating one result never affect another
+            disease_matches = [dict(match) for match in match_cache[key]]
+            results.append(self._build_prediction(
+                item['location'], symptoms, item.get('population'), item.get('historical_data'),
+                disease_matches, item_start
+            ))
+        
+        elapsed_ms = (datetime.utcnow() - batch_start).total_seconds() * 1000
+        critical = sum(1 for r in results if r['risk_level'] == "CRITICAL")
+        logger.info(f"Outbreak batch prediction: {len(results)} locations, "
+                    f"{len(match_cache)} distinct symptom sets, {critical} critical, {elapsed_ms:.1f}ms")
+        
+        return results
+    
+    def _build_prediction(
+        self,
+        location: Dict[str, float],
+        symptoms: List[str],
+        population: Optional[int],
+        historical_data: Optional[List[Dict]],
+        disease_matches: List[Dict[str, Any]],
+        prediction_start: datetime
+    ) -> Dict[str, Any]:
+        """Assemble one prediction result from matched disease signatures."""
         # Calculate Z-score based on current vs historical
         z_score = self._calculate_z_score(
             current_symptoms=symptoms,
@@ -112,7 +170,7 @@ class OutbreakPredictor:
         geographic_risk = self._assess_geographic_risk(location, disease_matches)
         
         # Build prediction result
-        result = {
+        return {
             "status": "success",
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "processing_time_ms": (datetime.utcnow() - prediction_start).total_seconds() * 1000,
@@ -130,10 +188,6 @@ class OutbreakPredictor:
             "confidence_score": self._calculate_confidence(z_score, len(symptoms)),
             "requires_immediate_action": z_score >= self.z_threshold_critical
         }
-        
-        logger.info(f"Outbreak prediction: Z-score {z_score:.2f}, Risk: {risk_level}, Bond: {bond_status}")
-        
-        return result
     
     def _match_disease_signatures(self, symptoms: List[str]) -> List[Dict[str, Any]]:
         """
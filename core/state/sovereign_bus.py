@@ -1,4 +1,21 @@
+"""
+Sovereign state bus with debounced write-behind
+
+set() updates memory only; changes are coalesced over a debounce window and
+written as one atomic snapshot (temp file + fsync + rename). By default a
+crash loses at most one window; use flush() or `with bus:` as a durability
+barrier. journal=True adds an append-only journal that fsyncs every set
+before it returns, so neither a process crash nor power loss drops an
+applied change (load() replays it); the per-set fsync costs most of the
+write-behind throughput, so enable it only for state that needs it.
+
+The shared `bus` is created on first use, so importing this module touches
+no files.
+"""
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -12,28 +29,149 @@ DEFAULT_STATE = {
 }
 
 class SovereignBus:
-    def __init__(self):
-        self.state_file = STATE_FILE
+    def __init__(self, state_file=STATE_FILE, debounce=0.5, journal=False):
+        """
+        Args:
+            state_file: JSON snapshot path
+            debounce: Seconds to coalesce updates before a snapshot write (0 = write on every set)
+            journal: Append and fsync each set to <state_file>.journal until the next snapshot
+        """
+        self.state_file = Path(state_file)
+        self.debounce = debounce
+        self.journal_file = self.state_file.with_name(self.state_file.name + ".journal") if journal else None
         self._state = DEFAULT_STATE.copy()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer = None
+        self._journal = None
+        self.stats = {"sets": 0, "flushes": 0, "bytes_written": 0}
         self.load()
+        atexit.register(self._flush_at_exit)
 
     def load(self):
-        if self.state_file.exists():
-            try:
-                self._state.update(json.loads(self.state_file.read_text()))
-            except:
-                self._state = DEFAULT_STATE.copy()
-        self._state["last_updated"] = datetime.utcnow().isoformat()
+        with self._lock:
+            if self.state_file.exists():
+                try:
+                    self._state.update(json.loads(self.state_file.read_text()))
+                except:
+                    self._state = DEFAULT_STATE.copy()
+            replayed = self._replay_journal()
+            self._state["last_updated"] = datetime.utcnow().isoformat()
+            if replayed:
+                # Fold the recovered changes into a snapshot and start a fresh journal
+                self.save()
+
+    def _replay_journal(self):
+        if self.journal_file is None or not self.journal_file.exists():
+            return 0
+        replayed = 0
+        with open(self.journal_file) as f:
+            for line in f:
+                try:
+                    change = json.loads(line)
+                except ValueError:
+                    break  # torn final line from a crash mid-append
+                self._state[change["k"]] = change["v"]
+                self._state["last_updated"] = change["t"]
+                replayed += 1
+        return replayed
 
     def save(self):
-        self.state_file.write_text(json.dumps(self._state, indent=2))
+        """Write the snapshot now (atomic temp-file + rename) and reset the journal."""
+        with self._lock:
+            self._cancel_timer()
+            data = json.dumps(self._state, indent=2).encode("utf-8")
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_name(self.state_file.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_file)
+            if self.journal_file is not None:
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                if self.journal_file.exists():
+                    self.journal_file.unlink()
+            self._dirty = False
+            self.stats["flushes"] += 1
+            self.stats["bytes_written"] += len(data)
+
+    def flush(self):
+        """Durability barrier: write pending changes, if any."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def _flush_at_exit(self):
+        # A removed state directory (e.g. a test's temp dir) must not be recreated at exit
+        if self.state_file.parent.exists():
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
 
     def get(self, key):
         return self._state.get(key)
 
     def set(self, key, value):
-        self._state[key] = value
-        self._state["last_updated"] = datetime.utcnow().isoformat()
-        self.save()
+        with self._lock:
+            now = datetime.utcnow().isoformat()
+            self._state[key] = value
+            self._state["last_updated"] = now
+            self._dirty = True
+            self.stats["sets"] += 1
+            if self.debounce <= 0:
+                self.save()
+                return
+            if self.journal_file is not None:
+                self._append_journal(key, value, now)
+            if self._timer is None:
+                # The window starts at the first unflushed change and is not extended by later ones
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _append_journal(self, key, value, timestamp):
+        if self._journal is None:
+            self._journal = open(self.journal_file, "a")
+        line = json.dumps({"k": key, "v": value, "t": timestamp}) + "\n"
+        self._journal.write(line)
+        # Durable before set() returns, so power loss cannot drop it either
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self.stats["bytes_written"] += len(line)
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+_default_bus = None
+_default_bus_lock = threading.Lock()
+
+def get_bus():
+    """The process-wide bus on STATE_FILE, created on first use."""
+    global _default_bus
+    with _default_bus_lock:
+        if _default_bus is None:
+            _default_bus = SovereignBus(STATE_FILE)
+        return _default_bus
+
+class _DefaultBus:
+    """Forwards to get_bus() so `from core.state.sovereign_bus import bus` stays side-effect free."""
+
+    def __getattr__(self, name):
+        return getattr(get_bus(), name)
+
+    def __enter__(self):
+        return get_bus().__enter__()
+
+    def __exit__(self, *exc_info):
+        return get_bus().__exit__(*exc_info)
 
-bus = SovereignBus()
+bus = _DefaultBus()
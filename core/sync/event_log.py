@@ -1,26 +1,430 @@
 """
 Append-only event log for offline safety
+
+Events are appended to size-bounded segment files instead of one JSON file
+per event (which exhausts inodes and costs an fsync and a directory entry
+per event on edge SD cards).
+
+Segment layout (core/sync/events/<base offset>.seg):
+    record = length (u32) | crc32 (u32) | JSON bytes
+Each record carries its own log offset. A sparse index
+(<base offset>.idx: offset u64 | file position u64, every index_interval
+records) lets replay seek into a segment without scanning it.
+
+Compaction rewrites sealed segments keeping only the latest event per
+(type, payload["key"]); events without a key are never dropped.
 """
+import bisect
 import json
+import logging
+import os
+import struct
+import threading
 import uuid
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 EVENT_DIR = Path("core/sync/events")
-EVENT_DIR.mkdir(exist_ok=True)
+
+RECORD_HEADER = struct.Struct(">II")
+INDEX_ENTRY = struct.Struct(">QQ")
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+
+class CorruptRecordError(Exception):
+    """A record failed its length or CRC check."""
+
+
+def _segment_name(base_offset: int) -> str:
+    return f"{base_offset:020d}"
+
+
+def _read_record(f) -> Optional[Tuple[Dict[str, Any], int]]:
+    """Read one record at the current position; None at a clean end of file."""
+    header = f.read(RECORD_HEADER.size)
+    if not header:
+        return None
+    if len(header) < RECORD_HEADER.size:
+        raise CorruptRecordError("truncated record header")
+    length, crc = RECORD_HEADER.unpack(header)
+    body = f.read(length)
+    if len(body) < length or zlib.crc32(body) != crc:
+        raise CorruptRecordError("record CRC mismatch")
+    return json.loads(body), RECORD_HEADER.size + length
+
+
+def _encode_record(event: Dict[str, Any]) -> bytes:
+    body = json.dumps(event, separators=(",", ":"), default=str).encode("utf-8")
+    return RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+class _Segment:
+    """One segment file plus its in-memory sparse index."""
+
+    def __init__(self, directory: Path, base_offset: int):
+        self.base_offset = base_offset
+        self.path = directory / (_segment_name(base_offset) + SEGMENT_SUFFIX)
+        self.index_path = directory / (_segment_name(base_offset) + INDEX_SUFFIX)
+        self.index_offsets: List[int] = []
+        self.index_positions: List[int] = []
+
+    def load_index(self):
+        self.index_offsets, self.index_positions = [], []
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            usable = len(data) - len(data) % INDEX_ENTRY.size
+            for offset, position in INDEX_ENTRY.iter_unpack(data[:usable]):
+                self.index_offsets.append(offset)
+                self.index_positions.append(position)
+
+    def seek_position(self, offset: int) -> int:
+        """File position of the last indexed record at or before offset."""
+        i = bisect.bisect_right(self.index_offsets, offset) - 1
+        return self.index_positions[i] if i >= 0 else 0
+
+
+class EventLog:
+    """
+    Segmented append-only event log.
+
+    Usage:
+        log = EventLog("core/sync/events")
+        event = log.append("STATE_CHANGE", {"key": "triage_mode", "value": "surge"})
+        for event in log.replay(from_offset=event["offset"]):
+            ...
+        log.start_compaction(interval=600)
+    """
+
+    def __init__(self, directory: Path = EVENT_DIR, segment_bytes: int = 4 << 20, index_interval: int = 64,
+                 fsync: bool = False):
+        """
+        Args:
+            directory: Directory holding the segment and index files
+            segment_bytes: Roll to a new segment once the active one reaches this size
+            index_interval: Records between sparse index entries
+            fsync: fsync the active segment after every append (default: on roll/close;
+                appends are always flushed to the OS)
+        """
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.index_interval = index_interval
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._segments: List[_Segment] = []
+        self._active_file = None
+        self._index_file = None
+        self._active_size = 0
+        self._since_index = 0
+        self.next_offset = 0
+        self._compaction_stop = threading.Event()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._open()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Opening and recovery
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _open(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        bases = sorted(int(p.stem) for p in self.directory.glob("*" + SEGMENT_SUFFIX) if p.stem.isdigit())
+        for base in bases:
+            segment = _Segment(self.directory, base)
+            segment.load_index()
+            self._segments.append(segment)
+
+        if self._segments:
+            self._recover_active(self._segments[-1])
+        else:
+            self._segments.append(_Segment(self.directory, 0))
+            self._open_active()
+        self._import_legacy_events()
+
+    def _recover_active(self, segment: _Segment):
+        """Find the end of the last segment, truncating a torn tail and rebuilding its index."""
+        index: List[Tuple[int, int]] = []
+        position = 0
+        last_offset = segment.base_offset - 1
+        with open(segment.path, "rb") as f:
+            count = 0
+            while True:
+                try:
+                    read = _read_record(f)
+                except CorruptRecordError:
+                    logger.warning(f"Truncating torn tail of {segment.path.name} at byte {position}")
+                    break
+                if read is None:
+                    break
+                event, size = read
+                if count % self.index_interval == 0:
+                    index.append((event["offset"], position))
+                last_offset = event["offset"]
+                position += size
+                count += 1
+        with open(segment.path, "r+b") as f:
+            f.truncate(position)
+        with open(segment.index_path, "wb") as f:
+            f.write(b"".join(INDEX_ENTRY.pack(o, p) for o, p in index))
+        segment.load_index()
+
+        self.next_offset = max(last_offset + 1, segment.base_offset)
+        self._open_active()
+        self._active_size = position
+        self._since_index = count % self.index_interval
+
+    def _open_active(self):
+        segment = self._segments[-1]
+        self._active_file = open(segment.path, "ab")
+        self._index_file = open(segment.index_path, "ab")
+        self._active_size = 0
+        self._since_index = 0
+
+    def _import_legacy_events(self):
+        """Move events from the old one-JSON-file-per-event layout into the log."""
+        legacy = list(self.directory.glob("*.json"))
+        if not legacy:
+            return
+        events, imported = [], []
+        for path in legacy:
+            try:
+                with open(path) as f:
+                    events.append(json.load(f))
+                imported.append(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Leaving unreadable legacy event {path.name} in place: {e}")
+        for event in sorted(events, key=lambda e: e.get("timestamp", "")):
+            self._append_record(event)
+        self.flush(fsync=True)
+        for path in imported:
+            path.unlink()
+        logger.info(f"Imported {len(events)} legacy events into the segmented log")
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Appending
+    # ─────────────────────────────────────────────────────────────────────
+
+    def append(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        event = {
+            "event_id": str(uuid.uuid4()),
+            "type": event_type,
+            "timestamp": datetime.utcnow().isoformat(),
+            "payload": payload,
+        }
+        return self._append_record(event)
+
+    def _append_record(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if self._active_size >= self.segment_bytes:
+                self._roll()
+            event = dict(event, offset=self.next_offset)
+            record = _encode_record(event)
+            if self._since_index == 0:
+                self._index_file.write(INDEX_ENTRY.pack(event["offset"], self._active_size))
+                segment = self._segments[-1]
+                segment.index_offsets.append(event["offset"])
+                segment.index_positions.append(self._active_size)
+            self._since_index = (self._since_index + 1) % self.index_interval
+            self._active_file.write(record)
+            self._active_size += len(record)
+            self.next_offset += 1
+            # Hand every record to the OS so a process crash loses nothing;
+            # fsync (power loss) stays opt-in
+            self.flush(fsync=self.fsync)
+            return event
+
+    def _roll(self):
+        self.flush(fsync=True)
+        self._active_file.close()
+        self._index_file.close()
+        self._segments.append(_Segment(self.directory, self.next_offset))
+        self._open_active()
+
+    def flush(self, fsync: bool = False):
+        with self._lock:
+            for f in (self._active_file, self._index_file):
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+
+    def close(self):
+        self.stop_compaction()
+        with self._lock:
+            if self._active_file is not None:
+                self.flush(fsync=True)
+                self._active_file.close()
+                self._index_file.close()
+                self._active_file = self._index_file = None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Replay
+    # ─────────────────────────────────────────────────────────────────────
+
+    def replay(self, from_offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Stream events with offset >= from_offset in log order, one record at a time."""
+        with self._lock:
+            self.flush()
+            segments = list(self._segments)
+            end_offset = self.next_offset
+        bases = [s.base_offset for s in segments]
+        start = max(0, bisect.bisect_right(bases, from_offset) - 1)
+        for segment in segments[start:]:
+            # Open and look up the index together so a concurrent compaction swap cannot split them
+            with self._lock:
+                f = open(segment.path, "rb")
+                position = segment.seek_position(from_offset)
+            with f:
+                f.seek(position)
+                while True:
+                    try:
+                        read = _read_record(f)
+                    except CorruptRecordError:
+                        logger.error(f"Corrupt record in {segment.path.name}; skipping rest of segment")
+                        break
+                    if read is None:
+                        break
+                    event = read[0]
+                    if event["offset"] >= end_offset:
+                        return
+                    if event["offset"] >= from_offset:
+                        yield event
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Compaction
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _compaction_key(event: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        payload = event.get("payload")
+        if isinstance(payload, dict) and "key" in payload:
+            return event.get("type"), json.dumps(payload["key"], sort_keys=True, default=str)
+        return None
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Fold superseded keys out of sealed segments.
+
+        The latest offset per key is taken over the whole log (including the
+        active segment); sealed segments are rewritten without older records
+        and swapped in atomically. Offsets are preserved.
+        """
+        with self._lock:
+            self.flush()
+            sealed = list(self._segments[:-1])
+        if not sealed:
+            return {"segments_rewritten": 0, "records_dropped": 0}
+
+        latest: Dict[Tuple[str, str], int] = {}
+        for event in self.replay():
+            key = self._compaction_key(event)
+            if key is not None:
+                latest[key] = event["offset"]
+
+        rewritten = dropped = 0
+        for segment in sealed:
+            kept, removed = self._rewrite_segment(segment, latest)
+            dropped += removed
+            rewritten += removed > 0
+        if dropped:
+            logger.info(f"Compaction dropped {dropped} superseded events from {rewritten} segments")
+        return {"segments_rewritten": rewritten, "records_dropped": dropped}
+
+    def _rewrite_segment(self, segment: _Segment, latest: Dict[Tuple[str, str], int]) -> Tuple[int, int]:
+        kept = removed = 0
+        tmp_path = segment.path.with_suffix(SEGMENT_SUFFIX + ".compact")
+        tmp_index = segment.index_path.with_suffix(INDEX_SUFFIX + ".compact")
+        position = 0
+        with open(segment.path, "rb") as src, open(tmp_path, "wb") as dst, open(tmp_index, "wb") as idx:
+            while True:
+                try:
+                    read = _read_record(src)
+                except CorruptRecordError:
+                    logger.error(f"Corrupt record in {segment.path.name}; keeping segment as is")
+                    dst.close()
+                    os.remove(tmp_path)
+                    idx.close()
+                    os.remove(tmp_index)
+                    return 0, 0
+                if read is None:
+                    break
+                event = read[0]
+                key = self._compaction_key(event)
+                if key is not None and latest.get(key, -1) > event["offset"]:
+                    removed += 1
+                    continue
+                if kept % self.index_interval == 0:
+                    idx.write(INDEX_ENTRY.pack(event["offset"], position))
+                record = _encode_record(event)
+                dst.write(record)
+                position += len(record)
+                kept += 1
+            if removed:
+                dst.flush()
+                os.fsync(dst.fileno())
+                idx.flush()
+                os.fsync(idx.fileno())
+
+        if not removed:
+            os.remove(tmp_path)
+            os.remove(tmp_index)
+            return kept, 0
+        with self._lock:
+            os.replace(tmp_index, segment.index_path)
+            os.replace(tmp_path, segment.path)
+            segment.load_index()
+        return kept, removed
+
+    def start_compaction(self, interval: float = 600.0):
+        """Compact in a background thread every interval seconds."""
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+        self._compaction_stop.clear()
+
+        def loop():
+            while not self._compaction_stop.wait(interval):
+                try:
+                    self.compact()
+                except Exception as e:
+                    logger.error(f"Event log compaction failed: {e}")
+
+        self._compaction_thread = threading.Thread(target=loop, name="event-log-compaction", daemon=True)
+        self._compaction_thread.start()
+
+    def stop_compaction(self):
+        self._compaction_stop.set()
+        if self._compaction_thread is not None:
+            self._compaction_thread.join(timeout=5)
+            self._compaction_thread = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self.flush()
+            return {
+                "segments": len(self._segments),
+                "next_offset": self.next_offset,
+                "size_bytes": sum(s.path.stat().st_size for s in self._segments if s.path.exists()),
+            }
+
+
+_default_log: Optional[EventLog] = None
+_default_lock = threading.Lock()
+
+
+def get_event_log() -> EventLog:
+    """Process-wide log at EVENT_DIR, opened on first use."""
+    global _default_log
+    with _default_lock:
+        if _default_log is None:
+            _default_log = EventLog(EVENT_DIR)
+        return _default_log
 
 
 def append_event(event_type: str, payload: Dict[str, Any]):
-    event = {
-        "event_id": str(uuid.uuid4()),
-        "type": event_type,
-        "timestamp": datetime.utcnow().isoformat(),
-        "payload": payload,
-    }
-
-    path = EVENT_DIR / f"{event['event_id']}.json"
-    with open(path, "w") as f:
-        json.dump(event, f, indent=2)
-
-    return event
+    return get_event_log().append(event_type, payload)
+
+
+def iter_events(from_offset: int = 0) -> Iterator[Dict[str, Any]]:
+    return get_event_log().replay(from_offset)
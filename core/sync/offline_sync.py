@@ -1,11 +1,20 @@
 """
 Offline-First Conflict-Free Synchronization
 Last-write-wins with timestamp + optional CRDT merge
+
+merge_states() reconciles whole JSON files (last writer wins). DeltaCRDTStore
+is the delta-state alternative: per-key LWW registers ordered by hybrid
+logical clocks, OR-sets for collections and a version vector per node, so
+peers exchange only the operations the other side has not seen and merge
+cost follows the change set rather than the state size.
 """
 
+import bisect
 import json
 import logging
+import time
 from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
 
 def merge_states(local_path: str = "state.json", remote_state: dict = None) -> dict:
     try:
@@ -32,3 +41,218 @@ def merge_states(local_path: str = "state.json", remote_state: dict = None) -> d
         logging.error(f"Sync save failed: {e}")
     
     return merged
+
+
+Timestamp = Tuple[int, int, str]
+Dot = Tuple[str, int]
+
+
+class HybridLogicalClock:
+    """Hybrid logical clock: (physical ms, logical counter, node id), totally ordered."""
+
+    def __init__(self, node_id: str, wall_clock: Callable[[], float] = time.time):
+        self.node_id = node_id
+        self.wall_clock = wall_clock
+        self.physical = 0
+        self.logical = 0
+
+    def now(self) -> Timestamp:
+        physical = int(self.wall_clock() * 1000)
+        if physical > self.physical:
+            self.physical, self.logical = physical, 0
+        else:
+            self.logical += 1
+        return self.physical, self.logical, self.node_id
+
+    def observe(self, remote: Timestamp):
+        """Advance past a timestamp received from another node."""
+        physical = max(int(self.wall_clock() * 1000), self.physical, remote[0])
+        if physical == self.physical == remote[0]:
+            self.logical = max(self.logical, remote[1]) + 1
+        elif physical == self.physical:
+            self.logical += 1
+        elif physical == remote[0]:
+            self.logical = remote[1] + 1
+        else:
+            self.logical = 0
+        self.physical = physical
+
+
+class DeltaCRDTStore:
+    """
+    Delta-state CRDT replica.
+
+    Every mutation gets a dot (origin node, per-node counter). The version
+    vector records, per origin, the highest counter whose effect this replica
+    reflects; deltas are always computed against the receiver's own vector,
+    so vectors stay contiguous and the receiver can adopt the sender's
+    vector after merging.
+
+    Only live operations are kept in the per-origin log: an LWW write
+    supersedes the previous write of its key and an OR-set remove retires
+    the adds it observed, so the log stays proportional to the state.
+
+    Usage:
+        a, b = DeltaCRDTStore("clinic_a"), DeltaCRDTStore("clinic_b")
+        a.set("bed_occupancy.ward_3", 14)
+        b.add("active_alerts", "cholera:dadaab")
+        b.merge_delta(a.delta_since(b.version_vector()))
+    """
+
+    def __init__(self, node_id: str, wall_clock: Callable[[], float] = time.time):
+        self.node_id = node_id
+        self.clock = HybridLogicalClock(node_id, wall_clock)
+        self.vv: Dict[str, int] = {}
+        # key -> (timestamp, value, deleted, dot)
+        self.registers: Dict[str, Tuple[Timestamp, Any, bool, Dot]] = {}
+        # key -> element id -> {dot: element}
+        self.sets: Dict[str, Dict[str, Dict[Dot, Any]]] = {}
+        # origin -> counter -> encoded op; plus the counters in arrival (ascending) order
+        self._log: Dict[str, Dict[int, list]] = {}
+        self._log_counters: Dict[str, List[int]] = {}
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Local mutations
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _next_dot(self) -> Dot:
+        counter = self.vv.get(self.node_id, 0) + 1
+        self.vv[self.node_id] = counter
+        return self.node_id, counter
+
+    def set(self, key: str, value: Any):
+        node, counter = self._next_dot()
+        self._apply(["w", node, counter, key, list(self.clock.now()), value, False])
+
+    def delete(self, key: str):
+        node, counter = self._next_dot()
+        self._apply(["w", node, counter, key, list(self.clock.now()), None, True])
+
+    def add(self, key: str, element: Any):
+        node, counter = self._next_dot()
+        self._apply(["a", node, counter, key, element])
+
+    def remove(self, key: str, element: Any):
+        observed = self.sets.get(key, {}).get(self._element_id(element), {})
+        if not observed:
+            return
+        node, counter = self._next_dot()
+        self._apply(["r", node, counter, key, element, [list(dot) for dot in observed]])
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Reads
+    # ─────────────────────────────────────────────────────────────────────
+
+    def get(self, key: str, default: Any = None) -> Any:
+        register = self.registers.get(key)
+        if register is None or register[2]:
+            return default
+        return register[1]
+
+    def members(self, key: str) -> List[Any]:
+        return [next(iter(dots.values())) for dots in self.sets.get(key, {}).values() if dots]
+
+    def version_vector(self) -> Dict[str, int]:
+        return dict(self.vv)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain view of the state (registers, then sets as sorted member lists)."""
+        state = {key: reg[1] for key, reg in self.registers.items() if not reg[2]}
+        for key in self.sets:
+            members = self.members(key)
+            if members:
+                state[key] = sorted(members, key=self._element_id)
+        return state
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Delta exchange
+    # ─────────────────────────────────────────────────────────────────────
+
+    def delta_since(self, peer_vv: Dict[str, int]) -> Dict[str, Any]:
+        """Live operations the peer (with version vector peer_vv) has not seen, plus our vector."""
+        ops = []
+        for origin, counters in self._log_counters.items():
+            live = self._log[origin]
+            start = bisect.bisect_right(counters, peer_vv.get(origin, 0))
+            ops.extend(live[c] for c in counters[start:] if c in live)
+        return {"origin": self.node_id, "vv": dict(self.vv), "ops": ops}
+
+    def merge_delta(self, delta: Dict[str, Any]) -> int:
+        """Apply a delta computed against this replica's version vector; returns ops applied."""
+        applied = 0
+        for op in delta["ops"]:
+            if op[2] <= self.vv.get(op[1], 0):
+                continue
+            self._apply(op)
+            applied += 1
+        for origin, counter in delta["vv"].items():
+            if counter > self.vv.get(origin, 0):
+                self.vv[origin] = counter
+        return applied
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _element_id(element: Any) -> str:
+        return json.dumps(element, sort_keys=True, default=str)
+
+    def _log_op(self, op: list):
+        origin, counter = op[1], op[2]
+        live = self._log.setdefault(origin, {})
+        counters = self._log_counters.setdefault(origin, [])
+        live[counter] = op
+        counters.append(counter)
+
+    def _retire(self, dot: Dot):
+        live = self._log.get(dot[0])
+        if live is None or live.pop(dot[1], None) is None:
+            return
+        counters = self._log_counters[dot[0]]
+        if len(counters) > 64 and len(counters) > 2 * len(live):
+            counters[:] = [c for c in counters if c in live]
+
+    def _apply(self, op: list):
+        kind, origin, counter, key = op[0], op[1], op[2], op[3]
+        dot = (origin, counter)
+        if kind == "w":
+            timestamp = tuple(op[4])
+            if origin != self.node_id:
+                self.clock.observe(timestamp)
+            current = self.registers.get(key)
+            if current is None or timestamp > current[0]:
+                if current is not None:
+                    self._retire(current[3])
+                self.registers[key] = (timestamp, op[5], op[6], dot)
+                self._log_op(op)
+        elif kind == "a":
+            element_dots = self.sets.setdefault(key, {}).setdefault(self._element_id(op[4]), {})
+            element_dots[dot] = op[4]
+            self._log_op(op)
+        elif kind == "r":
+            elements = self.sets.get(key, {})
+            element_id = self._element_id(op[4])
+            element_dots = elements.get(element_id, {})
+            for removed in op[5]:
+                removed = tuple(removed)
+                element_dots.pop(removed, None)
+                self._retire(removed)
+            if not element_dots:
+                elements.pop(element_id, None)
+            self._log_op(op)
+        if origin != self.node_id and counter > self.vv.get(origin, 0):
+            # Contiguous by construction: ops from one origin arrive in counter order
+            self.vv[origin] = counter
+
+
+def sync_pair(a: DeltaCRDTStore, b: DeltaCRDTStore) -> int:
+    """Anti-entropy between two replicas; returns bytes exchanged (JSON-encoded deltas)."""
+    to_b = a.delta_since(b.version_vector())
+    to_a = b.delta_since(a.version_vector())
+    payload = len(json.dumps(to_b, separators=(",", ":"), default=str)) + \
+        len(json.dumps(to_a, separators=(",", ":"), default=str))
+    b.merge_delta(to_b)
+    a.merge_delta(to_a)
+    return payload
+
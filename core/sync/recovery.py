@@ -1,17 +1,14 @@
 """
 Recovery from partial or failed sync
 """
-import json
-from pathlib import Path
+from core.sync.event_log import iter_events
 from core.sync.sync import replay_events
 
-EVENT_DIR = Path("core/sync/events")
 
-
-def recover():
-    events = []
-    for path in EVENT_DIR.glob("*.json"):
-        with open(path) as f:
-            events.append(json.load(f))
-    replay_events(events)
-    return len(events)
+def recover(from_offset: int = 0):
+    """Replay the event log from from_offset, streaming one event at a time."""
+    count = 0
+    for event in iter_events(from_offset):
+        replay_events([event])
+        count += 1
+    return count
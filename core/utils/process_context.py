@@ -0,0 +1,18 @@
+"""
+Start method for worker processes
+
+Worker pools here are started from processes that already run threads (thread
+pools, async servers). Forking such a process copies locks held by other
+threads into the child, which can then deadlock, so workers come from the
+forkserver (or spawn, where forkserver is unavailable).
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+
+def worker_context() -> BaseContext:
+    """multiprocessing context to hand to Process / ProcessPoolExecutor(mp_context=...)."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
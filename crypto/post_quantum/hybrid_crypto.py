@@ -4,14 +4,21 @@ Post-Quantum Hybrid: ML-KEM + AES-256-GCM
 - Derive AES-256 key via HKDF
 - Encrypt/authenticate clinical payload with AES-GCM
 Pure Python (cryptography lib for AES-GCM - widely trusted, minimal dep)
+
+One-shot API: every call pays a full ML-KEM encapsulation. For sustained
+telemetry streams use crypto.post_quantum.pqc_session, which reuses one
+handshake per peer per rekey interval.
 """
 
+import logging
 from kyber import ML_KEM_768
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import os
 
+logger = logging.getLogger(__name__)
+
 class HybridPQCrypto:
     def __init__(self):
         self.kem = ML_KEM_768()
@@ -26,7 +33,7 @@ class HybridPQCrypto:
         aesgcm = AESGCM(aes_key)
         ciphertext = aesgcm.encrypt(nonce, plaintext, None)
         
-        print(f"Hybrid encrypted payload ({len(plaintext)} → {len(ciphertext)} bytes)")
+        logger.debug("Hybrid encrypted payload (%d → %d bytes)", len(plaintext), len(ciphertext))
         return ct, nonce, ciphertext
 
     def decrypt_payload(self, sk, ct, nonce, ciphertext):
@@ -36,7 +43,7 @@ class HybridPQCrypto:
         
         aesgcm = AESGCM(aes_key)
         plaintext = aesgcm.decrypt(nonce, ciphertext, None)
-        print("Hybrid decrypted successfully")
+        logger.debug("Hybrid decrypted successfully")
         return plaintext
 
 if __name__ == "__main__":
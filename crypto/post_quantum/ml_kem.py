@@ -4,25 +4,29 @@ Uses kyber-py pure-Python impl for sovereignty.
 Secures edge telemetry (e.g., clinical data over Nairobi-Dadaab link).
 """
 
+import logging
+
 from kyber import ML_KEM_768  # NIST-recommended level
 
+logger = logging.getLogger(__name__)
+
 class SovereignMLKEM:
     def __init__(self):
         self.kem = ML_KEM_768()
 
     def generate_keypair(self):
         pk, sk = self.kem.keygen()
-        print("ML-KEM-768 keypair generated (post-quantum secure)")
+        logger.info("ML-KEM-768 keypair generated (post-quantum secure)")
         return pk, sk
 
     def encapsulate(self, pk):
         ct, ss = self.kem.encaps(pk)
-        print(f"Encapsulated shared secret: {len(ss)} bytes")
+        logger.debug("Encapsulated shared secret: %d bytes", len(ss))
         return ct, ss
 
     def decapsulate(self, sk, ct):
         ss = self.kem.decaps(sk, ct)
-        print("Decapsulated shared secret")
+        logger.debug("Decapsulated shared secret")
         return ss
 
 # Secure telemetry demo
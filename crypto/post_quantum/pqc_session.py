@@ -0,0 +1,272 @@
+"""
+Session-based Hybrid PQC Channel: ML-KEM handshake reuse + AES-256-GCM
+- One ML-KEM-768 encapsulation per peer per rekey interval
+- Session root derived once via HKDF over the shared secret (bound to the KEM ciphertext)
+- Per-message AES-256 keys via HKDF-Expand over a 64-bit counter; nonces derived from the counter
+- Batch seal_many/open_many over length-prefixed framed buffers
+- Rekey by bytes sealed, message count or session age
+Quiet on the hot path: only handshakes and rekeys are logged (DEBUG).
+"""
+
+import hashlib
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF, HKDFExpand
+
+logger = logging.getLogger(__name__)
+
+# Frame header: session id (8 bytes) | message counter (u64) | ciphertext length (u32)
+FRAME_HEADER = struct.Struct(">8sQI")
+SESSION_ID_BYTES = 8
+REPLAY_WINDOW = 64
+
+INITIATOR = "initiator"
+RESPONDER = "responder"
+_DIRECTION_LABELS = {
+    INITIATOR: b"iLuminara telemetry i2r",
+    RESPONDER: b"iLuminara telemetry r2i",
+}
+
+
+@dataclass
+class RekeyPolicy:
+    """When a session must be replaced by a fresh ML-KEM handshake."""
+    max_bytes: int = 1 << 30            # plaintext bytes sealed under one handshake
+    max_messages: int = 1 << 32         # counter space per handshake
+    max_age_seconds: float = 3600.0     # wall-clock lifetime of a handshake
+
+
+def session_id_for(kem_ciphertext: bytes) -> bytes:
+    """Stable session identifier shared by both peers (derived from the handshake)."""
+    return hashlib.sha256(kem_ciphertext).digest()[:SESSION_ID_BYTES]
+
+
+class HybridPQCSession:
+    """
+    One side of an established ML-KEM session.
+
+    Each direction (initiator→responder, responder→initiator) has its own
+    root key, so both peers can seal concurrently without sharing a counter.
+    Receivers accept each counter at most once within a sliding window.
+    """
+
+    def __init__(self, shared_secret: bytes, kem_ciphertext: bytes, role: str,
+                 policy: Optional[RekeyPolicy] = None, clock=time.monotonic):
+        if role not in _DIRECTION_LABELS:
+            raise ValueError(f"Unknown session role: {role}")
+        self.role = role
+        self.policy = policy or RekeyPolicy()
+        self.session_id = session_id_for(kem_ciphertext)
+        self._clock = clock
+        self.created_at = clock()
+
+        peer_role = RESPONDER if role == INITIATOR else INITIATOR
+        self._send_root = self._derive_root(shared_secret, kem_ciphertext, _DIRECTION_LABELS[role])
+        self._recv_root = self._derive_root(shared_secret, kem_ciphertext, _DIRECTION_LABELS[peer_role])
+        self._send_label = _DIRECTION_LABELS[role]
+        self._recv_label = _DIRECTION_LABELS[peer_role]
+
+        self._send_counter = 0
+        self._recv_highest = -1
+        self._recv_window = 0
+        self.bytes_sealed = 0
+        self.messages_sealed = 0
+        self.messages_opened = 0
+
+    @staticmethod
+    def _derive_root(shared_secret: bytes, kem_ciphertext: bytes, label: bytes) -> bytes:
+        hkdf = HKDF(algorithm=SHA256(), length=32, salt=hashlib.sha256(kem_ciphertext).digest(), info=label)
+        return hkdf.derive(shared_secret)
+
+    @staticmethod
+    def _message_key(root: bytes, label: bytes, counter: int) -> bytes:
+        return HKDFExpand(algorithm=SHA256(), length=32, info=label + counter.to_bytes(8, "big")).derive(root)
+
+    @staticmethod
+    def _nonce(counter: int) -> bytes:
+        return b"\x00\x00\x00\x00" + counter.to_bytes(8, "big")
+
+    # ------------------------------------------------------------------ state
+
+    def needs_rekey(self, pending_bytes: int = 0, pending_messages: int = 0) -> bool:
+        """True once this session's byte, message or age budget is spent."""
+        if self.bytes_sealed + pending_bytes > self.policy.max_bytes:
+            return True
+        if self.messages_sealed + pending_messages > self.policy.max_messages:
+            return True
+        return self._clock() - self.created_at >= self.policy.max_age_seconds
+
+    def stats(self) -> Dict:
+        return {
+            "session_id": self.session_id.hex(),
+            "role": self.role,
+            "age_seconds": self._clock() - self.created_at,
+            "bytes_sealed": self.bytes_sealed,
+            "messages_sealed": self.messages_sealed,
+            "messages_opened": self.messages_opened,
+        }
+
+    # ------------------------------------------------------------ single frame
+
+    def seal(self, plaintext: bytes, aad: bytes = b"") -> bytes:
+        """Encrypt one message into a self-describing frame."""
+        if self._send_counter >= self.policy.max_messages:
+            raise ValueError("Session counter exhausted; rekey required")
+        counter = self._send_counter
+        self._send_counter += 1
+
+        key = self._message_key(self._send_root, self._send_label, counter)
+        prefix = self.session_id + counter.to_bytes(8, "big")
+        ciphertext = AESGCM(key).encrypt(self._nonce(counter), plaintext, prefix + aad)
+
+        self.bytes_sealed += len(plaintext)
+        self.messages_sealed += 1
+        return FRAME_HEADER.pack(self.session_id, counter, len(ciphertext)) + ciphertext
+
+    def open(self, frame: bytes, aad: bytes = b"") -> bytes:
+        """Authenticate and decrypt one frame produced by the peer's seal()."""
+        session_id, counter, length = FRAME_HEADER.unpack_from(frame, 0)
+        body = bytes(frame[FRAME_HEADER.size:FRAME_HEADER.size + length])
+        if len(body) != length:
+            raise ValueError("Truncated frame")
+        return self._open_frame(session_id, counter, body, aad)
+
+    def _open_frame(self, session_id: bytes, counter: int, body: bytes, aad: bytes) -> bytes:
+        if session_id != self.session_id:
+            raise ValueError("Frame belongs to a different session")
+        if not self._counter_is_fresh(counter):
+            raise ValueError(f"Replayed or stale frame counter: {counter}")
+
+        key = self._message_key(self._recv_root, self._recv_label, counter)
+        plaintext = AESGCM(key).decrypt(self._nonce(counter), body, session_id + counter.to_bytes(8, "big") + aad)
+
+        self._mark_received(counter)
+        self.messages_opened += 1
+        return plaintext
+
+    def _counter_is_fresh(self, counter: int) -> bool:
+        if counter > self._recv_highest:
+            return True
+        offset = self._recv_highest - counter
+        if offset >= REPLAY_WINDOW:
+            return False
+        return not (self._recv_window >> offset) & 1
+
+    def _mark_received(self, counter: int):
+        if counter > self._recv_highest:
+            shift = counter - self._recv_highest
+            self._recv_window = ((self._recv_window << shift) | 1) & ((1 << REPLAY_WINDOW) - 1)
+            self._recv_highest = counter
+        else:
+            self._recv_window |= 1 << (self._recv_highest - counter)
+
+    # ------------------------------------------------------------------- batch
+
+    def seal_many(self, messages: Sequence[bytes]) -> bytes:
+        """Seal a batch into one buffer of concatenated frames."""
+        return b"".join(self.seal(message) for message in messages)
+
+    def open_many(self, buffer: bytes) -> List[bytes]:
+        """Open every frame in a buffer produced by seal_many()."""
+        return [self._open_frame(session_id, counter, body, b"")
+                for session_id, counter, body in iter_frames(buffer)]
+
+
+def iter_frames(buffer: bytes) -> Iterator[Tuple[bytes, int, bytes]]:
+    """Yield (session_id, counter, ciphertext) for each frame in a framed buffer."""
+    view = memoryview(buffer)
+    offset = 0
+    total = len(view)
+    while offset < total:
+        if total - offset < FRAME_HEADER.size:
+            raise ValueError("Truncated frame header")
+        session_id, counter, length = FRAME_HEADER.unpack_from(view, offset)
+        start = offset + FRAME_HEADER.size
+        end = start + length
+        if end > total:
+            raise ValueError("Truncated frame")
+        yield session_id, counter, bytes(view[start:end])
+        offset = end
+
+
+class PQCSessionManager:
+    """
+    Per-peer session cache. The initiator calls session_for()/seal_many() and
+    ships any returned handshake (the ML-KEM ciphertext) ahead of the frames;
+    the responder calls accept() with its secret key, then open_many().
+    """
+
+    def __init__(self, kem=None, policy: Optional[RekeyPolicy] = None, clock=time.monotonic):
+        if kem is None:
+            from crypto.post_quantum.ml_kem import SovereignMLKEM
+            kem = SovereignMLKEM()
+        self.kem = kem
+        self.policy = policy or RekeyPolicy()
+        self._clock = clock
+        self._outbound: Dict[str, HybridPQCSession] = {}
+        self._inbound: Dict[bytes, HybridPQCSession] = {}
+        self._inbound_by_peer: Dict[str, List[bytes]] = {}
+        self.handshakes = 0
+
+    def session_for(self, peer_id: str, peer_pk, pending_bytes: int = 0,
+                    pending_messages: int = 0) -> Tuple[HybridPQCSession, Optional[bytes]]:
+        """
+        Return the live outbound session for a peer, performing a fresh ML-KEM
+        handshake if none exists or the current one is due for rekey.
+        The second element is the handshake to deliver, or None if reused.
+        """
+        session = self._outbound.get(peer_id)
+        if session is not None and not session.needs_rekey(pending_bytes, pending_messages):
+            return session, None
+
+        kem_ciphertext, shared_secret = self.kem.encapsulate(peer_pk)
+        session = HybridPQCSession(shared_secret, kem_ciphertext, INITIATOR, self.policy, self._clock)
+        self._outbound[peer_id] = session
+        self.handshakes += 1
+        logger.debug("PQC session %s established with %s", session.session_id.hex(), peer_id)
+        return session, kem_ciphertext
+
+    def accept(self, peer_id: str, sk, kem_ciphertext: bytes, retain: int = 2) -> HybridPQCSession:
+        """Complete a handshake on the responder side; keeps `retain` sessions per peer for in-flight frames."""
+        session_id = session_id_for(kem_ciphertext)
+        existing = self._inbound.get(session_id)
+        if existing is not None:
+            return existing
+
+        shared_secret = self.kem.decapsulate(sk, kem_ciphertext)
+        session = HybridPQCSession(shared_secret, kem_ciphertext, RESPONDER, self.policy, self._clock)
+        self._inbound[session_id] = session
+        history = self._inbound_by_peer.setdefault(peer_id, [])
+        history.append(session_id)
+        while len(history) > max(1, retain):
+            self._inbound.pop(history.pop(0), None)
+        logger.debug("PQC session %s accepted from %s", session_id.hex(), peer_id)
+        return session
+
+    def seal_many(self, peer_id: str, peer_pk, messages: Sequence[bytes]) -> Tuple[Optional[bytes], bytes]:
+        """Seal a batch for a peer under one session; rekey boundaries fall between batches."""
+        pending_bytes = sum(len(message) for message in messages)
+        session, handshake = self.session_for(peer_id, peer_pk, pending_bytes, len(messages))
+        return handshake, session.seal_many(messages)
+
+    def open_many(self, buffer: bytes) -> List[bytes]:
+        """Open a framed buffer, routing each frame to its accepted session."""
+        plaintexts = []
+        for session_id, counter, body in iter_frames(buffer):
+            session = self._inbound.get(session_id)
+            if session is None:
+                raise ValueError(f"Unknown PQC session: {session_id.hex()}")
+            plaintexts.append(session._open_frame(session_id, counter, body, b""))
+        return plaintexts
+
+    def drop(self, peer_id: str):
+        """Forget every session for a peer (e.g., on key compromise)."""
+        self._outbound.pop(peer_id, None)
+        for session_id in self._inbound_by_peer.pop(peer_id, []):
+            self._inbound.pop(session_id, None)
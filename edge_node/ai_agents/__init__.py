@@ -26,7 +26,8 @@ AI Agents Module
 from .epidemiological_forecasting_agent import EpidemiologicalForecastingAgent
 from .spatiotemporal_analysis_agent import SpatiotemporalAnalysisAgent
 from .early_warning_system_agent import EarlyWarningSystemAgent
-from .agent_orchestrator import AgentOrchestrator
+from .agent_orchestrator import AgentOrchestrator, CaseFrame
+from .execution_planner import AgentTask, ExecutionPlanner, PlanError
 
 
 __all__ = [
@@ -34,6 +35,10 @@ __all__ = [
     'SpatiotemporalAnalysisAgent',
     'EarlyWarningSystemAgent',
     'AgentOrchestrator',
+    'CaseFrame',
+    'AgentTask',
+    'ExecutionPlanner',
+    'PlanError',
 ]
 
 # --- Section --- Swahili Medical Intelligence
@@ -73,7 +78,7 @@ __version__ = "1.0.0"
 
 from .base_agent import BaseAgent, AgentCapability, AgentStatus
 from .offline_agent import OfflineAgent
-from .federated_client import FederatedLearningClient
+from .federated_client import FederatedLearningClient, PrivacyBudgetExhausted, RDPAccountant
 from .agent_registry import AgentRegistry
 
 __all__ = [
@@ -82,5 +87,7 @@ __all__ = [
     "AgentStatus",
     "OfflineAgent",
     "FederatedLearningClient",
+    "PrivacyBudgetExhausted",
+    "RDPAccountant",
     "AgentRegistry",
 ]
@@ -23,11 +23,15 @@ Core Capabilities:
 - Coordinated analysis workflows
 - Consolidated reporting and alerting
 - Compliance checking via SovereignGuardrail integration
+- Dependency-aware parallel execution: agents that only read the shared case
+  frame run concurrently, each under an optional deadline
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+import itertools
 import json
 
 from .epidemiological_forecasting_agent import (
@@ -46,6 +50,68 @@ from .early_warning_system_agent import (
     SensorReading,
     EarlyWarningAlert,
 )
+from .execution_planner import AgentTask, ExecutionPlanner, COMPLETED
+
+
+class CaseFrame:
+    """
+    Case records decoded once and shared by every agent in an analysis run.
+
+    A single pass groups records by their (disease, diagnosis, symptom) key, so
+    a per-disease selection tests each distinct key once instead of re-scanning
+    every record. The frame holds a reference to the record list; records are
+    only gathered into a new list when a selection is taken.
+    """
+
+    KEY_FIELDS = ("disease", "diagnosis", "symptom")
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, record in enumerate(records):
+            key = (record.get("disease"), record.get("diagnosis"), record.get("symptom"))
+            rows = groups.get(key)
+            if rows is None:
+                groups[key] = [index]
+            else:
+                rows.append(index)
+        self._groups = groups
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def keys(self) -> List[Dict[str, Any]]:
+        """The distinct key-field combinations, as records holding only those fields."""
+        return [
+            {name: value for name, value in zip(self.KEY_FIELDS, key) if value is not None}
+            for key in self._groups
+        ]
+
+    def select(self, predicate: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Records whose key fields satisfy predicate, in their original order.
+
+        predicate sees only the key fields, so it must not depend on anything else.
+        """
+        matching = [
+            rows for key_record, rows in zip(self.keys(), self._groups.values())
+            if predicate(key_record)
+        ]
+        if not matching:
+            return []
+        # Each group is already ascending; sorted() merges the runs in near-linear time
+        rows = matching[0] if len(matching) == 1 else sorted(itertools.chain.from_iterable(matching))
+        records = self.records
+        return [records[i] for i in rows]
+
+
+def _analyze_frame(
+    agent: SpatiotemporalAnalysisAgent,
+    frame: CaseFrame,
+    spatial_scale: SpatialScale,
+    temporal_scale: TemporalScale,
+) -> SpatiotemporalAnalysis:
+    return agent.analyze(case_data=frame.records, spatial_scale=spatial_scale, temporal_scale=temporal_scale)
 
 
 @dataclass
@@ -105,6 +171,8 @@ class AgentOrchestrator:
         population_size: int = 100000,
         coordinate_bounds: Optional[Dict[str, float]] = None,
         enable_compliance_checking: bool = True,
+        agent_deadlines: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the agent orchestrator.
@@ -114,10 +182,16 @@ class AgentOrchestrator:
             population_size: Population for epidemiological models
             coordinate_bounds: Geographic bounds for spatial analysis
             enable_compliance_checking: Enable SovereignGuardrail validation
+            agent_deadlines: Seconds allowed per analysis task ("alerts",
+                "spatial_analysis", "forecasts"); a late task is dropped from
+                the result instead of holding up the others
+            max_workers: Worker threads for the execution planner
         """
         self.location = location
         self.population_size = population_size
         self.enable_compliance = enable_compliance_checking
+        self.agent_deadlines = dict(agent_deadlines or {})
+        self.max_workers = max_workers
         
         # Initialize specialized agents
         self.forecasting_agent = EpidemiologicalForecastingAgent(
@@ -203,58 +277,42 @@ class AgentOrchestrator:
         forecast_horizon_days: int = 14,
         spatial_scale: SpatialScale = SpatialScale.DISTRICT,
         temporal_scale: TemporalScale = TemporalScale.WEEKLY,
+        parallel: bool = True,
     ) -> OrchestrationResult:
         """
         Run coordinated analysis across all agents.
         
+        The agents run as an execution plan (see build_analysis_plan): the
+        case frame is decoded once, then early warning, spatiotemporal
+        analysis and forecasting run concurrently. An agent that fails or
+        misses its deadline contributes nothing and the result is marked
+        partial in metadata["execution"].
+        
         Args:
             diseases: List of diseases to forecast (if None, inferred from data)
             forecast_horizon_days: Forecast period
             spatial_scale: Scale for spatial analysis
             temporal_scale: Scale for temporal analysis
+            parallel: False runs the same plan one agent at a time
             
         Returns:
             OrchestrationResult with consolidated findings
         """
-        # Step 1: Generate early warning alerts
         print(f"🔍 Checking for early warning signals in {self.location}...")
-        alerts = self.early_warning_agent.check_and_generate_alerts()
-        
-        # Step 2: Run spatiotemporal analysis
         print(f"🗺️ Performing spatiotemporal analysis at {spatial_scale.value} scale...")
-        spatial_analysis = None
-        if self.case_data_buffer:
-            spatial_analysis = self.spatial_agent.analyze(
-                case_data=self.case_data_buffer,
-                spatial_scale=spatial_scale,
-                temporal_scale=temporal_scale,
-            )
-        
-        # Step 3: Generate forecasts
         print(f"📈 Generating epidemiological forecasts...")
-        forecasts = []
+        planner = self.build_analysis_plan(diseases, forecast_horizon_days, spatial_scale, temporal_scale)
+        plan = planner.run({"case_records": self.case_data_buffer}, parallel=parallel)
         
-        # Identify diseases to forecast
-        if not diseases:
-            diseases = self._identify_diseases_from_data()
+        alerts = plan.values.get("alerts", [])
+        spatial_analysis = plan.values.get("spatial_analysis")
+        forecasts = plan.values.get("forecasts", [])
         
-        for disease in diseases:
-            # Filter historical data for this disease
-            disease_data = [
-                record for record in self.case_data_buffer
-                if self._matches_disease(record, disease)
-            ]
-            
-            if disease_data:
-                forecast = self.forecasting_agent.forecast_outbreak(
-                    disease=disease,
-                    historical_data=disease_data,
-                    forecast_horizon_days=forecast_horizon_days,
-                    model=ForecastModel.SEIR,
-                )
-                forecasts.append(forecast)
+        for name, outcome in plan.outcomes.items():
+            if outcome.status != COMPLETED:
+                print(f"⚠️ {name} {outcome.status}: {outcome.error}")
         
-        # Step 4: Validate compliance (if enabled)
+        # Validate compliance (if enabled)
         compliance_status = self._check_compliance(forecasts, spatial_analysis, alerts)
         
         # Step 5: Generate summary
@@ -274,6 +332,7 @@ class AgentOrchestrator:
                 "forecast_horizon_days": forecast_horizon_days,
                 "spatial_scale": spatial_scale.value,
                 "temporal_scale": temporal_scale.value,
+                "execution": {"parallel": parallel, **plan.to_dict()},
             }
         )
         
@@ -283,6 +342,73 @@ class AgentOrchestrator:
         
         return result
     
+    def build_analysis_plan(
+        self,
+        diseases: Optional[List[str]] = None,
+        forecast_horizon_days: int = 14,
+        spatial_scale: SpatialScale = SpatialScale.DISTRICT,
+        temporal_scale: TemporalScale = TemporalScale.WEEKLY,
+    ) -> ExecutionPlanner:
+        """
+        Declare the agent tasks of a full analysis and their data dependencies.
+        
+        case_records ─▶ case_frame ─┬▶ spatial_analysis
+                                    └▶ forecasts
+        (no inputs) ──────────────────▶ alerts
+        
+        Every agent runs on a thread. Spatiotemporal analysis is pure CPU, but
+        a forkserver/spawn worker would have to pickle the whole frame to it,
+        which costs more than the analysis saves (see
+        benchmarks/orchestrator_parallel.py).
+        """
+        planner = ExecutionPlanner(max_workers=self.max_workers)
+        deadline = self.agent_deadlines.get
+        
+        planner.add(AgentTask(
+            "alerts",
+            self.early_warning_agent.check_and_generate_alerts,
+            deadline=deadline("alerts"),
+        ))
+        planner.add(AgentTask("case_frame", CaseFrame, inputs=("case_records",)))
+        if self.case_data_buffer:
+            planner.add(AgentTask(
+                "spatial_analysis",
+                partial(_analyze_frame, self.spatial_agent,
+                        spatial_scale=spatial_scale, temporal_scale=temporal_scale),
+                inputs=("case_frame",),
+                deadline=deadline("spatial_analysis"),
+            ))
+        planner.add(AgentTask(
+            "forecasts",
+            partial(self._run_forecasts, diseases=diseases, forecast_horizon_days=forecast_horizon_days),
+            inputs=("case_frame",),
+            deadline=deadline("forecasts"),
+        ))
+        return planner
+    
+    def _run_forecasts(
+        self,
+        frame: CaseFrame,
+        diseases: Optional[List[str]],
+        forecast_horizon_days: int,
+    ) -> List[EpidemicForecast]:
+        """Forecast every disease that has matching records in the frame."""
+        if not diseases:
+            diseases = self._identify_diseases_from_data(frame)
+        
+        forecasts = []
+        for disease in diseases:
+            disease_data = frame.select(lambda record: self._matches_disease(record, disease))
+            if disease_data:
+                forecast = self.forecasting_agent.forecast_outbreak(
+                    disease=disease,
+                    historical_data=disease_data,
+                    forecast_horizon_days=forecast_horizon_days,
+                    model=ForecastModel.SEIR,
+                )
+                forecasts.append(forecast)
+        return forecasts
+    
     def run_realtime_monitoring(self) -> Dict[str, Any]:
         """
         Run real-time monitoring mode - lightweight checks for immediate alerts.
@@ -330,11 +456,11 @@ class AgentOrchestrator:
         else:
             return "Unsupported format"
     
-    def _identify_diseases_from_data(self) -> List[str]:
+    def _identify_diseases_from_data(self, frame: Optional[CaseFrame] = None) -> List[str]:
         """Identify diseases present in case data."""
         diseases = set()
         
-        for record in self.case_data_buffer:
+        for record in (frame.keys() if frame is not None else self.case_data_buffer):
             if "disease" in record:
                 diseases.add(record["disease"])
             if "diagnosis" in record:
@@ -19,8 +19,13 @@ tags, and requirements.
 Philosophy: "Find the right agent for the right task, anywhere, anytime."
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterable, Set, Tuple, Type
 from datetime import datetime
+from pathlib import Path
+import heapq
+import itertools
+import json
+import os
 from .base_agent import BaseAgent, AgentCapability, AgentStatus
 
 
@@ -34,6 +39,13 @@ class AgentRegistry:
     - Tag-based filtering
     - Status monitoring
     - Multi-criteria matching
+    - Least-loaded routing
+    - Snapshot/restore across restarts
+    
+    Lookups go through inverted indexes (capability, type, tag, status ->
+    agents, kept as insertion-ordered dicts) maintained on
+    register/unregister and, via a status listener on each agent, on every
+    status change. Results keep registration order.
     
     Usage:
         registry = AgentRegistry()
@@ -50,12 +62,128 @@ class AgentRegistry:
         
         # Search by tags
         health_agents = registry.search_by_tags(["health", "surveillance"])
+        
+        # Route to the least-loaded online agent with a capability
+        agent = registry.select_least_loaded([AgentCapability.FEDERATED_LEARNING],
+                                             status=AgentStatus.ONLINE)
     """
     
+    SNAPSHOT_VERSION = 1
+    
     def __init__(self):
         """Initialize agent registry."""
         self.agents: Dict[str, BaseAgent] = {}
         self.registration_log: List[Dict[str, Any]] = []
+        self._order: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._by_capability: Dict[AgentCapability, Dict[str, BaseAgent]] = {}
+        self._by_type: Dict[str, Dict[str, BaseAgent]] = {}
+        self._by_tag: Dict[str, Dict[str, BaseAgent]] = {}
+        self._by_status: Dict[AgentStatus, Dict[str, BaseAgent]] = {}
+        self._indexed: Dict[str, Dict[str, Any]] = {}
+        # Routing: agent load plus one lazy min-heap per capability (and one for all agents)
+        self.loads: Dict[str, int] = {}
+        self._heaps: Dict[Optional[AgentCapability], List[Tuple[int, int, str]]] = {}
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Index maintenance
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def _index(self, agent: BaseAgent, load: Optional[int] = None, route: bool = True):
+        agent_id = agent.metadata.agent_id
+        capabilities = list(dict.fromkeys(agent.get_capabilities()))
+        tags = list(dict.fromkeys(agent.metadata.tags))
+        agent_type = type(agent).__name__
+        self.agents[agent_id] = agent
+        self._order[agent_id] = next(self._sequence)
+        for capability in capabilities:
+            self._by_capability.setdefault(capability, {})[agent_id] = agent
+        for tag in tags:
+            self._by_tag.setdefault(tag, {})[agent_id] = agent
+        self._by_type.setdefault(agent_type, {})[agent_id] = agent
+        self._by_status.setdefault(agent.status, {})[agent_id] = agent
+        self._indexed[agent_id] = {"capabilities": capabilities, "tags": tags, "type": agent_type}
+        agent.add_status_listener(self._on_status_change)
+        if load is None:
+            load = sum(1 for op in getattr(agent, "operation_queue", []) if op.status == "pending")
+        if route:
+            self._push_load(agent_id, load)
+        else:
+            self.loads[agent_id] = load
+    
+    def _rebuild_heaps(self):
+        """Build every routing heap in O(n) (bulk restore)."""
+        loads, order = self.loads, self._order
+        self._heaps = {None: [(loads[a], order[a], a) for a in self.agents]}
+        for capability, members in self._by_capability.items():
+            self._heaps[capability] = [(loads[a], order[a], a) for a in members]
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+    
+    def _unindex(self, agent_id: str) -> BaseAgent:
+        agent = self.agents.pop(agent_id)
+        indexed = self._indexed.pop(agent_id)
+        for capability in indexed["capabilities"]:
+            self._discard(self._by_capability, capability, agent_id)
+        for tag in indexed["tags"]:
+            self._discard(self._by_tag, tag, agent_id)
+        self._discard(self._by_type, indexed["type"], agent_id)
+        self._discard(self._by_status, agent.status, agent_id)
+        self._order.pop(agent_id, None)
+        self.loads.pop(agent_id, None)  # heap entries become stale and are skipped
+        agent.remove_status_listener(self._on_status_change)
+        return agent
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[str, BaseAgent]], key: Any, agent_id: str):
+        members = index.get(key)
+        if members is not None:
+            members.pop(agent_id, None)
+            if not members:
+                del index[key]
+    
+    def _on_status_change(self, agent: BaseAgent, old_status: AgentStatus, new_status: AgentStatus):
+        agent_id = agent.metadata.agent_id
+        if self.agents.get(agent_id) is not agent:
+            return
+        self._discard(self._by_status, old_status, agent_id)
+        self._by_status.setdefault(new_status, {})[agent_id] = agent
+    
+    def reindex(self, agent_id: str):
+        """Refresh indexes after an agent's capabilities or tags were edited in place."""
+        load = self.loads.get(agent_id, 0)
+        order = self._order[agent_id]
+        agent = self._unindex(agent_id)
+        self._index(agent, load)
+        self._order[agent_id] = order
+    
+    def _in_registration_order(self, agent_ids: Set[str], driver: Dict[str, BaseAgent]) -> List[BaseAgent]:
+        """Order a result set; `driver` is a registration-ordered superset."""
+        if len(agent_ids) * 8 < len(driver):
+            agents = self.agents
+            return [agents[a] for a in sorted(agent_ids, key=self._order.__getitem__)]
+        return [agent for agent_id, agent in driver.items() if agent_id in agent_ids]
+    
+    def _match(self, index: Dict[Any, Dict[str, BaseAgent]], keys: Iterable[Any], match_all: bool) -> List[BaseAgent]:
+        """Agents in any/all postings of `keys`, in registration order."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return list(self.agents.values()) if match_all else []
+        postings = [index.get(key, {}) for key in keys]
+        if len(postings) == 1:
+            return list(postings[0].values())
+        if match_all:
+            postings.sort(key=len)
+            matched = postings[0].keys() & postings[1].keys()
+            for other in postings[2:]:
+                matched &= other.keys()
+            return self._in_registration_order(matched, postings[0])
+        merged = set().union(*(posting.keys() for posting in postings))
+        return self._in_registration_order(merged, self.agents)
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Registration
+    # ─────────────────────────────────────────────────────────────────────────
     
     def register(self, agent: BaseAgent) -> bool:
         """
@@ -73,7 +201,7 @@ class AgentRegistry:
             print(f"⚠️  Agent already registered: {agent.metadata.name} ({agent_id})")
             return False
         
-        self.agents[agent_id] = agent
+        self._index(agent)
         
         self.registration_log.append({
             "agent_id": agent_id,
@@ -99,8 +227,7 @@ class AgentRegistry:
             print(f"⚠️  Agent not found: {agent_id}")
             return False
         
-        agent = self.agents[agent_id]
-        del self.agents[agent_id]
+        agent = self._unindex(agent_id)
         
         self.registration_log.append({
             "agent_id": agent_id,
@@ -124,6 +251,10 @@ class AgentRegistry:
         """
         return self.agents.get(agent_id)
     
+    # ─────────────────────────────────────────────────────────────────────────
+    # Search
+    # ─────────────────────────────────────────────────────────────────────────
+    
     def search_by_capabilities(
         self,
         required_capabilities: List[AgentCapability],
@@ -140,22 +271,7 @@ class AgentRegistry:
         Returns:
             List of matching agents
         """
-        matching_agents = []
-        
-        for agent in self.agents.values():
-            agent_capabilities = set(agent.get_capabilities())
-            required_set = set(required_capabilities)
-            
-            if match_all:
-                # Agent must have all required capabilities
-                if required_set.issubset(agent_capabilities):
-                    matching_agents.append(agent)
-            else:
-                # Agent must have at least one required capability
-                if required_set.intersection(agent_capabilities):
-                    matching_agents.append(agent)
-        
-        return matching_agents
+        return self._match(self._by_capability, required_capabilities, match_all)
     
     def search_by_tags(
         self,
@@ -173,20 +289,7 @@ class AgentRegistry:
         Returns:
             List of matching agents
         """
-        matching_agents = []
-        
-        for agent in self.agents.values():
-            agent_tags = set(agent.metadata.tags)
-            search_tags = set(tags)
-            
-            if match_all:
-                if search_tags.issubset(agent_tags):
-                    matching_agents.append(agent)
-            else:
-                if search_tags.intersection(agent_tags):
-                    matching_agents.append(agent)
-        
-        return matching_agents
+        return self._match(self._by_tag, tags, match_all)
     
     def search_by_status(
         self,
@@ -201,10 +304,25 @@ class AgentRegistry:
         Returns:
             List of agents with matching status
         """
-        return [
-            agent for agent in self.agents.values()
-            if agent.status == status
-        ]
+        # Status postings are ordered by when agents entered the status
+        members = self._by_status.get(status, {})
+        return [members[a] for a in sorted(members, key=self._order.__getitem__)]
+    
+    def search_by_type(
+        self,
+        agent_type: Any,
+    ) -> List[BaseAgent]:
+        """
+        Search agents by concrete type.
+        
+        Args:
+            agent_type: Agent class or class name (exact type, not subclasses)
+            
+        Returns:
+            List of agents of that type
+        """
+        name = agent_type if isinstance(agent_type, str) else agent_type.__name__
+        return list(self._by_type.get(name, {}).values())
     
     def search_by_name(
         self,
@@ -257,28 +375,22 @@ class AgentRegistry:
         Returns:
             List of matching agents
         """
-        results = list(self.agents.values())
-        
-        # Filter by capabilities
+        # Narrow with the indexes first: intersect id sets, smallest first
+        id_sets: List[Set[str]] = []
         if capabilities:
-            results = [
-                agent for agent in results
-                if set(capabilities).issubset(set(agent.get_capabilities()))
-            ]
-        
-        # Filter by tags
+            id_sets.extend(self._by_capability.get(c, {}).keys() for c in set(capabilities))
         if tags:
-            results = [
-                agent for agent in results
-                if set(tags).intersection(set(agent.metadata.tags))
-            ]
-        
-        # Filter by status
+            id_sets.append(set().union(*(self._by_tag.get(t, {}).keys() for t in tags)))
         if status:
-            results = [
-                agent for agent in results
-                if agent.status == status
-            ]
+            id_sets.append(self._by_status.get(status, {}).keys())
+        if id_sets:
+            id_sets.sort(key=len)
+            matched = set(id_sets[0])
+            for other in id_sets[1:]:
+                matched &= other
+            results = self._in_registration_order(matched, self.agents)
+        else:
+            results = list(self.agents.values())
         
         # Filter by name pattern
         if name_pattern:
@@ -297,6 +409,82 @@ class AgentRegistry:
         
         return results
     
+    # ─────────────────────────────────────────────────────────────────────────
+    # Least-loaded routing
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def _push_load(self, agent_id: str, load: int):
+        self.loads[agent_id] = load
+        entry_keys = [None] + self._indexed[agent_id]["capabilities"]
+        for key in entry_keys:
+            heap = self._heaps.setdefault(key, [])
+            heapq.heappush(heap, (load, self._order[agent_id], agent_id))
+            members = self.agents if key is None else self._by_capability.get(key, ())
+            if len(heap) > 64 and len(heap) > 2 * len(members):
+                # Mostly stale entries: rebuild from current loads
+                heap[:] = [(self.loads[a], self._order[a], a) for a in members]
+                heapq.heapify(heap)
+    
+    def report_load(self, agent_id: str, load: int):
+        """Set an agent's current load (e.g. pending operations or in-flight tasks)."""
+        if agent_id not in self.agents:
+            raise KeyError(agent_id)
+        if self.loads.get(agent_id) != load:
+            self._push_load(agent_id, load)
+    
+    def release(self, agent_id: str, amount: int = 1):
+        """Decrease an agent's load when routed work completes."""
+        if agent_id in self.agents:
+            self.report_load(agent_id, max(self.loads[agent_id] - amount, 0))
+    
+    def select_least_loaded(
+        self,
+        capabilities: Optional[List[AgentCapability]] = None,
+        status: Optional[AgentStatus] = None,
+        reserve: bool = True,
+    ) -> Optional[BaseAgent]:
+        """
+        Pick the least-loaded agent with all the given capabilities.
+        
+        Args:
+            capabilities: Required capabilities
+            status: Required status (any if None)
+            reserve: Count the routed task against the chosen agent's load
+            
+        Returns:
+            Agent instance or None if no agent qualifies
+        """
+        capabilities = list(dict.fromkeys(capabilities or []))
+        if capabilities:
+            postings = [(len(self._by_capability.get(c, ())), c) for c in capabilities]
+            key = min(postings, key=lambda p: p[0])[1]
+            required = set(capabilities) - {key}
+        else:
+            key, required = None, set()
+        heap = self._heaps.get(key, [])
+        skipped = []
+        chosen = None
+        while heap:
+            load, _, agent_id = heap[0]
+            if self.loads.get(agent_id) != load or agent_id not in self.agents:
+                heapq.heappop(heap)  # stale entry
+                continue
+            agent = self.agents[agent_id]
+            if (status is None or agent.status == status) and \
+                    required.issubset(self._indexed[agent_id]["capabilities"]):
+                chosen = agent
+                break
+            skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        if chosen is not None and reserve:
+            self.report_load(chosen.metadata.agent_id, self.loads[chosen.metadata.agent_id] + 1)
+        return chosen
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Summaries
+    # ─────────────────────────────────────────────────────────────────────────
+    
     def get_all_agents(self) -> List[BaseAgent]:
         """Get all registered agents."""
         return list(self.agents.values())
@@ -312,14 +500,7 @@ class AgentRegistry:
         Returns:
             Dict mapping capability to count of agents with that capability
         """
-        distribution = {}
-        
-        for agent in self.agents.values():
-            for capability in agent.get_capabilities():
-                cap_name = capability.value
-                distribution[cap_name] = distribution.get(cap_name, 0) + 1
-        
-        return distribution
+        return {capability.value: len(ids) for capability, ids in self._by_capability.items()}
     
     def get_status_distribution(self) -> Dict[str, int]:
         """
@@ -328,13 +509,7 @@ class AgentRegistry:
         Returns:
             Dict mapping status to count
         """
-        distribution = {}
-        
-        for agent in self.agents.values():
-            status_name = agent.status.value
-            distribution[status_name] = distribution.get(status_name, 0) + 1
-        
-        return distribution
+        return {status.value: len(ids) for status, ids in self._by_status.items()}
     
     def get_registry_summary(self) -> Dict[str, Any]:
         """
@@ -374,6 +549,119 @@ class AgentRegistry:
             ],
             "registration_log": self.registration_log,
         }
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # Snapshot / restore
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    def snapshot(self, path: str) -> int:
+        """
+        Write the registry (agent metadata, status, load, log) to a JSON file
+        atomically (temp file + fsync + rename).
+        
+        Returns:
+            Number of agents written
+        """
+        data = {
+            "version": self.SNAPSHOT_VERSION,
+            "snapshot_timestamp": datetime.utcnow().isoformat(),
+            "agents": [
+                {
+                    "type": type(agent).__name__,
+                    "metadata": agent.metadata.to_dict(),
+                    "status": agent.status.value,
+                    "load": self.loads.get(agent_id, 0),
+                }
+                for agent_id, agent in self.agents.items()
+            ],
+            "registration_log": self.registration_log,
+        }
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+        return len(data["agents"])
+    
+    @staticmethod
+    def _agent_types() -> Dict[str, Type[BaseAgent]]:
+        types, pending = {}, [BaseAgent]
+        while pending:
+            cls = pending.pop()
+            for subclass in cls.__subclasses__():
+                types.setdefault(subclass.__name__, subclass)
+                pending.append(subclass)
+        return types
+    
+    @staticmethod
+    def _rebuild_agent(record: Dict[str, Any], agent_cls: Type[BaseAgent]) -> BaseAgent:
+        metadata = record["metadata"]
+        agent = agent_cls(
+            name=metadata["name"],
+            version=metadata["version"],
+            capabilities=[AgentCapability(c) for c in metadata["capabilities"]],
+            description=metadata.get("description", ""),
+            tags=metadata.get("tags", []),
+        )
+        agent.metadata.agent_id = metadata["agent_id"]
+        agent.metadata.capabilities = [AgentCapability(c) for c in metadata["capabilities"]]
+        agent.metadata.created_at = datetime.fromisoformat(metadata["created_at"])
+        if metadata.get("last_online"):
+            agent.metadata.last_online = datetime.fromisoformat(metadata["last_online"])
+        agent._status = AgentStatus(record["status"])
+        return agent
+    
+    @classmethod
+    def restore(
+        cls,
+        path: str,
+        live_agents: Optional[Iterable[BaseAgent]] = None,
+        agent_factory: Optional[Callable[[Dict[str, Any]], Optional[BaseAgent]]] = None,
+    ) -> "AgentRegistry":
+        """
+        Rebuild a registry from a snapshot without re-registering each agent.
+        
+        Agents still alive in this process (live_agents) are re-attached by
+        id. Other records are rebuilt by agent_factory(record) or, by
+        default, by the recorded agent class. Records that cannot be rebuilt
+        are skipped.
+        
+        Args:
+            path: Snapshot written by snapshot()
+            live_agents: Existing agent instances to re-attach
+            agent_factory: Custom record -> agent constructor
+            
+        Returns:
+            Restored registry
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported registry snapshot version: {data.get('version')}")
+        registry = cls()
+        live = {agent.metadata.agent_id: agent for agent in (live_agents or [])}
+        types = cls._agent_types()
+        for record in data["agents"]:
+            agent_id = record["metadata"]["agent_id"]
+            agent = live.get(agent_id)
+            if agent is None and agent_factory is not None:
+                agent = agent_factory(record)
+            if agent is None and record["type"] in types:
+                try:
+                    agent = cls._rebuild_agent(record, types[record["type"]])
+                except TypeError:
+                    agent = None  # constructor needs more than the base agent arguments
+            if agent is None:
+                print(f"⚠️  Could not restore agent: {record['metadata']['name']} ({agent_id})")
+                continue
+            registry._index(agent, record.get("load", 0), route=False)
+        registry._rebuild_heaps()
+        registry.registration_log = data.get("registration_log", [])
+        print(f"✅ Restored {registry.get_agent_count()} agents from snapshot")
+        return registry
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -19,7 +19,7 @@ intermittent connectivity handling.
 Philosophy: "Sovereign agents operate with dignity even in digital darkness."
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -150,7 +150,8 @@ class BaseAgent(ABC):
             description=description,
             tags=tags or [],
         )
-        self.status = AgentStatus.OFFLINE
+        self._status_listeners: List[Callable[["BaseAgent", AgentStatus, AgentStatus], None]] = []
+        self._status = AgentStatus.OFFLINE
         self.operation_queue: List[OperationRecord] = []
         self.execution_log: List[Dict[str, Any]] = []
         self.local_state: Dict[str, Any] = {}
@@ -235,6 +236,27 @@ class BaseAgent(ABC):
         """
         pass
     
+    @property
+    def status(self) -> AgentStatus:
+        """Current operational status."""
+        return self._status
+    
+    @status.setter
+    def status(self, status: AgentStatus):
+        old_status = self._status
+        self._status = status
+        if status != old_status:
+            for listener in list(self._status_listeners):
+                listener(self, old_status, status)
+    
+    def add_status_listener(self, listener: Callable[["BaseAgent", AgentStatus, AgentStatus], None]):
+        """Call listener(agent, old_status, new_status) on every status change (e.g. registry indexes)."""
+        self._status_listeners.append(listener)
+    
+    def remove_status_listener(self, listener: Callable[["BaseAgent", AgentStatus, AgentStatus], None]):
+        if listener in self._status_listeners:
+            self._status_listeners.remove(listener)
+    
     def set_status(self, status: AgentStatus):
         """Update agent status."""
         old_status = self.status
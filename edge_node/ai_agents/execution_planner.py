@@ -0,0 +1,418 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+# 
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS 
+# solutions is STRICTLY PROHIBITED without a commercial license.
+# 
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are 
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+Agent Execution Planner
+═════════════════════════════════════════════════════════════════════════════
+
+Runs agent tasks as a dependency graph. Each task declares the named inputs it
+reads and the outputs it produces; the planner derives the DAG from those
+declarations and starts every task as soon as its inputs exist.
+
+Execution model:
+- CPU-bound tasks run in their own worker process, started at the moment the
+  task becomes ready. Workers come from a forkserver (spawn where that is
+  unavailable), never from a plain fork of this process: thread-pool tasks
+  are running at that point, and a child forked while one of them holds a
+  lock (logging, the import lock, an allocator) can deadlock. The task's
+  function and inputs are therefore pickled, so they must be module-level
+  callables (or partials of them) and picklable values; the result travels
+  back over a pipe.
+- I/O-bound tasks, and tasks that must mutate in-process agent state, run on
+  a thread pool.
+- Per-task deadlines: a task still running past its deadline is abandoned,
+  everything downstream of it is skipped, and the run returns whatever did
+  complete. A worker process is terminated; a thread cannot be, so a
+  timed-out thread task keeps running in the background and any agent state
+  it mutates after the deadline is still mutated. Give such tasks their own
+  way to stop early if that matters.
+"""
+
+from typing import Dict, Any, Optional, List, Callable, Iterable, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import os
+import time
+
+from core.utils.process_context import worker_context
+
+
+COMPLETED = "completed"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+SKIPPED = "skipped"
+
+
+class PlanError(ValueError):
+    """Raised when task declarations do not form a valid DAG."""
+
+
+@dataclass
+class AgentTask:
+    """
+    One node of the execution graph.
+
+    The planner calls func(*[value of each input]); a task with several
+    outputs must return a tuple in the same order.
+    """
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()  # defaults to (name,)
+    cpu_bound: bool = False  # func and inputs must then be picklable
+    deadline: Optional[float] = None  # seconds from the moment the task starts; threads are not stopped
+
+    def __post_init__(self):
+        self.inputs = tuple(self.inputs)
+        self.outputs = tuple(self.outputs) or (self.name,)
+
+
+@dataclass
+class TaskOutcome:
+    """How one task ended."""
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+    isolated: bool = False  # ran in a worker process; agent state it mutated stayed there
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "seconds": self.seconds,
+            "error": self.error,
+            "isolated": self.isolated,
+        }
+
+
+@dataclass
+class PlanResult:
+    """Outputs of every completed task plus per-task outcomes and timings."""
+    values: Dict[str, Any]
+    outcomes: Dict[str, TaskOutcome]
+    wall_seconds: float
+    critical_path_seconds: float
+
+    @property
+    def partial(self) -> bool:
+        """True when at least one task did not complete."""
+        return any(o.status != COMPLETED for o in self.outcomes.values())
+
+    @property
+    def serial_seconds(self) -> float:
+        """Summed task run time, i.e. the wall clock of a one-at-a-time schedule."""
+        return sum(o.seconds for o in self.outcomes.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "partial": self.partial,
+            "wall_seconds": self.wall_seconds,
+            "serial_seconds": self.serial_seconds,
+            "critical_path_seconds": self.critical_path_seconds,
+            "tasks": {name: o.to_dict() for name, o in self.outcomes.items()},
+        }
+
+
+class _RemoteError(RuntimeError):
+    """A task raised inside its worker process (message already formatted)."""
+
+
+def _describe(exc: BaseException) -> str:
+    if isinstance(exc, _RemoteError):
+        return str(exc)
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _process_context():
+    # Workers are started while thread-pool tasks run, so forking this process is unsafe
+    return worker_context()
+
+
+def _child_main(conn, func: Callable[..., Any], args: List[Any]):
+    try:
+        payload = (True, func(*args))
+    except BaseException as exc:
+        payload = (False, _describe(exc))
+    try:
+        conn.send(payload)
+    finally:
+        conn.close()
+
+
+class _ProcessCall:
+    """A CPU-bound task running in its own worker process."""
+
+    def __init__(self, context, func: Callable[..., Any], args: List[Any]):
+        self._reader, writer = context.Pipe(duplex=False)
+        self.process = context.Process(target=_child_main, args=(writer, func, args), daemon=True)
+        self.process.start()
+        # Only the child may hold the write end, so its exit shows up as EOF
+        writer.close()
+
+    def result(self) -> Any:
+        try:
+            ok, payload = self._reader.recv()
+        except EOFError:
+            self.process.join()
+            raise _RemoteError(f"worker process exited with code {self.process.exitcode}")
+        finally:
+            self._reader.close()
+        self.process.join()
+        if not ok:
+            raise _RemoteError(payload)
+        return payload
+
+    def terminate(self):
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class ExecutionPlanner:
+    """
+    Dependency-aware scheduler for agent tasks.
+
+    Usage:
+        planner = ExecutionPlanner()
+        planner.add(AgentTask("frame", CaseFrame, inputs=("records",)))
+        planner.add(AgentTask("spatial", analyze, inputs=("frame",), cpu_bound=True, deadline=30.0))
+        planner.add(AgentTask("alerts", agent.check_and_generate_alerts))
+        result = planner.run({"records": case_records})
+        result.values.get("spatial"), result.partial
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_processes: Optional[int] = None):
+        """
+        Args:
+            max_workers: Thread pool size (default: min(32, cpu + 4))
+            max_processes: Concurrent worker processes for CPU-bound tasks (default: cpu count)
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_processes = max_processes or (os.cpu_count() or 1)
+        self.tasks: Dict[str, AgentTask] = {}
+        self._producers: Dict[str, str] = {}
+
+    def add(self, task: AgentTask) -> AgentTask:
+        """Declare a task; its outputs must not already be produced by another task."""
+        if task.name in self.tasks:
+            raise PlanError(f"Duplicate task {task.name!r}")
+        for output in task.outputs:
+            if output in self._producers:
+                raise PlanError(
+                    f"Output {output!r} is produced by both {self._producers[output]!r} and {task.name!r}"
+                )
+        self.tasks[task.name] = task
+        for output in task.outputs:
+            self._producers[output] = task.name
+        return task
+
+    def dependencies(self, name: str) -> List[str]:
+        """Tasks whose outputs the named task reads."""
+        return list(dict.fromkeys(
+            self._producers[key] for key in self.tasks[name].inputs if key in self._producers
+        ))
+
+    def order(self, provided: Iterable[str] = ()) -> List[str]:
+        """
+        Topological order of the tasks (declaration order among peers).
+
+        Args:
+            provided: Input names supplied by the caller rather than a task
+
+        Raises:
+            PlanError: An input has no producer, or the graph has a cycle
+        """
+        provided = set(provided)
+        for task in self.tasks.values():
+            missing = [key for key in task.inputs if key not in self._producers and key not in provided]
+            if missing:
+                raise PlanError(f"Task {task.name!r} reads undeclared input(s): {', '.join(missing)}")
+
+        dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        indegree: Dict[str, int] = {}
+        for name in self.tasks:
+            deps = self.dependencies(name)
+            indegree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+
+        ready = [name for name in self.tasks if indegree[name] == 0]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in dependents[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self.tasks):
+            cyclic = [name for name in self.tasks if name not in order]
+            raise PlanError(f"Task graph has a cycle through: {', '.join(cyclic)}")
+        return order
+
+    def run(self, inputs: Optional[Dict[str, Any]] = None, parallel: bool = True) -> PlanResult:
+        """
+        Execute the graph.
+
+        Args:
+            inputs: Values for inputs no task produces (shared by reference)
+            parallel: False runs tasks one at a time in the calling thread, in
+                topological order; deadlines are not enforced in that mode
+
+        Returns:
+            PlanResult; a failed or timed-out task leaves its outputs, and those
+            of every task downstream of it, absent from values
+        """
+        values: Dict[str, Any] = dict(inputs or {})
+        order = self.order(values)
+        outcomes: Dict[str, TaskOutcome] = {}
+
+        started = time.perf_counter()
+        if parallel:
+            self._run_parallel(order, values, outcomes)
+        else:
+            self._run_inline(order, values, outcomes)
+        wall = time.perf_counter() - started
+
+        return PlanResult(
+            values={key: value for key, value in values.items() if key in self._producers},
+            outcomes={name: outcomes[name] for name in order},
+            wall_seconds=wall,
+            critical_path_seconds=self._critical_path(order, outcomes),
+        )
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Schedulers
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _run_inline(self, order: List[str], values: Dict[str, Any], outcomes: Dict[str, TaskOutcome]):
+        for name in order:
+            task = self.tasks[name]
+            blocked = self._blocked_by(name, outcomes)
+            if blocked:
+                outcomes[name] = TaskOutcome(name, SKIPPED, error=f"upstream {blocked!r} did not complete")
+                continue
+            started = time.perf_counter()
+            try:
+                self._store(task, task.func(*[values[key] for key in task.inputs]), values)
+            except Exception as exc:
+                outcomes[name] = TaskOutcome(name, FAILED, time.perf_counter() - started, _describe(exc))
+            else:
+                outcomes[name] = TaskOutcome(name, COMPLETED, time.perf_counter() - started)
+
+    def _run_parallel(self, order: List[str], values: Dict[str, Any], outcomes: Dict[str, TaskOutcome]):
+        context = _process_context()
+        threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix="agent-task")
+        pending = list(order)
+        running: Dict[Future, Tuple[AgentTask, float, Optional[_ProcessCall]]] = {}
+        processes = 0
+
+        try:
+            while pending or running:
+                # Start (or skip) everything whose dependencies have settled. pending is
+                # topologically ordered, so a skip propagates downstream in one pass.
+                for name in list(pending):
+                    task = self.tasks[name]
+                    deps = self.dependencies(name)
+                    if any(dep not in outcomes for dep in deps):
+                        continue
+                    blocked = self._blocked_by(name, outcomes)
+                    if blocked:
+                        pending.remove(name)
+                        outcomes[name] = TaskOutcome(name, SKIPPED, error=f"upstream {blocked!r} did not complete")
+                        continue
+                    if task.cpu_bound and processes >= self.max_processes:
+                        continue
+                    pending.remove(name)
+                    args = [values[key] for key in task.inputs]
+                    call = None
+                    if task.cpu_bound:
+                        try:
+                            call = _ProcessCall(context, task.func, args)
+                        except OSError as exc:
+                            outcomes[name] = TaskOutcome(name, FAILED, error=_describe(exc), isolated=True)
+                            continue
+                        processes += 1
+                        future = threads.submit(call.result)
+                    else:
+                        future = threads.submit(task.func, *args)
+                    running[future] = (task, time.perf_counter(), call)
+
+                if not running:
+                    break
+
+                expiries = [
+                    started + task.deadline
+                    for task, started, _ in running.values()
+                    if task.deadline is not None
+                ]
+                timeout = max(0.0, min(expiries) - time.perf_counter()) if expiries else None
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task, started, call = running.pop(future)
+                    if call is not None:
+                        processes -= 1
+                    elapsed = time.perf_counter() - started
+                    try:
+                        self._store(task, future.result(), values)
+                    except Exception as exc:
+                        outcomes[task.name] = TaskOutcome(task.name, FAILED, elapsed, _describe(exc), call is not None)
+                    else:
+                        outcomes[task.name] = TaskOutcome(task.name, COMPLETED, elapsed, isolated=call is not None)
+
+                now = time.perf_counter()
+                for future, (task, started, call) in list(running.items()):
+                    if task.deadline is None or now - started < task.deadline:
+                        continue
+                    del running[future]
+                    if call is not None:
+                        call.terminate()
+                        processes -= 1
+                    # A thread cannot be stopped: it runs on (and may still mutate agent
+                    # state), only its late result is discarded
+                    outcomes[task.name] = TaskOutcome(
+                        task.name, TIMED_OUT, now - started,
+                        f"exceeded {task.deadline:g}s deadline", call is not None,
+                    )
+        finally:
+            for _, _, call in running.values():
+                if call is not None:
+                    call.terminate()
+            threads.shutdown(wait=False, cancel_futures=True)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Helpers
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _blocked_by(self, name: str, outcomes: Dict[str, TaskOutcome]) -> Optional[str]:
+        for dep in self.dependencies(name):
+            if outcomes[dep].status != COMPLETED:
+                return dep
+        return None
+
+    def _store(self, task: AgentTask, result: Any, values: Dict[str, Any]):
+        if len(task.outputs) == 1:
+            values[task.outputs[0]] = result
+            return
+        result = tuple(result)
+        if len(result) != len(task.outputs):
+            raise PlanError(f"Task {task.name!r} returned {len(result)} values for {len(task.outputs)} outputs")
+        values.update(zip(task.outputs, result))
+
+    def _critical_path(self, order: List[str], outcomes: Dict[str, TaskOutcome]) -> float:
+        """Longest dependency chain of measured task times (the many-core wall clock bound)."""
+        finish: Dict[str, float] = {}
+        for name in order:
+            upstream = max((finish[dep] for dep in self.dependencies(name)), default=0.0)
+            finish[name] = upstream + outcomes[name].seconds
+        return max(finish.values(), default=0.0)
@@ -19,33 +19,184 @@ training without sharing raw data.
 Philosophy: "Learn together. Share nothing but wisdom."
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Sequence, Tuple
 from datetime import datetime
 import json
 import hashlib
+import math
 import numpy as np
+from ml_ops.federated.aggregation_engine import StreamingAggregator
 from .base_agent import AgentCapability
 from .offline_agent import OfflineAgent
 
 
+class PrivacyBudgetExhausted(RuntimeError):
+    """Raised when a release would push cumulative epsilon past the budget."""
+
+
+class RDPAccountant:
+    """
+    Rényi-DP (moments) accountant.
+    
+    Keeps one RDP curve over a grid of orders per (client, dataset) pair.
+    Composition adds curves, and epsilon for a given delta uses the
+    conversion of Balle et al. (2020). Pure-DP (Laplace) releases also keep
+    their plain epsilon sum, which is reported when it is tighter.
+    
+    Usage:
+        accountant = RDPAccountant()
+        accountant.record_gaussian(noise_multiplier=1.1, sample_rate=0.01, steps=1000,
+                                   client_id="hospital_a", dataset_id="malaria_2025")
+        accountant.get_epsilon(1e-5, client_id="hospital_a")
+    """
+    
+    ORDERS: Tuple[float, ...] = (1.25, 1.5, 1.75) + tuple(float(a) for a in range(2, 65)) + (80.0, 96.0, 128.0, 256.0)
+    
+    def __init__(self, orders: Optional[Sequence[float]] = None):
+        """
+        Initialize accountant.
+        
+        Args:
+            orders: Rényi orders to track (all > 1)
+        """
+        self.orders = np.asarray(self.ORDERS if orders is None else orders, dtype=np.float64)
+        self._rdp: Dict[Tuple[str, str], np.ndarray] = {}
+        self._pure_epsilon: Dict[Tuple[str, str], float] = {}
+        self._releases: Dict[Tuple[str, str], int] = {}
+        self._curves: Dict[Tuple[str, float, float], np.ndarray] = {}
+    
+    # Mechanism RDP curves ───────────────────────────────────────────────────
+    
+    def gaussian_rdp(self, noise_multiplier: float, sample_rate: float = 1.0) -> np.ndarray:
+        """
+        RDP of one (Poisson-subsampled) Gaussian release, noise std = noise_multiplier * sensitivity.
+        
+        Full batch: alpha / (2 sigma^2). Subsampled: exact binomial expansion for
+        integer orders (Mironov et al. 2019); fractional orders are skipped (inf).
+        """
+        key = ("gaussian", noise_multiplier, sample_rate)
+        if key in self._curves:
+            return self._curves[key]
+        sigma2 = noise_multiplier ** 2
+        if sample_rate >= 1.0:
+            rdp = self.orders / (2 * sigma2)
+        elif sample_rate <= 0.0:
+            rdp = np.zeros_like(self.orders)
+        else:
+            log_q, log_1mq = math.log(sample_rate), math.log1p(-sample_rate)
+            max_order = int(self.orders.max())
+            log_factorial = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, max_order + 1)))))
+            rdp = np.full_like(self.orders, np.inf)
+            for i, alpha in enumerate(self.orders):
+                if alpha != int(alpha):
+                    continue
+                a = int(alpha)
+                k = np.arange(a + 1)
+                terms = (log_factorial[a] - log_factorial[k] - log_factorial[a - k]
+                         + (a - k) * log_1mq + k * log_q + (k * k - k) / (2 * sigma2))
+                rdp[i] = np.logaddexp.reduce(terms) / (a - 1)
+        self._curves[key] = rdp
+        return rdp
+    
+    def laplace_rdp(self, epsilon: float) -> np.ndarray:
+        """RDP of one Laplace release with scale sensitivity/epsilon (Mironov 2017)."""
+        a = self.orders
+        log_mix = np.logaddexp(
+            np.log(a / (2 * a - 1)) + (a - 1) * epsilon,
+            np.log((a - 1) / (2 * a - 1)) - a * epsilon,
+        )
+        return np.minimum(log_mix / (a - 1), epsilon)
+    
+    # Ledger ─────────────────────────────────────────────────────────────────
+    
+    def _record(self, rdp: np.ndarray, pure_epsilon: float, steps: int, client_id: str, dataset_id: str):
+        key = (client_id, dataset_id)
+        self._rdp[key] = self._rdp.get(key, 0.0) + steps * rdp
+        self._pure_epsilon[key] = self._pure_epsilon.get(key, 0.0) + steps * pure_epsilon
+        self._releases[key] = self._releases.get(key, 0) + steps
+    
+    def record_gaussian(self, noise_multiplier: float, sample_rate: float = 1.0, steps: int = 1,
+                        client_id: str = "local", dataset_id: str = "default"):
+        """Record `steps` Gaussian releases."""
+        self._record(self.gaussian_rdp(noise_multiplier, sample_rate), math.inf, steps, client_id, dataset_id)
+    
+    def record_laplace(self, epsilon: float, steps: int = 1,
+                       client_id: str = "local", dataset_id: str = "default"):
+        """Record `steps` Laplace releases."""
+        self._record(self.laplace_rdp(epsilon), epsilon, steps, client_id, dataset_id)
+    
+    def _matching(self, client_id: Optional[str], dataset_id: Optional[str]) -> List[Tuple[str, str]]:
+        return [key for key in self._rdp
+                if (client_id is None or key[0] == client_id) and (dataset_id is None or key[1] == dataset_id)]
+    
+    def releases(self, client_id: Optional[str] = None, dataset_id: Optional[str] = None) -> int:
+        return sum(self._releases[key] for key in self._matching(client_id, dataset_id))
+    
+    def epsilon_from_rdp(self, rdp: np.ndarray, delta: float) -> float:
+        """Tightest (epsilon, delta) over the order grid (Balle et al. 2020, Thm. 21)."""
+        a = self.orders
+        eps = rdp + np.log1p(-1 / a) - (math.log(delta) + np.log(a)) / (a - 1)
+        return float(max(np.min(eps), 0.0))
+    
+    def get_epsilon(self, delta: float, client_id: Optional[str] = None,
+                    dataset_id: Optional[str] = None, extra_rdp: Optional[np.ndarray] = None,
+                    extra_pure_epsilon: float = 0.0) -> float:
+        """
+        Cumulative epsilon at `delta` over the matching releases. A client's
+        epsilon composes all its datasets; a dataset's composes all clients
+        holding it. extra_* project a release that has not happened yet.
+        """
+        keys = self._matching(client_id, dataset_id)
+        rdp = sum((self._rdp[key] for key in keys), np.zeros_like(self.orders))
+        pure = sum(self._pure_epsilon[key] for key in keys)
+        if extra_rdp is not None:
+            rdp = rdp + extra_rdp
+            pure += extra_pure_epsilon
+        if not keys and extra_rdp is None:
+            return 0.0
+        return min(pure, self.epsilon_from_rdp(rdp, delta))
+
+
 class DifferentialPrivacy:
     """
     Differential privacy mechanisms for protecting individual data points.
     
     Implements noise injection to ensure privacy guarantees while maintaining
-    model utility.
+    model utility. Every release is recorded in an RDPAccountant under this
+    instance's client/dataset ids, and releases that would exceed the budget
+    trigger the early-stop hooks and raise PrivacyBudgetExhausted.
     """
     
-    def __init__(self, epsilon: float = 1.0, delta: float = 1e-5):
+    def __init__(
+        self,
+        epsilon: float = 1.0,
+        delta: float = 1e-5,
+        noise_multiplier: float = 1.1,
+        budget_epsilon: float = 10.0,
+        accountant: Optional[RDPAccountant] = None,
+        client_id: str = "local",
+        dataset_id: str = "default",
+    ):
         """
         Initialize differential privacy mechanism.
         
         Args:
             epsilon: Privacy budget (lower = more privacy)
             delta: Privacy relaxation parameter
+            noise_multiplier: Gaussian noise std as a multiple of the clipping norm
+            budget_epsilon: Cumulative epsilon (at delta) after which releases stop
+            accountant: Shared accountant (e.g. one per federation); private one if None
+            client_id: Ledger key for this client
+            dataset_id: Ledger key for the local dataset
         """
         self.epsilon = epsilon
         self.delta = delta
+        self.noise_multiplier = noise_multiplier
+        self.budget_epsilon = budget_epsilon
+        self.accountant = accountant or RDPAccountant()
+        self.client_id = client_id
+        self.dataset_id = dataset_id
+        self._exhausted_hooks: List[Callable[[Dict[str, Any]], None]] = []
     
     def add_noise(
         self,
@@ -62,8 +213,10 @@ class DifferentialPrivacy:
         Returns:
             Noised data
         """
+        self.check_budget(self.accountant.laplace_rdp(self.epsilon), self.epsilon)
         scale = sensitivity / self.epsilon
         noise = np.random.laplace(0, scale, len(data))
+        self.accountant.record_laplace(self.epsilon, client_id=self.client_id, dataset_id=self.dataset_id)
         return (np.array(data) + noise).tolist()
     
     def clip_gradients(
@@ -88,17 +241,124 @@ class DifferentialPrivacy:
             grad_array = grad_array * (max_norm / norm)
         
         return grad_array.tolist()
+    
+    def clip_per_layer(
+        self,
+        flat: np.ndarray,
+        layer_sizes: Optional[Sequence[int]] = None,
+        max_norm: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Clip each layer of a flattened parameter vector in place.
+        
+        Each of the L layers is bounded by max_norm / sqrt(L), so the whole
+        update has L2 norm at most max_norm (the Gaussian sensitivity).
+        
+        Args:
+            flat: Flattened float parameter array (modified in place)
+            layer_sizes: Parameter count per layer (one layer if None)
+            max_norm: Total L2 bound
+            
+        Returns:
+            Per-layer scale factors applied
+        """
+        sizes = np.asarray(layer_sizes if layer_sizes is not None else [flat.size], dtype=np.int64)
+        if sizes.sum() != flat.size:
+            raise ValueError(f"layer sizes sum to {sizes.sum()}, update has {flat.size} parameters")
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        norms = np.sqrt(np.add.reduceat(np.square(flat, dtype=np.float64), offsets))
+        factors = np.minimum(1.0, (max_norm / math.sqrt(len(sizes))) / np.maximum(norms, 1e-12))
+        if np.any(factors < 1.0):
+            flat *= np.repeat(factors.astype(flat.dtype), sizes)
+        return factors
+    
+    def privatize(
+        self,
+        update: np.ndarray,
+        layer_sizes: Optional[Sequence[int]] = None,
+        max_norm: float = 1.0,
+        noise_multiplier: Optional[float] = None,
+        sample_rate: float = 1.0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Per-layer clipping plus Gaussian noise over a flattened update.
+        
+        Args:
+            update: Flattened parameter update (float32/float64; copied)
+            layer_sizes: Parameter count per layer
+            max_norm: Total L2 clipping bound
+            noise_multiplier: Noise std / max_norm (instance default if None)
+            sample_rate: Fraction of local records used for this release
+            rng: numpy Generator
+            
+        Returns:
+            Clipped and noised update
+        """
+        sigma = self.noise_multiplier if noise_multiplier is None else noise_multiplier
+        self.check_budget(self.accountant.gaussian_rdp(sigma, sample_rate))
+        flat = np.array(update, dtype=np.result_type(np.asarray(update).dtype, np.float32)).reshape(-1)
+        self.clip_per_layer(flat, layer_sizes, max_norm)
+        rng = rng or np.random.default_rng()
+        noise = rng.standard_normal(flat.size, dtype=flat.dtype)
+        noise *= sigma * max_norm
+        flat += noise
+        self.accountant.record_gaussian(sigma, sample_rate, client_id=self.client_id, dataset_id=self.dataset_id)
+        return flat
+    
+    def epsilon_spent(self) -> float:
+        """Cumulative epsilon at delta for this client (all its datasets)."""
+        return self.accountant.get_epsilon(self.delta, client_id=self.client_id)
+    
+    def budget_remaining(self) -> float:
+        return max(self.budget_epsilon - self.epsilon_spent(), 0.0)
+    
+    def on_budget_exhausted(self, hook: Callable[[Dict[str, Any]], None]):
+        """Register an early-stop hook, called before a release is refused."""
+        self._exhausted_hooks.append(hook)
+    
+    def check_budget(self, release_rdp: np.ndarray, release_pure_epsilon: float = math.inf):
+        """
+        Refuse a release whose projected cumulative epsilon exceeds the budget.
+        
+        Raises:
+            PrivacyBudgetExhausted: after running the early-stop hooks
+        """
+        projected = self.accountant.get_epsilon(
+            self.delta, client_id=self.client_id,
+            extra_rdp=release_rdp, extra_pure_epsilon=release_pure_epsilon,
+        )
+        if projected <= self.budget_epsilon:
+            return
+        status = {
+            "client_id": self.client_id,
+            "epsilon_spent": self.epsilon_spent(),
+            "projected_epsilon": projected,
+            "budget_epsilon": self.budget_epsilon,
+            "delta": self.delta,
+        }
+        for hook in self._exhausted_hooks:
+            hook(status)
+        raise PrivacyBudgetExhausted(
+            f"release would raise epsilon to {projected:.3f} (budget {self.budget_epsilon})"
+        )
 
 
 class SecureAggregation:
     """
     Secure aggregation protocol for combining model updates without
     revealing individual contributions.
+    
+    Update vectors are folded into a float64 weighted running sum as they
+    arrive (see ml_ops.federated.aggregation_engine); only contribution
+    metadata is retained. Pairwise-masked rounds with dropout recovery use
+    SecureAggregationRound from the same engine.
     """
     
     def __init__(self):
         """Initialize secure aggregation."""
         self.contributions: List[Dict[str, Any]] = []
+        self.engine = StreamingAggregator()
     
     def add_contribution(
         self,
@@ -111,12 +371,15 @@ class SecureAggregation:
         
         Args:
             agent_id: Contributor agent ID
-            model_update: Model update (e.g., gradients, parameters)
+            model_update: Model update with a "gradients" vector (list, array or .npy path)
             weight: Contribution weight (e.g., based on data size)
         """
+        if "gradients" not in model_update:
+            raise ValueError(f"model update from {agent_id} has no 'gradients' vector")
+        self.engine.add(model_update["gradients"], weight=weight, client_id=agent_id)
         contribution = {
             "agent_id": agent_id,
-            "model_update": model_update,
+            "round": model_update.get("round"),
             "weight": weight,
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -132,10 +395,7 @@ class SecureAggregation:
         if not self.contributions:
             return {}
         
-        # Simple weighted averaging
-        # In production: Use secure multi-party computation
-        
-        total_weight = sum(c["weight"] for c in self.contributions)
+        total_weight = self.engine.total_weight
         
         aggregated = {
             "aggregation_method": "weighted_average",
@@ -144,10 +404,8 @@ class SecureAggregation:
             "timestamp": datetime.utcnow().isoformat(),
         }
         
-        # Simulate parameter aggregation
-        # In production: Aggregate actual model parameters
         aggregated["parameters"] = {
-            "simulated": "aggregated_parameters",
+            "gradients": self.engine.result().tolist(),
             "contributors": [c["agent_id"] for c in self.contributions],
         }
         
@@ -156,6 +414,7 @@ class SecureAggregation:
     def clear(self):
         """Clear contributions."""
         self.contributions = []
+        self.engine.reset()
 
 
 class FederatedLearningClient(OfflineAgent):
@@ -195,6 +454,10 @@ class FederatedLearningClient(OfflineAgent):
         epsilon: float = 1.0,
         delta: float = 1e-5,
         gradient_clip_norm: float = 1.0,
+        noise_multiplier: Optional[float] = None,
+        privacy_budget: float = 10.0,
+        dataset_id: str = "local",
+        accountant: Optional[RDPAccountant] = None,
     ):
         """
         Initialize federated learning client.
@@ -208,6 +471,11 @@ class FederatedLearningClient(OfflineAgent):
             epsilon: Differential privacy epsilon
             delta: Differential privacy delta
             gradient_clip_norm: Gradient clipping norm
+            noise_multiplier: Use per-layer clipping + Gaussian noise at this multiplier
+                (Laplace at epsilon per round if None)
+            privacy_budget: Cumulative epsilon after which rounds stop
+            dataset_id: Accountant ledger key for the local dataset
+            accountant: Shared RDPAccountant (e.g. held by the federation server)
         """
         # Add federated learning capabilities
         fl_capabilities = [
@@ -226,7 +494,18 @@ class FederatedLearningClient(OfflineAgent):
             tags=tags,
         )
         
-        self.privacy = DifferentialPrivacy(epsilon=epsilon, delta=delta)
+        self.privacy = DifferentialPrivacy(
+            epsilon=epsilon,
+            delta=delta,
+            noise_multiplier=noise_multiplier if noise_multiplier is not None else 1.1,
+            budget_epsilon=privacy_budget,
+            accountant=accountant,
+            client_id=self.metadata.agent_id,
+            dataset_id=dataset_id,
+        )
+        self.privacy.on_budget_exhausted(self._on_privacy_budget_exhausted)
+        self.noise_multiplier = noise_multiplier
+        self.rounds_halted = False
         self.aggregator = SecureAggregation()
         self.gradient_clip_norm = gradient_clip_norm
         
@@ -242,6 +521,9 @@ class FederatedLearningClient(OfflineAgent):
         """
         Train model locally on private data.
         
+        Once the privacy budget is exhausted (rounds_halted), the round is
+        skipped: nothing is trained and the result has "halted": True.
+        
         Args:
             training_data: Local training data (never leaves device)
             epochs: Number of training epochs
@@ -249,6 +531,16 @@ class FederatedLearningClient(OfflineAgent):
         Returns:
             Training metrics
         """
+        if self.rounds_halted:
+            self._log("Privacy budget exhausted, skipping local training round")
+            return {
+                "training_round": self.training_rounds,
+                "samples": len(training_data),
+                "epochs": epochs,
+                "timestamp": datetime.utcnow().isoformat(),
+                "halted": True,
+            }
+        
         self._log(f"Training local model with {len(training_data)} samples for {epochs} epochs")
         
         # Simulate local training
@@ -263,6 +555,7 @@ class FederatedLearningClient(OfflineAgent):
                 "loss": 0.25,  # Simulated
                 "accuracy": 0.92,  # Simulated
             },
+            "halted": False,
         }
         
         self.training_rounds += 1
@@ -293,7 +586,16 @@ class FederatedLearningClient(OfflineAgent):
             
         Returns:
             Model update (gradients/parameters with privacy guarantees)
+            
+        Raises:
+            PrivacyBudgetExhausted: when this release would exceed the privacy
+                budget, and on every call after that (rounds_halted); callers
+                running rounds should catch it or check rounds_halted first
         """
+        if self.rounds_halted:
+            raise PrivacyBudgetExhausted(
+                f"federated rounds halted for {self.metadata.agent_id}: privacy budget exhausted"
+            )
         if not self.local_model:
             raise ValueError("No local model available. Train first.")
         
@@ -301,8 +603,13 @@ class FederatedLearningClient(OfflineAgent):
         # In production: Compute actual gradients
         gradients = [0.1, -0.5, 0.3, -0.15, 0.2]  # Simulated
         
-        # Apply privacy mechanisms
-        if apply_privacy:
+        # Apply privacy mechanisms (raises PrivacyBudgetExhausted once the budget is spent)
+        if apply_privacy and self.noise_multiplier is not None:
+            gradients = self.privacy.privatize(
+                np.asarray(gradients, dtype=np.float64),
+                max_norm=self.gradient_clip_norm,
+            ).tolist()
+        elif apply_privacy:
             # Clip gradients to bound sensitivity
             gradients = self.privacy.clip_gradients(
                 gradients,
@@ -325,6 +632,9 @@ class FederatedLearningClient(OfflineAgent):
                 "epsilon": self.privacy.epsilon,
                 "delta": self.privacy.delta,
                 "clip_norm": self.gradient_clip_norm,
+                "mechanism": "gaussian" if self.noise_multiplier is not None else "laplace",
+                "noise_multiplier": self.noise_multiplier,
+                "epsilon_spent": self.privacy.epsilon_spent(),
             } if apply_privacy else None,
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -405,6 +715,14 @@ class FederatedLearningClient(OfflineAgent):
         
         return validation_result
     
+    def _on_privacy_budget_exhausted(self, status: Dict[str, Any]):
+        """Early-stop hook: halt further federated rounds for this client."""
+        self.rounds_halted = True
+        self._log(
+            f"Privacy budget exhausted (ε={status['epsilon_spent']:.3f} of {status['budget_epsilon']}), "
+            "stopping federated rounds"
+        )
+    
     def get_training_stats(self) -> Dict[str, Any]:
         """
         Get training statistics.
@@ -426,22 +744,22 @@ class FederatedLearningClient(OfflineAgent):
         """
         Compute privacy budget spent across training rounds.
         
-        Uses composition theorems for differential privacy.
+        Uses Rényi-DP composition over every recorded release (falling back to
+        basic composition for pure-DP releases when that is tighter).
         
         Returns:
             Privacy accounting information
         """
-        # Simple composition: epsilon adds up across rounds
-        # In production: Use advanced composition (e.g., Rényi DP)
-        
-        total_epsilon = self.privacy.epsilon * self.training_rounds
+        total_epsilon = self.privacy.epsilon_spent()
         
         return {
             "per_round_epsilon": self.privacy.epsilon,
             "total_rounds": self.training_rounds,
+            "releases": self.privacy.accountant.releases(client_id=self.privacy.client_id),
             "total_epsilon_spent": total_epsilon,
             "delta": self.privacy.delta,
-            "privacy_budget_exhausted": total_epsilon >= 10.0,  # Example threshold
+            "budget_epsilon": self.privacy.budget_epsilon,
+            "privacy_budget_exhausted": self.rounds_halted or total_epsilon >= self.privacy.budget_epsilon,
         }
 
 
@@ -10,6 +10,15 @@
 # ------------------------------------------------------------------------------
 
 # IP-2: Crypto Shredder — Post-Quantum Edition
+#
+# CryptoShredder seals small in-memory payloads under one instance key.
+# StreamingShredder seals large imaging/genomics blobs in fixed-size AES-GCM
+# segments with constant memory; each object gets its own data key (DEK),
+# wrapped by a key-encryption key (KEK) and kept in a KeyCatalog. Shredding
+# an object (or every object of one patient) deletes its DEK row — the
+# ciphertext on disk becomes unrecoverable without being rewritten.
+# The KEK never lives next to the catalog: it comes from the caller or from
+# the OS keyring.
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 try:
@@ -17,27 +26,265 @@ try:
     POST_QUANTUM = True
 except ImportError:
     POST_QUANTUM = False
+try:
+    import keyring
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
 import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import BinaryIO, Dict, Optional
 
 class CryptoShredder:
     def __init__(self):
         self.key = os.urandom(32)
         if POST_QUANTUM:
             self.kem = KeyEncapsulation('Kyber1024')
+            # One keypair per instance; shredding drops it with the KEM.
+            self.public_key = self.kem.generate_keypair()
 
     def encrypt(self, data: bytes) -> bytes:
         if POST_QUANTUM:
-            pk, sk = self.kem.generate_keypair()
-            ciphertext, shared_secret = self.kem.encapsulate(pk)
+            # Envelope: len(kem_ct) | kem_ct | nonce | ciphertext — the
+            # encapsulation is kept so the holder of the secret key can decrypt.
+            kem_ciphertext, shared_secret = self.kem.encap_secret(self.public_key)
             aesgcm = AESGCM(shared_secret[:32])
             nonce = os.urandom(12)
-            return nonce + aesgcm.encrypt(nonce, data, None)
+            return (struct.pack(">H", len(kem_ciphertext)) + kem_ciphertext
+                    + nonce + aesgcm.encrypt(nonce, data, None))
         else:
             aesgcm = AESGCM(self.key)
             nonce = os.urandom(12)
             return nonce + aesgcm.encrypt(nonce, data, None)
 
+    def decrypt(self, blob: bytes) -> bytes:
+        if self.key is None:
+            raise KeyError("Key has been shredded")
+        if POST_QUANTUM:
+            (kem_len,) = struct.unpack_from(">H", blob, 0)
+            kem_ciphertext = blob[2:2 + kem_len]
+            shared_secret = self.kem.decap_secret(kem_ciphertext)
+            rest = blob[2 + kem_len:]
+            return AESGCM(shared_secret[:32]).decrypt(rest[:12], rest[12:], None)
+        return AESGCM(self.key).decrypt(blob[:12], blob[12:], None)
+
     def shred(self):
         self.key = None
         if POST_QUANTUM:
             self.kem = None
+            self.public_key = None
+
+
+class KeyCatalog:
+    """
+    Persistent object_id → wrapped DEK catalog (SQLite).
+
+    DEKs are wrapped with AES-GCM under the KEK, bound to their object_id.
+    secure_delete makes SQLite zero freed pages, and the catalog keeps the
+    default rollback journal rather than WAL, so a shredded DEK does not
+    linger in the database file or in a -wal file awaiting checkpoint.
+
+    The KEK is passed in by the caller or, when omitted, held in the OS
+    keyring (service KEYRING_SERVICE, one entry per catalog path). It is
+    never written to the data directory.
+    """
+
+    KEYRING_SERVICE = "iluminara-crypto-shredder"
+
+    def __init__(self, db_path: str = "data/shredder/key_catalog.db", kek: Optional[bytes] = None):
+        if kek is None:
+            kek = self._keyring_kek(db_path)
+        if len(kek) != 32:
+            raise ValueError("KEK must be 32 bytes")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self._wrap = AESGCM(kek)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA secure_delete = ON")
+        self._conn.execute("PRAGMA journal_mode = DELETE")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS object_keys (
+                object_id TEXT PRIMARY KEY,
+                subject_id TEXT,
+                wrapped_dek BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_object_keys_subject ON object_keys(subject_id)")
+        self._conn.commit()
+
+    @classmethod
+    def _keyring_kek(cls, db_path: str) -> bytes:
+        """Load this catalog's KEK from the OS keyring, creating it on first use."""
+        if not KEYRING_AVAILABLE:
+            raise ValueError("No KEK given and the keyring package is not installed; pass kek=")
+        account = os.path.abspath(db_path)
+        stored = keyring.get_password(cls.KEYRING_SERVICE, account)
+        if stored is not None:
+            return bytes.fromhex(stored)
+        kek = os.urandom(32)
+        keyring.set_password(cls.KEYRING_SERVICE, account, kek.hex())
+        return kek
+
+    def create_key(self, object_id: str, subject_id: Optional[str] = None) -> bytes:
+        """Generate, wrap and persist a fresh DEK for an object."""
+        dek = AESGCM.generate_key(bit_length=256)
+        nonce = os.urandom(12)
+        wrapped = nonce + self._wrap.encrypt(nonce, dek, object_id.encode())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO object_keys (object_id, subject_id, wrapped_dek, created_at) VALUES (?, ?, ?, ?)",
+                (object_id, subject_id, wrapped, time.time()),
+            )
+            self._conn.commit()
+        return dek
+
+    def get_key(self, object_id: str) -> bytes:
+        """Unwrap an object's DEK; KeyError once it has been shredded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT wrapped_dek FROM object_keys WHERE object_id = ?", (object_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No key for object {object_id} (never created or shredded)")
+        wrapped = row[0]
+        return self._wrap.decrypt(wrapped[:12], wrapped[12:], object_id.encode())
+
+    def shred(self, object_id: str) -> bool:
+        """Delete one object's DEK (primary-key delete)."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM object_keys WHERE object_id = ?", (object_id,))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def shred_subject(self, subject_id: str) -> int:
+        """Delete every DEK belonging to one patient/subject; returns the count."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM object_keys WHERE subject_id = ?", (subject_id,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def __contains__(self, object_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM object_keys WHERE object_id = ?", (object_id,)
+            ).fetchone() is not None
+
+    def close(self):
+        self._conn.close()
+
+
+class StreamingShredder:
+    """
+    Chunked AEAD encryptor for large objects (constant memory).
+
+    Layout: header | segment_0 | ... | segment_n, where each segment is
+    AES-256-GCM over `segment_size` plaintext bytes (the last may be short).
+    Segment nonce = 7-byte random prefix | 4-byte segment index | 1-byte
+    final flag, so segments cannot be reordered, and truncation is detected
+    because the stream must end on a segment sealed with the final flag.
+    The header (and object_id) is authenticated as AAD on every segment.
+    """
+
+    MAGIC = b"ILCS"
+    VERSION = 1
+    HEADER = struct.Struct(">4sBI7s")
+    TAG_SIZE = 16
+    DEFAULT_SEGMENT_SIZE = 1 << 20  # 1 MiB
+
+    def __init__(self, catalog: KeyCatalog, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        self.catalog = catalog
+        self.segment_size = segment_size
+
+    @staticmethod
+    def _nonce(prefix: bytes, index: int, final: bool) -> bytes:
+        return prefix + struct.pack(">IB", index, 1 if final else 0)
+
+    @staticmethod
+    def _read_full(src: BinaryIO, size: int) -> bytes:
+        """Read exactly size bytes, or fewer only at EOF (pipes and sockets return short reads)."""
+        data = src.read(size)
+        if len(data) in (0, size):
+            return data
+        parts = [data]
+        remaining = size - len(data)
+        while remaining:
+            more = src.read(remaining)
+            if not more:
+                break
+            parts.append(more)
+            remaining -= len(more)
+        return b"".join(parts)
+
+    def encrypt_stream(self, object_id: str, src: BinaryIO, dst: BinaryIO,
+                       subject_id: Optional[str] = None) -> Dict:
+        """Encrypt src into dst under a new per-object DEK."""
+        aead = AESGCM(self.catalog.create_key(object_id, subject_id))
+        prefix = os.urandom(7)
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.segment_size, prefix)
+        aad = header + object_id.encode()
+        dst.write(header)
+
+        index = 0
+        plaintext_bytes = 0
+        current = self._read_full(src, self.segment_size)
+        while True:
+            following = self._read_full(src, self.segment_size) if len(current) == self.segment_size else b""
+            final = not following
+            dst.write(aead.encrypt(self._nonce(prefix, index, final), current, aad))
+            plaintext_bytes += len(current)
+            index += 1
+            if final:
+                break
+            current = following
+        return {"object_id": object_id, "segments": index, "plaintext_bytes": plaintext_bytes}
+
+    def decrypt_stream(self, object_id: str, src: BinaryIO, dst: BinaryIO) -> Dict:
+        """Decrypt and authenticate a stream produced by encrypt_stream()."""
+        header = self._read_full(src, self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            raise ValueError("Truncated header")
+        magic, version, segment_size, prefix = self.HEADER.unpack(header)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Not a CryptoShredder stream")
+        aead = AESGCM(self.catalog.get_key(object_id))
+        aad = header + object_id.encode()
+        chunk = segment_size + self.TAG_SIZE
+
+        index = 0
+        plaintext_bytes = 0
+        current = self._read_full(src, chunk)
+        while True:
+            following = self._read_full(src, chunk) if len(current) == chunk else b""
+            final = not following
+            plaintext = aead.decrypt(self._nonce(prefix, index, final), current, aad)
+            dst.write(plaintext)
+            plaintext_bytes += len(plaintext)
+            index += 1
+            if final:
+                break
+            current = following
+        return {"object_id": object_id, "segments": index, "plaintext_bytes": plaintext_bytes}
+
+    def encrypt_file(self, object_id: str, in_path: str, out_path: str,
+                     subject_id: Optional[str] = None) -> Dict:
+        with open(in_path, "rb") as src, open(out_path, "wb") as dst:
+            return self.encrypt_stream(object_id, src, dst, subject_id)
+
+    def decrypt_file(self, object_id: str, in_path: str, out_path: str) -> Dict:
+        with open(in_path, "rb") as src, open(out_path, "wb") as dst:
+            return self.decrypt_stream(object_id, src, dst)
+
+    def shred(self, object_id: str) -> bool:
+        return self.catalog.shred(object_id)
+
+    def shred_subject(self, subject_id: str) -> int:
+        return self.catalog.shred_subject(subject_id)
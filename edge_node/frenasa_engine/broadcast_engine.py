@@ -0,0 +1,499 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+# 
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS 
+# solutions is STRICTLY PROHIBITED without a commercial license.
+# 
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are 
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+5DM Broadcast Engine: Rate-Limited Batched Fan-Out
+═════════════════════════════════════════════════════════════════════════════
+
+Delivers one alert to hundreds of thousands of recipients inside the outbreak
+window.
+
+- Recipients are bucketed by gateway (one per delivery channel unless a
+  recipient names its own) and sent in batches.
+- Each gateway has a token bucket (messages per second plus burst) so the
+  engine never exceeds the operator's contracted throughput.
+- Delivery runs on a bounded set of asyncio workers per gateway, under a
+  global cap on in-flight gateway calls.
+- Failed recipients are retried with full-jitter exponential backoff. Every
+  recipient is recorded as PENDING before the first send, and the retry
+  queue and the delivered ledger live in SQLite too, so resume() finishes
+  an interrupted broadcast, including recipients never attempted.
+- Sends are idempotent on (alert_id, recipient): a recipient already marked
+  delivered for an alert is never sent to again, and the alert id travels to
+  the gateway so it can drop duplicates of its own.
+"""
+
+from typing import Dict, Any, Optional, List, Iterable, Set, Tuple, Union
+from dataclasses import dataclass, field
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+
+
+PENDING = "PENDING"
+DELIVERED = "DELIVERED"
+RETRY = "RETRY"
+FAILED = "FAILED"
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter (rate tokens per second, up to burst).
+
+    Tokens are reserved up front: a caller asking for more than is available
+    goes into debt and sleeps until the debt is repaid, so concurrent callers
+    are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens now; returns the seconds to wait before using them."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= tokens
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self, tokens: float = 1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class DeliveryLedger:
+    """
+    Per-recipient delivery state on SQLite (WAL), keyed by (alert_id, recipient).
+
+    Holds the delivered set that makes sends idempotent and the persistent
+    send queue: PENDING (not attempted yet) and RETRY (with the next attempt time).
+    """
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS alerts ("
+                "alert_id TEXT PRIMARY KEY, message TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS deliveries ("
+                "alert_id TEXT NOT NULL, recipient TEXT NOT NULL, gateway TEXT NOT NULL, "
+                "status TEXT NOT NULL, attempts INTEGER NOT NULL, next_attempt REAL, error TEXT, "
+                "PRIMARY KEY (alert_id, recipient)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_deliveries_status ON deliveries (alert_id, status)")
+
+    def record_alert(self, alert_id: str, message: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO alerts (alert_id, message, created) VALUES (?, ?, ?)",
+                (alert_id, message, time.time()),
+            )
+
+    def message(self, alert_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT message FROM alerts WHERE alert_id = ?", (alert_id,)).fetchone()
+        return row[0] if row else None
+
+    def delivered(self, alert_id: str) -> Set[str]:
+        with self._lock:
+            return {row[0] for row in self._conn.execute(
+                "SELECT recipient FROM deliveries WHERE alert_id = ? AND status = ?", (alert_id, DELIVERED)
+            )}
+
+    def update(
+        self,
+        alert_id: str,
+        gateway: str,
+        recipients: List[str],
+        status: str,
+        attempts: int,
+        next_attempt: Optional[float] = None,
+        error: Optional[str] = None,
+    ):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO deliveries "
+                "(alert_id, recipient, gateway, status, attempts, next_attempt, error) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(alert_id, r, gateway, status, attempts, next_attempt, error) for r in recipients],
+            )
+
+    def pending_retries(self, alert_id: str) -> List[Tuple[str, str, int, float]]:
+        """(recipient, gateway, attempts, next_attempt) for every PENDING or RETRY recipient of the alert."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT recipient, gateway, attempts, next_attempt FROM deliveries "
+                "WHERE alert_id = ? AND status IN (?, ?) ORDER BY next_attempt", (alert_id, PENDING, RETRY)
+            ).fetchall()
+
+    def counts(self, alert_id: str) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM deliveries WHERE alert_id = ? GROUP BY status", (alert_id,)
+            ).fetchall())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class FakeGateway:
+    """
+    Local stand-in for an operator gateway (SMS aggregator, USSD, WhatsApp).
+
+    Each call sleeps for `latency` seconds. With probability `outage_rate`
+    the whole call raises ConnectionError; otherwise each recipient fails
+    independently with probability `failure_rate`. Like real bulk-SMS APIs
+    it drops repeat sends of the same (alert_id, recipient).
+    """
+
+    def __init__(
+        self,
+        name: str = "fake",
+        latency: float = 0.05,
+        failure_rate: float = 0.0,
+        outage_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.outage_rate = outage_rate
+        self._rng = random.Random(seed)
+        self.delivered: Set[Tuple[str, str]] = set()
+        self.calls = 0
+        self.duplicates = 0
+        self.max_concurrency = 0
+        self._active = 0
+
+    async def send_batch(self, alert_id: str, recipients: List[str], message: str) -> List[str]:
+        """Send message to recipients; returns the recipients that failed."""
+        self.calls += 1
+        self._active += 1
+        self.max_concurrency = max(self.max_concurrency, self._active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.outage_rate and self._rng.random() < self.outage_rate:
+                raise ConnectionError(f"{self.name} gateway unavailable")
+            failed = []
+            for recipient in recipients:
+                key = (alert_id, recipient)
+                if key in self.delivered:
+                    self.duplicates += 1
+                elif self.failure_rate and self._rng.random() < self.failure_rate:
+                    failed.append(recipient)
+                else:
+                    self.delivered.add(key)
+            return failed
+        finally:
+            self._active -= 1
+
+
+@dataclass
+class BroadcastReport:
+    """Outcome of one broadcast (or resume) call."""
+    alert_id: str
+    requested: int = 0
+    skipped: int = 0  # already delivered for this alert, or repeated in the list
+    delivered: int = 0
+    failed: int = 0  # gave up after max_attempts
+    retries: int = 0  # recipient re-sends scheduled
+    seconds: float = 0.0
+    gateways: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def status(self) -> str:
+        if not self.failed:
+            return "DELIVERED"
+        return "PARTIAL" if self.delivered or self.skipped else "FAILED"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "alert_id": self.alert_id,
+            "status": self.status,
+            "requested": self.requested,
+            "skipped": self.skipped,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retries": self.retries,
+            "seconds": self.seconds,
+            "gateways": self.gateways,
+        }
+
+
+class _Broadcast:
+    """Mutable state of one in-progress fan-out."""
+
+    def __init__(self, alert_id: str, message: str, report: BroadcastReport, max_in_flight: int):
+        self.alert_id = alert_id
+        self.message = message
+        self.report = report
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.outstanding = 0
+        self.done = asyncio.Event()
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.timers: List[asyncio.TimerHandle] = []
+
+
+class BroadcastEngine:
+    """
+    Rate-limited, batched, retrying fan-out of one alert to many recipients.
+
+    Usage:
+        engine = BroadcastEngine(
+            gateways={"sms": sms_gateway, "whatsapp": whatsapp_gateway},
+            rate_limits={"sms": (2000, 2000)},
+            ledger_path="data/broadcast/five_dm.sqlite",
+        )
+        report = await engine.broadcast("ALERT-42", text, phone_numbers, default_gateway="sms")
+        report = await engine.resume("ALERT-42")  # after a restart
+
+    A gateway is any object with
+    `async send_batch(alert_id, recipients, message) -> failed_recipients`.
+    """
+
+    def __init__(
+        self,
+        gateways: Dict[str, Any],
+        ledger_path: str = ":memory:",
+        rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        batch_size: int = 500,
+        workers_per_gateway: int = 8,
+        max_in_flight: int = 64,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 60.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            gateways: Gateway name -> gateway
+            ledger_path: SQLite path for the delivered ledger and retry queue
+            rate_limits: Gateway name -> (messages per second, burst); unlisted gateways are unthrottled
+            batch_size: Recipients per gateway call
+            workers_per_gateway: Concurrent delivery workers per gateway
+            max_in_flight: Cap on gateway calls in flight across all gateways
+            max_attempts: Sends per recipient before it is marked FAILED
+            backoff_base: Retry n waits uniform(0, min(backoff_cap, backoff_base * 2**n)) seconds
+            backoff_cap: Upper bound on a single retry delay
+            seed: Seed for backoff jitter
+        """
+        self.gateways = dict(gateways)
+        self.ledger = DeliveryLedger(ledger_path)
+        self.limiters = {
+            name: TokenBucket(rate, burst) for name, (rate, burst) in (rate_limits or {}).items()
+        }
+        self.batch_size = batch_size
+        self.workers_per_gateway = workers_per_gateway
+        self.max_in_flight = max_in_flight
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._rng = random.Random(seed)
+
+    async def broadcast(
+        self,
+        alert_id: str,
+        message: str,
+        recipients: Iterable[Union[str, Tuple[str, str]]],
+        default_gateway: Optional[str] = None,
+    ) -> BroadcastReport:
+        """
+        Deliver message to every recipient not yet delivered for alert_id.
+
+        Args:
+            alert_id: Idempotency key; re-broadcasting the same id only reaches
+                recipients that have not received it
+            message: Message body
+            recipients: Addresses (sent through default_gateway) or
+                (address, gateway) pairs
+            default_gateway: Gateway for bare addresses
+
+        Returns:
+            BroadcastReport once every recipient is delivered or has
+            exhausted max_attempts
+        """
+        started = time.monotonic()
+        report = BroadcastReport(alert_id=alert_id)
+        self.ledger.record_alert(alert_id, message)
+        seen = self.ledger.delivered(alert_id)
+
+        buckets: Dict[str, List[str]] = {}
+        for item in recipients:
+            address, gateway = (item, default_gateway) if isinstance(item, str) else item
+            report.requested += 1
+            if address in seen:
+                report.skipped += 1
+                continue
+            seen.add(address)
+            if gateway not in self.gateways:
+                raise ValueError(f"❌ No gateway configured for {gateway!r}")
+            bucket = buckets.get(gateway)
+            if bucket is None:
+                bucket = buckets[gateway] = []
+            bucket.append(address)
+
+        # Persist the whole send queue first so resume() can finish it after a crash
+        for gateway, addresses in buckets.items():
+            self.ledger.update(alert_id, gateway, addresses, PENDING, 0)
+
+        work = [
+            (gateway, 0, addresses[start:start + self.batch_size], 0.0)
+            for gateway, addresses in buckets.items()
+            for start in range(0, len(addresses), self.batch_size)
+        ]
+        await self._fan_out(alert_id, message, work, report)
+        report.seconds = time.monotonic() - started
+        return report
+
+    async def resume(self, alert_id: str) -> BroadcastReport:
+        """Send to every PENDING or RETRY recipient of an interrupted broadcast."""
+        started = time.monotonic()
+        report = BroadcastReport(alert_id=alert_id)
+        message = self.ledger.message(alert_id)
+        if message is None:
+            raise KeyError(f"Unknown alert {alert_id!r}")
+
+        groups: Dict[Tuple[str, int], List[Tuple[str, float]]] = {}
+        for recipient, gateway, attempts, next_attempt in self.ledger.pending_retries(alert_id):
+            groups.setdefault((gateway, attempts), []).append((recipient, next_attempt or 0.0))
+
+        now = time.time()
+        work = []
+        for (gateway, attempts), rows in groups.items():
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                # rows are ordered by due time, so the chunk is due when its last row is
+                work.append((gateway, attempts, [r for r, _ in chunk], max(0.0, chunk[-1][1] - now)))
+                report.requested += len(chunk)
+        await self._fan_out(alert_id, message, work, report)
+        report.seconds = time.monotonic() - started
+        return report
+
+    def close(self):
+        self.ledger.close()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Fan-out
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def _fan_out(
+        self,
+        alert_id: str,
+        message: str,
+        work: List[Tuple[str, int, List[str], float]],
+        report: BroadcastReport,
+    ):
+        """Run (gateway, attempt, batch, delay) items to completion."""
+        state = _Broadcast(alert_id, message, report, self.max_in_flight)
+        loop = asyncio.get_running_loop()
+        for gateway, attempt, batch, delay in work:
+            queue = state.queues.get(gateway)
+            if queue is None:
+                queue = state.queues[gateway] = asyncio.Queue()
+                report.gateways[gateway] = {"sent": 0, "delivered": 0, "failed": 0, "retries": 0}
+            state.outstanding += len(batch)
+            if delay > 0:
+                state.timers.append(loop.call_later(delay, queue.put_nowait, (attempt, batch)))
+            else:
+                queue.put_nowait((attempt, batch))
+        if not state.outstanding:
+            return
+
+        workers = [
+            asyncio.ensure_future(self._worker(state, gateway, queue))
+            for gateway, queue in state.queues.items()
+            for _ in range(self.workers_per_gateway)
+        ]
+        try:
+            await state.done.wait()
+        finally:
+            for timer in state.timers:
+                timer.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, state: _Broadcast, gateway_name: str, queue: asyncio.Queue):
+        gateway = self.gateways[gateway_name]
+        limiter = self.limiters.get(gateway_name)
+        while True:
+            attempt, batch = await queue.get()
+            if limiter is not None:
+                await limiter.acquire(len(batch))
+            async with state.in_flight:
+                try:
+                    failed = list(await gateway.send_batch(state.alert_id, batch, state.message))
+                    error = "rejected by gateway"
+                except Exception as exc:
+                    failed, error = batch, f"{type(exc).__name__}: {exc}"
+            self._settle(state, gateway_name, queue, attempt, batch, failed, error)
+
+    def _settle(
+        self,
+        state: _Broadcast,
+        gateway_name: str,
+        queue: asyncio.Queue,
+        attempt: int,
+        batch: List[str],
+        failed: List[str],
+        error: str,
+    ):
+        attempts = attempt + 1
+        stats = state.report.gateways[gateway_name]
+        stats["sent"] += len(batch)
+        if failed:
+            rejected = set(failed)
+            delivered = [r for r in batch if r not in rejected]
+            failed = [r for r in batch if r in rejected]
+        else:
+            delivered = batch
+        if delivered:
+            self.ledger.update(state.alert_id, gateway_name, delivered, DELIVERED, attempts)
+            stats["delivered"] += len(delivered)
+            state.report.delivered += len(delivered)
+            state.outstanding -= len(delivered)
+
+        if failed and attempts >= self.max_attempts:
+            self.ledger.update(state.alert_id, gateway_name, failed, FAILED, attempts, error=error)
+            stats["failed"] += len(failed)
+            state.report.failed += len(failed)
+            state.outstanding -= len(failed)
+        elif failed:
+            # Full jitter keeps retries from many workers from re-synchronising
+            delay = self._rng.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+            self.ledger.update(state.alert_id, gateway_name, failed, RETRY, attempts, time.time() + delay, error)
+            stats["retries"] += len(failed)
+            state.report.retries += len(failed)
+            state.timers.append(
+                asyncio.get_running_loop().call_later(delay, queue.put_nowait, (attempts, failed))
+            )
+
+        if state.outstanding == 0:
+            state.done.set()
@@ -36,14 +36,21 @@ Integration Points:
 2. USSD gateway (feature phone access)
 3. SMS alerts (universal reach)
 4. WhatsApp Business API (rich media)
+
+Large broadcasts with an explicit recipient list go through the
+BroadcastEngine: per-gateway batching and token-bucket rate limits,
+bounded async workers, persistent jittered retries and idempotent sends.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+import asyncio
 import json
 
+from .broadcast_engine import BroadcastEngine, FakeGateway
+
 
 class DeliveryChannel(Enum):
     """Distribution channels for health intelligence."""
@@ -54,6 +61,24 @@ class DeliveryChannel(Enum):
     MPESA = "MPESA"  # Mobile money integration
 
 
+# Simulated per-channel delivery success rates (used until real gateways are configured)
+CHANNEL_SUCCESS_RATES = {
+    DeliveryChannel.SMS: 0.98,  # SMS has highest reliability
+    DeliveryChannel.USSD: 0.95,
+    DeliveryChannel.WHATSAPP: 0.92,  # Requires internet
+}
+DEFAULT_SUCCESS_RATE = 0.99
+
+# Contracted gateway throughput: (messages per second, burst)
+DEFAULT_GATEWAY_RATE_LIMITS = {
+    "sms": (2000.0, 2000.0),
+    "ussd": (500.0, 500.0),
+    "whatsapp": (1000.0, 1000.0),
+    "api": (5000.0, 5000.0),
+    "mpesa": (200.0, 200.0),
+}
+
+
 class MessagePriority(Enum):
     """Message priority for throttling."""
     ROUTINE = "ROUTINE"  # General health information
@@ -140,7 +165,10 @@ class FiveDMBridge:
         enable_sms: bool = True,
         enable_ussd: bool = True,
         enable_whatsapp: bool = True,
-        enable_mpesa: bool = True
+        enable_mpesa: bool = True,
+        gateways: Optional[Dict[str, Any]] = None,
+        rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        delivery_ledger_path: str = "data/broadcast/five_dm.sqlite",
     ):
         """
         Initialize 5DM Bridge.
@@ -151,6 +179,11 @@ class FiveDMBridge:
             enable_ussd: Enable USSD menu integration
             enable_whatsapp: Enable WhatsApp Business API
             enable_mpesa: Enable M-PESA payment integration
+            gateways: Gateway name -> gateway for recipient fan-out; names
+                default to the lower-cased channel ("sms", "whatsapp", ...).
+                Simulated gateways are used when omitted.
+            rate_limits: Gateway name -> (messages per second, burst)
+            delivery_ledger_path: SQLite ledger for idempotent sends and retries
         """
         self.api_key = api_key
         self.enable_sms = enable_sms
@@ -167,13 +200,31 @@ class FiveDMBridge:
             "api": 0,
         }
         
+        self.gateways = gateways
+        self.rate_limits = rate_limits or DEFAULT_GATEWAY_RATE_LIMITS
+        self.delivery_ledger_path = delivery_ledger_path
+        self._engine: Optional[BroadcastEngine] = None
+        
+    @property
+    def engine(self) -> BroadcastEngine:
+        """Broadcast engine, created on first fan-out."""
+        if self._engine is None:
+            self._engine = BroadcastEngine(
+                gateways=self.gateways or self._simulated_gateways(),
+                ledger_path=self.delivery_ledger_path,
+                rate_limits=self.rate_limits,
+            )
+        return self._engine
+    
     def broadcast_alert(
         self,
         message: str,
         target_region: str,
         channel: DeliveryChannel = DeliveryChannel.SMS,
         priority: MessagePriority = MessagePriority.ROUTINE,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        recipients: Optional[Iterable[Union[str, Tuple[str, str]]]] = None,
+        alert_id: Optional[str] = None,
     ) -> BridgeMessage:
         """
         Broadcast health alert through 5DM network.
@@ -184,17 +235,32 @@ class FiveDMBridge:
             channel: Delivery channel
             priority: Message priority
             metadata: Additional metadata (campaign ID, etc.)
+            recipients: Explicit recipients to fan out to (see
+                broadcast_alert_async); if None, the region's nodes are
+                reached through a single 5DM network call
+            alert_id: Idempotency key for the fan-out (defaults to a new message ID)
             
         Returns:
             BridgeMessage: Message record with delivery tracking
+        
+        Raises:
+            RuntimeError: recipients given while an event loop is running in
+                this thread; await broadcast_alert_async() instead
         """
-        # Validate message length for SMS
-        if channel == DeliveryChannel.SMS and len(message) > 160:
-            raise ValueError(
-                f"❌ SMS message exceeds 160 characters ({len(message)}). "
-                "Split into multiple messages or use different channel."
+        if recipients is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.broadcast_alert_async(
+                    message, target_region, recipients, channel, priority, metadata, alert_id
+                ))
+            raise RuntimeError(
+                "broadcast_alert(recipients=...) cannot run inside an event loop; "
+                "await broadcast_alert_async() instead"
             )
         
+        self._validate_message(message, channel)
+        
         # Estimate recipient count based on region
         recipient_count = self._estimate_recipients(target_region)
         
@@ -224,6 +290,60 @@ class FiveDMBridge:
         
         return bridge_message
     
+    async def broadcast_alert_async(
+        self,
+        message: str,
+        target_region: str,
+        recipients: Iterable[Union[str, Tuple[str, str]]],
+        channel: DeliveryChannel = DeliveryChannel.SMS,
+        priority: MessagePriority = MessagePriority.ROUTINE,
+        metadata: Optional[Dict[str, Any]] = None,
+        alert_id: Optional[str] = None,
+    ) -> BridgeMessage:
+        """
+        Fan an alert out to individual recipients through the broadcast engine.
+        
+        Calling again with the same alert_id only reaches recipients that have
+        not received it yet, so an interrupted broadcast can simply be re-run.
+        
+        Args:
+            message: Alert content (max 160 chars for SMS)
+            target_region: Geographic targeting, recorded on the message
+            recipients: Phone numbers/addresses, sent through the channel's
+                gateway, or (address, gateway) pairs
+            channel: Delivery channel
+            priority: Message priority
+            metadata: Additional metadata (campaign ID, etc.)
+            alert_id: Idempotency key (defaults to a new message ID)
+            
+        Returns:
+            BridgeMessage with delivery_status DELIVERED, PARTIAL or FAILED and
+            the engine's report under metadata["delivery_report"]
+        """
+        self._validate_message(message, channel)
+        
+        gateway = channel.value.lower()
+        report = await self.engine.broadcast(
+            alert_id or self._generate_message_id(), message, recipients, default_gateway=gateway
+        )
+        
+        bridge_message = BridgeMessage(
+            message_id=report.alert_id,
+            timestamp=datetime.utcnow(),
+            recipient_count=report.requested,
+            channel=channel,
+            priority=priority,
+            content=message,
+            metadata={**(metadata or {}), "target_region": target_region, "delivery_report": report.to_dict()},
+            delivery_status=report.status,
+        )
+        
+        self.message_history.append(bridge_message)
+        self.total_nodes_reached += report.delivered
+        self.delivery_stats[gateway] = self.delivery_stats.get(gateway, 0) + report.delivered
+        
+        return bridge_message
+    
     def create_ussd_menu(
         self,
         menu_structure: Dict[str, Any],
@@ -373,15 +493,7 @@ class FiveDMBridge:
         In production, this calls the actual 5DM API endpoints.
         """
         # Simulate delivery based on channel
-        if message.channel == DeliveryChannel.SMS:
-            # SMS has highest reliability
-            success_rate = 0.98
-        elif message.channel == DeliveryChannel.USSD:
-            success_rate = 0.95
-        elif message.channel == DeliveryChannel.WHATSAPP:
-            success_rate = 0.92  # Requires internet
-        else:
-            success_rate = 0.99
+        success_rate = CHANNEL_SUCCESS_RATES.get(message.channel, DEFAULT_SUCCESS_RATE)
         
         # Simulate delivery status
         import random
@@ -396,6 +508,29 @@ class FiveDMBridge:
             "attempts": 1,
         }
     
+    def _validate_message(self, message: str, channel: DeliveryChannel):
+        """Validate message length for SMS."""
+        if channel == DeliveryChannel.SMS and len(message) > 160:
+            raise ValueError(
+                f"❌ SMS message exceeds 160 characters ({len(message)}). "
+                "Split into multiple messages or use different channel."
+            )
+    
+    def _simulated_gateways(self) -> Dict[str, FakeGateway]:
+        """
+        One simulated gateway per channel, failing at the channel's simulated rate.
+        
+        In production, replace with clients for the 5DM gateway endpoints.
+        """
+        return {
+            channel.value.lower(): FakeGateway(
+                name=channel.value.lower(),
+                latency=0.0,
+                failure_rate=1.0 - CHANNEL_SUCCESS_RATES.get(channel, DEFAULT_SUCCESS_RATE),
+            )
+            for channel in DeliveryChannel
+        }
+    
     def _estimate_recipients(self, target_region: str) -> int:
         """
         Estimate recipient count based on target region.
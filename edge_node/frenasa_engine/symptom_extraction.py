@@ -26,14 +26,31 @@ Features:
 - Severity classification
 - JSON schema compliance
 
+Rule mode compiles the symptom, severity and demographic lexicons into one
+Aho-Corasick automaton (built once per process), so every keyword hit and
+its offset is found in a single pass over the transcript.
+
 Philosophy: "Transform voice into actionable intelligence while preserving dignity."
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
 import re
+import threading
+
+
+# Swahili duration patterns, in precedence order
+DURATION_PATTERNS = [re.compile(pattern) for pattern in (
+    r"siku (\w+)",  # "siku mbili" = two days
+    r"wiki (\w+)",  # "wiki moja" = one week
+    r"mwezi (\w+)",  # "mwezi mmoja" = one month
+    r"(\d+)\s*siku",  # "2 siku" = 2 days
+    r"(\d+)\s*wiki",  # "1 wiki" = 1 week
+)]
+
+PREGNANCY_KEYWORDS = ["mjamzito", "mimba", "kujifungua"]
 
 
 @dataclass
@@ -98,6 +115,104 @@ class ExtractedSymptoms:
         return json.dumps(self.to_dict(), indent=2)
 
 
+class AhoCorasickMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick automaton).
+    
+    Each pattern carries one or more payloads. The goto/failure structure is
+    flattened into a full transition table at build time, so matching is one
+    dict lookup per character regardless of how many patterns are loaded.
+    Matches are plain substring hits (same semantics as `keyword in text`).
+    
+    Usage:
+        matcher = AhoCorasickMatcher([("homa", "fever"), ("kali", "severe")])
+        for start, end, keyword, payloads in matcher.find_all("homa kali"):
+            ...
+    """
+    
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._keyword: List[Optional[str]] = [None]
+        self._payloads: Dict[str, List[Any]] = {}
+        self._outputs: List[Tuple[str, ...]] = []
+        for keyword, payload in patterns:
+            self.add(keyword, payload)
+        self.build()
+    
+    def add(self, keyword: str, payload: Any = None):
+        """Add a pattern; call build() before matching again."""
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._keyword.append(None)
+            state = next_state
+        self._keyword[state] = keyword
+        self._payloads.setdefault(keyword, []).append(payload)
+    
+    def build(self):
+        """Compute failure links and the flattened transition table (BFS)."""
+        goto = self._goto
+        fail = [0] * len(goto)
+        outputs: List[Tuple[str, ...]] = [()] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        
+        order = list(goto[0].values())
+        for state in order:
+            outputs[state] = (self._keyword[state],) if self._keyword[state] else ()
+        for state in order:
+            # Parents precede children in BFS order, so fail[state] is final here
+            delta[state] = dict(delta[fail[state]]) if state else delta[0]
+            delta[state].update(goto[state])
+            outputs[state] = outputs[state] + outputs[fail[state]] if fail[state] else outputs[state]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                outputs[child] = (self._keyword[child],) if self._keyword[child] else ()
+                order.append(child)
+        
+        self._delta = delta
+        self._outputs = outputs
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, str, List[Any]]]:
+        """Every (start, end, keyword, payloads) hit in text, ordered by end offset."""
+        delta = self._delta
+        outputs = self._outputs
+        payloads = self._payloads
+        matches = []
+        state = 0
+        for position, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for keyword in outputs[state]:
+                    matches.append((position - len(keyword), position, keyword, payloads[keyword]))
+        return matches
+    
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+_LEXICON_MATCHERS: Dict[str, AhoCorasickMatcher] = {}
+_LEXICON_MATCHERS_LOCK = threading.Lock()
+
+
+def get_lexicon_matcher(patterns: List[Tuple[str, Any]]) -> AhoCorasickMatcher:
+    """Return the process-wide matcher for a pattern set, building it on first use."""
+    key = json.dumps(patterns, sort_keys=True, default=str)
+    matcher = _LEXICON_MATCHERS.get(key)
+    if matcher is None:
+        with _LEXICON_MATCHERS_LOCK:
+            matcher = _LEXICON_MATCHERS.get(key)
+            if matcher is None:
+                matcher = _LEXICON_MATCHERS[key] = AhoCorasickMatcher(patterns)
+    return matcher
+
+
 class FRENASASymptomExtractor:
     """
     FRENASA Symptom Extraction Engine powered by Vertex AI.
@@ -145,6 +260,24 @@ class FRENASASymptomExtractor:
         self.symptom_lexicon = self._build_symptom_lexicon()
         self.severity_keywords = self._build_severity_keywords()
         self.demographic_patterns = self._build_demographic_patterns()
+        self.matcher = get_lexicon_matcher(self._lexicon_patterns())
+    
+    def _lexicon_patterns(self) -> List[Tuple[str, Any]]:
+        """Flatten all rule-mode lexicons into (keyword, (kind, label, rank)) patterns."""
+        patterns = []
+        for rank, (symptom_name, keywords) in enumerate(self.symptom_lexicon.items()):
+            for keyword_rank, keyword in enumerate(keywords):
+                patterns.append((keyword, ("symptom", symptom_name, (rank, keyword_rank))))
+        for level, keywords in self.severity_keywords.items():
+            for keyword in keywords:
+                patterns.append((keyword, ("severity", level, 0)))
+        for dimension, groups in self.demographic_patterns.items():
+            for rank, (group, keywords) in enumerate(groups.items()):
+                for keyword in keywords:
+                    patterns.append((keyword, (dimension, group, rank)))
+        for keyword in PREGNANCY_KEYWORDS:
+            patterns.append((keyword, ("pregnancy", True, 0)))
+        return patterns
     
     def _initialize_client(self):
         """
@@ -196,6 +329,32 @@ class FRENASASymptomExtractor:
         else:
             return self._extract_with_rules(transcription_text, location)
     
+    def extract_symptoms_many(
+        self,
+        transcriptions: Iterable[str],
+        locations: Optional[Iterable[Optional[str]]] = None,
+        use_vertex_ai: bool = True,
+    ) -> List[ExtractedSymptoms]:
+        """
+        Extract symptoms from a batch of transcriptions.
+        
+        Args:
+            transcriptions: Transcribed Swahili texts
+            locations: Per-transcription locations (optional, same length)
+            use_vertex_ai: Whether to use Vertex AI model (falls back to rules if False)
+        
+        Returns:
+            List of ExtractedSymptoms, in input order
+        """
+        transcriptions = list(transcriptions)
+        locations = list(locations) if locations is not None else [None] * len(transcriptions)
+        if len(locations) != len(transcriptions):
+            raise ValueError("locations must match transcriptions in length")
+        return [
+            self.extract_symptoms(text, location=location, use_vertex_ai=use_vertex_ai)
+            for text, location in zip(transcriptions, locations)
+        ]
+    
     def _extract_with_vertex_ai(
         self,
         transcription_text: str,
@@ -235,11 +394,14 @@ class FRENASASymptomExtractor:
         """
         text_lower = transcription_text.lower()
         
+        # One automaton pass finds every lexicon hit with its offsets
+        matches = self.matcher.find_all(text_lower)
+        
         # Extract symptoms
-        symptoms = self._identify_symptoms(text_lower)
+        symptoms = self._identify_symptoms(text_lower, matches)
         
         # Extract demographics
-        demographics = self._identify_demographics(text_lower)
+        demographics = self._identify_demographics(text_lower, matches)
         
         # Determine urgency
         urgency = self._classify_urgency(symptoms)
@@ -261,85 +423,96 @@ class FRENASASymptomExtractor:
             timestamp=datetime.utcnow()
         )
     
-    def _identify_symptoms(self, text: str) -> List[SymptomVector]:
+    def _identify_symptoms(self, text: str, matches: Optional[List] = None) -> List[SymptomVector]:
         """Identify symptoms from Swahili text using lexicon matching."""
-        identified_symptoms = []
+        if matches is None:
+            matches = self.matcher.find_all(text)
+        
+        # Per symptom, keep the highest-priority keyword found (lexicon order),
+        # at its first occurrence; collect severity indicator spans alongside
+        best: Dict[str, Tuple[Tuple[int, int], int, int]] = {}
+        severity_spans: Dict[str, List[Tuple[int, int]]] = {"severe": [], "mild": []}
+        for start, end, _keyword, payloads in matches:
+            for kind, label, rank in payloads:
+                if kind == "symptom":
+                    current = best.get(label)
+                    if current is None or rank < current[0]:
+                        best[label] = (rank, start, end)
+                elif kind == "severity":
+                    severity_spans.setdefault(label, []).append((start, end))
+        if not best:
+            return []
+        
+        # Duration does not depend on the symptom, so extract it once
+        duration = self._extract_duration(text)
         
-        for symptom_name, keywords in self.symptom_lexicon.items():
-            for keyword in keywords:
-                if keyword in text:
-                    # Determine severity
-                    severity = self._determine_severity(text, keyword)
-                    
-                    # Extract duration if present
-                    duration = self._extract_duration(text)
-                    
-                    identified_symptoms.append(SymptomVector(
-                        symptom_name=symptom_name,
-                        severity=severity,
-                        duration=duration,
-                        confidence=0.85
-                    ))
-                    break  # Only count each symptom once
+        identified_symptoms = []
+        for symptom_name, (_rank, start, end) in sorted(best.items(), key=lambda item: item[1]):
+            identified_symptoms.append(SymptomVector(
+                symptom_name=symptom_name,
+                severity=self._severity_from_spans(start, end, severity_spans),
+                duration=duration,
+                confidence=0.85
+            ))
         
         return identified_symptoms
     
+    def _severity_from_spans(
+        self,
+        start: int,
+        end: int,
+        severity_spans: Dict[str, List[Tuple[int, int]]],
+        window: int = 30,
+    ) -> str:
+        """Severity from indicator hits inside the context window around a keyword."""
+        low, high = max(0, start - window), end + window
+        if any(low <= s and e <= high for s, e in severity_spans.get("severe", ())):
+            return "severe"
+        if any(low <= s and e <= high for s, e in severity_spans.get("mild", ())):
+            return "mild"
+        return "moderate"
+    
     def _determine_severity(self, text: str, symptom_keyword: str) -> str:
         """Determine severity from context around symptom keyword."""
-        # Find symptom in text
         index = text.find(symptom_keyword)
         if index == -1:
             return "moderate"
-        
-        # Check surrounding words for severity indicators
-        window = 30  # characters before and after
-        context = text[max(0, index-window):index+len(symptom_keyword)+window]
-        
-        # Check for severity keywords
-        if any(kw in context for kw in self.severity_keywords["severe"]):
-            return "severe"
-        elif any(kw in context for kw in self.severity_keywords["mild"]):
-            return "mild"
-        else:
-            return "moderate"
+        spans: Dict[str, List[Tuple[int, int]]] = {"severe": [], "mild": []}
+        for start, end, _keyword, payloads in self.matcher.find_all(text):
+            for kind, label, _rank in payloads:
+                if kind == "severity":
+                    spans.setdefault(label, []).append((start, end))
+        return self._severity_from_spans(index, index + len(symptom_keyword), spans)
     
     def _extract_duration(self, text: str) -> Optional[str]:
         """Extract temporal duration from text."""
-        # Swahili duration patterns
-        patterns = [
-            r"siku (\w+)",  # "siku mbili" = two days
-            r"wiki (\w+)",  # "wiki moja" = one week
-            r"mwezi (\w+)",  # "mwezi mmoja" = one month
-            r"(\d+)\s*siku",  # "2 siku" = 2 days
-            r"(\d+)\s*wiki",  # "1 wiki" = 1 week
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in DURATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         
         return None
     
-    def _identify_demographics(self, text: str) -> PatientDemographics:
+    def _identify_demographics(self, text: str, matches: Optional[List] = None) -> PatientDemographics:
         """Extract patient demographics from text."""
+        if matches is None:
+            matches = self.matcher.find_all(text)
         demographics = PatientDemographics()
         
-        # Age group patterns
-        for age_group, patterns in self.demographic_patterns["age"].items():
-            if any(pattern in text for pattern in patterns):
-                demographics.age_group = age_group
-                break
-        
-        # Gender patterns
-        for gender, patterns in self.demographic_patterns["gender"].items():
-            if any(pattern in text for pattern in patterns):
-                demographics.gender = gender
-                break
-        
-        # Pregnancy indicator
-        if any(kw in text for kw in ["mjamzito", "mimba", "kujifungua"]):
-            demographics.pregnant = True
+        # First group (in pattern order) with any hit wins, per dimension
+        found: Dict[str, Tuple[int, str]] = {}
+        for _start, _end, _keyword, payloads in matches:
+            for kind, label, rank in payloads:
+                if kind in ("age", "gender"):
+                    if kind not in found or rank < found[kind][0]:
+                        found[kind] = (rank, label)
+                elif kind == "pregnancy":
+                    demographics.pregnant = True
+        
+        if "age" in found:
+            demographics.age_group = found["age"][1]
+        if "gender" in found:
+            demographics.gender = found["gender"][1]
         
         return demographics
     
@@ -28,12 +28,14 @@ API Endpoints:
 """
 
 from flask import Flask, request, jsonify
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
 import json
 import logging
 from datetime import datetime
 import traceback
 
+from edge_node.frenasa_engine.symptom_extraction import get_lexicon_matcher
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -88,6 +90,9 @@ class SymptomExtractor:
             "covid19": ["kikohozi", "homa", "pumu", "dhaifu"],
         }
         
+        # Shared Aho-Corasick automaton (same engine as FRENASASymptomExtractor rule mode)
+        self.matcher = get_lexicon_matcher([(term, "symptom") for term in self.symptom_dictionary])
+        
     def extract_symptoms(self, transcript: str) -> Dict[str, Any]:
         """
         Extract symptoms from Swahili transcript.
@@ -100,10 +105,11 @@ class SymptomExtractor:
         """
         transcript_lower = transcript.lower()
         detected_symptoms = []
+        found_terms = {keyword for _start, _end, keyword, _payloads in self.matcher.find_all(transcript_lower)}
         
-        # Extract individual symptoms
+        # Extract individual symptoms (dictionary order)
         for swahili_term, symptom_info in self.symptom_dictionary.items():
-            if swahili_term in transcript_lower:
+            if swahili_term in found_terms:
                 detected_symptoms.append({
                     "swahili": swahili_term,
                     "english": symptom_info["english"],
@@ -138,6 +144,10 @@ class SymptomExtractor:
             "timestamp": datetime.utcnow().isoformat(),
         }
     
+    def extract_symptoms_many(self, transcripts: Iterable[str]) -> List[Dict[str, Any]]:
+        """Extract symptoms from a batch of transcripts, in input order."""
+        return [self.extract_symptoms(transcript) for transcript in transcripts]
+    
     def _assess_disease_risk(self, symptoms: List[Dict]) -> List[Dict[str, Any]]:
         """
         Assess disease risk based on symptom patterns.
@@ -23,14 +23,26 @@ Complete Pipeline:
 4. Governance Validation (Sovereign Guardrail)
 5. Structured JSON Output
 
+Burst Mode (process_many / stream):
+    feeder (Stage 0) → [bounded queue] → N transcription workers (Stage 1)
+    → [bounded queue] → batched extraction + fusion + validation (Stages 2-4)
+Each stream has its own bounded queues, which give backpressure; the batch
+stage extracts symptoms for a whole batch in one extractor call. Every stage
+records a latency histogram and throughput counters (see get_stage_metrics()).
+
 Philosophy: "From voice to verified intelligence in seconds."
 """
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, Iterable, Iterator, List
 from dataclasses import dataclass, field
 from datetime import datetime
+import bisect
+import itertools
 import json
 import os
+import queue
+import threading
+import time
 
 
 @dataclass
@@ -95,6 +107,61 @@ class VoiceToJSONResult:
         print(f"💾 Saved pipeline result to: {filepath}")
 
 
+class StageMetrics:
+    """Fixed-bucket latency histogram and throughput counters for one stage."""
+    
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, float("inf"))
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.bucket_counts = [0] * len(self.BUCKETS_MS)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def observe(self, latency_ms: float, error: bool = False):
+        now = time.monotonic()
+        with self._lock:
+            self.bucket_counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+            self.count += 1
+            self.errors += int(error)
+            self.total_ms += latency_ms
+            if self.first_seen is None:
+                self.first_seen = now - latency_ms / 1000.0
+            self.last_seen = now
+    
+    def percentile(self, fraction: float) -> float:
+        """Upper bucket bound containing the given fraction of observations."""
+        target = fraction * self.count
+        running = 0
+        for bound, bucket in zip(self.BUCKETS_MS, self.bucket_counts):
+            running += bucket
+            if running >= target and bucket:
+                return bound
+        return 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = (self.last_seen - self.first_seen) if self.count else 0.0
+            return {
+                "stage": self.name,
+                "count": self.count,
+                "errors": self.errors,
+                "mean_ms": self.total_ms / self.count if self.count else 0.0,
+                "p50_ms": self.percentile(0.5),
+                "p95_ms": self.percentile(0.95),
+                "p99_ms": self.percentile(0.99),
+                "throughput_per_s": self.count / elapsed if elapsed > 0 else 0.0,
+                "histogram_ms": {
+                    ("+Inf" if bound == float("inf") else str(bound)): bucket
+                    for bound, bucket in zip(self.BUCKETS_MS, self.bucket_counts)
+                },
+            }
+
+
 class VoiceToJSONPipeline:
     """
     Complete pipeline for Swahili voice note to structured JSON transformation.
@@ -142,6 +209,15 @@ class VoiceToJSONPipeline:
             "failed": 0,
             "average_time_ms": 0.0
         }
+        self._stats_lock = threading.Lock()
+        self.stage_metrics = {
+            name: StageMetrics(name)
+            for name in ("precheck", "transcription", "extraction", "fusion", "postcheck", "end_to_end")
+        }
+        # Queues of the streams currently running, keyed by stream id
+        self._streams: Dict[int, Dict[str, queue.Queue]] = {}
+        self._streams_lock = threading.Lock()
+        self._stream_ids = itertools.count()
     
     def _initialize_components(self):
         """Initialize all pipeline components."""
@@ -421,21 +497,306 @@ class VoiceToJSONPipeline:
     
     def _update_stats(self, success: bool, time_ms: float):
         """Update pipeline statistics."""
-        self.stats["total_processed"] += 1
-        if success:
-            self.stats["successful"] += 1
-        else:
-            self.stats["failed"] += 1
-        
-        # Update average time
-        total = self.stats["total_processed"]
-        current_avg = self.stats["average_time_ms"]
-        new_avg = ((current_avg * (total - 1)) + time_ms) / total
-        self.stats["average_time_ms"] = new_avg
+        with self._stats_lock:
+            self.stats["total_processed"] += 1
+            if success:
+                self.stats["successful"] += 1
+            else:
+                self.stats["failed"] += 1
+            
+            # Update average time
+            total = self.stats["total_processed"]
+            current_avg = self.stats["average_time_ms"]
+            new_avg = ((current_avg * (total - 1)) + time_ms) / total
+            self.stats["average_time_ms"] = new_avg
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get pipeline statistics."""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
+    
+    def get_stage_metrics(self) -> Dict[str, Any]:
+        """
+        Per-stage latency histograms, throughput counters and current queue
+        depths (summed over the streams currently running).
+        """
+        with self._streams_lock:
+            streams = list(self._streams.values())
+        depths = {"transcription": 0, "extraction": 0, "results": 0}
+        for queues in streams:
+            for name, q in queues.items():
+                depths[name] += q.qsize()
+        return {
+            "stages": {name: metrics.to_dict() for name, metrics in self.stage_metrics.items()},
+            "queue_depths": depths,
+            "active_streams": len(streams),
+        }
+    
+    # ═════════════════════════════════════════════════════════════════════════
+    # Burst Mode: staged pipeline with bounded queues
+    # ═════════════════════════════════════════════════════════════════════════
+    
+    def process_many(
+        self,
+        voice_notes: Iterable[Dict[str, Any]],
+        transcription_workers: int = 4,
+        queue_size: int = 64,
+        batch_size: int = 32,
+    ) -> List[VoiceToJSONResult]:
+        """
+        Process a burst of voice notes; results are returned in input order.
+        
+        Args:
+            voice_notes: Dicts with the keyword arguments of process()
+                         (audio_data, patient_id, location, chv_id, ...)
+            transcription_workers: Worker threads for the transcription stage
+            queue_size: Capacity of each inter-stage queue (backpressure)
+            batch_size: Max notes drained per pass by the lightweight stages
+        
+        Returns:
+            List of VoiceToJSONResult
+        """
+        indexed = sorted(
+            self.stream(voice_notes, transcription_workers, queue_size, batch_size),
+            key=lambda pair: pair[0]
+        )
+        return [result for _, result in indexed]
+    
+    def stream(
+        self,
+        voice_notes: Iterable[Dict[str, Any]],
+        transcription_workers: int = 4,
+        queue_size: int = 64,
+        batch_size: int = 32,
+    ) -> Iterator:
+        """
+        Stream (input_index, VoiceToJSONResult) pairs in completion order.
+        
+        Stages run on their own threads and are silent regardless of
+        enable_logging; use get_stage_metrics() for observability. Results
+        also pass through a bounded queue, so a slow consumer throttles the
+        whole pipeline. Closing the generator early stops the feeder and
+        workers (notes already inside a stage finish that stage first).
+        Concurrent streams each get their own queues and threads.
+        """
+        transcribe_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        extract_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        result_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        stream_id = next(self._stream_ids)
+        done = object()
+        stop = threading.Event()
+        
+        def put(q: queue.Queue, item) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def get(q: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+            return done
+        
+        def feeder():
+            try:
+                for index, note in enumerate(voice_notes):
+                    if stop.is_set():
+                        return
+                    job = self._new_job(index, note)
+                    if self._run_stage("precheck", job, self._stage_precheck):
+                        put(transcribe_q, job)
+                    else:
+                        put(result_q, self._finish_job(job))
+            finally:
+                for _ in range(transcription_workers):
+                    put(transcribe_q, done)
+        
+        def transcription_worker():
+            while True:
+                job = get(transcribe_q)
+                if job is done:
+                    put(extract_q, done)
+                    return
+                if self._run_stage("transcription", job, self._stage_transcribe):
+                    put(extract_q, job)
+                else:
+                    put(result_q, self._finish_job(job))
+        
+        def batch_worker():
+            finished_workers = 0
+            while finished_workers < transcription_workers and not stop.is_set():
+                batch = [get(extract_q)]
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(extract_q.get_nowait())
+                    except queue.Empty:
+                        break
+                jobs = [job for job in batch if job is not done]
+                finished_workers += len(batch) - len(jobs)
+                if jobs:
+                    self._extract_batch(jobs)
+                for job in jobs:
+                    if stop.is_set():
+                        return
+                    # Fusion and validation run back-to-back; a failing stage ends the job
+                    (job["error"] is None
+                     and self._run_stage("fusion", job, self._stage_fuse)
+                     and self._run_stage("postcheck", job, self._stage_postcheck))
+                    put(result_q, self._finish_job(job))
+            put(result_q, done)
+        
+        threads = [threading.Thread(target=feeder, name="v2j-feeder", daemon=True),
+                   threading.Thread(target=batch_worker, name="v2j-batch", daemon=True)]
+        threads += [threading.Thread(target=transcription_worker, name=f"v2j-transcribe-{i}", daemon=True)
+                    for i in range(transcription_workers)]
+        with self._streams_lock:
+            self._streams[stream_id] = {"transcription": transcribe_q, "extraction": extract_q, "results": result_q}
+        for thread in threads:
+            thread.start()
+        
+        try:
+            while True:
+                item = result_q.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            # Runs on normal exhaustion and on GeneratorExit from close()
+            stop.set()
+            for thread in threads:
+                thread.join()
+            with self._streams_lock:
+                del self._streams[stream_id]
+    
+    def _new_job(self, index: int, note: Dict[str, Any]) -> Dict[str, Any]:
+        audio_data = note.get("audio_data", b"")
+        return {
+            "index": index,
+            "pipeline_id": f"{self._generate_pipeline_id()}-{index:06d}",
+            "start": datetime.utcnow(),
+            "note": note,
+            "audio_metadata": {
+                "size_bytes": len(audio_data),
+                "format": note.get("audio_format", "LINEAR16"),
+                "sample_rate": note.get("sample_rate", 16000),
+                "location": note.get("location"),
+                "chv_id": note.get("chv_id"),
+                "patient_id": note.get("patient_id", "UNKNOWN")
+            },
+            "stage_ms": {},
+            "error": None,
+        }
+    
+    def _run_stage(self, stage: str, job: Dict[str, Any], handler) -> bool:
+        """Run one stage for a job, recording latency; False if the job failed."""
+        started = time.perf_counter()
+        try:
+            handler(job)
+            ok = True
+        except Exception as e:
+            job["error"] = f"{stage}: {e}"
+            ok = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        job["stage_ms"][stage] = elapsed_ms
+        self.stage_metrics[stage].observe(elapsed_ms, error=not ok)
+        return ok
+    
+    def _stage_precheck(self, job: Dict[str, Any]):
+        self._validate_governance_precheck(
+            job["audio_metadata"],
+            job["note"].get("consent_token") or "IMPLICIT_CHV_CONSENT"
+        )
+    
+    def _stage_transcribe(self, job: Dict[str, Any]):
+        note = job["note"]
+        job["transcription"] = self.transcriber.transcribe_audio(
+            note.get("audio_data", b""),
+            sample_rate_hertz=note.get("sample_rate", 16000),
+            encoding=note.get("audio_format", "LINEAR16")
+        )
+    
+    def _extract_batch(self, jobs: List[Dict[str, Any]]):
+        """
+        Extraction stage for a whole batch in one extractor call, with the
+        latency split evenly across its jobs. If the batch call fails, each
+        job is retried on its own so one bad note fails alone.
+        """
+        started = time.perf_counter()
+        try:
+            extracted = self.extractor.extract_symptoms_many(
+                [job["transcription"].text for job in jobs],
+                locations=[job["note"].get("location") for job in jobs]
+            )
+        except Exception:
+            for job in jobs:
+                self._run_stage("extraction", job, self._stage_extract)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000 / len(jobs)
+        for job, symptoms in zip(jobs, extracted):
+            job["symptoms"] = symptoms
+            job["stage_ms"]["extraction"] = elapsed_ms
+            self.stage_metrics["extraction"].observe(elapsed_ms)
+    
+    def _stage_extract(self, job: Dict[str, Any]):
+        job["symptoms"] = self.extractor.extract_symptoms(
+            job["transcription"].text,
+            location=job["note"].get("location")
+        )
+    
+    def _stage_fuse(self, job: Dict[str, Any]):
+        job["golden_thread_record"] = self._fuse_with_golden_thread(
+            job["transcription"],
+            job["symptoms"],
+            job["note"].get("patient_id", "UNKNOWN"),
+            job["note"].get("chv_id")
+        )
+    
+    def _stage_postcheck(self, job: Dict[str, Any]):
+        self._validate_governance_postcheck(job["golden_thread_record"])
+    
+    def _finish_job(self, job: Dict[str, Any]):
+        """Build the (index, VoiceToJSONResult) pair and record end-to-end metrics."""
+        total_time = (datetime.utcnow() - job["start"]).total_seconds() * 1000
+        success = job["error"] is None
+        self._update_stats(success, total_time)
+        self.stage_metrics["end_to_end"].observe(total_time, error=not success)
+        
+        if not success:
+            result = VoiceToJSONResult(
+                pipeline_id=job["pipeline_id"],
+                success=False,
+                audio_metadata=job["audio_metadata"],
+                total_time_ms=total_time,
+                processing_mode=self.mode,
+                sovereignty_compliant=False,
+                governance_status="failed",
+                error_message=job["error"],
+                timestamp=datetime.utcnow()
+            )
+        else:
+            result = VoiceToJSONResult(
+                pipeline_id=job["pipeline_id"],
+                success=True,
+                audio_metadata=job["audio_metadata"],
+                transcription=job["transcription"].to_dict(),
+                transcription_time_ms=job["stage_ms"].get("transcription", 0.0),
+                symptoms=job["symptoms"].to_dict(),
+                extraction_time_ms=job["stage_ms"].get("extraction", 0.0),
+                golden_thread_record=job["golden_thread_record"].to_dict(),
+                fusion_time_ms=job["stage_ms"].get("fusion", 0.0),
+                governance_status="compliant",
+                sovereignty_compliant=True,
+                total_time_ms=total_time,
+                processing_mode=self.mode,
+                timestamp=datetime.utcnow()
+            )
+        return job["index"], result
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -18,10 +18,20 @@ Provides data synchronization and fusion capabilities for edge deployments.
 Components:
 - GoldenThread: Data fusion engine merging EMR, CBS, and IDSR streams
 - SovereignSync: 80% offline capability with cloud-first fallback
+- SyncCache / SyncSink / ConnectivityProbe: durable edge cache, pluggable
+  flush destinations and cached connectivity checks used by SovereignSync
 """
 
 from .golden_thread import GoldenThread, TimeseriesRecord, DataSourceType, VerificationScore
-from .sovereign_sync import SovereignSync, CloudUnavailableError
+from .sovereign_sync import (
+    SovereignSync,
+    CloudUnavailableError,
+    ConnectivityProbe,
+    SyncCache,
+    SyncSink,
+    FirestoreSink,
+    LocalFileSink,
+)
 
 __all__ = [
     'GoldenThread',
@@ -30,4 +40,9 @@ __all__ = [
     'VerificationScore',
     'SovereignSync',
     'CloudUnavailableError',
+    'ConnectivityProbe',
+    'SyncCache',
+    'SyncSink',
+    'FirestoreSink',
+    'LocalFileSink',
 ]
@@ -97,26 +97,310 @@ class SovereignSync:
 
     def get_status(self) -> str:
         return f"ACTIVE ({self.mode})"
-from google.auth.exceptions import DefaultCredentialsError
+try:
+    from google.auth.exceptions import DefaultCredentialsError
+except ImportError:
+    DefaultCredentialsError = Exception
 import json
 import hashlib
+from collections.abc import MutableMapping
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import socket
+import sqlite3
+import threading
 import uuid
 
+# Default files live under the repository's data/ directory, not the caller's cwd
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "sync")
+DEFAULT_CACHE_PATH = os.path.join(_DATA_DIR, "sovereign_cache.sqlite")
+DEFAULT_STANDIN_PATH = os.path.join(_DATA_DIR, "cloud_standin.sqlite")
+
 
 class CloudUnavailableError(Exception):
     """Raised when cloud connectivity is unavailable."""
     pass
 
 
+class ConnectivityProbe:
+    """
+    Cached connectivity check.
+
+    One socket probe answers for `ttl` seconds. After a failed probe (or a
+    reported write failure) the link is considered down for a backoff period
+    that doubles up to `max_backoff`, so a flush of tens of thousands of
+    records costs at most one probe and an offline clinic does not keep
+    waking the radio.
+    """
+
+    def __init__(self, host: str = "8.8.8.8", port: int = 53, timeout: float = 3.0, ttl: float = 30.0,
+                 initial_backoff: float = 5.0, max_backoff: float = 300.0, clock=time.monotonic):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ttl = ttl
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.probes = 0
+        self._online: Optional[bool] = None
+        self._checked_at = 0.0
+        self._backoff = 0.0
+        self._lock = threading.Lock()
+
+    def is_online(self) -> bool:
+        with self._lock:
+            now = self.clock()
+            if self._online is not None:
+                window = self.ttl if self._online else self._backoff
+                if now - self._checked_at < window:
+                    return self._online
+            self.probes += 1
+            self._set(self._probe(), now)
+            return self._online
+
+    def reset(self):
+        """Forget the cached result (e.g. on an OS network-change event)."""
+        with self._lock:
+            self._online = None
+            self._backoff = 0.0
+
+    def report_failure(self):
+        """Mark the link down after a failed write and extend the backoff."""
+        with self._lock:
+            self._set(False, self.clock())
+
+    def _set(self, online: bool, now: float):
+        self._online = online
+        self._checked_at = now
+        self._backoff = 0.0 if online else min(self.max_backoff, max(self.initial_backoff, self._backoff * 2))
+
+    def _probe(self) -> bool:
+        try:
+            # Reach Google's DNS server as a quick connectivity check
+            with socket.create_connection((self.host, self.port), timeout=self.timeout):
+                return True
+        except OSError:
+            return False
+
+
+class SyncSink:
+    """
+    Destination for flushed records.
+
+    write_batch must be all-or-nothing and idempotent per document id:
+    records are removed from the edge cache only after the batch is written,
+    so a crash in between re-sends the same ids.
+
+    is_cloud marks sinks that are the central store. Writes to any other sink
+    are mirrors: the edge cache stays the copy of record and is never drained.
+    """
+
+    max_batch_size = 500
+    is_cloud = True
+
+    def write_batch(self, collection: str, records: List[Tuple[str, Dict[str, Any]]]) -> None:
+        raise NotImplementedError
+
+
+class FirestoreSink(SyncSink):
+    """Firestore batched writes (at most 500 operations per commit)."""
+
+    max_batch_size = 500
+
+    def __init__(self, client):
+        self.client = client
+
+    def write_batch(self, collection: str, records: List[Tuple[str, Dict[str, Any]]]) -> None:
+        batch = self.client.batch()
+        collection_ref = self.client.collection(collection)
+        for document_id, data in records:
+            batch.set(collection_ref.document(document_id), data)
+        batch.commit()
+
+
+class LocalFileSink(SyncSink):
+    """
+    SQLite stand-in for the cloud store, used when no cloud client is configured.
+
+    Not a cloud sink unless constructed with is_cloud=True (e.g. when the file
+    is itself shipped upstream, or in benchmarks).
+    """
+
+    max_batch_size = 5000
+
+    def __init__(self, path: str = DEFAULT_STANDIN_PATH, is_cloud: bool = False):
+        self.is_cloud = is_cloud
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "collection TEXT NOT NULL, document_id TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (collection, document_id))"
+            )
+
+    def write_batch(self, collection: str, records: List[Tuple[str, Dict[str, Any]]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?)",
+                [(collection, document_id, json.dumps(data, default=str)) for document_id, data in records]
+            )
+
+    def count(self, collection: Optional[str] = None) -> int:
+        with self._lock:
+            if collection is None:
+                return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM documents WHERE collection = ?",
+                                      (collection,)).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+class SyncCache(MutableMapping):
+    """
+    Durable HSML edge cache backed by SQLite (WAL).
+
+    Behaves like the former in-memory dict of cache_key -> HSML entry, and
+    adds chunked reads/deletes in insertion order for the flush engine and
+    aggregate counters that do not materialise the cache. Every write bumps
+    the entry's version, so a flush only deletes the version it sent.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, cache_key TEXT UNIQUE NOT NULL, location TEXT, "
+                "timestamp TEXT NOT NULL, data TEXT NOT NULL, hash TEXT, sync_pending INTEGER NOT NULL, "
+                "version INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+            if 'version' not in columns:
+                self._conn.execute("ALTER TABLE entries ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_pending ON entries (sync_pending, seq)")
+
+    @staticmethod
+    def _entry(row: Tuple) -> Dict[str, Any]:
+        location, timestamp, data, data_hash, sync_pending = row
+        return {
+            'data': json.loads(data),
+            'location': location,
+            'timestamp': datetime.fromisoformat(timestamp),
+            'sync_pending': bool(sync_pending),
+            'hash': data_hash
+        }
+
+    def __getitem__(self, cache_key: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT location, timestamp, data, hash, sync_pending FROM entries WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(cache_key)
+        return self._entry(row)
+
+    def __setitem__(self, cache_key: str, entry: Dict[str, Any]):
+        timestamp = entry.get('timestamp') or datetime.now(timezone.utc)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO entries (cache_key, location, timestamp, data, hash, sync_pending) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(cache_key) DO UPDATE SET location = excluded.location, "
+                "timestamp = excluded.timestamp, data = excluded.data, hash = excluded.hash, "
+                "sync_pending = excluded.sync_pending, version = entries.version + 1",
+                (cache_key, entry.get('location'), timestamp.isoformat(), json.dumps(entry['data'], default=str),
+                 entry.get('hash'), int(entry.get('sync_pending', True)))
+            )
+
+    def __delitem__(self, cache_key: str):
+        with self._lock, self._conn:
+            if self._conn.execute("DELETE FROM entries WHERE cache_key = ?", (cache_key,)).rowcount == 0:
+                raise KeyError(cache_key)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute("SELECT cache_key FROM entries ORDER BY seq")]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, cache_key: object) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM entries WHERE cache_key = ?", (cache_key,)).fetchone() is not None
+
+    def iter_entries(self, chunk_size: int = 1000) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (cache_key, entry) pairs in insertion order, one chunk in memory at a time."""
+        after = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, cache_key, location, timestamp, data, hash, sync_pending FROM entries "
+                    "WHERE seq > ? ORDER BY seq LIMIT ?", (after, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row[1], self._entry(row[2:])
+            after = rows[-1][0]
+
+    def pending(self, limit: int, after_seq: int = 0) -> List[Tuple[int, str, int, Dict[str, Any]]]:
+        """Next chunk of (seq, cache_key, version, data) awaiting sync."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, cache_key, version, data FROM entries WHERE sync_pending = 1 AND seq > ? "
+                "ORDER BY seq LIMIT ?", (after_seq, limit)
+            ).fetchall()
+        return [(seq, cache_key, version, json.loads(data)) for seq, cache_key, version, data in rows]
+
+    def delete_flushed(self, flushed: List[Tuple[str, int]]) -> int:
+        """
+        Remove flushed (cache_key, version) pairs.
+
+        An entry rewritten after it was read has a newer version and is kept
+        for the next flush. Returns the number of entries deleted.
+        """
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM entries WHERE cache_key = ? AND version = ?", flushed)
+            return self._conn.total_changes - before
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total, pending, oldest, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(sync_pending), 0), MIN(timestamp), COALESCE(SUM(LENGTH(data)), 0) "
+                "FROM entries"
+            ).fetchone()
+        return {'total_entries': total, 'pending_sync': pending, 'oldest_entry': oldest, 'cache_size_bytes': size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class SovereignSync:
     """
     Sovereign synchronization engine with 80% offline capability.
     
     Provides cloud-first data sync with automatic fallback to local edge storage
     when connectivity is unavailable. Uses HSML format for offline data integrity.
+    Cached entries live in a durable on-disk cache and are flushed in chunked
+    batch writes to a pluggable sink (Firestore when a client is available,
+    otherwise a local SQLite stand-in). Only a cloud sink counts as synced;
+    with the stand-in, records stay on the edge and flushes only mirror them.
     
     Usage:
         sync = SovereignSync()
@@ -130,15 +414,34 @@ class SovereignSync:
         sync.batch_sync_when_connected()
     """
     
-    def __init__(self):
-        """Initialize the SovereignSync engine."""
-        self.local_cache = {}
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, sink: Optional[SyncSink] = None,
+                 probe: Optional[ConnectivityProbe] = None, batch_size: int = 500, collection: str = 'field_data'):
+        """
+        Initialize the SovereignSync engine.
+
+        Args:
+            cache_path: SQLite file for the durable edge cache (":memory:" for tests)
+            sink: Flush destination (default: Firestore if available, else LocalFileSink)
+            probe: Shared connectivity probe (default: cached probe of Google DNS)
+            batch_size: Records per batch write (capped at the sink's limit)
+            collection: Destination collection for field data
+        """
+        self.local_cache = SyncCache(cache_path)
         try:
             self.firestore_client = firestore.Client()
         except (DefaultCredentialsError, ImportError, Exception) as e:
             # If Firestore initialization fails (e.g., no credentials), set to None
             # This allows the system to function in fully offline mode
             self.firestore_client = None
+        if sink is None:
+            sink = FirestoreSink(self.firestore_client) if self.firestore_client is not None else LocalFileSink()
+        self.sink = sink
+        self.probe = probe or ConnectivityProbe()
+        self.batch_size = batch_size
+        self.collection = collection
+        self.counters = {'cloud_synced': 0, 'edge_stored': 0, 'flushed': 0, 'mirrored': 0, 'flush_failures': 0,
+                         'batches': 0}
+        self.last_flush: Optional[Dict[str, Any]] = None
     
     def sync_with_edge_fallback(self, data: Dict[str, Any], location: str) -> str:
         """
@@ -150,25 +453,33 @@ class SovereignSync:
             
         Returns:
             str: "cloud_synced" if successful cloud sync,
-                 "edge_stored_with_hsml" if stored locally
+                 "edge_stored_with_hsml" if stored locally (always the case
+                 when the sink is not a cloud sink)
                  
         Philosophy:
             Cloud-first approach ensures data reaches central systems when possible,
             but never blocks field operations when connectivity is unavailable.
         """
+        # Generate unique cache key combining location and a random suffix; it is
+        # also the document id, so a retried write never duplicates the record
+        cache_key = f"{location}_{uuid.uuid4().hex}"
         try:
             # Try cloud sync first
-            if self.firestore_client is not None and self._check_connectivity():
-                doc_ref = self.firestore_client.collection('field_data').document()
-                doc_ref.set(data)
+            if not self.sink.is_cloud:
+                raise CloudUnavailableError("No cloud sink configured")
+            if self._check_connectivity():
+                try:
+                    self.sink.write_batch(self.collection, [(cache_key, data)])
+                except Exception as e:
+                    self.probe.report_failure()
+                    raise CloudUnavailableError(str(e))
+                self.counters['cloud_synced'] += 1
                 return "cloud_synced"
             else:
-                # No client or no connectivity - fall back to local
+                # No connectivity - fall back to local
                 raise CloudUnavailableError("Cloud unavailable")
         except CloudUnavailableError:
             # Fall back to local storage with HSML format
-            # Generate unique cache key combining location and timestamp
-            cache_key = f"{location}_{uuid.uuid4().hex[:8]}"
             hsml_entry = {
                 'data': data,
                 'location': location,
@@ -177,56 +488,83 @@ class SovereignSync:
                 'hash': self._calculate_hash(data)
             }
             self.local_cache[cache_key] = hsml_entry
+            self.counters['edge_stored'] += 1
             return "edge_stored_with_hsml"
     
-    def batch_sync_when_connected(self) -> Dict[str, Any]:
+    def batch_sync_when_connected(self, max_records: Optional[int] = None) -> Dict[str, Any]:
         """
         Batch synchronize all pending local cache entries when connectivity restored.
+
+        Connectivity is checked once (cached probe); pending entries are then
+        written in chunks of batch_size and removed from the cache per chunk,
+        by (cache_key, version) so entries rewritten mid-flush are kept.
+        A failed chunk stops the flush and backs off the probe. When the sink
+        is not a cloud sink, chunks are mirrored to it and nothing is deleted.
         
+        Args:
+            max_records: Optional cap on records flushed in this call
+
         Returns:
             Dict with sync statistics:
-                - synced_count: Number of successfully synced entries
+                - synced_count: Number of entries synced to the cloud and removed
+                - mirrored_count: Number of entries copied to a non-cloud sink
                 - failed_count: Number of entries that failed to sync
                 - remaining_count: Number of entries still in cache
+                - batches: Number of batch writes
+                - records_per_second: Flush throughput
                 
         Usage:
             # Call periodically or on connectivity restoration event
             stats = sync.batch_sync_when_connected()
             print(f"Synced {stats['synced_count']} entries")
         """
+        started = time.perf_counter()
         synced_count = 0
+        mirrored_count = 0
         failed_count = 0
-        cache_keys_to_remove = []
-        
-        for cache_key, entry in list(self.local_cache.items()):
-            if self._check_connectivity() and self.firestore_client is not None:
-                try:
-                    # Extract data from HSML entry
-                    data = entry['data']
-                    
-                    # Sync directly to cloud (avoid recursion)
-                    doc_ref = self.firestore_client.collection('field_data').document()
-                    doc_ref.set(data)
-                    
-                    # Mark for removal from cache
-                    cache_keys_to_remove.append(cache_key)
-                    synced_count += 1
-                except Exception as e:
-                    # Sync failed, keep in cache
-                    failed_count += 1
-            else:
-                # No connectivity, stop trying
+        batches = 0
+        chunk_size = max(1, min(self.batch_size, self.sink.max_batch_size))
+        after_seq = 0
+
+        while self._check_connectivity():
+            written = synced_count + mirrored_count
+            if max_records is not None and written >= max_records:
                 break
-        
-        # Remove successfully synced entries
-        for cache_key in cache_keys_to_remove:
-            del self.local_cache[cache_key]
-        
-        return {
+            limit = chunk_size if max_records is None else min(chunk_size, max_records - written)
+            chunk = self.local_cache.pending(limit, after_seq)
+            if not chunk:
+                break
+            try:
+                self.sink.write_batch(self.collection, [(cache_key, data) for _, cache_key, _, data in chunk])
+            except Exception as e:
+                # Sync failed, keep chunk in cache and back off
+                print(f"   [!] Batch sync failed: {e}")
+                failed_count += len(chunk)
+                self.probe.report_failure()
+                break
+            if self.sink.is_cloud:
+                synced_count += self.local_cache.delete_flushed(
+                    [(cache_key, version) for _, cache_key, version, _ in chunk])
+            else:
+                mirrored_count += len(chunk)
+            batches += 1
+            after_seq = chunk[-1][0]
+
+        elapsed = time.perf_counter() - started
+        self.counters['flushed'] += synced_count
+        self.counters['mirrored'] += mirrored_count
+        self.counters['flush_failures'] += failed_count
+        self.counters['batches'] += batches
+        self.last_flush = {
             'synced_count': synced_count,
+            'mirrored_count': mirrored_count,
             'failed_count': failed_count,
-            'remaining_count': len(self.local_cache)
+            'remaining_count': len(self.local_cache),
+            'batches': batches,
+            'elapsed_seconds': elapsed,
+            'records_per_second': (synced_count + mirrored_count) / elapsed if elapsed > 0 else 0.0
         }
+        return dict(self.last_flush)
     
     def _calculate_hash(self, data: Dict[str, Any]) -> str:
         """
@@ -257,15 +595,11 @@ class SovereignSync:
             bool: True if connectivity available, False otherwise
             
         Implementation:
-            Attempts to resolve Google's DNS server as a quick connectivity check.
-            This is a lightweight operation suitable for frequent polling.
+            Delegates to the shared ConnectivityProbe, which caches the result
+            for a TTL and backs off after failures instead of opening a socket
+            per call.
         """
-        try:
-            # Try to resolve a well-known host (Google DNS)
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
-            return True
-        except (OSError, socket.timeout):
-            return False
+        return self.probe.is_online()
     
     def get_cache_status(self) -> Dict[str, Any]:
         """
@@ -276,35 +610,14 @@ class SovereignSync:
                 - total_entries: Total number of cached entries
                 - pending_sync: Number of entries waiting for sync
                 - oldest_entry: Timestamp of oldest cached entry
-                - cache_size_bytes: Approximate size of cache in bytes
+                - cache_size_bytes: Size of cached payloads in bytes
+                - counters: Lifetime sync/flush counters and connectivity probes
+                - last_flush: Statistics of the most recent flush
         """
-        if not self.local_cache:
-            return {
-                'total_entries': 0,
-                'pending_sync': 0,
-                'oldest_entry': None,
-                'cache_size_bytes': 0
-            }
-        
-        oldest_timestamp = min(
-            entry['timestamp'] for entry in self.local_cache.values()
-        )
-        
-        pending_sync = sum(
-            1 for entry in self.local_cache.values()
-            if entry.get('sync_pending', False)
-        )
-        
-        # Estimate cache size
-        cache_json = json.dumps(self.local_cache, default=str)
-        cache_size = len(cache_json.encode('utf-8'))
-        
-        return {
-            'total_entries': len(self.local_cache),
-            'pending_sync': pending_sync,
-            'oldest_entry': oldest_timestamp.isoformat() if oldest_timestamp else None,
-            'cache_size_bytes': cache_size
-        }
+        status = self.local_cache.stats()
+        status['counters'] = dict(self.counters, connectivity_probes=self.probe.probes)
+        status['last_flush'] = self.last_flush
+        return status
     
     def verify_cache_integrity(self) -> Dict[str, Any]:
         """
@@ -318,8 +631,10 @@ class SovereignSync:
         """
         corrupted = []
         valid_count = 0
+        total_checked = 0
         
-        for location, entry in self.local_cache.items():
+        for location, entry in self.local_cache.iter_entries():
+            total_checked += 1
             stored_hash = entry.get('hash')
             current_hash = self._calculate_hash(entry['data'])
             
@@ -329,7 +644,7 @@ class SovereignSync:
                 corrupted.append(location)
         
         return {
-            'total_checked': len(self.local_cache),
+            'total_checked': total_checked,
             'valid_entries': valid_count,
             'corrupted_entries': corrupted
         }
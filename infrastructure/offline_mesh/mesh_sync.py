@@ -9,19 +9,241 @@
 # proprietary inventions of iLuminara.
 # ------------------------------------------------------------------------------
 
+"""
+Store-and-forward mesh with anti-entropy handshakes.
+
+Bundles live in an on-disk content-addressed store (SQLite, keyed by the
+payload's SHA-256) with TTL and hop-limit eviction. When two nodes meet,
+each sends the other a Bloom filter of the bundle hashes it holds and
+receives only the bundles that are missing from its filter, so a courier
+handed the same bundles by several clinics carries each one once.
+"""
+
 import hashlib
 import json
+import math
+import os
+import sqlite3
+import threading
 import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_MASK64 = (1 << 64) - 1
+BUNDLE_FIELDS = ("integrity_hash", "origin", "timestamp", "hop_count", "payload")
+
+
+class BundleSummary:
+    """
+    Bloom filter over bundle hashes.
+
+    Bundle hashes are already uniform SHA-256 digests, so bit positions are
+    derived from their first 128 bits XOR-ed with a per-summary seed (double
+    hashing). Each handshake uses a fresh seed, so a bundle hidden by a false
+    positive in one exchange is almost surely transferred in the next.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001, seed: bytes = None):
+        capacity = max(capacity, 1)
+        self.num_bits = max(64, int(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.seed = seed if seed is not None else os.urandom(16)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _seeds(self) -> Tuple[int, int]:
+        return int.from_bytes(self.seed[:8], "big"), int.from_bytes(self.seed[8:16], "big")
+
+    def _positions(self, bundle_hash: str) -> List[int]:
+        s1, s2 = self._seeds()
+        h1 = int(bundle_hash[:16], 16) ^ s1
+        h2 = (int(bundle_hash[16:32], 16) ^ s2) | 1
+        m = self.num_bits
+        # Same wrap-around as the uint64 arithmetic in _positions_array
+        return [((h1 + i * h2) & _MASK64) % m for i in range(self.num_hashes)]
+
+    def _positions_array(self, hashes: List[str]):
+        s1, s2 = self._seeds()
+        words = np.frombuffer(bytes.fromhex("".join(h[:32] for h in hashes)), dtype=">u8").reshape(-1, 2)
+        h1 = words[:, 0].astype(np.uint64) ^ np.uint64(s1)
+        h2 = (words[:, 1].astype(np.uint64) ^ np.uint64(s2)) | np.uint64(1)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return (h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(self.num_bits)
+
+    def add(self, bundle_hash: str):
+        bits = self.bits
+        for pos in self._positions(bundle_hash):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, bundle_hash: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(bundle_hash))
+
+    def add_many(self, hashes: List[str]):
+        if not NUMPY_AVAILABLE or len(hashes) < 64:
+            for bundle_hash in hashes:
+                self.add(bundle_hash)
+            return
+        flags = np.unpackbits(np.frombuffer(bytes(self.bits), dtype=np.uint8), bitorder="little")
+        for start in range(0, len(hashes), 65536):
+            flags[self._positions_array(hashes[start:start + 65536]).ravel()] = 1
+        self.bits = bytearray(np.packbits(flags, bitorder="little").tobytes())
+        self.count += len(hashes)
+
+    def contains_many(self, hashes: List[str]) -> List[bool]:
+        if not NUMPY_AVAILABLE or len(hashes) < 64:
+            return [h in self for h in hashes]
+        flags = np.unpackbits(np.frombuffer(bytes(self.bits), dtype=np.uint8), bitorder="little")
+        found = []
+        for start in range(0, len(hashes), 65536):
+            found.extend(flags[self._positions_array(hashes[start:start + 65536])].all(axis=1).tolist())
+        return found
+
+    def to_wire(self) -> Dict[str, Any]:
+        return {"m": self.num_bits, "k": self.num_hashes, "seed": self.seed.hex(),
+                "count": self.count, "bits": bytes(self.bits)}
+
+    @classmethod
+    def from_wire(cls, wire: Dict[str, Any]) -> "BundleSummary":
+        summary = cls.__new__(cls)
+        summary.num_bits, summary.num_hashes = wire["m"], wire["k"]
+        summary.seed = bytes.fromhex(wire["seed"])
+        summary.count = wire["count"]
+        summary.bits = bytearray(wire["bits"])
+        return summary
+
+    def wire_size(self) -> int:
+        return len(self.bits) + 32  # bit array plus m/k/seed/count header
+
+
+class BundleStore:
+    """
+    Content-addressed bundle store on SQLite (WAL).
+
+    Bundles are keyed by integrity_hash, so storing a bundle twice is a
+    no-op. Bundles older than ttl_seconds, or with more than max_hops hops,
+    are dropped by evict() and never accepted or forwarded.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 14 * 86400, max_hops: int = 8):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_hops = max_hops
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bundles ("
+                "integrity_hash TEXT PRIMARY KEY, origin TEXT NOT NULL, timestamp REAL NOT NULL, "
+                "hop_count INTEGER NOT NULL, payload TEXT NOT NULL, received INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bundles_timestamp ON bundles (timestamp)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM bundles").fetchone()[0]
+
+    def __contains__(self, bundle_hash: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM bundles WHERE integrity_hash = ?", (bundle_hash,)
+            ).fetchone() is not None
+
+    def hashes(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT integrity_hash FROM bundles")]
+
+    def is_live(self, bundle: Dict[str, Any], now: float = None) -> bool:
+        now = time.time() if now is None else now
+        return bundle["hop_count"] <= self.max_hops and now - bundle["timestamp"] <= self.ttl_seconds
+
+    def put_many(self, bundles: Iterable[Dict[str, Any]], received: bool = False) -> int:
+        """Store bundles not already present; returns how many were new."""
+        rows = [(b["integrity_hash"], b["origin"], b["timestamp"], b["hop_count"], b["payload"], int(received))
+                for b in bundles]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bundles (integrity_hash, origin, timestamp, hop_count, payload, received) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            return self._conn.total_changes - before
+
+    def missing(self, hashes: List[str]) -> List[str]:
+        """Subset of hashes this store does not hold."""
+        held = set()
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                held.update(row[0] for row in self._conn.execute(
+                    f"SELECT integrity_hash FROM bundles WHERE integrity_hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ))
+        return [h for h in hashes if h not in held]
+
+    def get_many(self, hashes: List[str]) -> List[Dict[str, Any]]:
+        bundles = []
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                bundles.extend(dict(zip(BUNDLE_FIELDS, row)) for row in self._conn.execute(
+                    f"SELECT {', '.join(BUNDLE_FIELDS)} FROM bundles "
+                    f"WHERE integrity_hash IN ({','.join('?' * len(chunk))})", chunk
+                ))
+        return bundles
+
+    def bundles(self, received: bool = None) -> List[Dict[str, Any]]:
+        query = f"SELECT {', '.join(BUNDLE_FIELDS)} FROM bundles"
+        params: Tuple = ()
+        if received is not None:
+            query += " WHERE received = ?"
+            params = (int(received),)
+        with self._lock:
+            return [dict(zip(BUNDLE_FIELDS, row)) for row in self._conn.execute(query + " ORDER BY timestamp", params)]
+
+    def evict(self, now: float = None) -> int:
+        """Drop expired and over-hopped bundles; returns the number removed."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM bundles WHERE timestamp < ? OR hop_count > ?",
+                (now - self.ttl_seconds, self.max_hops)
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class MeshNode:
     """
     Implements a 'Store-and-Forward' Mesh Protocol.
     Allows data to hop between devices (e.g., via motorbike courier) securely.
     """
-    def __init__(self, node_id):
+    def __init__(self, node_id, store_path=None, ttl_seconds=14 * 86400, max_hops=8,
+                 false_positive_rate=0.001):
         self.node_id = node_id
-        self.local_storage = []
-        self.pending_uploads = []
+        self.store = BundleStore(store_path or f"data/mesh/{node_id}.sqlite", ttl_seconds, max_hops)
+        self.false_positive_rate = false_positive_rate
+
+    @property
+    def local_storage(self):
+        """Bundles sealed on this node."""
+        return self.store.bundles(received=False)
+
+    @property
+    def pending_uploads(self):
+        """Bundles received from peers, awaiting upload."""
+        return self.store.bundles(received=True)
 
     def bundle_for_transport(self, data_packet):
         """
@@ -36,7 +258,7 @@ class MeshNode:
             "integrity_hash": packet_hash,
             "hop_count": 0
         }
-        self.local_storage.append(bundle)
+        self.store.put_many([bundle])
         print(f"   📦 [Mesh] Data Bundled for Transport: {packet_hash[:8]}...")
         return bundle
 
@@ -44,15 +266,92 @@ class MeshNode:
         """
         Receives a bundle from a peer (Data Mule).
         """
+        if bundle["integrity_hash"] in self.store:
+            print(f"   ♻️ [Mesh] Duplicate Bundle Ignored: {bundle['integrity_hash'][:8]}...")
+            return
         # Verify Integrity
         computed_hash = hashlib.sha256(bundle["payload"].encode()).hexdigest()
         if computed_hash == bundle["integrity_hash"]:
             bundle["hop_count"] += 1
-            self.pending_uploads.append(bundle)
+            if not self.store.is_live(bundle):
+                print("   ⌛ [Mesh] Bundle Expired or Over Hop Limit, Dropped.")
+                return
+            self.store.put_many([bundle], received=True)
             print(f"   📥 [Mesh] Bundle Received & Verified (Hops: {bundle['hop_count']})")
         else:
             print("   ⚠️ [Mesh] CORRUPT BUNDLE REJECTED.")
 
+    # ─────────────────────────────────────────────────────────────────────
+    # Anti-entropy handshake
+    # ─────────────────────────────────────────────────────────────────────
+
+    def summary(self):
+        """Bloom filter of held bundle hashes, freshly seeded, in wire form."""
+        self.store.evict()
+        hashes = self.store.hashes()
+        summary = BundleSummary(len(hashes), self.false_positive_rate)
+        summary.add_many(hashes)
+        return summary.to_wire()
+
+    def bundles_missing_from(self, peer_summary):
+        """Bundles the peer's summary says it lacks, minus those that would exceed the hop limit."""
+        summary = BundleSummary.from_wire(peer_summary)
+        held = self.store.hashes()
+        missing = [h for h, present in zip(held, summary.contains_many(held)) if not present]
+        now = time.time()
+        return [b for b in self.store.get_many(missing)
+                if b["hop_count"] + 1 <= self.store.max_hops and self.store.is_live(b, now)]
+
+    def receive_bundles(self, bundles):
+        """
+        Batch receive: skips bundles already held before hashing them, then
+        verifies and stores the rest in one transaction.
+        Returns (accepted, duplicates, rejected).
+        """
+        new_hashes = set(self.store.missing([b["integrity_hash"] for b in bundles]))
+        accepted, rejected = [], 0
+        now = time.time()
+        for bundle in bundles:
+            bundle_hash = bundle["integrity_hash"]
+            if bundle_hash not in new_hashes:
+                continue
+            new_hashes.discard(bundle_hash)  # duplicates within the same batch
+            if hashlib.sha256(bundle["payload"].encode()).hexdigest() != bundle_hash:
+                rejected += 1
+                continue
+            bundle = dict(bundle, hop_count=bundle["hop_count"] + 1)
+            if self.store.is_live(bundle, now):
+                accepted.append(bundle)
+            else:
+                rejected += 1
+        stored = self.store.put_many(accepted, received=True)
+        return stored, len(bundles) - len(accepted) - rejected, rejected
+
+    def sync_with(self, peer):
+        """
+        Two-way anti-entropy with a co-located peer: swap summaries, then send
+        each side only the bundles missing from its summary.
+        """
+        start = time.perf_counter()
+        mine, theirs = self.summary(), peer.summary()
+        to_peer = self.bundles_missing_from(theirs)
+        to_me = peer.bundles_missing_from(mine)
+        handshake_ms = (time.perf_counter() - start) * 1000
+        sent = peer.receive_bundles(to_peer)
+        received = self.receive_bundles(to_me)
+        stats = {
+            "summary_bytes": BundleSummary.from_wire(mine).wire_size() + BundleSummary.from_wire(theirs).wire_size(),
+            "bundle_bytes": sum(len(json.dumps(b)) for b in to_peer + to_me),
+            "bundles_sent": sent[0],
+            "bundles_received": received[0],
+            "rejected": sent[2] + received[2],
+            "handshake_ms": handshake_ms,
+            "total_ms": (time.perf_counter() - start) * 1000,
+        }
+        print(f"   🔄 [Mesh] {self.node_id} <-> {peer.node_id}: sent {stats['bundles_sent']}, "
+              f"received {stats['bundles_received']}")
+        return stats
+
 if __name__ == "__main__":
     clinic = MeshNode("Clinic-Remote-1")
     courier = MeshNode("Courier-Bike-99")
@@ -62,3 +361,7 @@ if __name__ == "__main__":
 
     # Physical Transfer (Simulated)
     courier.receive_bundle(packet)
+
+    # Next visit: the handshake only moves bundles the other side lacks
+    clinic.bundle_for_transport({"patient_id": "Y", "diagnosis": "Cholera"})
+    clinic.sync_with(courier)
@@ -0,0 +1,384 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+# 
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS 
+# solutions is STRICTLY PROHIBITED without a commercial license.
+# 
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are 
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+Streaming federated aggregation engine.
+
+Shared by SovereignAggregator, SecureAggregator and the edge
+SecureAggregation protocol:
+
+- StreamingAggregator folds weighted client updates into one float64
+  running sum as they arrive, chunk by chunk. Memory stays at one vector
+  plus one chunk however many clients report. Updates may be arrays,
+  memory-mapped arrays or .npy paths (read in chunks, never mapped whole).
+- SecureAggregationRound / MaskingClient implement pairwise-mask secure
+  aggregation (Bonawitz et al., CCS 2017) with double masking. Clients
+  agree pairwise seeds over X25519 and add PRG masks that cancel in the
+  sum over Z_2^64 fixed point. Survivors reveal their seeds with dropped
+  peers, so stragglers are cut without restarting the round.
+"""
+
+import hashlib
+import logging
+import os
+import random
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+try:
+    from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+    from cryptography.hazmat.primitives.hashes import SHA256
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK = 1 << 20  # parameters per chunk (8 MiB of float64)
+
+ArrayLike = Union[np.ndarray, List[float], str, Path]
+
+
+def iter_chunks(update: ArrayLike, chunk_size: int = DEFAULT_CHUNK) -> Iterator[np.ndarray]:
+    """
+    Yield a flat parameter vector in chunks without materialising it.
+
+    .npy paths are read sequentially from disk; arrays (including np.memmap)
+    are sliced. Lists are converted once.
+    """
+    if isinstance(update, (str, Path)):
+        with open(update, "rb") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"{update}: object arrays are not parameter vectors")
+            remaining = int(np.prod(shape))
+            while remaining:
+                count = min(chunk_size, remaining)
+                chunk = np.fromfile(f, dtype=dtype, count=count)
+                if chunk.size != count:
+                    raise ValueError(f"{update}: truncated parameter file")
+                remaining -= count
+                yield chunk
+        return
+    array = np.asarray(update).reshape(-1)
+    for start in range(0, array.size, chunk_size):
+        yield array[start:start + chunk_size]
+
+
+class StreamingAggregator:
+    """
+    Incremental weighted mean of parameter vectors in float64.
+
+    Updates are accumulated flat; the first update's shape is recorded, later
+    updates must match it, and result() is returned in that shape.
+
+    Usage:
+        agg = StreamingAggregator()
+        for client_id, update, samples in arriving_updates:
+            agg.add(update, weight=samples, client_id=client_id)
+        global_update = agg.result()
+    """
+
+    def __init__(self, dimension: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK,
+                 accumulator_path: Optional[str] = None):
+        """
+        Args:
+            dimension: Parameter count (inferred from the first update if None)
+            chunk_size: Parameters processed per step
+            accumulator_path: Keep the running sum in a memory-mapped file instead of RAM
+        """
+        self.dimension = dimension
+        self.chunk_size = chunk_size
+        self.accumulator_path = accumulator_path
+        self.shape: Optional[Tuple[int, ...]] = None
+        self._sum: Optional[np.ndarray] = None
+        self.total_weight = 0.0
+        self.clients: List[str] = []
+
+    def _accumulator(self, dimension: int) -> np.ndarray:
+        if self._sum is None:
+            self.dimension = dimension
+            if self.accumulator_path:
+                self._sum = np.lib.format.open_memmap(self.accumulator_path, mode="w+",
+                                                      dtype=np.float64, shape=(dimension,))
+            else:
+                self._sum = np.zeros(dimension, dtype=np.float64)
+        return self._sum
+
+    @staticmethod
+    def _shape(update: ArrayLike) -> Tuple[int, ...]:
+        if isinstance(update, (str, Path)):
+            return tuple(np.load(update, mmap_mode="r").shape)
+        return tuple(np.shape(update))
+
+    def add(self, update: ArrayLike, weight: float = 1.0, client_id: Optional[str] = None):
+        """Fold one client update into the running sum (weight = e.g. local sample count)."""
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        shape = self._shape(update)
+        if self.shape is not None and shape != self.shape:
+            raise ValueError(f"update has shape {shape}, expected {self.shape}")
+        dimension = self.dimension if self.dimension is not None else int(np.prod(shape))
+        total = self._accumulator(dimension)
+        offset = 0
+        for chunk in iter_chunks(update, self.chunk_size):
+            end = offset + chunk.size
+            if end > dimension:
+                raise ValueError(f"update longer than model dimension {dimension}")
+            target = total[offset:end]
+            if weight == 1.0:
+                target += chunk
+            else:
+                target += np.multiply(chunk, weight, dtype=np.float64)
+            offset = end
+        if offset != dimension:
+            raise ValueError(f"update has {offset} parameters, expected {dimension}")
+        self.shape = shape
+        self.total_weight += weight
+        self.clients.append(client_id if client_id is not None else str(len(self.clients)))
+
+    def add_many(self, updates: Iterable[ArrayLike], weights: Optional[Iterable[float]] = None):
+        if weights is None:
+            for update in updates:
+                self.add(update)
+            return
+        weights = iter(weights)
+        for update in updates:
+            weight = next(weights, None)
+            if weight is None:
+                raise ValueError("fewer weights than updates")
+            self.add(update, weight)
+        if next(weights, None) is not None:
+            raise ValueError("more weights than updates")
+
+    @property
+    def num_clients(self) -> int:
+        return len(self.clients)
+
+    def weighted_sum(self) -> np.ndarray:
+        if self._sum is None:
+            raise ValueError("no updates aggregated")
+        return self._sum
+
+    def result(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Weighted mean in the updates' shape; written into `out` (e.g. a memmap) when given."""
+        total = self.weighted_sum()
+        if out is None:
+            return (total / self.total_weight).reshape(self.shape)
+        flat = out.reshape(-1)
+        for start in range(0, total.size, self.chunk_size):
+            np.divide(total[start:start + self.chunk_size], self.total_weight,
+                      out=flat[start:start + self.chunk_size])
+        return out
+
+    def reset(self):
+        self.shape = None
+        self._sum = None
+        self.total_weight = 0.0
+        self.clients = []
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pairwise-mask secure aggregation
+# ─────────────────────────────────────────────────────────────────────────────
+
+MASK_BLOCK = 1 << 16  # PRG block; masks are addressed by parameter offset, not by chunking
+
+
+def _prg(seed: bytes, start: int, stop: int) -> np.ndarray:
+    """Uniform uint64 mask for parameters [start, stop) of the stream seeded by `seed`."""
+    entropy = int.from_bytes(hashlib.sha256(seed).digest(), "big")
+    first, last = start // MASK_BLOCK, (stop - 1) // MASK_BLOCK
+    blocks = [np.random.PCG64(np.random.SeedSequence(entropy, spawn_key=(b,))).random_raw(MASK_BLOCK)
+              for b in range(first, last + 1)]
+    stream = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+    offset = first * MASK_BLOCK
+    return stream[start - offset:stop - offset]
+
+
+def masking_graph(round_id: str, client_ids: List[str], degree: Optional[int] = None) -> Dict[str, Set[str]]:
+    """
+    Who masks with whom. degree=None is the complete graph (original
+    protocol). A bounded degree gives each client about `degree` random
+    neighbours (Bell et al., CCS 2020), so per-client cost stops growing
+    with the cohort.
+    """
+    ids = sorted(client_ids)
+    graph: Dict[str, Set[str]] = {cid: set() for cid in ids}
+    if degree is None or degree >= len(ids) - 1:
+        for cid in ids:
+            graph[cid] = set(ids) - {cid}
+        return graph
+    rng = random.Random(hashlib.sha256(round_id.encode()).digest())
+    half = max(1, degree // 2)
+    order = ids[:]
+    rng.shuffle(order)
+    # Circulant graph over a round-seeded permutation: connected and regular
+    for i, cid in enumerate(order):
+        for step in range(1, half + 1):
+            peer = order[(i + step) % len(order)]
+            if peer != cid:
+                graph[cid].add(peer)
+                graph[peer].add(cid)
+    return graph
+
+
+class MaskingClient:
+    """
+    Client side of one secure aggregation round.
+
+    Usage:
+        client = MaskingClient("clinic_a", round_id="r42")
+        # publish client.public_key(); receive peers' keys and the masking graph
+        client.agree(peer_public_keys, graph["clinic_a"])
+        server.submit("clinic_a", client.mask(update, weight=samples), weight=samples)
+        # after the server announces dropouts:
+        server.recover("clinic_a", client.reveal(dropped=server.dropped()))
+    """
+
+    def __init__(self, client_id: str, round_id: str, fixed_point_bits: int = 32,
+                 chunk_size: int = DEFAULT_CHUNK):
+        if not CRYPTOGRAPHY_AVAILABLE:
+            raise RuntimeError("secure aggregation requires the 'cryptography' package")
+        self.client_id = client_id
+        self.round_id = round_id
+        self.scale = float(1 << fixed_point_bits)
+        self.chunk_size = chunk_size
+        self._key = X25519PrivateKey.generate()
+        self._self_seed = os.urandom(32)
+        self._pair_seeds: Dict[str, bytes] = {}
+        self._revealed_for: Optional[frozenset] = None
+
+    def public_key(self) -> bytes:
+        return self._key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+
+    def agree(self, public_keys: Dict[str, bytes], neighbours: Iterable[str]):
+        """Derive a shared mask seed with each neighbour (X25519 + HKDF, bound to the round)."""
+        for peer in neighbours:
+            shared = self._key.exchange(X25519PublicKey.from_public_bytes(public_keys[peer]))
+            pair = "|".join(sorted((self.client_id, peer)))
+            self._pair_seeds[peer] = HKDF(
+                algorithm=SHA256(), length=32, salt=None,
+                info=f"iluminara-secagg|{self.round_id}|{pair}".encode()
+            ).derive(shared)
+
+    def mask(self, update: ArrayLike, weight: float = 1.0) -> Iterator[np.ndarray]:
+        """Yield the masked, fixed-point encoded weight*update chunk by chunk (uint64)."""
+        start = 0
+        for chunk in iter_chunks(update, self.chunk_size):
+            stop = start + chunk.size
+            encoded = np.rint(np.multiply(chunk, weight * self.scale, dtype=np.float64)).astype(np.int64)
+            masked = encoded.view(np.uint64)
+            masked += _prg(self._self_seed, start, stop)
+            for peer, seed in self._pair_seeds.items():
+                if self.client_id < peer:
+                    masked += _prg(seed, start, stop)
+                else:
+                    masked -= _prg(seed, start, stop)
+            yield masked
+            start = stop
+
+    def reveal(self, dropped: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Unmasking material for a surviving client: its self-mask seed plus
+        its pairwise seeds with dropped neighbours. In the full protocol
+        these come from Shamir shares held by the other survivors.
+
+        The self seed and a pair seed must never both be revealed for the
+        same client, or its update is unmasked. So this refuses if the client
+        itself is announced as dropped, and if a later call names a different
+        dropout set than the first.
+        """
+        dropped = frozenset(dropped)
+        if self.client_id in dropped:
+            raise ValueError(f"{self.client_id} was announced as dropped; refusing to reveal its self seed")
+        if self._revealed_for is not None and dropped != self._revealed_for:
+            raise ValueError(f"conflicting dropout announcements for round {self.round_id}")
+        self._revealed_for = dropped
+        revealed = {"self": self._self_seed}
+        for peer in dropped:
+            if peer in self._pair_seeds:
+                revealed[peer] = self._pair_seeds[peer]
+        return revealed
+
+
+class SecureAggregationRound:
+    """
+    Server side: sums masked submissions as they stream in and removes the
+    masks of survivors and dropped clients at the end, with no restart.
+    """
+
+    def __init__(self, round_id: str, client_ids: List[str], dimension: int,
+                 mask_degree: Optional[int] = None, fixed_point_bits: int = 32):
+        self.round_id = round_id
+        self.dimension = dimension
+        self.scale = float(1 << fixed_point_bits)
+        self.graph = masking_graph(round_id, client_ids, mask_degree)
+        self._sum = np.zeros(dimension, dtype=np.uint64)
+        self.weights: Dict[str, float] = {}
+        self._recovered: Set[str] = set()
+
+    def submit(self, client_id: str, masked_chunks: Iterable[np.ndarray], weight: float = 1.0):
+        if client_id not in self.graph:
+            raise KeyError(f"{client_id} is not enrolled in round {self.round_id}")
+        if client_id in self.weights:
+            raise ValueError(f"{client_id} already submitted")
+        offset = 0
+        for chunk in masked_chunks:
+            self._sum[offset:offset + chunk.size] += chunk
+            offset += chunk.size
+        if offset != self.dimension:
+            raise ValueError(f"submission has {offset} parameters, expected {self.dimension}")
+        self.weights[client_id] = weight
+
+    def dropped(self) -> Set[str]:
+        """Enrolled clients that did not submit; announced to survivors for unmasking."""
+        return set(self.graph) - set(self.weights)
+
+    def recover(self, survivor_id: str, revealed: Dict[str, bytes], chunk_size: int = DEFAULT_CHUNK):
+        """Strip a survivor's self mask and its masks shared with dropped clients."""
+        if survivor_id not in self.weights or survivor_id in self._recovered:
+            raise ValueError(f"unexpected unmasking material from {survivor_id}")
+        dropped = self.dropped()
+        for start in range(0, self.dimension, chunk_size):
+            stop = min(start + chunk_size, self.dimension)
+            target = self._sum[start:stop]
+            target -= _prg(revealed["self"], start, stop)
+            for peer in dropped & self.graph[survivor_id]:
+                mask = _prg(revealed[peer], start, stop)
+                # Undo exactly what the survivor added for this pair
+                if survivor_id < peer:
+                    target -= mask
+                else:
+                    target += mask
+        self._recovered.add(survivor_id)
+
+    def result(self) -> np.ndarray:
+        """Weighted mean of the survivors' updates."""
+        missing = set(self.weights) - self._recovered
+        if missing:
+            raise ValueError(f"awaiting unmasking material from {sorted(missing)}")
+        if not self.weights:
+            raise ValueError("no submissions")
+        total = self._sum.view(np.int64).astype(np.float64)
+        total /= self.scale * sum(self.weights.values())
+        logger.info("Secure aggregation round %s: %d survivors, %d dropped",
+                    self.round_id, len(self.weights), len(self.dropped()))
+        return total
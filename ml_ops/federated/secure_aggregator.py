@@ -9,23 +9,35 @@
 # proprietary inventions of iLuminara.
 # ------------------------------------------------------------------------------
 
-import numpy as np
+from ml_ops.federated.aggregation_engine import (
+    SecureAggregationRound,
+    StreamingAggregator,
+)
 
 class SecureAggregator:
     """
     Implements Bonawitz et al. 'Secure Aggregation'.
     Aggregates weights w_i from N clients such that Server learns ONLY sum(w_i).
     """
-    def aggregate_gradients(self, encrypted_gradients):
+    def aggregate_gradients(self, encrypted_gradients, weights=None):
         """
-        Input: List of masked gradient vectors from Edge Nodes.
+        Input: List (or stream) of masked gradient vectors from Edge Nodes.
         Output: Updated Global Model weights.
         """
-        print(f"   [SecAgg] Aggregating {len(encrypted_gradients)} encrypted vectors...")
-        
-        # Simulating Homomorphic Addition
+        aggregator = StreamingAggregator()
         # The masks cancel out, revealing only the true sum
-        global_update = np.sum(encrypted_gradients, axis=0)
-        
+        aggregator.add_many(encrypted_gradients, weights)
+        print(f"   [SecAgg] Aggregating {aggregator.num_clients} encrypted vectors...")
+
         # Normalization
-        return global_update / len(encrypted_gradients)
\ No newline at end of file
+        return aggregator.result()
+
+    def open_round(self, round_id, client_ids, dimension, mask_degree=None):
+        """
+        Start a pairwise-masked round: clients build a MaskingClient, agree
+        seeds along round.graph, submit masked chunks and, once round.dropped()
+        is announced, send their unmasking material. Stragglers are simply
+        left out of the result.
+        """
+        print(f"   [SecAgg] Opening round {round_id} for {len(client_ids)} clients...")
+        return SecureAggregationRound(round_id, client_ids, dimension, mask_degree=mask_degree)
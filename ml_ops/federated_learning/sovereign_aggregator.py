@@ -9,36 +9,39 @@
 # proprietary inventions of iLuminara.
 # ------------------------------------------------------------------------------
 
-import numpy as np
+from ml_ops.federated.aggregation_engine import StreamingAggregator
 
 class SovereignAggregator:
     """
-        Implements Zero-Knowledge Federated Learning (ZK-FL).
-            Aggregates local model updates into the Global Brain while 
-                maintaining 100% local data residency.
-                    """
-                        def aggregate_updates(self, local_gradients):
-                                """
-                                        Aggregates gradients using a secure, weighted average.
-                                                In a production environment, this would use Homomorphic Encryption.
-                                                        """
-                                                                print(f"   [ZK-FL] Aggregating updates from {len(local_gradients)} nodes...")
-                                                                        
-                                                                                # Simple weighted aggregation for simulation
-                                                                                        global_update = np.mean(local_gradients, axis=0)
-                                                                                                return global_update
+    Implements Zero-Knowledge Federated Learning (ZK-FL).
+    Aggregates local model updates into the Global Brain while
+    maintaining 100% local data residency.
+    """
+    def aggregate_updates(self, local_gradients, weights=None):
+        """
+        Aggregates gradients using a secure, weighted average.
+        Updates are folded in one at a time (float64), so local_gradients may be
+        a generator, memory-mapped arrays or .npy paths; weights are typically
+        local sample counts (uniform if omitted).
+        In a production environment, this would use Homomorphic Encryption.
+        """
+        aggregator = StreamingAggregator()
+        aggregator.add_many(local_gradients, weights)
+        print(f"   [ZK-FL] Aggregating updates from {aggregator.num_clients} nodes...")
+        global_update = aggregator.result()
+        return global_update
+
+class FeedbackFlywheel:
+    """
+    The Data Flywheel.
+    Measures the 'Energy Gap' between JEPA predictions and reality.
+    """
+    def evaluate_performance(self, predicted_energy, actual_outcome_energy):
+        gap = abs(predicted_energy - actual_outcome_energy)
+        print(f"   [Flywheel] Energy Gap Detected: {gap:.4f}")
 
-                                                                                                class FeedbackFlywheel:
-                                                                                                    """
-                                                                                                        The Data Flywheel.
-                                                                                                            Measures the 'Energy Gap' between JEPA predictions and reality.
-                                                                                                                """
-                                                                                                                    def evaluate_performance(self, predicted_energy, actual_outcome_energy):
-                                                                                                                            gap = abs(predicted_energy - actual_outcome_energy)
-                                                                                                                                    print(f"   [Flywheel] Energy Gap Detected: {gap:.4f}")
-                                                                                                                                            
-                                                                                                                                                    # If the gap is too wide, the World Model is inaccurate
-                                                                                                                                                            if gap > 0.15:
-                                                                                                                                                                        print("   [Flywheel] Significant prediction error. Triggering local re-training.")
-                                                                                                                                                                                    return "RETRAIN_REQUIRED"
-                                                                                                                                                                                            return "MODEL_STABLE"
\ No newline at end of file
+        # If the gap is too wide, the World Model is inaccurate
+        if gap > 0.15:
+            print("   [Flywheel] Significant prediction error. Triggering local re-training.")
+            return "RETRAIN_REQUIRED"
+        return "MODEL_STABLE"
@@ -0,0 +1,421 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Resource Allocation Engine
+Supply → location network allocation shared by the ResourceOptimizationOracle
+
+- Targets: supply is split across locations proportionally to their weight
+  (water-filling, capped at need and storage capacity) or strictly by
+  priority, then rounded with the largest-remainder method so integer
+  allocations sum exactly to the distributable supply.
+- Network: depots reach locations over routes with transport capacity,
+  cost and a cold-chain flag. Components of the depot/location graph are
+  solved independently; single-depot components reduce to the targets,
+  the rest are solved as a min-cost flow LP (HiGHS dual simplex, integral
+  at the vertex because the constraint matrix is a network matrix).
+- Re-optimization: only components whose demand or supply changed are
+  re-solved; unchanged components keep their previous flows.
+- Scenarios: many demand scenarios are solved against one assembled network.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    from scipy.optimize import linprog
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ('proportional', 'priority')
+
+
+def largest_remainder_round(values: np.ndarray, caps: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """
+    Round rows of non-negative values to integers that sum exactly to totals.
+
+    values, caps: (S, n); totals: (S,) integers with totals <= caps.sum(1).
+    Units left over after flooring go to the largest fractional parts, never
+    above caps.
+    """
+    values = np.minimum(np.maximum(values, 0.0), caps)
+    floors = np.floor(values + 1e-9)
+    floors = np.minimum(floors, caps)
+    remainder = totals - floors.sum(axis=1)
+    fractions = np.where(floors < caps, values - floors, -1.0)
+    ranks = np.argsort(np.argsort(-fractions, axis=1, kind='stable'), axis=1, kind='stable')
+    return (floors + ((ranks < remainder[:, None]) & (fractions >= 0))).astype(np.int64)
+
+
+def allocation_targets(weights: np.ndarray, caps: np.ndarray, supply: np.ndarray,
+                       policy: str = 'proportional') -> np.ndarray:
+    """
+    Integer allocation targets for rows of locations (vectorized over rows).
+
+    weights, caps: (S, n); supply: (S,). 'priority' fills caps in descending
+    weight order; 'proportional' splits by weight, so locations with zero
+    weight receive nothing. Each row's targets sum to min(supply, eligible caps).
+    """
+    caps = np.floor(caps) if policy == 'priority' else np.where(weights > 0, np.floor(caps), 0.0)
+    totals = np.minimum(np.floor(supply), caps.sum(axis=1))
+
+    if policy == 'priority':
+        order = np.argsort(-weights, axis=1, kind='stable')
+        ordered_caps = np.take_along_axis(caps, order, axis=1)
+        before = np.cumsum(ordered_caps, axis=1) - ordered_caps
+        ordered = np.clip(totals[:, None] - before, 0.0, ordered_caps)
+        targets = np.empty_like(ordered)
+        np.put_along_axis(targets, order, ordered, axis=1)
+        return targets.astype(np.int64)
+    if policy != 'proportional':
+        raise ValueError(f"Unknown allocation policy: {policy}")
+
+    # Water-filling: split proportionally, saturate locations that hit their cap, repeat
+    allocated = np.zeros_like(caps)
+    active = caps > 0
+    remaining = totals.astype(np.float64).copy()
+    for _ in range(caps.shape[1] + 1):
+        live = active.any(axis=1) & (remaining > 1e-9)
+        if not live.any():
+            break
+        w = np.where(active, weights, 0.0)
+        share = remaining[:, None] * w / np.maximum(w.sum(axis=1), 1e-300)[:, None]
+        over = active & (allocated + share >= caps) & live[:, None]
+        rows_over = over.any(axis=1)
+
+        settle = live & ~rows_over
+        allocated[settle] += share[settle]
+        remaining[settle] = 0.0
+        active[settle] = False
+
+        remaining -= np.where(over, caps - allocated, 0.0).sum(axis=1)
+        allocated[over] = caps[over]
+        active &= ~over
+    return largest_remainder_round(allocated, caps, totals.astype(np.int64))
+
+
+@dataclass
+class AllocationResult:
+    """Integer allocation for one demand scenario"""
+    allocated: np.ndarray      # units per location
+    targets: np.ndarray        # planned units per location (need, storage and route capacity applied)
+    flows: np.ndarray          # units per route
+    unallocated: np.ndarray    # units left per depot
+    methods: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_allocated(self) -> int:
+        return int(self.allocated.sum())
+
+    @property
+    def shortfall(self) -> np.ndarray:
+        return np.maximum(self.targets - self.allocated, 0)
+
+
+class _Component:
+    """Connected piece of the depot/location network"""
+
+    def __init__(self, depots: np.ndarray, locations: np.ndarray, routes: np.ndarray):
+        self.depots = depots
+        self.locations = locations
+        self.routes = routes
+        self.trivial = False
+        self.model: Optional[Dict[str, Any]] = None
+
+
+class AllocationEngine:
+    """
+    Allocate integer supply from depots to locations over a route network.
+
+    Usage:
+        engine = AllocationEngine(locations, depots=["nairobi", "mombasa"],
+                                  routes=[("nairobi", "kisumu_hc", 5000, 2.5, True), ...],
+                                  storage_capacity=cold_storage_doses, cold_chain=True)
+        result = engine.solve({"nairobi": 80000, "mombasa": 20000}, need, weights)
+        result = engine.reoptimize(need=updated_need)
+
+    Without routes every location is served directly by a single depot with
+    unlimited transport capacity.
+    """
+
+    def __init__(self, locations: Sequence[str], depots: Optional[Sequence[str]] = None,
+                 routes: Optional[Sequence[Tuple[str, str, float, float, bool]]] = None,
+                 storage_capacity: Optional[Sequence[float]] = None, cold_chain: bool = False,
+                 policy: str = 'proportional'):
+        """
+        Args:
+            locations: Location ids
+            depots: Depot ids (default: one central depot)
+            routes: (depot, location, capacity, cost, cold_chain) tuples; capacity may be inf
+            storage_capacity: Per-location storage limit (e.g. cold-chain doses)
+            cold_chain: Only routes with a cold chain may carry the resource
+            policy: 'proportional' or 'priority' split of supply across locations
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown allocation policy: {policy}")
+        self.locations = list(locations)
+        self.depots = list(depots) if depots else ['central']
+        self.policy = policy
+        n = len(self.locations)
+        self.storage_capacity = (np.full(n, np.inf) if storage_capacity is None
+                                 else np.asarray(storage_capacity, dtype=np.float64))
+
+        location_index = {loc: i for i, loc in enumerate(self.locations)}
+        depot_index = {dep: i for i, dep in enumerate(self.depots)}
+        if routes is None:
+            if len(self.depots) != 1:
+                raise ValueError("routes are required with more than one depot")
+            self.route_depot = np.zeros(n, dtype=np.int64)
+            self.route_location = np.arange(n, dtype=np.int64)
+            self.route_capacity = np.full(n, np.inf)
+            self.route_cost = np.zeros(n)
+        else:
+            routes = [r for r in routes if not cold_chain or r[4]]
+            self.route_depot = np.array([depot_index[r[0]] for r in routes], dtype=np.int64)
+            self.route_location = np.array([location_index[r[1]] for r in routes], dtype=np.int64)
+            self.route_capacity = np.floor(np.array([r[2] for r in routes], dtype=np.float64))
+            self.route_cost = np.array([r[3] for r in routes], dtype=np.float64)
+            usable = self.route_capacity > 0
+            self.route_depot, self.route_location = self.route_depot[usable], self.route_location[usable]
+            self.route_capacity, self.route_cost = self.route_capacity[usable], self.route_cost[usable]
+
+        self.components = self._build_components()
+        self._last: Optional[Dict[str, Any]] = None
+        self._last_results: List[Tuple[np.ndarray, np.ndarray, np.ndarray, str]] = []
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Network structure
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _build_components(self) -> List[_Component]:
+        n_depots, n_locations = len(self.depots), len(self.locations)
+        n_nodes = n_depots + n_locations
+        if SCIPY_AVAILABLE:
+            graph = sparse.coo_matrix(
+                (np.ones(len(self.route_depot)), (self.route_depot, n_depots + self.route_location)),
+                shape=(n_nodes, n_nodes))
+            _, labels = connected_components(graph, directed=False)
+        else:
+            parent = list(range(n_nodes))
+
+            def find(x):
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+            for d, l in zip(self.route_depot.tolist(), self.route_location.tolist()):
+                parent[find(d)] = find(n_depots + l)
+            labels = np.array([find(x) for x in range(n_nodes)])
+
+        depot_labels, location_labels = labels[:n_depots], labels[n_depots:]
+        route_labels = depot_labels[self.route_depot]
+        order = np.argsort(route_labels, kind='stable')
+        bounds = np.searchsorted(route_labels[order], np.unique(route_labels))
+
+        components = []
+        for label, routes in zip(np.unique(route_labels), np.split(order, bounds[1:])):
+            component = _Component(np.flatnonzero(depot_labels == label),
+                                   np.flatnonzero(location_labels == label), routes)
+            # One depot and one route per location: the flows are the targets
+            component.trivial = (len(component.depots) == 1 and len(routes) == len(component.locations))
+            components.append(component)
+        return components
+
+    def _lp_model(self, component: _Component) -> Dict[str, Any]:
+        """Constraint matrices for a component; demand only enters via RHS and bounds."""
+        if component.model is not None:
+            return component.model
+        k, m = len(component.locations), len(component.routes)
+        local_location = {loc: i for i, loc in enumerate(component.locations.tolist())}
+        local_depot = {dep: i for i, dep in enumerate(component.depots.tolist())}
+        route_rows = np.array([local_location[l] for l in self.route_location[component.routes].tolist()])
+        depot_rows = np.array([local_depot[d] for d in self.route_depot[component.routes].tolist()])
+
+        # Variables: [route flows (m), shortfall below target (k), spillover above target (k)]
+        identity = np.arange(k)
+        a_eq = sparse.csr_matrix((
+            np.concatenate([np.ones(m), np.ones(k), -np.ones(k)]),
+            (np.concatenate([route_rows, identity, identity]), np.concatenate([np.arange(m), m + identity, m + k + identity]))
+        ), shape=(k, m + 2 * k))
+        a_ub = sparse.csr_matrix((np.ones(m), (depot_rows, np.arange(m))), shape=(len(component.depots), m + 2 * k))
+        component.model = {'a_eq': a_eq, 'a_ub': a_ub, 'route_rows': route_rows, 'depot_rows': depot_rows,
+                           'inflow_capacity': np.bincount(route_rows, weights=self.route_capacity[component.routes],
+                                                          minlength=k)}
+        return component.model
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Solving
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _caps(self, need: np.ndarray, locations: np.ndarray) -> np.ndarray:
+        return np.floor(np.minimum(np.maximum(need[:, locations], 0.0), self.storage_capacity[locations]))
+
+    def _solve_component(self, component: _Component, supply: np.ndarray, need: np.ndarray,
+                         weights: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, str]]:
+        """Solve one component for (S, ...) scenario rows; returns (targets, allocated, flows, method) per row."""
+        locs = component.locations
+        caps = self._caps(need, locs)
+        w = weights[:, locs]
+        comp_supply = supply[:, component.depots].sum(axis=1)
+
+        if component.trivial:
+            route_caps = np.zeros(len(locs))
+            route_caps[np.searchsorted(locs, self.route_location[component.routes])] = \
+                self.route_capacity[component.routes]
+            targets = allocation_targets(w, np.minimum(caps, route_caps), comp_supply, self.policy)
+            flows = targets[:, np.searchsorted(locs, self.route_location[component.routes])]
+            return [(targets[s], targets[s], flows[s], 'direct') for s in range(len(targets))]
+
+        solved = []
+        for s in range(len(caps)):
+            model = self._lp_model(component) if SCIPY_AVAILABLE else None
+            inflow_capacity = (model['inflow_capacity'] if model is not None else np.bincount(
+                np.searchsorted(locs, self.route_location[component.routes]),
+                weights=self.route_capacity[component.routes], minlength=len(locs)))
+            row_caps = np.minimum(caps[s], inflow_capacity)
+            targets = allocation_targets(w[s:s + 1], row_caps[None, :], comp_supply[s:s + 1], self.policy)[0]
+            if model is not None:
+                flows, method = self._solve_lp(component, model, supply[s, component.depots], targets, row_caps, w[s])
+            else:
+                flows, method = None, 'greedy'
+            if flows is None:
+                flows, method = self._solve_greedy(component, supply[s, component.depots], targets, row_caps, w[s])
+            allocated = np.bincount(np.searchsorted(locs, self.route_location[component.routes]),
+                                    weights=flows, minlength=len(locs)).astype(np.int64)
+            solved.append((targets, allocated, flows, method))
+        return solved
+
+    def _solve_lp(self, component: _Component, model: Dict[str, Any], supply: np.ndarray, targets: np.ndarray,
+                  caps: np.ndarray, weights: np.ndarray) -> Tuple[Optional[np.ndarray], str]:
+        k, m = len(component.locations), len(component.routes)
+        cost = self.route_cost[component.routes]
+        # Meeting a target always beats spillover elsewhere, which always beats transport cost
+        scale = float(cost.max(initial=0.0)) + 1.0
+        priority = weights / max(float(weights.max(initial=0.0)), 1e-12)
+        objective = np.concatenate([cost, 4 * scale * (1 + priority), -scale * (1 + priority)])
+        bounds = np.column_stack([
+            np.zeros(m + 2 * k),
+            np.concatenate([self.route_capacity[component.routes], targets, np.maximum(caps - targets, 0)])
+        ])
+        result = linprog(objective, A_ub=model['a_ub'], b_ub=np.floor(supply), A_eq=model['a_eq'],
+                         b_eq=targets.astype(np.float64), bounds=bounds, method='highs-ds')
+        if not result.success:
+            logger.warning(f"Allocation LP failed ({result.message}), using greedy fallback")
+            return None, 'greedy'
+        flows = np.rint(result.x[:m]).astype(np.int64)
+        return flows, 'min_cost_flow'
+
+    def _solve_greedy(self, component: _Component, supply: np.ndarray, targets: np.ndarray, caps: np.ndarray,
+                      weights: np.ndarray) -> Tuple[np.ndarray, str]:
+        """Fill targets by weight, then spill leftovers, cheapest route first."""
+        location_rows = np.searchsorted(component.locations, self.route_location[component.routes])
+        depot_rows = np.searchsorted(component.depots, self.route_depot[component.routes])
+        remaining_supply = np.floor(supply).astype(np.int64)
+        remaining_route = self.route_capacity[component.routes].copy()
+        flows = np.zeros(len(component.routes), dtype=np.int64)
+        received = np.zeros(len(component.locations), dtype=np.int64)
+        routes_by_cost = np.argsort(self.route_cost[component.routes], kind='stable')
+        by_location: Dict[int, List[int]] = {}
+        for r in routes_by_cost.tolist():
+            by_location.setdefault(int(location_rows[r]), []).append(r)
+
+        for limit in (targets, caps.astype(np.int64)):
+            for j in np.argsort(-weights, kind='stable').tolist():
+                for r in by_location.get(j, []):
+                    wanted = int(limit[j] - received[j])
+                    if wanted <= 0:
+                        break
+                    d = depot_rows[r]
+                    units = int(min(wanted, remaining_supply[d], remaining_route[r]))
+                    if units > 0:
+                        flows[r] += units
+                        received[j] += units
+                        remaining_supply[d] -= units
+                        remaining_route[r] -= units
+        return flows, 'greedy'
+
+    def _inputs(self, supply, need, weights) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if isinstance(supply, dict):
+            supply = [supply.get(dep, 0) for dep in self.depots]
+        supply = np.atleast_1d(np.asarray(supply, dtype=np.float64))
+        need = np.atleast_2d(np.asarray(need, dtype=np.float64))
+        weights = need if weights is None else np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        weights = np.broadcast_to(weights, need.shape)
+        supply = np.broadcast_to(supply if supply.ndim == 2 else supply[None, :], (need.shape[0], len(self.depots)))
+        return supply, need, weights
+
+    def _assemble(self, supply: np.ndarray, per_component: List[List[Tuple]]) -> List[AllocationResult]:
+        results = []
+        for s in range(supply.shape[0]):
+            allocated = np.zeros(len(self.locations), dtype=np.int64)
+            targets = np.zeros(len(self.locations), dtype=np.int64)
+            flows = np.zeros(len(self.route_depot), dtype=np.int64)
+            methods: Dict[str, int] = {}
+            for component, solved in zip(self.components, per_component):
+                c_targets, c_allocated, c_flows, method = solved[s]
+                targets[component.locations] = c_targets
+                allocated[component.locations] = c_allocated
+                flows[component.routes] = c_flows
+                methods[method] = methods.get(method, 0) + 1
+            shipped = np.bincount(self.route_depot, weights=flows, minlength=len(self.depots)).astype(np.int64)
+            unallocated = np.floor(supply[s]).astype(np.int64) - shipped
+            results.append(AllocationResult(allocated, targets, flows, unallocated, methods))
+        return results
+
+    def solve(self, supply, need: Sequence[float], weights: Optional[Sequence[float]] = None) -> AllocationResult:
+        """
+        Allocate supply (per depot, or a dict depot -> units) against per-location need.
+
+        weights default to need. allocated.sum() + unallocated.sum() always
+        equals the integer supply.
+        """
+        supply_rows, need_rows, weight_rows = self._inputs(supply, need, weights)
+        per_component = [self._solve_component(c, supply_rows, need_rows, weight_rows) for c in self.components]
+        self._last = {'supply': supply_rows[0].copy(), 'need': need_rows[0].copy(), 'weights': weight_rows[0].copy()}
+        self._last_results = [solved[0] for solved in per_component]
+        return self._assemble(supply_rows, per_component)[0]
+
+    def reoptimize(self, supply=None, need: Optional[Sequence[float]] = None,
+                   weights: Optional[Sequence[float]] = None) -> AllocationResult:
+        """Re-solve after a change, reusing flows of components whose inputs did not change."""
+        if self._last is None:
+            return self.solve(supply, need, weights)
+        supply_rows, need_rows, weight_rows = self._inputs(
+            self._last['supply'] if supply is None else supply,
+            self._last['need'] if need is None else need,
+            self._last['weights'] if weights is None else weights)
+        changed_depots = supply_rows[0] != self._last['supply']
+        changed_locations = (need_rows[0] != self._last['need']) | (weight_rows[0] != self._last['weights'])
+
+        per_component = []
+        for component, previous in zip(self.components, self._last_results):
+            if changed_depots[component.depots].any() or changed_locations[component.locations].any():
+                per_component.append(self._solve_component(component, supply_rows, need_rows, weight_rows))
+            else:
+                per_component.append([previous])
+        self._last = {'supply': supply_rows[0].copy(), 'need': need_rows[0].copy(), 'weights': weight_rows[0].copy()}
+        self._last_results = [solved[0] for solved in per_component]
+        return self._assemble(supply_rows, per_component)[0]
+
+    def solve_scenarios(self, supply, needs: Sequence[Sequence[float]],
+                        weights: Optional[Sequence[Sequence[float]]] = None) -> List[AllocationResult]:
+        """Solve many demand scenarios (rows of needs) against the same network."""
+        supply_rows, need_rows, weight_rows = self._inputs(supply, needs, weights)
+        per_component = [self._solve_component(c, supply_rows, need_rows, weight_rows) for c in self.components]
+        return self._assemble(supply_rows, per_component)
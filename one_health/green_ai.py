@@ -22,12 +22,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 from surveillance_outbreak.predictive_models import SurveillanceFortress
+from one_health.allocation import AllocationEngine, AllocationResult
 
 logger = logging.getLogger(__name__)
 
 @dataclass
 class CarbonFootprint:
-    """Carbon footprint(assessment for AI operations""")
+    """Carbon footprint assessment for AI operations"""
     model_training: float  # kg CO2
     inference: float       # kg CO2 per prediction
     data_storage: float    # kg CO2 per GB per year
@@ -60,7 +61,7 @@ class OneHealthMetrics:
         }
 
 class EnvironmentalImpactTracker:
-    """Quantify carbon footprint(of AI models and optimize for green AI""")
+    """Quantify carbon footprint of AI models and optimize for green AI"""
 
     def __init__(self):
         self.baseline_emissions = {
@@ -72,7 +73,7 @@ class EnvironmentalImpactTracker:
         }
 
     def calculate_model_footprint(self, model_config: Dict[str, Any]) -> CarbonFootprint:
-        """Calculate carbon footprint(for AI model operations""")
+        """Calculate carbon footprint for AI model operations"""
         training_hours = model_config.get('training_hours', 0)
         daily_inferences = model_config.get('daily_inferences', 0)
         storage_gb = model_config.get('storage_gb', 0)
@@ -374,6 +375,8 @@ class ResourceOptimizationOracle:
     def __init__(self):
         self.allocation_models = {}
         self.resource_constraints = {}
+        # allocation key -> (network signature, engine); reused to re-optimize when only demand changes
+        self._engines: Dict[str, Tuple[Tuple, AllocationEngine]] = {}
         self._initialize_allocation_models()
 
     def _initialize_allocation_models(self):
@@ -394,57 +397,110 @@ class ResourceOptimizationOracle:
         optimizer = self.allocation_models[resource_type]
         return optimizer(demand_data, supply_data)
 
+    def _engine(self, key: str, names: List[str], depots: Optional[List[str]] = None,
+                routes: Optional[List[Dict[str, Any]]] = None, storage_capacity: Optional[List[float]] = None,
+                cold_chain: bool = False, policy: str = 'proportional') -> Tuple[AllocationEngine, bool]:
+        """Engine for a network, reused (warm) while the network is unchanged."""
+        route_tuples = None if routes is None else tuple(
+            (r['depot'], r['location'], float(r.get('capacity', np.inf)), float(r.get('cost', 0.0)),
+             bool(r.get('cold_chain', True)))
+            for r in routes
+        )
+        signature = (tuple(names), tuple(depots or ()), route_tuples,
+                     None if storage_capacity is None else tuple(storage_capacity), cold_chain, policy)
+        cached = self._engines.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1], True
+        engine = AllocationEngine(names, depots, route_tuples, storage_capacity, cold_chain, policy)
+        self._engines[key] = (signature, engine)
+        return engine, False
+
+    def _allocate(self, key: str, names: List[str], supply: Any, need: np.ndarray, weights: np.ndarray,
+                  policy: str = 'proportional', **network: Any) -> Tuple[AllocationEngine, AllocationResult]:
+        engine, warm = self._engine(key, names, policy=policy, **network)
+        if warm:
+            return engine, engine.reoptimize(supply, need, weights)
+        return engine, engine.solve(supply, need, weights)
+
+    def _vaccine_network(self, demand_data: Dict[str, Any],
+                         supply_data: Dict[str, Any]) -> Tuple[List[str], np.ndarray, np.ndarray, Any, Dict[str, Any]]:
+        """Names, need, risk-weighted demand, supply and network arguments for vaccines."""
+        locations = demand_data.get('locations', [])
+        names = [location['name'] for location in locations]
+        risk = np.array([location.get('risk_score', 0.5) for location in locations], dtype=np.float64)
+        population = np.array([location.get('population', 1000) for location in locations], dtype=np.float64)
+        coverage = np.array([location.get('current_coverage', 0) for location in locations], dtype=np.float64)
+        need = np.array([location.get('doses_needed', p * (1 - c))
+                         for location, p, c in zip(locations, population, coverage)], dtype=np.float64)
+
+        depots = supply_data.get('depots')
+        network: Dict[str, Any] = {'cold_chain': supply_data.get('requires_cold_chain', True)}
+        if depots:
+            network['depots'] = list(depots)
+            network['routes'] = demand_data.get('routes', [])
+            supply: Any = dict(depots)
+        else:
+            supply = supply_data.get('total_vaccines', 0)
+        if any('cold_storage_capacity' in location for location in locations):
+            network['storage_capacity'] = [location.get('cold_storage_capacity', np.inf) for location in locations]
+        # Weight by risk and population
+        return names, need, risk * population * (1 - coverage), supply, network
+
     def _optimize_vaccine_distribution(self, demand_data: Dict[str, Any],
                                      supply_data: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize vaccine distribution using risk-based allocation"""
-        locations = demand_data.get('locations', [])
-        total_supply = supply_data.get('total_vaccines', 0)
-
-        # Calculate risk-weighted demand
-        risk_weighted_demand = []
-        total_weighted_demand = 0
-
-        for location in locations:
-            risk_score = location.get('risk_score', 0.5)
-            population = location.get('population', 1000)
-            coverage_gap = location.get('current_coverage', 0)
-
-            # Weight by risk and population
-            weighted_demand = risk_score * population * (1 - coverage_gap)
-            risk_weighted_demand.append({
-                'location': location['name'],
-                'weighted_demand': weighted_demand,
-                'risk_score': risk_score,
-                'population': population
-            })
-            total_weighted_demand += weighted_demand
-
-        # Allocate based on weighted demand
-        allocations = []
-        remaining_supply = total_supply
-
-        for demand in risk_weighted_demand:
-            if total_weighted_demand > 0:
-                proportion = demand['weighted_demand'] / total_weighted_demand
-                allocation = min(remaining_supply, int(total_supply * proportion))
-                allocations.append({
-                    'location': demand['location'],
-                    'allocated_vaccines': allocation,
-                    'proportion': proportion
-                })
-                remaining_supply -= allocation
-
-        return {
+        names, need, weighted_demand, supply, network = self._vaccine_network(demand_data, supply_data)
+        engine, result = self._allocate('vaccines', names, supply, need, weighted_demand, **network)
+        total_weighted_demand = weighted_demand.sum()
+
+        allocations = [{
+            'location': name,
+            'allocated_vaccines': int(allocated),
+            'proportion': float(weight / total_weighted_demand) if total_weighted_demand > 0 else 0.0,
+            'shortfall': int(shortfall)
+        } for name, allocated, weight, shortfall in zip(names, result.allocated, weighted_demand, result.shortfall)]
+
+        response = {
             'resource_type': 'vaccines',
-            'total_allocated': sum(a['allocated_vaccines'] for a in allocations),
+            'total_allocated': result.total_allocated,
+            'unallocated': int(result.unallocated.sum()),
             'allocations': allocations,
-            'optimization_criteria': 'risk-weighted demand'
+            'optimization_criteria': 'risk-weighted demand',
+            'solver': result.methods
         }
+        if 'routes' in network:
+            response['route_flows'] = [{
+                'depot': engine.depots[d], 'location': engine.locations[l], 'units': int(units)
+            } for d, l, units in zip(engine.route_depot, engine.route_location, result.flows) if units > 0]
+        return response
+
+    def evaluate_vaccine_scenarios(self, demand_data: Dict[str, Any], supply_data: Dict[str, Any],
+                                   scenarios: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Allocate under several demand scenarios at once. Each scenario maps
+        location name -> doses needed; unspecified locations keep their need.
+        """
+        names, need, weighted_demand, supply, network = self._vaccine_network(demand_data, supply_data)
+        engine, _ = self._engine('vaccines', names, **network)
+        index = {name: i for i, name in enumerate(names)}
+        needs = np.tile(need, (len(scenarios), 1))
+        for row, scenario in enumerate(scenarios):
+            for name, doses in scenario.items():
+                needs[row, index[name]] = doses
+
+        results = engine.solve_scenarios(supply, needs, weighted_demand)
+        return [{
+            'total_allocated': result.total_allocated,
+            'unallocated': int(result.unallocated.sum()),
+            'total_shortfall': int(result.shortfall.sum()),
+            'allocations': dict(zip(names, result.allocated.tolist()))
+        } for result in results]
 
     def _optimize_medicine_allocation(self, demand_data: Dict[str, Any],
                                     supply_data: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize medicine allocation based on disease burden"""
         disease_burden = demand_data.get('disease_burden', {})
+        facility_burden = demand_data.get('facility_burden', {})
         supply_levels = supply_data.get('medicine_stock', {})
 
         allocations = []
@@ -453,14 +509,26 @@ class ResourceOptimizationOracle:
                 burden = disease_burden[medicine]
                 # Allocate based on burden and stock availability
                 allocation_factor = min(1.0, burden / 1000)  # Normalize burden
-                allocated = int(stock * allocation_factor)
+                allocated = int(round(stock * allocation_factor))
 
-                allocations.append({
+                allocation = {
                     'medicine': medicine,
                     'allocated_quantity': allocated,
+                    'retained_quantity': int(stock) - allocated,
                     'disease_burden': burden,
                     'allocation_factor': allocation_factor
-                })
+                }
+
+                # Split the released quantity across facilities by their burden
+                facilities = facility_burden.get(medicine)
+                if facilities:
+                    names = [f['facility'] for f in facilities]
+                    burdens = np.array([f.get('burden', 0) for f in facilities], dtype=np.float64)
+                    need = np.array([f.get('max_quantity', np.inf) for f in facilities], dtype=np.float64)
+                    _, result = self._allocate(f'medicines:{medicine}', names, allocated, need, burdens)
+                    allocation['facility_allocations'] = dict(zip(names, result.allocated.tolist()))
+                    allocation['retained_quantity'] += int(result.unallocated.sum())
+                allocations.append(allocation)
 
         return {
             'resource_type': 'medicines',
@@ -474,33 +542,22 @@ class ResourceOptimizationOracle:
         facility_workload = demand_data.get('facility_workload', [])
         available_personnel = supply_data.get('available_personnel', 0)
 
-        # Sort facilities by workload
-        sorted_facilities = sorted(facility_workload,
-                                 key=lambda x: x.get('patient_load', 0),
-                                 reverse=True)
-
-        allocations = []
-        remaining_personnel = available_personnel
+        names = [facility['name'] for facility in facility_workload]
+        patient_load = np.array([facility.get('patient_load', 0) for facility in facility_workload], dtype=np.float64)
+        # 1 personnel per 50 patients, at least one per facility; highest load served first
+        need = np.maximum(1, np.floor(patient_load / 50))
+        _, result = self._allocate('personnel', names, available_personnel, need, patient_load, policy='priority')
 
-        for facility in sorted_facilities:
-            if remaining_personnel <= 0:
-                break
-
-            patient_load = facility.get('patient_load', 0)
-            # Allocate personnel based on patient load
-            allocation = min(remaining_personnel,
-                           max(1, int(patient_load / 50)))  # 1 personnel per 50 patients
-
-            allocations.append({
-                'facility': facility['name'],
-                'allocated_personnel': allocation,
-                'patient_load': patient_load
-            })
-            remaining_personnel -= allocation
+        allocations = [{
+            'facility': names[i],
+            'allocated_personnel': int(result.allocated[i]),
+            'patient_load': facility_workload[i].get('patient_load', 0)
+        } for i in np.argsort(-patient_load, kind='stable') if result.allocated[i] > 0]
 
         return {
             'resource_type': 'personnel',
-            'total_allocated': sum(a['allocated_personnel'] for a in allocations),
+            'total_allocated': result.total_allocated,
+            'unallocated': int(result.unallocated.sum()),
             'allocations': allocations,
             'optimization_criteria': 'patient load priority'
         }
@@ -516,22 +573,21 @@ class ResourceOptimizationOracle:
             needs = [n for n in equipment_needs if n['type'] == equipment_type]
 
             if needs:
-                # Sort by priority
-                sorted_needs = sorted(needs, key=lambda x: x.get('priority', 0), reverse=True)
-
-                allocated = 0
-                for need in sorted_needs:
-                    if allocated >= available_count:
-                        break
-                    allocation = min(need.get('required_count', 1),
-                                   available_count - allocated)
-                    allocations.append({
-                        'equipment_type': equipment_type,
-                        'facility': need['facility'],
-                        'allocated_count': allocation,
-                        'priority': need.get('priority', 0)
-                    })
-                    allocated += allocation
+                names = [need['facility'] for need in needs]
+                priority = np.array([need.get('priority', 0) for need in needs], dtype=np.float64)
+                required = np.array([need.get('required_count', 1) for need in needs], dtype=np.float64)
+                _, result = self._allocate(f'equipment:{equipment_type}', names, available_count, required,
+                                           priority, policy='priority')
+
+                # Highest priority first
+                for i in np.argsort(-priority, kind='stable'):
+                    if result.allocated[i] > 0:
+                        allocations.append({
+                            'equipment_type': equipment_type,
+                            'facility': names[i],
+                            'allocated_count': int(result.allocated[i]),
+                            'priority': needs[i].get('priority', 0)
+                        })
 
         return {
             'resource_type': 'equipment',
@@ -554,7 +610,7 @@ class SustainabilityHarmonizer:
         # Environmental impact assessment
         if 'ai_models' in health_data:
             for model in health_data['ai_models']:
-                footprint(= self.environmental_tracker.calculate_model_footprint(model))
+                footprint = self.environmental_tracker.calculate_model_footprint(model)
                 optimizations = self.environmental_tracker.optimize_for_green_ai(model)
                 model['carbon_footprint'] = footprint.to_dict()
                 model['green_ai_optimizations'] = optimizations
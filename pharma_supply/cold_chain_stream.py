@@ -0,0 +1,259 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Streaming Cold-Chain Anomaly Detector
+=====================================
+
+Keeps compact rolling state for tens of thousands of fridge/cold-box sensors
+in flat NumPy arrays (one slot per sensor) and ingests readings in vectorized
+batches:
+
+- EWMA of temperature and humidity
+- Running mean/variance of temperature (Welford)
+- Time-above/below-range accumulators and heat exposure in degree-minutes
+
+Each batch returns spoilage predictions for the sensors it touched plus
+alerts only for sensors whose status worsened, so per-batch latency depends
+on the batch size, not the fleet size. State checkpoints atomically to an
+.npz file; a fridge that went offline resumes from its last reading, and
+exposure across the gap is capped at `max_gap_seconds`.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Status codes, ordered by severity (match ColdChainStatus values)
+STATUS_NAMES = np.array(['optimal', 'warning', 'critical', 'breached'])
+OPTIMAL, WARNING, CRITICAL, BREACHED = range(4)
+
+_FLOAT_FIELDS = (
+    'last_ts', 'last_temp', 'last_humidity', 'ewma_temp', 'ewma_humidity',
+    'temp_mean', 'temp_m2', 'seconds_above', 'seconds_below', 'seconds_humid',
+    'heat_degree_minutes', 'freeze_seconds',
+)
+_INT_FIELDS = ('count', 'status', 'offline_gaps')
+
+
+class StreamingColdChainDetector:
+    """Array-backed per-sensor rolling state with vectorized batch ingestion"""
+
+    def __init__(self, temp_min: float = 2.0, temp_max: float = 8.0, humidity_max: float = 65.0,
+                 freeze_point: float = 0.0, ewma_alpha: float = 0.2,
+                 heat_budget_degree_minutes: float = 600.0, max_gap_seconds: float = 3600.0,
+                 initial_capacity: int = 1024):
+        self.temp_min = temp_min
+        self.temp_max = temp_max
+        self.humidity_max = humidity_max
+        self.freeze_point = freeze_point
+        self.ewma_alpha = ewma_alpha
+        self.heat_budget = heat_budget_degree_minutes
+        self.max_gap_seconds = max_gap_seconds
+
+        self.sensor_ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._capacity = 0
+        self._state: Dict[str, np.ndarray] = {}
+        self._allocate(initial_capacity)
+
+    # ------------------------------------------------------------------ storage
+
+    def _allocate(self, capacity: int):
+        for name in _FLOAT_FIELDS:
+            grown = np.zeros(capacity, dtype=np.float64)
+            if name in self._state:
+                grown[:self._capacity] = self._state[name]
+            self._state[name] = grown
+        for name in _INT_FIELDS:
+            grown = np.zeros(capacity, dtype=np.int64)
+            if name in self._state:
+                grown[:self._capacity] = self._state[name]
+            self._state[name] = grown
+        self._capacity = capacity
+
+    def _slots(self, sensor_ids: Sequence[str]) -> np.ndarray:
+        index = self._index
+        slots = np.empty(len(sensor_ids), dtype=np.int64)
+        for i, sensor_id in enumerate(sensor_ids):
+            slot = index.get(sensor_id)
+            if slot is None:
+                slot = index[sensor_id] = len(self.sensor_ids)
+                self.sensor_ids.append(sensor_id)
+            slots[i] = slot
+        if len(self.sensor_ids) > self._capacity:
+            self._allocate(max(len(self.sensor_ids), self._capacity * 2))
+        return slots
+
+    def __len__(self) -> int:
+        return len(self.sensor_ids)
+
+    # ---------------------------------------------------------------- ingestion
+
+    def ingest(self, sensor_ids: Sequence[str], timestamps: Iterable[float],
+               temperatures: Iterable[float], humidities: Iterable[float]) -> Dict[str, Any]:
+        """
+        Ingest one batch of readings (parallel sequences; timestamps in epoch seconds).
+
+        Several readings for the same sensor in one batch are applied in
+        timestamp order: the batch is processed in rounds, where round k holds
+        each sensor's k-th reading, so every round is a conflict-free scatter.
+        """
+        slots = self._slots(sensor_ids)
+        ts = np.asarray(timestamps, dtype=np.float64)
+        temp = np.asarray(temperatures, dtype=np.float64)
+        hum = np.asarray(humidities, dtype=np.float64)
+        if not len(slots):
+            return self._empty_result()
+
+        order = np.lexsort((ts, slots))
+        slots, ts, temp, hum = slots[order], ts[order], temp[order], hum[order]
+        group_start = np.r_[0, np.flatnonzero(np.diff(slots)) + 1]
+        group_sizes = np.diff(np.r_[group_start, len(slots)])
+        rank = np.arange(len(slots)) - np.repeat(group_start, group_sizes)
+
+        previous_status = self._state['status'][np.unique(slots)].copy()
+        for round_number in range(int(rank.max()) + 1):
+            mask = rank == round_number
+            self._update(slots[mask], ts[mask], temp[mask], hum[mask])
+
+        touched = np.unique(slots)
+        return self._predict(touched, previous_status)
+
+    def _update(self, slots: np.ndarray, ts: np.ndarray, temp: np.ndarray, hum: np.ndarray):
+        s = self._state
+        first = s['count'][slots] == 0
+        raw_gap = np.where(first, 0.0, ts - s['last_ts'][slots])
+        dt = np.clip(raw_gap, 0.0, self.max_gap_seconds)
+        s['offline_gaps'][slots] += raw_gap > self.max_gap_seconds
+
+        # Exposure accrues at the previous reading's level over the elapsed interval
+        prev_temp = s['last_temp'][slots]
+        prev_hum = s['last_humidity'][slots]
+        s['seconds_above'][slots] += np.where(prev_temp > self.temp_max, dt, 0.0)
+        s['seconds_below'][slots] += np.where(prev_temp < self.temp_min, dt, 0.0)
+        s['seconds_humid'][slots] += np.where(prev_hum > self.humidity_max, dt, 0.0)
+        s['freeze_seconds'][slots] += np.where(prev_temp <= self.freeze_point, dt, 0.0)
+        s['heat_degree_minutes'][slots] += np.maximum(prev_temp - self.temp_max, 0.0) * dt / 60.0
+
+        alpha = self.ewma_alpha
+        s['ewma_temp'][slots] = np.where(first, temp, alpha * temp + (1 - alpha) * s['ewma_temp'][slots])
+        s['ewma_humidity'][slots] = np.where(first, hum, alpha * hum + (1 - alpha) * s['ewma_humidity'][slots])
+
+        count = s['count'][slots] + 1
+        delta = temp - s['temp_mean'][slots]
+        mean = s['temp_mean'][slots] + delta / count
+        s['temp_m2'][slots] += delta * (temp - mean)
+        s['temp_mean'][slots] = mean
+        s['count'][slots] = count
+
+        s['last_ts'][slots] = np.where(first, ts, np.maximum(ts, s['last_ts'][slots]))
+        s['last_temp'][slots] = temp
+        s['last_humidity'][slots] = hum
+
+    # --------------------------------------------------------------- prediction
+
+    def _predict(self, slots: np.ndarray, previous_status: np.ndarray) -> Dict[str, Any]:
+        s = self._state
+        heat = s['heat_degree_minutes'][slots]
+        freeze = s['freeze_seconds'][slots]
+        humid = s['seconds_humid'][slots]
+        ewma_temp = s['ewma_temp'][slots]
+
+        # Heat damage is cumulative against a stability budget; any freezing is near-certain loss
+        heat_risk = 1.0 - np.exp(-heat / self.heat_budget)
+        freeze_risk = np.where(freeze > 0, 0.9, 0.0)
+        humidity_risk = 0.2 * (1.0 - np.exp(-humid / 86400.0))
+        spoilage = np.clip(np.maximum.reduce([heat_risk, freeze_risk, humidity_risk]), 0.0, 1.0)
+
+        out_of_range = (ewma_temp > self.temp_max) | (ewma_temp < self.temp_min)
+        far_out = (ewma_temp > self.temp_max + 2) | (ewma_temp < self.temp_min - 2)
+        status = np.full(len(slots), OPTIMAL, dtype=np.int64)
+        status[out_of_range | (s['ewma_humidity'][slots] > self.humidity_max)] = WARNING
+        status[far_out | (spoilage >= 0.5)] = CRITICAL
+        status[(spoilage >= 0.9) | (freeze > 0)] = BREACHED
+        s['status'][slots] = status
+
+        worsened = np.flatnonzero(status > previous_status)
+        alerts = [{
+            'alert_type': 'cold_chain_status_change',
+            'sensor_id': self.sensor_ids[slots[i]],
+            'severity': STATUS_NAMES[status[i]],
+            'previous_status': STATUS_NAMES[previous_status[i]],
+            'spoilage_probability': float(spoilage[i]),
+            'ewma_temperature': float(ewma_temp[i]),
+        } for i in worsened]
+
+        return {
+            'sensor_ids': [self.sensor_ids[slot] for slot in slots],
+            'status': STATUS_NAMES[status],
+            'spoilage_probability': spoilage,
+            'ewma_temperature': ewma_temp,
+            'alerts': alerts,
+            'readings_ingested_sensors': len(slots),
+        }
+
+    def _empty_result(self) -> Dict[str, Any]:
+        return {'sensor_ids': [], 'status': STATUS_NAMES[:0], 'spoilage_probability': np.zeros(0),
+                'ewma_temperature': np.zeros(0), 'alerts': [], 'readings_ingested_sensors': 0}
+
+    def sensor_state(self, sensor_id: str) -> Dict[str, Any]:
+        """Rolling state for one sensor (for dashboards and debugging)"""
+        slot = self._index[sensor_id]
+        state = {name: self._state[name][slot].item() for name in _FLOAT_FIELDS + _INT_FIELDS}
+        count = state['count']
+        state['temp_variance'] = state['temp_m2'] / (count - 1) if count > 1 else 0.0
+        state['status'] = str(STATUS_NAMES[state['status']])
+        return state
+
+    def fleet_summary(self) -> Dict[str, Any]:
+        n = len(self.sensor_ids)
+        status = self._state['status'][:n]
+        return {
+            'sensors': n,
+            'status_counts': {str(name): int((status == code).sum()) for code, name in enumerate(STATUS_NAMES)},
+        }
+
+    # -------------------------------------------------------------- checkpoint
+
+    def checkpoint(self, path: str):
+        """Atomically persist all sensor state (temp file + rename)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        n = len(self.sensor_ids)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, sensor_ids=np.array(self.sensor_ids, dtype=str),
+                     **{name: array[:n] for name, array in self._state.items()})
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def restore(cls, path: str, **config) -> 'StreamingColdChainDetector':
+        """Rebuild a detector from a checkpoint; missing file gives a fresh detector"""
+        detector = cls(**config)
+        if not os.path.exists(path):
+            return detector
+        with np.load(path) as data:
+            sensor_ids = [str(sensor_id) for sensor_id in data['sensor_ids']]
+            detector._allocate(max(len(sensor_ids), detector._capacity))
+            for name in _FLOAT_FIELDS + _INT_FIELDS:
+                detector._state[name][:len(sensor_ids)] = data[name]
+        detector.sensor_ids = sensor_ids
+        detector._index = {sensor_id: slot for slot, sensor_id in enumerate(sensor_ids)}
+        logger.info(f"Restored cold-chain state for {len(sensor_ids)} sensors from {path}")
+        return detector
@@ -0,0 +1,271 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Pharmaceutical Provenance Ledger
+================================
+
+Local, append-only, hash-linked ledger for serialization events.
+
+- Every entry carries the hash of the previous entry (global chain) and a
+  back-pointer to the previous entry for the same product serial, so a
+  serial's provenance chain is retrieved in O(depth) without scanning.
+- Secondary indexes by serial, batch and GTIN map to entry sequence
+  numbers; entries themselves stay on disk and are read by file offset.
+- append_batch() writes a whole batch and fsyncs once.
+- validate_new() re-hashes only entries appended since the last validation.
+
+Storage is JSON Lines; indexes are rebuilt by one sequential scan on open,
+which also re-verifies every hash and link and raises LedgerIntegrityError
+at the first break.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+
+
+def _entry_hash(entry: Dict[str, Any]) -> str:
+    body = {k: v for k, v in entry.items() if k != 'hash'}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(',', ':'), default=str).encode()).hexdigest()
+
+
+class LedgerIntegrityError(Exception):
+    """Raised on open when a stored entry's hash or links do not verify"""
+
+    def __init__(self, seq: int, reason: str):
+        super().__init__(f"Provenance ledger integrity failure at seq {seq}: {reason}")
+        self.seq = seq
+        self.reason = reason
+
+
+class ProvenanceLedger:
+    """Hash-linked provenance ledger with serial/batch/GTIN indexes"""
+
+    def __init__(self, path: str = "data/pharma/provenance_ledger.jsonl"):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._offsets = array('q')
+        self._by_serial: Dict[str, array] = {}
+        self._by_batch: Dict[str, array] = {}
+        self._by_gtin: Dict[str, array] = {}
+        self._serial_tip: Dict[str, int] = {}
+        self._tip_hash = GENESIS_HASH
+        self._validated_upto = 0
+        self._load()
+        self._writer = open(self.path, 'ab')
+        self._reader = open(self.path, 'rb')
+
+    # ------------------------------------------------------------------ loading
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        offset = 0
+        serial_tip_hashes: Dict[str, str] = {}
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write from a crash mid-batch: drop the partial record
+                    logger.warning(f"Truncating partial ledger record at offset {offset}")
+                    break
+                entry = json.loads(line)
+                self._verify_loaded(entry, serial_tip_hashes)
+                serial_tip_hashes[entry['serial']] = entry['hash']
+                self._index(entry, offset)
+                offset += len(line)
+        if offset != os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+        # Every entry on disk was verified above; start incremental validation at the tail
+        self._validated_upto = len(self._offsets)
+
+    def _verify_loaded(self, entry: Dict[str, Any], serial_tip_hashes: Dict[str, str]):
+        seq = len(self._offsets)
+        if entry.get('seq') != seq:
+            reason = f"unexpected seq {entry.get('seq')}"
+        elif entry.get('previous_hash') != self._tip_hash:
+            reason = "previous_hash does not match the preceding entry"
+        elif entry.get('serial_prev_hash') != serial_tip_hashes.get(entry.get('serial')):
+            reason = "serial_prev_hash does not match the serial's previous entry"
+        elif _entry_hash(entry) != entry.get('hash'):
+            reason = "hash does not match entry contents"
+        else:
+            return
+        logger.error(f"Provenance ledger integrity failure at seq {seq}: {reason}")
+        raise LedgerIntegrityError(seq, reason)
+
+    def _index(self, entry: Dict[str, Any], offset: int):
+        seq = entry['seq']
+        self._offsets.append(offset)
+        self._by_serial.setdefault(entry['serial'], array('q')).append(seq)
+        if entry.get('batch_number'):
+            self._by_batch.setdefault(entry['batch_number'], array('q')).append(seq)
+        if entry.get('gtin'):
+            self._by_gtin.setdefault(entry['gtin'], array('q')).append(seq)
+        self._serial_tip[entry['serial']] = seq
+        self._tip_hash = entry['hash']
+
+    # ------------------------------------------------------------------ writing
+
+    def append_batch(self, transactions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Append a batch of transactions; one write and one fsync for the whole batch"""
+        with self._lock:
+            entries = []
+            lines = []
+            offset = self._writer.seek(0, os.SEEK_END)
+            pending_tips: Dict[str, Dict[str, Any]] = {}
+            previous_hash = self._tip_hash
+
+            for seq, transaction in enumerate(transactions, start=len(self._offsets)):
+                serial = str(transaction.get('serial_number') or transaction.get('serialization_number')
+                             or transaction.get('product_id', ''))
+                serial_prev = pending_tips.get(serial)
+                if serial_prev is not None:
+                    serial_prev_seq, serial_prev_hash = serial_prev['seq'], serial_prev['hash']
+                elif serial in self._serial_tip:
+                    serial_prev_seq = self._serial_tip[serial]
+                    serial_prev_hash = self._read(serial_prev_seq)['hash']
+                else:
+                    serial_prev_seq, serial_prev_hash = None, None
+
+                entry = {
+                    'seq': seq,
+                    'entry_id': str(uuid.uuid4()),
+                    'serial': serial,
+                    'product_id': transaction.get('product_id', serial),
+                    'batch_number': transaction.get('batch_number'),
+                    'gtin': transaction.get('gtin'),
+                    'transaction_type': transaction.get('transaction_type', 'transfer'),
+                    'from_entity': transaction.get('from_entity'),
+                    'to_entity': transaction.get('to_entity'),
+                    'timestamp': str(transaction.get('timestamp') or datetime.now().isoformat()),
+                    'metadata': transaction.get('metadata', {}),
+                    'previous_hash': previous_hash,
+                    'serial_prev_seq': serial_prev_seq,
+                    'serial_prev_hash': serial_prev_hash,
+                }
+                entry['hash'] = _entry_hash(entry)
+                previous_hash = entry['hash']
+                pending_tips[serial] = entry
+                entries.append(entry)
+                lines.append(json.dumps(entry, separators=(',', ':'), default=str).encode() + b'\n')
+
+            if not entries:
+                return []
+            self._writer.write(b''.join(lines))
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+
+            for entry, line in zip(entries, lines):
+                self._index(entry, offset)
+                offset += len(line)
+            return entries
+
+    def append(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        return self.append_batch([transaction])[0]
+
+    # ------------------------------------------------------------------ reading
+
+    def _read(self, seq: int) -> Dict[str, Any]:
+        self._reader.seek(self._offsets[seq])
+        return json.loads(self._reader.readline())
+
+    def get(self, seq: int) -> Dict[str, Any]:
+        with self._lock:
+            return self._read(seq)
+
+    def provenance_chain(self, serial: str, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Walk a serial's back-pointers from its latest event; oldest event first"""
+        with self._lock:
+            chain = []
+            seq = self._serial_tip.get(serial)
+            while seq is not None and (max_depth is None or len(chain) < max_depth):
+                entry = self._read(seq)
+                chain.append(entry)
+                seq = entry['serial_prev_seq']
+        chain.reverse()
+        return chain
+
+    def provenance_chains(self, serials: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Provenance chains for many serials (each serial walked once)"""
+        return {serial: self.provenance_chain(serial) for serial in set(serials)}
+
+    def _lookup(self, index: Dict[str, array], key: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        with self._lock:
+            seqs = index.get(key, ())
+            if limit is not None:
+                seqs = seqs[-limit:]
+            return [self._read(seq) for seq in seqs]
+
+    def entries_for_serial(self, serial: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._lookup(self._by_serial, serial, limit)
+
+    def entries_for_batch(self, batch_number: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._lookup(self._by_batch, batch_number, limit)
+
+    def entries_for_gtin(self, gtin: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._lookup(self._by_gtin, gtin, limit)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    # --------------------------------------------------------------- validation
+
+    def validate_chain(self, chain: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Verify hashes and serial back-links of one provenance chain (O(depth))"""
+        for previous, entry in zip([None] + chain[:-1], chain):
+            if _entry_hash(entry) != entry.get('hash'):
+                return {'status': 'invalid', 'score': 0.0, 'first_invalid_seq': entry.get('seq')}
+            if previous is not None and entry.get('serial_prev_hash') != previous.get('hash'):
+                return {'status': 'invalid', 'score': 0.0, 'first_invalid_seq': entry.get('seq')}
+        return {'status': 'valid', 'score': 1.0, 'links_checked': len(chain)}
+
+    def validate_new(self) -> Dict[str, Any]:
+        """Validate only links appended since the last call (global and per-serial)"""
+        with self._lock:
+            start = self._validated_upto
+            end = len(self._offsets)
+            previous_hash = self._read(start - 1)['hash'] if start else GENESIS_HASH
+            new_hashes: Dict[int, str] = {}
+            for seq in range(start, end):
+                entry = self._read(seq)
+                serial_prev_seq = entry['serial_prev_seq']
+                serial_link_ok = serial_prev_seq is None or entry['serial_prev_hash'] == (
+                    new_hashes[serial_prev_seq] if serial_prev_seq in new_hashes
+                    else self._read(serial_prev_seq)['hash']
+                )
+                if entry['previous_hash'] != previous_hash or not serial_link_ok \
+                        or _entry_hash(entry) != entry['hash']:
+                    logger.error(f"Provenance ledger integrity failure at seq {seq}")
+                    return {'status': 'invalid', 'score': 0.0, 'first_invalid_seq': seq,
+                            'validated': seq - start}
+                previous_hash = new_hashes[seq] = entry['hash']
+            self._validated_upto = end
+            return {'status': 'valid', 'score': 1.0, 'validated': end - start, 'ledger_height': end}
+
+    def close(self):
+        with self._lock:
+            self._writer.close()
+            self._reader.close()
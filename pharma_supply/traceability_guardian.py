@@ -32,13 +32,15 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Union
-import json
 import logging
-import hashlib
 import uuid
+import asyncio
 from dataclasses import dataclass, field
 from enum import Enum
 
+from pharma_supply.provenance_ledger import ProvenanceLedger
+from pharma_supply.cold_chain_stream import StreamingColdChainDetector
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -259,11 +261,12 @@ class BlockchainIntegrityWeaver:
     drone data for last-mile Africa.
     """
 
-    def __init__(self):
-        self.blockchain_network = BlockchainNetwork()
+    def __init__(self, ledger: Optional[ProvenanceLedger] = None):
+        self.ledger = ledger if ledger is not None else ProvenanceLedger()
+        self.blockchain_network = BlockchainNetwork(self.ledger)
         self.drone_integrator = DroneDataIntegrator()
-        self.provenance_tracker = ProvenanceTracker()
-        self.integrity_validator = IntegrityValidator()
+        self.provenance_tracker = ProvenanceTracker(self.ledger)
+        self.integrity_validator = IntegrityValidator(self.ledger)
 
     async def weave_blockchain_integrity(self, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -291,26 +294,7 @@ class BlockchainIntegrityWeaver:
             blockchain_entry = await self.blockchain_network.create_entry(transaction_data)
             integrity_results['blockchain_entry'] = blockchain_entry
 
-            # Integrate drone data if applicable
-            if transaction_data.get('transport_method') == 'drone':
-                drone_data = await self.drone_integrator.integrate_drone_data(transaction_data)
-                integrity_results['drone_integration'] = drone_data
-
-            # Track provenance
-            provenance_chain = await self.provenance_tracker.track_provenance(
-                transaction_data.get('product_id', '')
-            )
-            integrity_results['provenance_chain'] = provenance_chain
-
-            # Validate integrity
-            validation_result = await self.integrity_validator.validate_chain(provenance_chain)
-            integrity_results['validation_status'] = validation_result.get('status', 'invalid')
-            integrity_results['integrity_score'] = validation_result.get('score', 0.0)
-
-            # Generate recommendations
-            integrity_results['recommendations'] = self._generate_integrity_recommendations(
-                validation_result
-            )
+            await self._complete_integrity_results(transaction_data, blockchain_entry, integrity_results)
 
         except Exception as e:
             logger.error(f"Blockchain integrity weaving failed: {e}")
@@ -318,6 +302,76 @@ class BlockchainIntegrityWeaver:
 
         return integrity_results
 
+    async def weave_blockchain_integrity_batch(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Record many transactions with one ledger append (one fsync), then
+        enrich every transaction concurrently.
+
+        Args:
+            transactions: Transaction details to record on blockchain
+
+        Returns:
+            Blockchain integrity results, one per transaction
+        """
+        try:
+            entries = await self.blockchain_network.create_entries(transactions)
+        except Exception as e:
+            logger.error(f"Blockchain batch ingestion failed: {e}")
+            return [{'transaction_id': t.get('transaction_id', ''), 'error': str(e)} for t in transactions]
+
+        # Independent lookups: provenance (each serial walked once) and drone data
+        drone_transactions = [t for t in transactions if t.get('transport_method') == 'drone']
+        chains, drone_results = await asyncio.gather(
+            self.provenance_tracker.track_provenance_many([e['serial'] for e in entries]),
+            asyncio.gather(*[self.drone_integrator.integrate_drone_data(t) for t in drone_transactions])
+        )
+        drone_by_transaction = {id(t): d for t, d in zip(drone_transactions, drone_results)}
+
+        # One incremental validation covers every link appended by this batch
+        validation_result = await self.integrity_validator.validate_new()
+        recommendations = self._generate_integrity_recommendations(validation_result)
+
+        results = []
+        for transaction_data, blockchain_entry in zip(transactions, entries):
+            chain = chains.get(blockchain_entry['serial'], [])
+            depth = next((i + 1 for i, link in enumerate(chain)
+                          if link['seq'] == blockchain_entry['block_height']), len(chain))
+            results.append({
+                'transaction_id': transaction_data.get('transaction_id', ''),
+                'weaving_timestamp': datetime.now(),
+                'blockchain_entry': blockchain_entry,
+                'integrity_score': validation_result.get('score', 0.0),
+                'drone_integration': drone_by_transaction.get(id(transaction_data)),
+                'provenance_chain': chain[:depth],
+                'validation_status': validation_result.get('status', 'invalid'),
+                'recommendations': recommendations
+            })
+        return results
+
+    async def _complete_integrity_results(self, transaction_data: Dict[str, Any],
+                                          blockchain_entry: Dict[str, Any],
+                                          integrity_results: Dict[str, Any]):
+        """Drone integration and provenance lookup are independent, so run them together"""
+        drone_task = (self.drone_integrator.integrate_drone_data(transaction_data)
+                      if transaction_data.get('transport_method') == 'drone' else None)
+        provenance_task = self.provenance_tracker.track_provenance(blockchain_entry.get('serial', ''))
+        if drone_task is not None:
+            drone_data, provenance_chain = await asyncio.gather(drone_task, provenance_task)
+            integrity_results['drone_integration'] = drone_data
+        else:
+            provenance_chain = await provenance_task
+        integrity_results['provenance_chain'] = provenance_chain
+
+        # Validate the newest link of this serial plus any newly appended links
+        validation_result = await self.integrity_validator.validate_chain(provenance_chain)
+        integrity_results['validation_status'] = validation_result.get('status', 'invalid')
+        integrity_results['integrity_score'] = validation_result.get('score', 0.0)
+
+        # Generate recommendations
+        integrity_results['recommendations'] = self._generate_integrity_recommendations(
+            validation_result
+        )
+
     def _generate_integrity_recommendations(self, validation_result: Dict[str, Any]) -> List[str]:
         """Generate recommendations for maintaining integrity"""
         recommendations = []
@@ -343,11 +397,45 @@ class ColdChainPredictor:
     IoT + AI monitors temperature/humidity; prevent spoilage in rural/offline settings.
     """
 
-    def __init__(self):
+    def __init__(self, stream_detector: Optional[StreamingColdChainDetector] = None,
+                 checkpoint_path: Optional[str] = None):
         self.iot_monitor = IoTMonitor()
         self.predictive_model = PredictiveModel()
         self.alert_system = AlertSystem()
         self.offline_handler = OfflineHandler()
+        self.checkpoint_path = checkpoint_path
+        if stream_detector is None:
+            stream_detector = (StreamingColdChainDetector.restore(checkpoint_path)
+                               if checkpoint_path else StreamingColdChainDetector())
+        self.stream_detector = stream_detector
+
+    async def ingest_sensor_batch(self, readings: Dict[str, Any], checkpoint: bool = False) -> Dict[str, Any]:
+        """
+        Stream a batch of fleet readings through the per-sensor detector
+
+        Args:
+            readings: Parallel sequences 'sensor_id', 'timestamp' (epoch seconds),
+                      'temperature' and 'humidity'
+            checkpoint: Persist detector state after this batch
+
+        Returns:
+            Spoilage predictions for the sensors in the batch and status-change alerts
+        """
+        batch_result = self.stream_detector.ingest(
+            readings.get('sensor_id', []),
+            readings.get('timestamp', []),
+            readings.get('temperature', []),
+            readings.get('humidity', [])
+        )
+        if checkpoint and self.checkpoint_path:
+            self.stream_detector.checkpoint(self.checkpoint_path)
+        return {
+            'batch_timestamp': datetime.now(),
+            'sensors_updated': batch_result['readings_ingested_sensors'],
+            'predictions': batch_result,
+            'alerts_generated': batch_result['alerts'],
+            'fleet_summary': self.stream_detector.fleet_summary()
+        }
 
     async def predict_cold_chain_integrity(self, monitoring_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -763,26 +851,50 @@ class ComplianceMonitor:
         return {'score': avg_score, 'compliant': avg_score > 0.7}
 
 class BlockchainNetwork:
+    def __init__(self, ledger: ProvenanceLedger):
+        self.ledger = ledger
+
     async def create_entry(self, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
-        entry_hash = hashlib.sha256(json.dumps(transaction_data).encode()).hexdigest()
-        return {
-            'entry_id': str(uuid.uuid4()),
-            'hash': entry_hash,
-            'block_height': 12345,
-            'confirmations': 6
-        }
+        return (await self.create_entries([transaction_data]))[0]
+
+    async def create_entries(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        entries = await asyncio.to_thread(self.ledger.append_batch, transactions)
+        return [{
+            'entry_id': entry['entry_id'],
+            'serial': entry['serial'],
+            'hash': entry['hash'],
+            'previous_hash': entry['previous_hash'],
+            'block_height': entry['seq'],
+            'confirmations': 1
+        } for entry in entries]
 
 class DroneDataIntegrator:
     async def integrate_drone_data(self, transaction_data: Dict[str, Any]) -> Dict[str, Any]:
         return {'drone_tracking_id': 'drone_001', 'delivery_status': 'completed'}
 
 class ProvenanceTracker:
+    def __init__(self, ledger: ProvenanceLedger):
+        self.ledger = ledger
+
     async def track_provenance(self, product_id: str) -> List[Dict[str, Any]]:
-        return [{'step': 'manufacture', 'entity': 'Factory A', 'timestamp': datetime.now()}]
+        return await asyncio.to_thread(self.ledger.provenance_chain, product_id)
+
+    async def track_provenance_many(self, serials: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return await asyncio.to_thread(self.ledger.provenance_chains, serials)
 
 class IntegrityValidator:
+    def __init__(self, ledger: ProvenanceLedger):
+        self.ledger = ledger
+
     async def validate_chain(self, provenance_chain: List[Dict[str, Any]]) -> Dict[str, Any]:
-        return {'status': 'valid', 'score': 0.95}
+        # Earlier links were validated when appended; only the newest link is re-checked here
+        chain_result = self.ledger.validate_chain(provenance_chain[-2:])
+        if chain_result['status'] != 'valid':
+            return chain_result
+        return await self.validate_new()
+
+    async def validate_new(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.ledger.validate_new)
 
 class IoTMonitor:
     async def get_current_readings(self, monitoring_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -891,9 +1003,10 @@ class PharmaceuticalTraceabilityAntiCounterfeitGuardian:
 
             # Weave blockchain integrity
             transactions_to_record = operation_context.get('transactions_to_record', [])
-            for transaction_data in transactions_to_record:
-                integrity_result = await self.blockchain_weaver.weave_blockchain_integrity(transaction_data)
-                guardian_results['blockchain_integrity'].append(integrity_result)
+            if transactions_to_record:
+                guardian_results['blockchain_integrity'].extend(
+                    await self.blockchain_weaver.weave_blockchain_integrity_batch(transactions_to_record)
+                )
 
             # Monitor cold chain
             cold_chain_data = operation_context.get('cold_chain_monitoring', [])
@@ -24,6 +24,7 @@ Key Components:
 - Geopatriation Orchestrator: Sovereign data routing and localization
 - Cyber-Resilience Guardian: Advanced threat detection and response
 - Inclusive Impact Tracker: Equity-focused risk monitoring for MSMEs
+- Monte Carlo Scenario Engine: Correlated, vectorized multi-sector stress testing
 
 Author: Global Health Nexus AI
 Date: December 28, 2025
@@ -39,6 +40,9 @@ import asyncio
 from dataclasses import dataclass, field
 from enum import Enum
 import random
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -127,6 +131,7 @@ class ScenarioForecastingEngine:
         self.impact_assessor = ImpactAssessor()
         self.probability_calculator = ProbabilityCalculator()
         self.mitigation_planner = MitigationPlanner()
+        self.monte_carlo_engine = MonteCarloScenarioEngine()
 
     async def forecast_risk_scenarios(self, context_data: Dict[str, Any],
                                     forecasting_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -149,6 +154,7 @@ class ScenarioForecastingEngine:
             'risk_heatmap': {},
             'mitigation_strategies': [],
             'early_warning_signals': [],
+            'scenario_distribution': {},
             'forecast_accuracy': 0.0
         }
 
@@ -171,6 +177,15 @@ class ScenarioForecastingEngine:
             )
             forecasting_results['probability_distributions'] = probabilities
 
+            # Distributional forecast over correlated draws (opt-in by sample count)
+            monte_carlo_samples = forecasting_params.get('monte_carlo_samples')
+            if monte_carlo_samples:
+                forecasting_results['scenario_distribution'] = await self.monte_carlo_engine.run_stress_test(
+                    self.monte_carlo_engine.calibrate_from_scenarios(scenarios),
+                    n_samples=monte_carlo_samples,
+                    seed=forecasting_params.get('seed', 0)
+                )
+
             # Create risk heatmap
             risk_heatmap = await self._create_risk_heatmap(scenarios, impact_assessments)
             forecasting_results['risk_heatmap'] = risk_heatmap
@@ -290,6 +305,206 @@ class ScenarioForecastingEngine:
         # Mock accuracy calculation based on historical validation
         return 0.82
 
+# Sector exposure of each risk category (rows sum to 1)
+MONTE_CARLO_SECTORS = ['healthcare', 'manufacturing', 'supply_chain', 'logistics']
+DEFAULT_SECTOR_WEIGHTS = {
+    RiskCategory.GEOPOLITICAL.value: [0.2, 0.3, 0.3, 0.2],
+    RiskCategory.CYBER_SECURITY.value: [0.5, 0.2, 0.1, 0.2],
+    RiskCategory.SUPPLY_CHAIN.value: [0.2, 0.2, 0.4, 0.2],
+    RiskCategory.REGULATORY.value: [0.4, 0.3, 0.2, 0.1],
+    RiskCategory.NATURAL_DISASTER.value: [0.3, 0.2, 0.2, 0.3],
+    RiskCategory.ECONOMIC.value: [0.2, 0.4, 0.2, 0.2],
+    RiskCategory.HEALTH_SECURITY.value: [0.6, 0.1, 0.2, 0.1],
+}
+
+def _simulate_monte_carlo_shard(seed_sequence: np.random.SeedSequence, n_samples: int,
+                                cholesky: np.ndarray, thresholds: np.ndarray,
+                                log_mu: np.ndarray, log_sigma: np.ndarray,
+                                loss_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate one shard of correlated risk draws (module-level so it pickles
+    into ProcessPoolExecutor workers).
+
+    Returns (sector_losses [n × sectors], occurrences [n × categories]).
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n_categories = cholesky.shape[0]
+
+    # Gaussian copula: correlated latent drivers decide occurrence and severity
+    latent = rng.standard_normal((n_samples, n_categories)) @ cholesky.T
+    occurrences = latent < thresholds
+    severity_drivers = rng.standard_normal((n_samples, n_categories)) @ cholesky.T
+    severities = np.exp(log_mu + log_sigma * severity_drivers)
+
+    category_losses = np.where(occurrences, severities, 0.0)
+    return category_losses @ loss_matrix, occurrences
+
+class MonteCarloScenarioEngine:
+    """
+    Monte Carlo risk scenario engine: samples thousands of correlated risk
+    draws per category as NumPy arrays, assesses sector impact for every
+    draw in one matrix product, and returns distributional outputs
+    (quantiles, VaR/CVaR, joint-event probabilities) instead of point scores.
+
+    Samples are split into fixed-size shards, each with its own child of one
+    SeedSequence, so results depend only on (seed, n_samples) — not on how
+    many worker processes ran the shards.
+    """
+
+    def __init__(self, shard_size: int = 50_000, max_workers: Optional[int] = None,
+                 default_correlation: float = 0.3, severity_sigma: float = 0.5):
+        self.shard_size = shard_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.default_correlation = default_correlation
+        self.severity_sigma = severity_sigma
+        self.categories = [cat.value for cat in RiskCategory]
+
+    def calibrate_from_scenarios(self, scenarios: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """Derive per-category occurrence probability and mean impact from generated scenarios"""
+        calibration = {}
+        for category in self.categories:
+            matching = [s for s in scenarios if s.get('category') == category]
+            if matching:
+                calibration[category] = {
+                    'probability': float(np.mean([s.get('probability', 0.0) for s in matching])),
+                    'impact': float(np.mean([s.get('impact_score', 0.0) for s in matching])),
+                }
+        return calibration
+
+    def _category_parameters(self, category_params: Dict[str, Dict[str, float]]) -> Tuple[np.ndarray, np.ndarray]:
+        probabilities = np.array([
+            min(max(category_params.get(cat, {}).get('probability', 0.1), 1e-6), 1 - 1e-6)
+            for cat in self.categories
+        ])
+        impacts = np.array([
+            max(category_params.get(cat, {}).get('impact', 0.3), 1e-6) for cat in self.categories
+        ])
+        return probabilities, impacts
+
+    def _cholesky(self, correlation: Optional[np.ndarray]) -> np.ndarray:
+        n = len(self.categories)
+        if correlation is None:
+            correlation = np.full((n, n), self.default_correlation)
+            np.fill_diagonal(correlation, 1.0)
+        correlation = np.asarray(correlation, dtype=np.float64)
+        try:
+            return np.linalg.cholesky(correlation)
+        except np.linalg.LinAlgError:
+            # Clip negative eigenvalues to recover the nearest valid correlation matrix
+            eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+            repaired = eigenvectors @ np.diag(np.clip(eigenvalues, 1e-8, None)) @ eigenvectors.T
+            scale = np.sqrt(np.diag(repaired))
+            return np.linalg.cholesky(repaired / np.outer(scale, scale))
+
+    def _loss_matrix(self, sector_weights: Optional[Dict[str, List[float]]],
+                     sector_exposure: Optional[Dict[str, float]]) -> np.ndarray:
+        weights = dict(DEFAULT_SECTOR_WEIGHTS)
+        weights.update(sector_weights or {})
+        exposure = np.array([(sector_exposure or {}).get(sector, 1.0) for sector in MONTE_CARLO_SECTORS])
+        return np.array([weights[cat] for cat in self.categories], dtype=np.float64) * exposure
+
+    def simulate(self, category_params: Dict[str, Dict[str, float]], n_samples: int = 10_000,
+                 seed: int = 0, correlation: Optional[np.ndarray] = None,
+                 sector_weights: Optional[Dict[str, List[float]]] = None,
+                 sector_exposure: Optional[Dict[str, float]] = None,
+                 mitigation_effectiveness: float = 0.0,
+                 loss_thresholds: Optional[List[float]] = None) -> Dict[str, Any]:
+        """
+        Run a correlated Monte Carlo stress test.
+
+        Args:
+            category_params: {category: {'probability': p, 'impact': mean severity}}
+            n_samples: Number of joint scenario draws
+            seed: Root seed for reproducible shard streams
+            correlation: Optional category × category correlation matrix
+            sector_weights: Optional overrides of DEFAULT_SECTOR_WEIGHTS
+            sector_exposure: Optional per-sector exposure multipliers
+            mitigation_effectiveness: Fraction of loss removed by mitigation (0-1)
+            loss_thresholds: Total-loss levels to report exceedance probabilities for
+
+        Returns:
+            Distributional stress-test results
+
+        Raises:
+            ValueError: n_samples is less than 1
+        """
+        if n_samples < 1:
+            raise ValueError(f"n_samples must be at least 1, got {n_samples}")
+        probabilities, impacts = self._category_parameters(category_params)
+        normal = NormalDist()
+        thresholds = np.array([normal.inv_cdf(p) for p in probabilities])
+        log_sigma = np.full(len(self.categories), self.severity_sigma)
+        log_mu = np.log(impacts) - 0.5 * log_sigma ** 2
+        cholesky = self._cholesky(correlation)
+        loss_matrix = self._loss_matrix(sector_weights, sector_exposure) * (1.0 - mitigation_effectiveness)
+
+        shard_sizes = [self.shard_size] * (n_samples // self.shard_size)
+        if n_samples % self.shard_size:
+            shard_sizes.append(n_samples % self.shard_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+        shard_args = [(seq, size, cholesky, thresholds, log_mu, log_sigma, loss_matrix)
+                      for seq, size in zip(seeds, shard_sizes)]
+
+        workers = min(self.max_workers, len(shard_args))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                shards = list(pool.map(_simulate_monte_carlo_shard, *zip(*shard_args)))
+        else:
+            shards = [_simulate_monte_carlo_shard(*args) for args in shard_args]
+
+        sector_losses = np.concatenate([shard[0] for shard in shards])
+        occurrences = np.concatenate([shard[1] for shard in shards])
+        return self._summarize(sector_losses, occurrences, loss_thresholds or [], seed)
+
+    async def run_stress_test(self, category_params: Dict[str, Dict[str, float]],
+                              **simulation_params) -> Dict[str, Any]:
+        """Run simulate() off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.simulate(category_params, **simulation_params))
+
+    def _summarize(self, sector_losses: np.ndarray, occurrences: np.ndarray,
+                   loss_thresholds: List[float], seed: int) -> Dict[str, Any]:
+        quantile_levels = [0.5, 0.9, 0.95, 0.99]
+        total_losses = sector_losses.sum(axis=1)
+        total_quantiles = np.quantile(total_losses, quantile_levels)
+        sector_quantiles = np.quantile(sector_losses, quantile_levels, axis=0)
+        events_per_draw = occurrences.sum(axis=1)
+
+        tail_risk = {}
+        for level, var in zip(quantile_levels[2:], total_quantiles[2:]):
+            tail = total_losses[total_losses >= var]
+            tail_risk[f'var_{int(level * 100)}'] = float(var)
+            tail_risk[f'cvar_{int(level * 100)}'] = float(tail.mean()) if tail.size else float(var)
+
+        return {
+            'n_samples': int(total_losses.size),
+            'seed': seed,
+            'total_loss': {
+                'mean': float(total_losses.mean()),
+                'std': float(total_losses.std()),
+                'quantiles': {f'p{int(q * 100)}': float(v) for q, v in zip(quantile_levels, total_quantiles)},
+            },
+            'tail_risk': tail_risk,
+            'sector_loss': {
+                sector: {
+                    'mean': float(sector_losses[:, i].mean()),
+                    'quantiles': {f'p{int(q * 100)}': float(v)
+                                  for q, v in zip(quantile_levels, sector_quantiles[:, i])},
+                }
+                for i, sector in enumerate(MONTE_CARLO_SECTORS)
+            },
+            'category_event_frequency': {
+                cat: float(freq) for cat, freq in zip(self.categories, occurrences.mean(axis=0))
+            },
+            'joint_event_probability': {
+                'any_event': float((events_per_draw >= 1).mean()),
+                'three_or_more_events': float((events_per_draw >= 3).mean()),
+            },
+            'exceedance_probability': {
+                str(threshold): float((total_losses > threshold).mean()) for threshold in loss_thresholds
+            },
+        }
+
 class GeopatriationOrchestrator:
     """
     Sovereign data routing and localization; ensure healthcare data stays
@@ -975,6 +1190,20 @@ class ResilientMultiSectorRiskMitigationNexus:
         self.geopatriation_orchestrator = GeopatriationOrchestrator()
         self.cyber_resilience_guardian = CyberResilienceGuardian()
         self.inclusive_impact_tracker = InclusiveImpactTracker()
+        self.monte_carlo_engine = self.scenario_forecasting.monte_carlo_engine
+
+    async def run_multi_sector_stress_test(self, stress_config: Dict[str, Any],
+                                           scenarios: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Monte Carlo stress test across healthcare, manufacturing, supply chain
+        and logistics. Category parameters come from stress_config or are
+        calibrated from the forecast scenarios.
+        """
+        config = dict(stress_config)
+        category_params = config.pop('category_params', None) or \
+            self.monte_carlo_engine.calibrate_from_scenarios(scenarios)
+        config.setdefault('n_samples', 10_000)
+        return await self.monte_carlo_engine.run_stress_test(category_params, **config)
 
     async def execute_risk_mitigation_nexus(self, nexus_context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -995,6 +1224,7 @@ class ResilientMultiSectorRiskMitigationNexus:
             'geopatriation_orchestration': [],
             'cyber_resilience_guarding': [],
             'inclusive_impact_tracking': [],
+            'multi_sector_stress_test': {},
             'overall_resilience_score': 0.0,
             'risk_mitigation_effectiveness': {},
             'equity_impact_assessment': {},
@@ -1010,6 +1240,12 @@ class ResilientMultiSectorRiskMitigationNexus:
             )
             nexus_results['scenario_forecasting'].append(scenario_results)
 
+            # Multi-sector Monte Carlo stress test
+            nexus_results['multi_sector_stress_test'] = await self.run_multi_sector_stress_test(
+                nexus_context.get('stress_test', {}),
+                scenario_results.get('generated_scenarios', [])
+            )
+
             # Orchestrate geopatriation
             data_flow_config = nexus_context.get('data_flow_config', {})
             geopatriation_results = await self.geopatriation_orchestrator.orchestrate_geopatriation(
@@ -1154,6 +1390,13 @@ class ResilientMultiSectorRiskMitigationNexus:
         if equity_score < 0.7:
             recommendations.append("Improve equity-focused risk mitigation approaches")
 
+        stress_test = results.get('multi_sector_stress_test', {})
+        cascade_probability = stress_test.get('joint_event_probability', {}).get('three_or_more_events', 0.0)
+        if cascade_probability > 0.05:
+            recommendations.append(
+                f"Prepare for correlated multi-sector disruptions ({cascade_probability:.0%} chance of 3+ concurrent risk events)"
+            )
+
         recommendations.extend([
             "Implement integrated risk monitoring dashboard",
             "Develop cross-sector contingency planning",
@@ -31,18 +31,34 @@ Date: December 28, 2025
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any, Union
+import csv
 import json
 import logging
 import asyncio
 import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from scipy import sparse
+    from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Suppliers counted as equitable (MSME or locally based) for equity metrics and constraints
+EQUITABLE_LOCATIONS = ('kenya', 'africa')
+
 class ProcurementStatus(Enum):
     INITIATED = "initiated"
     NEGOTIATING = "negotiating"
@@ -104,6 +120,254 @@ class NegotiationResult:
     equity_bonus: float
     timestamp: datetime = field(default_factory=datetime.now)
 
+class BatchProcurementOptimizer:
+    """
+    Vectorized request x supplier procurement for restocking rounds.
+
+    Feasibility and shortlisting are computed over the whole request x
+    supplier matrix in one pass; negotiated offers are scored with the same
+    weights as AutonomousProcurementAgents._calculate_supplier_score, and the
+    assignment maximises total score subject to:
+        - at most one supplier per request
+        - per-supplier capacity in units
+        - a minimum share of units placed with equitable (MSME/local) suppliers
+    Up to exact_pair_limit candidate pairs it is solved exactly as a 0/1
+    program (scipy HiGHS MILP). Larger rounds solve the LP relaxation, keep
+    its integral assignments and complete the rest greedily. Without scipy
+    the greedy assignment (with an equity repair pass) is used throughout.
+    """
+
+    SCORE_WEIGHTS = {
+        'price': 0.3,
+        'delivery': 0.25,
+        'quality': 0.2,
+        'equity': 0.15,
+        'reliability': 0.1
+    }
+
+    def __init__(self, candidates_per_request: int = 10, min_equity_share: float = 0.0,
+                 time_limit: float = 30.0, exact_pair_limit: int = 5000):
+        self.candidates_per_request = candidates_per_request
+        self.min_equity_share = min_equity_share
+        self.time_limit = time_limit
+        self.exact_pair_limit = exact_pair_limit
+
+    def catalog_arrays(self, suppliers: List[SupplierProfile], certifications: List[str]) -> Dict[str, np.ndarray]:
+        """Supplier catalog as column arrays (one entry per supplier)."""
+        cert_index = {cert: i for i, cert in enumerate(certifications)}
+        cert_matrix = np.zeros((len(suppliers), len(certifications)), dtype=np.float32)
+        for row, supplier in enumerate(suppliers):
+            for cert in supplier.certifications:
+                if cert in cert_index:
+                    cert_matrix[row, cert_index[cert]] = 1.0
+        return {
+            'reliability': np.array([s.reliability_score for s in suppliers], dtype=np.float64),
+            'price_competitiveness': np.array([s.price_competitiveness for s in suppliers], dtype=np.float64),
+            'delivery_speed': np.array([s.delivery_speed for s in suppliers], dtype=np.int64),
+            'quality': np.array([s.quality_rating for s in suppliers], dtype=np.float64),
+            'equity': np.array([s.equity_score for s in suppliers], dtype=np.float64),
+            'equitable': np.array([
+                s.tier == SupplierTier.LOCAL_MSME or s.location.lower() in EQUITABLE_LOCATIONS
+                for s in suppliers
+            ], dtype=bool),
+            'certifications': cert_matrix
+        }
+
+    def request_arrays(self, requests: List[ProcurementRequest], item_index: Dict[str, int],
+                       certifications: List[str], now: datetime) -> Dict[str, np.ndarray]:
+        """Requests as column arrays (one entry per request)."""
+        cert_index = {cert: i for i, cert in enumerate(certifications)}
+        required = np.zeros((len(requests), len(certifications)), dtype=np.float32)
+        for row, request in enumerate(requests):
+            for cert in request.specifications.get('required_certifications', []):
+                required[row, cert_index[cert]] = 1.0
+        return {
+            'item': np.array([item_index[r.item_type] for r in requests], dtype=np.int64),
+            'quantity': np.array([r.quantity for r in requests], dtype=np.float64),
+            'budget': np.array([r.budget_limit for r in requests], dtype=np.float64),
+            'days_left': np.array([(r.required_by - now).days for r in requests], dtype=np.int64),
+            'min_quality': np.array([r.specifications.get('min_quality_rating', 0.0) for r in requests],
+                                    dtype=np.float64),
+            'required_certifications': required
+        }
+
+    def feasibility(self, req: Dict[str, np.ndarray], cat: Dict[str, np.ndarray],
+                    coverage: np.ndarray) -> np.ndarray:
+        """
+        Boolean request x supplier matrix, same rules as _meets_basic_requirements.
+
+        Args:
+            coverage: item x supplier matrix of which supplier carries which item
+        """
+        required = req['required_certifications']
+        cert_ok = (required @ cat['certifications'].T > 0) | (required.sum(axis=1) == 0)[:, None]
+        return (
+            coverage[req['item']]
+            & cert_ok
+            & (cat['delivery_speed'][None, :] <= req['days_left'][:, None])
+            & (cat['quality'][None, :] >= req['min_quality'][:, None])
+        )
+
+    def shortlist(self, feasible: np.ndarray, cat: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Top candidates per request in _identify_supplier_candidates order
+        (equity, reliability, price competitiveness, all descending).
+
+        Returns:
+            request x k matrix of supplier indices, -1 where fewer are feasible
+        """
+        n_suppliers = feasible.shape[1]
+        k = min(self.candidates_per_request, n_suppliers)
+        if k == 0:
+            return np.full((feasible.shape[0], 0), -1, dtype=np.int64)
+
+        order = np.lexsort((-cat['price_competitiveness'], -cat['reliability'], -cat['equity']))
+        rank = np.empty(n_suppliers, dtype=np.int64)
+        rank[order] = np.arange(n_suppliers)
+
+        key = np.where(feasible, rank[None, :], n_suppliers)
+        top = np.argpartition(key, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(top, np.argsort(np.take_along_axis(key, top, axis=1), axis=1), axis=1)
+        return np.where(np.take_along_axis(key, top, axis=1) < n_suppliers, top, -1)
+
+    def score_pairs(self, pair_request: np.ndarray, pair_supplier: np.ndarray, price: np.ndarray,
+                    delivery_days: np.ndarray, equity_bonus: np.ndarray,
+                    req: Dict[str, np.ndarray], cat: Dict[str, np.ndarray]) -> np.ndarray:
+        """Weighted supplier score for every negotiated (request, supplier) pair."""
+        w = self.SCORE_WEIGHTS
+        price_ratio = price / req['budget'][pair_request]
+        price_score = np.where(price_ratio <= 1, np.maximum(0.0, 1 - price_ratio), 0.0)
+        delivery_score = np.minimum(1.0, req['days_left'][pair_request] / np.maximum(1, delivery_days))
+        return (
+            w['price'] * price_score
+            + w['delivery'] * delivery_score
+            + w['quality'] * cat['quality'][pair_supplier]
+            + w['equity'] * equity_bonus
+            + w['reliability'] * cat['reliability'][pair_supplier]
+        )
+
+    def solve(self, pair_request: np.ndarray, pair_supplier: np.ndarray, scores: np.ndarray,
+              quantity: np.ndarray, capacity: np.ndarray, equitable: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Choose at most one pair per request.
+
+        Args:
+            capacity: Units per supplier (np.inf for unlimited)
+
+        Returns:
+            (boolean mask over pairs, solver info)
+        """
+        if len(scores) == 0:
+            return np.zeros(0, dtype=bool), {'method': 'none', 'status': 'no_candidates'}
+        if not SCIPY_AVAILABLE:
+            return self._solve_greedy(pair_request, pair_supplier, scores, quantity, capacity, equitable)
+
+        A_ub, b_ub = self._constraint_matrix(pair_request, pair_supplier, quantity, capacity, equitable)
+        # Small bonus per assignment so zero-score pairs are still preferred over leaving a request open
+        objective = -(scores + 1e-6)
+        if len(scores) <= self.exact_pair_limit:
+            result = milp(objective, constraints=LinearConstraint(A_ub, ub=b_ub), integrality=np.ones(len(scores)),
+                          bounds=Bounds(0, 1), options={'time_limit': self.time_limit})
+            if result.x is not None:
+                return result.x > 0.5, {'method': 'milp', 'status': result.message, 'objective': float(-result.fun)}
+            logger.warning(f"MILP assignment failed ({result.message}); using LP relaxation")
+
+        result = linprog(objective, A_ub=A_ub, b_ub=b_ub, bounds=(0, 1), method='highs',
+                         options={'time_limit': self.time_limit})
+        solved = result.x is not None
+        fixed = result.x > 1 - 1e-6 if solved else np.zeros(len(scores), dtype=bool)
+        chosen, info = self._solve_greedy(pair_request, pair_supplier, scores, quantity, capacity, equitable,
+                                          initial=fixed)
+        info.update(method='lp_rounding', status=result.message, lp_bound=float(-result.fun) if solved else None)
+        return chosen, info
+
+    def _constraint_matrix(self, pair_request, pair_supplier, quantity, capacity, equitable):
+        """Stacked A_ub x <= b_ub rows: one per request, one per capped supplier, one for equity."""
+        n_pairs = len(pair_request)
+        columns = np.arange(n_pairs)
+        pair_units = quantity[pair_request]
+        blocks = [sparse.csr_matrix((np.ones(n_pairs), (pair_request, columns)), shape=(len(quantity), n_pairs))]
+        bounds = [np.ones(len(quantity))]
+
+        capped = np.flatnonzero(np.isfinite(capacity))
+        if capped.size:
+            row_of = np.full(len(capacity), -1)
+            row_of[capped] = np.arange(capped.size)
+            mask = row_of[pair_supplier] >= 0
+            blocks.append(sparse.csr_matrix((pair_units[mask], (row_of[pair_supplier[mask]], columns[mask])),
+                                            shape=(capped.size, n_pairs)))
+            bounds.append(capacity[capped])
+        if self.min_equity_share > 0:
+            # equitable units >= share * assigned units  <=>  sum(units * (share - equitable)) <= 0
+            weights = pair_units * (self.min_equity_share - equitable[pair_supplier].astype(np.float64))
+            blocks.append(sparse.csr_matrix(weights[None, :]))
+            bounds.append(np.zeros(1))
+        return sparse.vstack(blocks).tocsr(), np.concatenate(bounds)
+
+    def _solve_greedy(self, pair_request, pair_supplier, scores, quantity, capacity, equitable,
+                      initial: Optional[np.ndarray] = None):
+        remaining = capacity.astype(np.float64).copy()
+        chosen = np.zeros(len(scores), dtype=bool)
+        assigned_pair = np.full(len(quantity), -1)
+
+        # Pre-fixed pairs (e.g. integral LP assignments) go first, then the rest by score
+        order = np.argsort(-scores, kind='stable')
+        if initial is not None:
+            order = np.concatenate([order[initial[order]], order[~initial[order]]])
+        for pair in order:
+            r, s = pair_request[pair], pair_supplier[pair]
+            if assigned_pair[r] < 0 and remaining[s] >= quantity[r]:
+                chosen[pair] = True
+                assigned_pair[r] = pair
+                remaining[s] -= quantity[r]
+
+        if self.min_equity_share > 0:
+            self._repair_equity(pair_request, pair_supplier, scores, quantity, remaining, equitable,
+                                chosen, assigned_pair)
+        return chosen, {'method': 'greedy', 'status': 'heuristic', 'objective': float(scores[chosen].sum())}
+
+    def _repair_equity(self, pair_request, pair_supplier, scores, quantity, remaining, equitable,
+                       chosen, assigned_pair):
+        """
+        Move requests to equitable suppliers, cheapest score loss first, until
+        the share is met; if swaps are not enough, leave the lowest-scoring
+        non-equitable assignments open (the share is a hard constraint).
+        """
+        def equitable_share():
+            units = quantity[pair_request[chosen]]
+            total = units.sum()
+            return units[equitable[pair_supplier[chosen]]].sum() / total if total else 1.0
+
+        swaps = []
+        for pair in np.flatnonzero(equitable[pair_supplier] & ~chosen):
+            r = pair_request[pair]
+            current = assigned_pair[r]
+            if current >= 0 and equitable[pair_supplier[current]]:
+                continue
+            loss = (scores[current] if current >= 0 else 0.0) - scores[pair]
+            swaps.append((loss, pair))
+
+        for _loss, pair in sorted(swaps):
+            if equitable_share() >= self.min_equity_share:
+                break
+            r, s = pair_request[pair], pair_supplier[pair]
+            current = assigned_pair[r]
+            if (current >= 0 and equitable[pair_supplier[current]]) or remaining[s] < quantity[r]:
+                continue
+            if current >= 0:
+                chosen[current] = False
+                remaining[pair_supplier[current]] += quantity[r]
+            chosen[pair] = True
+            assigned_pair[r] = pair
+            remaining[s] -= quantity[r]
+
+        for pair in sorted(np.flatnonzero(chosen & ~equitable[pair_supplier]), key=lambda p: scores[p]):
+            if equitable_share() >= self.min_equity_share:
+                break
+            chosen[pair] = False
+            assigned_pair[pair_request[pair]] = -1
+            remaining[pair_supplier[pair]] += quantity[pair_request[pair]]
+
 class AutonomousProcurementAgents:
     """
     Self-negotiating agents that compare suppliers, execute orders, and optimize
@@ -117,6 +381,157 @@ class AutonomousProcurementAgents:
         self.edge_integrator = EdgeNodeIntegrator()
         self.performance_tracker = PerformanceTracker()
 
+        # supplier_id -> profile-dependent part of the supplier score; dropped on catalog changes
+        self._profile_score_cache: Dict[str, float] = {}
+        self.supplier_database.subscribe(self._on_supplier_change)
+
+    def _on_supplier_change(self, event: str, supplier_ids: List[str]):
+        for supplier_id in supplier_ids:
+            self._profile_score_cache.pop(supplier_id, None)
+
+    async def execute_procurement_batch(self,
+                                        requests: List[ProcurementRequest],
+                                        catalog: Optional[Dict[str, List[SupplierProfile]]] = None,
+                                        capacities: Optional[Dict[str, float]] = None,
+                                        min_equity_share: float = 0.0,
+                                        candidates_per_request: int = 10,
+                                        max_concurrent_negotiations: int = 64) -> Dict[str, Any]:
+        """
+        Execute a procurement round for many requests at once
+
+        Args:
+            requests: Procurement requests (hundreds to thousands of SKUs)
+            catalog: item_type -> suppliers carrying it (default: supplier database)
+            capacities: supplier_id -> units available this round (default: unlimited)
+            min_equity_share: Minimum share of units placed with MSME/local suppliers
+            candidates_per_request: Suppliers negotiated with per request
+            max_concurrent_negotiations: Bound on in-flight negotiations
+
+        Returns:
+            Batch results with one entry per request (input order) and round metrics
+        """
+        started = time.perf_counter()
+        now = datetime.now()
+        logger.info(f"Executing batch procurement for {len(requests)} requests")
+
+        # 1. Supplier catalog as arrays
+        item_types = sorted({r.item_type for r in requests})
+        if catalog is None:
+            fetched = await asyncio.gather(*(self.supplier_database.get_suppliers_by_item(i) for i in item_types))
+            catalog = dict(zip(item_types, fetched))
+        suppliers: List[SupplierProfile] = []
+        supplier_index: Dict[str, int] = {}
+        for item_type in item_types:
+            for supplier in catalog.get(item_type, []):
+                if supplier.supplier_id not in supplier_index:
+                    supplier_index[supplier.supplier_id] = len(suppliers)
+                    suppliers.append(supplier)
+        item_index = {item_type: i for i, item_type in enumerate(item_types)}
+        coverage = np.zeros((len(item_types), len(suppliers)), dtype=bool)
+        for item_type in item_types:
+            for supplier in catalog.get(item_type, []):
+                coverage[item_index[item_type], supplier_index[supplier.supplier_id]] = True
+
+        certifications = sorted({c for s in suppliers for c in s.certifications}
+                                | {c for r in requests for c in r.specifications.get('required_certifications', [])})
+        optimizer = BatchProcurementOptimizer(candidates_per_request, min_equity_share)
+        cat = optimizer.catalog_arrays(suppliers, certifications)
+        req = optimizer.request_arrays(requests, item_index, certifications, now)
+
+        # 2. Feasibility and shortlist in one vectorized pass
+        feasible = optimizer.feasibility(req, cat, coverage)
+        shortlist = optimizer.shortlist(feasible, cat)
+        prepared = time.perf_counter()
+
+        # 3. Concurrent negotiations over all shortlisted pairs
+        pair_request, pair_supplier = np.nonzero(shortlist >= 0)
+        pair_supplier = shortlist[pair_request, pair_supplier]
+        semaphore = asyncio.Semaphore(max_concurrent_negotiations)
+
+        async def negotiate(r: int, s: int):
+            async with semaphore:
+                return await self.negotiation_engine.negotiate_with_supplier(requests[r], suppliers[s])
+
+        outcomes = await asyncio.gather(*(negotiate(r, s) for r, s in zip(pair_request, pair_supplier)),
+                                        return_exceptions=True)
+        ok = np.array([isinstance(o, NegotiationResult) for o in outcomes], dtype=bool)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.warning(f"Negotiation failed: {outcome}")
+        negotiations = [o for o in outcomes if isinstance(o, NegotiationResult)]
+        pair_request, pair_supplier = pair_request[ok], pair_supplier[ok]
+        negotiated = time.perf_counter()
+
+        # 4. Score matrix and assignment under capacity/equity constraints
+        now_ts = now.timestamp()
+        price = np.array([n.final_price for n in negotiations], dtype=np.float64)
+        delivery_days = np.floor((np.array([n.delivery_date.timestamp() for n in negotiations]) - now_ts) / 86400)
+        equity_bonus = np.array([n.equity_bonus for n in negotiations], dtype=np.float64)
+        scores = optimizer.score_pairs(pair_request, pair_supplier, price, delivery_days, equity_bonus, req, cat)
+
+        capacity = np.full(len(suppliers), np.inf)
+        for supplier_id, units in (capacities or {}).items():
+            if supplier_id in supplier_index:
+                capacity[supplier_index[supplier_id]] = units
+        chosen, solver_info = optimizer.solve(pair_request, pair_supplier, scores, req['quantity'],
+                                              capacity, cat['equitable'])
+        solved = time.perf_counter()
+
+        # 5. Execute orders and track performance for assigned requests
+        selected: Dict[int, int] = {int(pair_request[p]): int(p) for p in np.flatnonzero(chosen)}
+        order_requests = sorted(selected)
+        orders = await asyncio.gather(*(
+            self.order_executor.execute_order(requests[r], negotiations[selected[r]]) for r in order_requests
+        ))
+        order_by_request = dict(zip(order_requests, orders))
+
+        candidates_by_request: Dict[int, List[str]] = {}
+        for r, s in zip(pair_request, pair_supplier):
+            candidates_by_request.setdefault(int(r), []).append(suppliers[s].supplier_id)
+
+        results = []
+        for r, request in enumerate(requests):
+            pair = selected.get(r)
+            result = {
+                'request_id': request.request_id,
+                'supplier_candidates': candidates_by_request.get(r, []),
+                'selected_supplier': negotiations[pair] if pair is not None else None,
+                'score': round(float(scores[pair]), 4) if pair is not None else None,
+                'order_status': order_by_request.get(r)
+            }
+            result['performance_metrics'] = await self.performance_tracker.track_performance(request, result)
+            results.append(result)
+
+        units = req['quantity'][pair_request[chosen]]
+        supplier_units = np.bincount(pair_supplier[chosen], weights=units, minlength=len(suppliers))
+        equitable_units = float(units[cat['equitable'][pair_supplier[chosen]]].sum())
+        return {
+            'batch_id': f"batch_{uuid.uuid4().hex[:12]}",
+            'execution_timestamp': now,
+            'request_count': len(requests),
+            'assigned_count': len(selected),
+            'unassigned_requests': [requests[r].request_id for r in range(len(requests)) if r not in selected],
+            'results': results,
+            'supplier_utilisation': {
+                suppliers[s].supplier_id: float(supplier_units[s]) for s in np.flatnonzero(supplier_units)
+            },
+            'equity_metrics': {
+                'equitable_unit_share': equitable_units / units.sum() if units.size and units.sum() else 0.0,
+                'min_equity_share': min_equity_share,
+                'feasible_pairs': int(feasible.sum()),
+                'negotiated_pairs': len(negotiations)
+            },
+            'total_cost': float(price[chosen].sum()),
+            'solver': solver_info,
+            'timings_s': {
+                'prepare': round(prepared - started, 4),
+                'negotiate': round(negotiated - prepared, 4),
+                'solve': round(solved - negotiated, 4),
+                'total': round(time.perf_counter() - started, 4)
+            },
+            'offline_capable': self.edge_integrator.is_offline_available()
+        }
+
     async def execute_procurement(self, request: ProcurementRequest) -> Dict[str, Any]:
         """
         Execute autonomous procurement for a medical supply request
@@ -179,22 +594,15 @@ class AutonomousProcurementAgents:
 
     async def _identify_supplier_candidates(self, request: ProcurementRequest) -> List[SupplierProfile]:
         """Identify suitable supplier candidates for the request"""
-        all_suppliers = await self.supplier_database.get_suppliers_by_item(request.item_type)
-
-        # Filter by basic requirements
-        candidates = []
-        for supplier in all_suppliers:
-            if self._meets_basic_requirements(supplier, request):
-                candidates.append(supplier)
-
-        # Prioritize equity (MSMEs, local suppliers)
-        candidates.sort(key=lambda x: (
-            x.equity_score,  # Higher equity score first
-            x.reliability_score,
-            x.price_competitiveness
-        ), reverse=True)
-
-        return candidates[:10]  # Return top 10 candidates
+        # Indexed lookup: basic requirements (see _meets_basic_requirements) applied over the
+        # item's suppliers, already ordered by equity, reliability and price competitiveness
+        return self.supplier_database.find_candidates(
+            request.item_type,
+            max_delivery_days=(request.required_by - datetime.now()).days,
+            min_quality=request.specifications.get('min_quality_rating', 0.0),
+            required_certifications=request.specifications.get('required_certifications', []),
+            limit=10  # Return top 10 candidates
+        )
 
     def _meets_basic_requirements(self, supplier: SupplierProfile, request: ProcurementRequest) -> bool:
         """Check if supplier meets basic procurement requirements"""
@@ -244,9 +652,10 @@ class AutonomousProcurementAgents:
             return None
 
         # Score each negotiation result
+        now = datetime.now()
         scored_results = []
         for result in negotiation_results:
-            score = self._calculate_supplier_score(result, request)
+            score = self._calculate_supplier_score(result, request, now)
             scored_results.append((result, score))
 
         # Sort by score (higher is better)
@@ -256,10 +665,9 @@ class AutonomousProcurementAgents:
         return scored_results[0][0] if scored_results else None
 
     def _calculate_supplier_score(self, negotiation: NegotiationResult,
-                                request: ProcurementRequest) -> float:
+                                request: ProcurementRequest, now: Optional[datetime] = None) -> float:
         """Calculate comprehensive score for supplier selection"""
-        # Get supplier profile
-        supplier = self.supplier_database.get_supplier_by_id(negotiation.supplier_id)
+        now = now or datetime.now()
 
         # Base scoring weights
         weights = {
@@ -275,13 +683,18 @@ class AutonomousProcurementAgents:
         price_score = max(0, 1 - price_ratio) if price_ratio <= 1 else 0
 
         # Delivery score (earlier delivery is better)
-        delivery_days = (negotiation.delivery_date - datetime.now()).days
-        required_days = (request.required_by - datetime.now()).days
+        delivery_days = (negotiation.delivery_date - now).days
+        required_days = (request.required_by - now).days
         delivery_score = min(1.0, required_days / max(1, delivery_days))
 
-        # Quality and reliability scores
-        quality_score = supplier.quality_rating if supplier else 0.5
-        reliability_score = supplier.reliability_score if supplier else 0.5
+        # Quality and reliability scores (profile-dependent, cached per supplier)
+        profile_score = self._profile_score_cache.get(negotiation.supplier_id)
+        if profile_score is None:
+            supplier = self.supplier_database.get_supplier_by_id(negotiation.supplier_id)
+            quality_score = supplier.quality_rating if supplier else 0.5
+            reliability_score = supplier.reliability_score if supplier else 0.5
+            profile_score = weights['quality'] * quality_score + weights['reliability'] * reliability_score
+            self._profile_score_cache[negotiation.supplier_id] = profile_score
 
         # Equity score (prioritize MSMEs and local suppliers)
         equity_score = negotiation.equity_bonus
@@ -290,9 +703,8 @@ class AutonomousProcurementAgents:
         total_score = (
             weights['price'] * price_score +
             weights['delivery'] * delivery_score +
-            weights['quality'] * quality_score +
-            weights['equity'] * equity_score +
-            weights['reliability'] * reliability_score
+            profile_score +
+            weights['equity'] * equity_score
         )
 
         return total_score
@@ -704,24 +1116,210 @@ class EquityEnforcer:
 # Supporting classes (simplified implementations)
 
 class SupplierDatabase:
-    async def get_suppliers_by_item(self, item_type: str) -> List[SupplierProfile]:
-        return [
-            SupplierProfile(
-                supplier_id="sup_001",
-                name="Kenya Pharma MSME",
-                tier=SupplierTier.LOCAL_MSME,
-                location="Kenya",
-                reliability_score=0.85,
-                price_competitiveness=0.75,
-                delivery_speed=7,
-                quality_rating=0.8,
-                equity_score=0.9,
-                certifications=["GMP", "WHO-PQ"]
-            )
-        ]
+    """
+    Local supplier catalog.
+
+    SQLite is the source of truth (indexed by item type, tier, location and
+    certification). Candidate identification runs against an in-process
+    columnar index (numpy arrays, rows per item pre-sorted in candidate
+    order) that is rebuilt lazily after changes; profile lookups go through
+    a read-through LRU cache. Subscribers are notified of every change so
+    derived caches (e.g. supplier scores) can be invalidated.
+
+    Suppliers registered for item type "*" supply every item.
+    """
+
+    WILDCARD_ITEM = "*"
+
+    def __init__(self, db_path: str = ":memory:", cache_size: int = 4096, seed_defaults: bool = True):
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS suppliers (
+                    supplier_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    tier TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    reliability_score REAL NOT NULL,
+                    price_competitiveness REAL NOT NULL,
+                    delivery_speed INTEGER NOT NULL,
+                    quality_rating REAL NOT NULL,
+                    equity_score REAL NOT NULL,
+                    certifications TEXT NOT NULL,
+                    last_updated TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS supplier_items (
+                    item_type TEXT NOT NULL,
+                    supplier_id TEXT NOT NULL REFERENCES suppliers(supplier_id) ON DELETE CASCADE,
+                    PRIMARY KEY (item_type, supplier_id)
+                );
+                CREATE TABLE IF NOT EXISTS supplier_certifications (
+                    certification TEXT NOT NULL,
+                    supplier_id TEXT NOT NULL REFERENCES suppliers(supplier_id) ON DELETE CASCADE,
+                    PRIMARY KEY (certification, supplier_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_suppliers_tier ON suppliers (tier);
+                CREATE INDEX IF NOT EXISTS idx_suppliers_location ON suppliers (location COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_supplier_items_supplier ON supplier_items (supplier_id);
+                CREATE INDEX IF NOT EXISTS idx_supplier_certifications_supplier ON supplier_certifications (supplier_id);
+            """)
+        self.cache_size = cache_size
+        self._profile_cache: "OrderedDict[str, SupplierProfile]" = OrderedDict()
+        self._columns: Optional[Dict[str, Any]] = None
+        self._subscribers: List[Callable[[str, List[str]], None]] = []
+        self.cache_stats = {'hits': 0, 'misses': 0}
+
+        if seed_defaults and self.count() == 0:
+            self.upsert_suppliers([(
+                SupplierProfile(
+                    supplier_id="sup_001",
+                    name="Kenya Pharma MSME",
+                    tier=SupplierTier.LOCAL_MSME,
+                    location="Kenya",
+                    reliability_score=0.85,
+                    price_competitiveness=0.75,
+                    delivery_speed=7,
+                    quality_rating=0.8,
+                    equity_score=0.9,
+                    certifications=["GMP", "WHO-PQ"]
+                ),
+                [self.WILDCARD_ITEM]
+            )])
+
+    # ------------------------------------------------------------------
+    # Change notifications
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[str, List[str]], None]):
+        """Register callback(event, supplier_ids); event is "upsert" or "delete"."""
+        self._subscribers.append(callback)
+
+    def _changed(self, event: str, supplier_ids: List[str]):
+        with self._lock:
+            self._columns = None
+            for supplier_id in supplier_ids:
+                self._profile_cache.pop(supplier_id, None)
+        for callback in list(self._subscribers):
+            try:
+                callback(event, supplier_ids)
+            except Exception as e:
+                logger.warning(f"Supplier change subscriber failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert_suppliers(self, entries: Iterable[Tuple[SupplierProfile, Iterable[str]]]) -> int:
+        """Insert or replace suppliers with the item types they carry, in one transaction."""
+        supplier_rows, item_rows, cert_rows = [], [], []
+        for profile, items in entries:
+            supplier_rows.append((
+                profile.supplier_id, profile.name, profile.tier.value, profile.location,
+                profile.reliability_score, profile.price_competitiveness, profile.delivery_speed,
+                profile.quality_rating, profile.equity_score, json.dumps(profile.certifications),
+                profile.last_updated.isoformat()
+            ))
+            item_rows += [(item_type, profile.supplier_id) for item_type in items]
+            cert_rows += [(cert, profile.supplier_id) for cert in profile.certifications]
+        supplier_ids = [row[0] for row in supplier_rows]
+
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM supplier_items WHERE supplier_id = ?", [(i,) for i in supplier_ids])
+            self._conn.executemany("DELETE FROM supplier_certifications WHERE supplier_id = ?",
+                                   [(i,) for i in supplier_ids])
+            self._conn.executemany("INSERT OR REPLACE INTO suppliers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   supplier_rows)
+            self._conn.executemany("INSERT OR IGNORE INTO supplier_items VALUES (?, ?)", item_rows)
+            self._conn.executemany("INSERT OR IGNORE INTO supplier_certifications VALUES (?, ?)", cert_rows)
+        self._changed("upsert", supplier_ids)
+        return len(supplier_ids)
+
+    def delete_suppliers(self, supplier_ids: List[str]) -> int:
+        params = [(i,) for i in supplier_ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM supplier_items WHERE supplier_id = ?", params)
+            self._conn.executemany("DELETE FROM supplier_certifications WHERE supplier_id = ?", params)
+            deleted = self._conn.executemany("DELETE FROM suppliers WHERE supplier_id = ?", params).rowcount
+        self._changed("delete", list(supplier_ids))
+        return deleted
+
+    async def bulk_import(self, path: str, batch_size: int = 5000) -> int:
+        """
+        Import suppliers from CSV or JSON without blocking the event loop.
+
+        CSV columns: supplier_id, name, tier, location, reliability_score,
+        price_competitiveness, delivery_speed, quality_rating, equity_score,
+        certifications and items (both ';'-separated). JSON: a list of
+        objects with the same keys (certifications/items as lists).
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self._import_file, path, batch_size)
+
+    def _import_file(self, path: str, batch_size: int) -> int:
+        imported = 0
+        batch: List[Tuple[SupplierProfile, List[str]]] = []
+        with open(path, newline='', encoding='utf-8') as f:
+            records = json.load(f) if path.lower().endswith('.json') else csv.DictReader(f)
+            for record in records:
+                batch.append(self._entry_from_record(record))
+                if len(batch) >= batch_size:
+                    imported += self.upsert_suppliers(batch)
+                    batch = []
+        if batch:
+            imported += self.upsert_suppliers(batch)
+        logger.info(f"Imported {imported} suppliers from {path}")
+        return imported
+
+    @staticmethod
+    def _entry_from_record(record: Dict[str, Any]) -> Tuple[SupplierProfile, List[str]]:
+        def as_list(value) -> List[str]:
+            if isinstance(value, list):
+                return value
+            return [v.strip() for v in (value or '').split(';') if v.strip()]
+
+        profile = SupplierProfile(
+            supplier_id=str(record['supplier_id']),
+            name=record['name'],
+            tier=SupplierTier(record['tier']),
+            location=record['location'],
+            reliability_score=float(record['reliability_score']),
+            price_competitiveness=float(record['price_competitiveness']),
+            delivery_speed=int(record['delivery_speed']),
+            quality_rating=float(record['quality_rating']),
+            equity_score=float(record['equity_score']),
+            certifications=as_list(record.get('certifications'))
+        )
+        return profile, as_list(record.get('items'))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM suppliers").fetchone()[0]
 
     def get_supplier_by_id(self, supplier_id: str) -> Optional[SupplierProfile]:
-        # Mock implementation
+        """Read-through LRU lookup; ids not in the catalog get the placeholder profile (not cached)."""
+        with self._lock:
+            profile = self._profile_cache.get(supplier_id)
+            if profile is not None:
+                self._profile_cache.move_to_end(supplier_id)
+                self.cache_stats['hits'] += 1
+                return profile
+            self.cache_stats['misses'] += 1
+            row = self._conn.execute("SELECT * FROM suppliers WHERE supplier_id = ?", (supplier_id,)).fetchone()
+            if row is None:
+                return self._placeholder_profile(supplier_id)
+            profile = self._profile_from_row(row)
+            self._profile_cache[supplier_id] = profile
+            if len(self._profile_cache) > self.cache_size:
+                self._profile_cache.popitem(last=False)
+            return profile
+
+    @staticmethod
+    def _placeholder_profile(supplier_id: str) -> SupplierProfile:
+        # Mock profile for suppliers known to negotiation but not (yet) to the catalog
         return SupplierProfile(
             supplier_id=supplier_id,
             name="Mock Supplier",
@@ -734,6 +1332,124 @@ class SupplierDatabase:
             equity_score=0.6
         )
 
+    @staticmethod
+    def _profile_from_row(row: Tuple) -> SupplierProfile:
+        return SupplierProfile(
+            supplier_id=row[0],
+            name=row[1],
+            tier=SupplierTier(row[2]),
+            location=row[3],
+            reliability_score=row[4],
+            price_competitiveness=row[5],
+            delivery_speed=row[6],
+            quality_rating=row[7],
+            equity_score=row[8],
+            certifications=json.loads(row[9]),
+            last_updated=datetime.fromisoformat(row[10])
+        )
+
+    def query(self, item_type: Optional[str] = None, tier: Optional[SupplierTier] = None,
+              location: Optional[str] = None, certification: Optional[str] = None) -> List[SupplierProfile]:
+        """Ad-hoc catalog query served by the SQLite indexes."""
+        sql = "SELECT s.* FROM suppliers s"
+        clauses, params = [], []
+        if item_type is not None:
+            sql += " JOIN supplier_items i ON i.supplier_id = s.supplier_id"
+            clauses.append("i.item_type IN (?, ?)")
+            params += [item_type, self.WILDCARD_ITEM]
+        if certification is not None:
+            sql += " JOIN supplier_certifications c ON c.supplier_id = s.supplier_id"
+            clauses.append("c.certification = ?")
+            params.append(certification)
+        if tier is not None:
+            clauses.append("s.tier = ?")
+            params.append(tier.value)
+        if location is not None:
+            clauses.append("s.location = ? COLLATE NOCASE")
+            params.append(location)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._conn.execute(sql + " GROUP BY s.supplier_id ORDER BY s.rowid", params).fetchall()
+        return [self._profile_from_row(row) for row in rows]
+
+    def _columnar_index(self) -> Dict[str, Any]:
+        """Columnar view of the catalog, rebuilt after changes."""
+        with self._lock:
+            if self._columns is not None:
+                return self._columns
+            rows = self._conn.execute(
+                "SELECT supplier_id, reliability_score, price_competitiveness, delivery_speed, quality_rating, "
+                "equity_score FROM suppliers ORDER BY rowid"
+            ).fetchall()
+            ids = [row[0] for row in rows]
+            row_of = {supplier_id: i for i, supplier_id in enumerate(ids)}
+            reliability = np.array([row[1] for row in rows], dtype=np.float64)
+            price = np.array([row[2] for row in rows], dtype=np.float64)
+            equity = np.array([row[5] for row in rows], dtype=np.float64)
+
+            cert_pairs = self._conn.execute("SELECT certification, supplier_id FROM supplier_certifications").fetchall()
+            cert_index = {cert: i for i, cert in enumerate(sorted({cert for cert, _ in cert_pairs}))}
+            certs = np.zeros((len(ids), len(cert_index)), dtype=bool)
+            for cert, supplier_id in cert_pairs:
+                certs[row_of[supplier_id], cert_index[cert]] = True
+
+            # Candidate order of _identify_supplier_candidates: equity, reliability, price (descending)
+            rank = np.empty(len(ids), dtype=np.int64)
+            rank[np.lexsort((-price, -reliability, -equity))] = np.arange(len(ids))
+            members: Dict[str, List[int]] = {}
+            for item_type, supplier_id in self._conn.execute("SELECT item_type, supplier_id FROM supplier_items"):
+                members.setdefault(item_type, []).append(row_of[supplier_id])
+            wildcard = members.pop(self.WILDCARD_ITEM, [])
+            by_item = {}
+            for item_type, item_rows in members.items():
+                item_rows = np.unique(np.array(item_rows + wildcard, dtype=np.int64))
+                by_item[item_type] = item_rows[np.argsort(rank[item_rows], kind='stable')]
+            wildcard_rows = np.array(wildcard, dtype=np.int64)
+
+            self._columns = {
+                'ids': ids,
+                'delivery_speed': np.array([row[3] for row in rows], dtype=np.int64),
+                'quality': np.array([row[4] for row in rows], dtype=np.float64),
+                'cert_index': cert_index,
+                'certs': certs,
+                'by_item': by_item,
+                'wildcard': wildcard_rows[np.argsort(rank[wildcard_rows], kind='stable')]
+            }
+            return self._columns
+
+    def _item_rows(self, columns: Dict[str, Any], item_type: str) -> np.ndarray:
+        rows = columns['by_item'].get(item_type)
+        return rows if rows is not None else columns['wildcard']
+
+    def find_candidates(self, item_type: str, max_delivery_days: int, min_quality: float = 0.0,
+                        required_certifications: Optional[List[str]] = None,
+                        limit: int = 10) -> List[SupplierProfile]:
+        """
+        Top suppliers for an item that meet delivery, quality and (any-of)
+        certification requirements, in candidate order. Vectorized over the
+        item's suppliers; profiles come from the LRU cache.
+        """
+        columns = self._columnar_index()
+        rows = self._item_rows(columns, item_type)
+        mask = (columns['delivery_speed'][rows] <= max_delivery_days) & (columns['quality'][rows] >= min_quality)
+        if required_certifications:
+            cert_cols = [columns['cert_index'][c] for c in required_certifications if c in columns['cert_index']]
+            if not cert_cols:
+                return []
+            mask &= columns['certs'][np.ix_(rows, cert_cols)].any(axis=1)
+        selected = rows[mask][:limit]
+        return [self.get_supplier_by_id(columns['ids'][row]) for row in selected]
+
+    async def get_suppliers_by_item(self, item_type: str) -> List[SupplierProfile]:
+        """All suppliers carrying an item, in candidate order."""
+        columns = self._columnar_index()
+        return [self.get_supplier_by_id(columns['ids'][row]) for row in self._item_rows(columns, item_type)]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 class NegotiationEngine:
     async def negotiate_with_supplier(self, request: ProcurementRequest,
                                     supplier: SupplierProfile) -> NegotiationResult:
@@ -869,10 +1585,20 @@ class AgenticSupplyChainAutonomyEngine:
         try:
             # Handle procurement requests
             procurement_requests = operation_context.get('procurement_requests', [])
-            for request_data in procurement_requests:
-                request = ProcurementRequest(**request_data)
-                procurement_result = await self.procurement_agents.execute_procurement(request)
-                autonomy_results['procurement_operations'].append(procurement_result)
+            if operation_context.get('batch_procurement') and procurement_requests:
+                # Restocking round: one joint assignment across all requests
+                batch = await self.procurement_agents.execute_procurement_batch(
+                    [ProcurementRequest(**request_data) for request_data in procurement_requests],
+                    capacities=operation_context.get('supplier_capacities'),
+                    min_equity_share=operation_context.get('min_equity_share', 0.0)
+                )
+                autonomy_results['batch_procurement'] = {k: v for k, v in batch.items() if k != 'results'}
+                autonomy_results['procurement_operations'] = batch['results']
+            else:
+                for request_data in procurement_requests:
+                    request = ProcurementRequest(**request_data)
+                    procurement_result = await self.procurement_agents.execute_procurement(request)
+                    autonomy_results['procurement_operations'].append(procurement_result)
 
             # Anticipate disruptions
             supply_chain_context = operation_context.get('supply_chain_context', {})
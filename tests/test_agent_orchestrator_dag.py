@@ -0,0 +1,152 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+Tests for the agent execution planner and parallel AgentOrchestrator analysis
+"""
+
+import io
+import os
+import random
+import time
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+import edge_node.ai_agents.agent_orchestrator as agent_orchestrator
+from edge_node.ai_agents import AgentOrchestrator, AgentTask, CaseFrame, ExecutionPlanner, PlanError
+from edge_node.ai_agents.execution_planner import _process_context
+
+
+def _column_sum(frame):
+    return sum(frame["values"])
+
+
+def _sleep_forever(_):
+    time.sleep(60)
+
+
+def _worker_pid(_):
+    return os.getpid()
+
+
+def _divide_by_zero(_):
+    return 1 / 0
+
+
+def make_cases(n, seed=7):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    cases = []
+    for _ in range(n):
+        record = {
+            "lat": rng.gauss(-1.28, 0.02),
+            "lon": rng.gauss(36.8, 0.02),
+            "timestamp": (now - timedelta(days=rng.randint(0, 20))).isoformat(),
+            "cases": rng.randint(1, 5),
+        }
+        roll = rng.random()
+        if roll < 0.4:
+            record["disease"] = "Cholera"
+        elif roll < 0.7:
+            record["symptom"] = "fever and chills"
+        elif roll < 0.9:
+            record["diagnosis"] = "malaria"
+        else:
+            record["symptom"] = "diarrhea"
+        cases.append(record)
+    return cases
+
+
+class TestExecutionPlanner(unittest.TestCase):
+
+    def test_order_follows_declared_inputs(self):
+        planner = ExecutionPlanner()
+        planner.add(AgentTask("report", lambda a, b: a + b, inputs=("left", "right")))
+        planner.add(AgentTask("left", lambda frame: frame * 2, inputs=("frame",)))
+        planner.add(AgentTask("right", lambda frame: frame + 1, inputs=("frame",)))
+        self.assertEqual(planner.order({"frame"}), ["left", "right", "report"])
+        self.assertEqual(planner.run({"frame": 3}).values["report"], 10)
+
+        with self.assertRaises(PlanError):
+            planner.order()  # "frame" has no producer
+        planner.add(AgentTask("loop", lambda x: x, inputs=("loop",)))
+        with self.assertRaises(PlanError):
+            planner.order({"frame"})
+
+    def test_deadline_returns_partial_result(self):
+        planner = ExecutionPlanner()
+        planner.add(AgentTask("slow", lambda: time.sleep(2) or "late", deadline=0.2))
+        planner.add(AgentTask("after_slow", lambda value: value, inputs=("slow",)))
+        planner.add(AgentTask("stuck", _sleep_forever, inputs=("frame",), cpu_bound=True, deadline=0.2))
+        planner.add(AgentTask("fast", lambda frame: len(frame), inputs=("frame",)))
+
+        result = planner.run({"frame": [1, 2, 3]})
+        self.assertLess(result.wall_seconds, 1.5)
+        self.assertTrue(result.partial)
+        self.assertEqual(result.values, {"fast": 3})
+        statuses = {name: outcome.status for name, outcome in result.outcomes.items()}
+        self.assertEqual(statuses, {"slow": "timed_out", "after_slow": "skipped",
+                                    "stuck": "timed_out", "fast": "completed"})
+
+    def test_cpu_task_runs_in_worker_process(self):
+        planner = ExecutionPlanner()
+        planner.add(AgentTask("pid", _worker_pid, inputs=("frame",), cpu_bound=True))
+        planner.add(AgentTask("total", _column_sum, inputs=("frame",), cpu_bound=True))
+        planner.add(AgentTask("broken", _divide_by_zero, inputs=("frame",), cpu_bound=True))
+        planner.add(AgentTask("after_broken", lambda value: value, inputs=("broken",)))
+
+        result = planner.run({"frame": {"values": list(range(100000))}})
+        self.assertNotEqual(result.values["pid"], os.getpid())
+        self.assertEqual(result.values["total"], sum(range(100000)))
+        self.assertTrue(result.outcomes["total"].isolated)
+        self.assertEqual(result.outcomes["broken"].status, "failed")
+        self.assertIn("ZeroDivisionError", result.outcomes["broken"].error)
+        self.assertEqual(result.outcomes["after_broken"].status, "skipped")
+
+    def test_workers_are_not_forked_from_threaded_parent(self):
+        self.assertIn(_process_context().get_start_method(), ("forkserver", "spawn"))
+
+
+class TestParallelAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.orchestrator = AgentOrchestrator("Nairobi", enable_compliance_checking=False)
+        self.orchestrator.ingest_case_data(make_cases(2000))
+
+    def test_frame_selection_matches_record_scan(self):
+        frame = CaseFrame(self.orchestrator.case_data_buffer)
+        for disease in ("cholera", "malaria", "measles"):
+            expected = [
+                record for record in self.orchestrator.case_data_buffer
+                if self.orchestrator._matches_disease(record, disease)
+            ]
+            selected = frame.select(lambda record: self.orchestrator._matches_disease(record, disease))
+            self.assertEqual(selected, expected)
+
+    def test_parallel_matches_serial(self):
+        with redirect_stdout(io.StringIO()):
+            serial = self.orchestrator.run_full_analysis(diseases=["cholera", "malaria"], parallel=False)
+            parallel = self.orchestrator.run_full_analysis(diseases=["cholera", "malaria"])
+
+        self.assertEqual(parallel.summary, serial.summary)
+        self.assertEqual(
+            [f.estimated_r0 for f in parallel.forecasts], [f.estimated_r0 for f in serial.forecasts]
+        )
+        execution = parallel.metadata["execution"]
+        self.assertFalse(execution["partial"])
+        # The frame is not pickled to a worker; the analysis lands in the agent's own history
+        self.assertFalse(execution["tasks"]["spatial_analysis"]["isolated"])
+        self.assertEqual(len(self.orchestrator.spatial_agent.analysis_history), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
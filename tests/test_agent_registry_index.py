@@ -0,0 +1,111 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for AgentRegistry inverted indexes, least-loaded routing and snapshot/restore
+"""
+
+import io
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from edge_node.ai_agents import AgentCapability, AgentRegistry, AgentStatus, FederatedLearningClient, OfflineAgent
+
+CAPABILITIES = list(AgentCapability)
+STATUSES = list(AgentStatus)
+
+
+def make_agent(rng, i):
+    cls = FederatedLearningClient if i % 5 == 0 else OfflineAgent
+    return cls(
+        name=f"Agent {i}",
+        capabilities=rng.sample(CAPABILITIES, rng.randint(1, 4)),
+        tags=rng.sample(["health", "remote", "dadaab", "kakuma", "lab"], 2),
+    )
+
+
+class TestIndexedRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.registry = AgentRegistry()
+        with redirect_stdout(io.StringIO()):
+            self.agents = [make_agent(self.rng, i) for i in range(120)]
+            for agent in self.agents:
+                self.registry.register(agent)
+
+    def test_indexes_match_linear_scan_through_churn(self):
+        with redirect_stdout(io.StringIO()):
+            for agent in self.rng.sample(self.agents, 40):
+                agent.set_status(self.rng.choice(STATUSES))
+            for agent in self.agents[:15]:
+                self.registry.unregister(agent.metadata.agent_id)
+            self.agents[20].status = AgentStatus.ERROR
+        live = list(self.registry.agents.values())
+        wanted = [AgentCapability.OFFLINE_OPERATION, AgentCapability.DATA_SYNC]
+        self.assertEqual(self.registry.search_by_capabilities(wanted),
+                         [a for a in live if set(wanted) <= set(a.get_capabilities())])
+        self.assertEqual(self.registry.search_by_capabilities(wanted, match_all=False),
+                         [a for a in live if set(wanted) & set(a.get_capabilities())])
+        self.assertEqual(self.registry.search_by_tags(["dadaab", "lab"], match_all=True),
+                         [a for a in live if {"dadaab", "lab"} <= set(a.metadata.tags)])
+        for status in STATUSES:
+            self.assertEqual(self.registry.search_by_status(status), [a for a in live if a.status == status])
+        self.assertEqual(self.registry.search_by_type(FederatedLearningClient),
+                         [a for a in live if type(a) is FederatedLearningClient])
+        self.assertEqual(
+            self.registry.advanced_search(capabilities=wanted, tags=["remote"], status=AgentStatus.OFFLINE),
+            [a for a in live if set(wanted) <= set(a.get_capabilities())
+             and "remote" in a.metadata.tags and a.status == AgentStatus.OFFLINE])
+        self.assertEqual(sum(self.registry.get_status_distribution().values()), len(live))
+
+    def test_least_loaded_routing(self):
+        capable = self.registry.search_by_capabilities([AgentCapability.MODEL_UPDATE])
+        for load, agent in enumerate(capable):
+            self.registry.report_load(agent.metadata.agent_id, 10 + load)
+        self.registry.report_load(capable[-1].metadata.agent_id, 0)
+        chosen = self.registry.select_least_loaded([AgentCapability.MODEL_UPDATE])
+        self.assertIs(chosen, capable[-1])
+        self.assertEqual(self.registry.loads[chosen.metadata.agent_id], 1)
+
+        with redirect_stdout(io.StringIO()):
+            capable[0].set_status(AgentStatus.ONLINE)
+            self.registry.unregister(capable[-1].metadata.agent_id)
+        online = self.registry.select_least_loaded([AgentCapability.MODEL_UPDATE], status=AgentStatus.ONLINE)
+        self.assertIs(online, capable[0])
+        self.assertIsNone(self.registry.select_least_loaded([AgentCapability.MODEL_UPDATE], status=AgentStatus.SYNCING))
+
+    def test_snapshot_restore(self):
+        with redirect_stdout(io.StringIO()):
+            self.agents[3].set_status(AgentStatus.ONLINE)
+        self.registry.report_load(self.agents[3].metadata.agent_id, 7)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "registry.json"
+            self.assertEqual(self.registry.snapshot(str(path)), 120)
+            with redirect_stdout(io.StringIO()):
+                restored = AgentRegistry.restore(str(path), live_agents=self.agents[:10])
+        self.assertEqual(restored.get_agent_count(), 120)
+        self.assertIs(restored.get_agent(self.agents[0].metadata.agent_id), self.agents[0])
+        rebuilt = restored.get_agent(self.agents[50].metadata.agent_id)
+        self.assertIsNot(rebuilt, self.agents[50])
+        self.assertIsInstance(rebuilt, FederatedLearningClient)
+        self.assertEqual(restored.loads[self.agents[3].metadata.agent_id], 7)
+        self.assertEqual(restored.get_capability_distribution(), self.registry.get_capability_distribution())
+        self.assertEqual([a.metadata.agent_id for a in restored.search_by_status(AgentStatus.ONLINE)],
+                         [self.agents[3].metadata.agent_id])
+        self.assertEqual(len(restored.registration_log), 120)
+
+
+if __name__ == "__main__":
+    unittest.main()
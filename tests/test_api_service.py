@@ -0,0 +1,71 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the batch prediction endpoint and compression in api_service
+"""
+
+import gzip
+import json
+import unittest
+
+from api_service import app
+
+
+class TestBatchPrediction(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def _item(self, lat=0.512, lng=40.3129, symptoms=("diarrhea", "vomiting", "dehydration")):
+        return {"location": {"lat": lat, "lng": lng}, "symptoms": list(symptoms)}
+
+    def test_batch_matches_single_predictions(self):
+        items = [self._item(), self._item(lat=3.0, lng=36.0, symptoms=["fever"])]
+        response = self.client.post("/predict/batch", json={"requests": items})
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+
+        for item, batch_result in zip(items, results):
+            single = self.client.post("/predict", json=item).get_json()
+            for key in ("z_score", "risk_level", "bond_status", "disease_likelihood", "location_name"):
+                self.assertEqual(batch_result[key], single[key])
+
+    def test_invalid_items_reported_in_place(self):
+        response = self.client.post("/predict/batch", json={"requests": [self._item(), {"symptoms": []}]})
+        body = response.get_json()
+        self.assertEqual(body["failed"], 1)
+        self.assertEqual(body["results"][1]["error"], "missing_location")
+        self.assertEqual(body["results"][0]["status"], "success")
+
+    def test_unhashable_symptoms_fail_only_their_item(self):
+        bad = [self._item(symptoms=[["fever"]]), self._item(symptoms=[{"name": "fever"}]), self._item(symptoms=["fever", 3])]
+        response = self.client.post("/predict/batch", json={"requests": [self._item()] + bad})
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["failed"], 3)
+        self.assertEqual(body["results"][0]["status"], "success")
+        self.assertEqual([result["error"] for result in body["results"][1:]], ["invalid_symptoms"] * 3)
+
+    def test_gzip_request_and_response(self):
+        payload = gzip.compress(json.dumps({"requests": [self._item()] * 50}).encode())
+        response = self.client.post("/predict/batch", data=payload, headers={
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "Accept-Encoding": "gzip",
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.data))["count"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for streaming audit package export
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from certification.audit_export import (
+    ContentStore,
+    StreamedArray,
+    StreamingAuditExporter,
+    iter_package_records,
+    iterencode_document,
+    load_export_index,
+    streaming_json_hash,
+)
+
+
+class TestStreamingAuditExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.files = {"logs/a.log": b"alpha\n" * 100, "logs/b.log": b"beta\n", "logs/copy.log": b"alpha\n" * 100}
+        os.makedirs(os.path.join(self.root, "logs"))
+        for name, data in self.files.items():
+            self._write(name, data)
+        self.exporter = StreamingAuditExporter(self.root, ContentStore(os.path.join(self.root, "store")))
+        self.header = {"bundle_id": "LEB-test", "export_timestamp": "2026-01-01T00:00:00"}
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.root, name), "wb") as f:
+            f.write(data)
+
+    def _records(self):
+        return [{"source_file": name, "content_hash": hashlib.sha256(open(os.path.join(self.root, name), "rb").read()).hexdigest()}
+                for name in sorted(self.files)]
+
+    def _export(self, name, fmt="tar", base=None):
+        path = os.path.join(self.root, name)
+        digest = self.exporter.export(path, self.header, reversed(self._records()), {"summary": {"n": 1}},
+                                      fmt=fmt, base_export=base)
+        return path, digest
+
+    def test_deterministic_and_deduplicated(self):
+        first, digest = self._export("one.tar")
+        second, _ = self._export("two.tar")
+        with open(first, "rb") as a, open(second, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+        names = tarfile.open(first).getnames()
+        self.assertEqual(len([n for n in names if n.startswith("blobs/")]), 2)  # a.log and copy.log share a blob
+        trailer = list(iter_package_records(first))[-1]
+        self.assertEqual(trailer["export_integrity_hash"], digest)
+        self.assertEqual(trailer["blobs_deduplicated"], 1)
+
+    def test_delta_against_previous_export(self):
+        base, _ = self._export("base.jsonl", fmt="jsonl")
+        self._write("logs/b.log", b"beta changed\n")
+        del self.files["logs/copy.log"]
+
+        delta, _ = self._export("delta.tar", base=base)
+        records = list(iter_package_records(delta))
+        self.assertIsNotNone(records[0]["delta_base"])
+        self.assertEqual([(r["record_type"], r["source_file"]) for r in records if "source_file" in r],
+                         [("artifact", "logs/b.log"), ("removed", "logs/copy.log")])
+        self.assertEqual(len(tarfile.open(delta).getnames()), 2)  # one new blob plus manifest
+
+        index, _ = load_export_index(base)
+        self.assertEqual(set(index), {"logs/a.log", "logs/b.log", "logs/copy.log"})
+
+    def test_chunked_sort_matches_in_memory_sort(self):
+        in_memory, _ = self._export("memory.jsonl", fmt="jsonl")
+        # One record per spilled run forces the external merge path
+        self.exporter = StreamingAuditExporter(self.root, ContentStore(os.path.join(self.root, "store")),
+                                               sort_chunk_size=1)
+        merged, _ = self._export("merged.jsonl", fmt="jsonl")
+        with open(in_memory, "rb") as a, open(merged, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+
+class TestJSONDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.inventory = [{"source_file": f"logs/{i}.log", "tags": ["a", "b"], "meta": {"n": i}} for i in range(3)]
+        self.document = {"package": {"id": "P-1"}, "inventory": self.inventory, "empty": [], "summary": {}}
+
+    def _streamed(self):
+        return dict(self.document, inventory=StreamedArray(lambda: iter(self.inventory)),
+                    empty=StreamedArray(list))
+
+    def test_matches_json_dumps(self):
+        for kwargs in ({"indent": 2}, {"sort_keys": True}, {}):
+            self.assertEqual("".join(iterencode_document(self._streamed(), **kwargs)),
+                             json.dumps(self.document, default=str, **kwargs))
+
+    def test_hash_is_unchanged_by_streaming(self):
+        expected = hashlib.sha256(json.dumps(self.document, sort_keys=True, default=str).encode()).hexdigest()
+        self.assertEqual(streaming_json_hash(self._streamed()), expected)
+        self.assertEqual(streaming_json_hash(self.document), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
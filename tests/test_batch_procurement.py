@@ -0,0 +1,109 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for batch procurement in the agentic supply chain engine
+"""
+
+import asyncio
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+
+from supply_chain.agentic import autonomy_engine
+from supply_chain.agentic.autonomy_engine import (
+    AutonomousProcurementAgents,
+    BatchProcurementOptimizer,
+    ProcurementRequest,
+    SupplierProfile,
+    SupplierTier,
+)
+
+
+def make_round(seed=7, n_requests=40, n_suppliers=12):
+    rng = random.Random(seed)
+    suppliers = [
+        SupplierProfile(
+            supplier_id=f"sup_{i:03d}", name=f"Supplier {i}", tier=rng.choice(list(SupplierTier)),
+            location=rng.choice(["Kenya", "India", "Germany"]), reliability_score=rng.random(),
+            price_competitiveness=rng.random(), delivery_speed=rng.randint(1, 20), quality_rating=rng.random(),
+            equity_score=rng.random(), certifications=rng.sample(["GMP", "WHO-PQ"], rng.randint(0, 2))
+        )
+        for i in range(n_suppliers)
+    ]
+    catalog = {item: rng.sample(suppliers, 6) for item in ("ors", "amoxicillin", "rdt_malaria")}
+    requests = [
+        ProcurementRequest(
+            request_id=f"req_{i:03d}", item_type=rng.choice(sorted(catalog)), quantity=rng.randint(10, 100),
+            urgency="high", budget_limit=rng.uniform(500, 2000),
+            required_by=datetime.now() + timedelta(days=rng.randint(5, 30)), destination="Nairobi",
+            specifications={"required_certifications": rng.sample(["GMP"], rng.randint(0, 1)),
+                            "min_quality_rating": rng.random() * 0.4}
+        )
+        for i in range(n_requests)
+    ]
+    return suppliers, catalog, requests
+
+
+class TestBatchProcurement(unittest.TestCase):
+
+    def setUp(self):
+        self.suppliers, self.catalog, self.requests = make_round()
+        self.agents = AutonomousProcurementAgents()
+
+        database = self.agents.supplier_database
+        database.delete_suppliers(["sup_001"])
+        database.upsert_suppliers(
+            (s, [item for item, members in self.catalog.items() if s in members]) for s in self.suppliers)
+
+    def test_shortlist_matches_single_request_candidates(self):
+        batch = asyncio.run(self.agents.execute_procurement_batch(self.requests))
+        for request, result in zip(self.requests, batch["results"]):
+            single = asyncio.run(self.agents._identify_supplier_candidates(request))
+            self.assertEqual(result["supplier_candidates"], [s.supplier_id for s in single])
+
+    def _check_constraints(self, batch, capacity, share):
+        self.assertTrue(all(units <= capacity for units in batch["supplier_utilisation"].values()))
+        self.assertGreaterEqual(batch["equity_metrics"]["equitable_unit_share"], share)
+        for result in batch["results"]:
+            if result["selected_supplier"] is not None:
+                self.assertIn(result["selected_supplier"].supplier_id, result["supplier_candidates"])
+
+    def test_capacity_and_equity_constraints_greedy(self):
+        capacities = {s.supplier_id: 300 for s in self.suppliers}
+        with mock.patch.object(autonomy_engine, "SCIPY_AVAILABLE", False):
+            batch = asyncio.run(self.agents.execute_procurement_batch(
+                self.requests, capacities=capacities, min_equity_share=0.5))
+        self.assertEqual(batch["solver"]["method"], "greedy")
+        self._check_constraints(batch, 300, 0.5)
+
+    @unittest.skipUnless(autonomy_engine.SCIPY_AVAILABLE, "scipy not installed")
+    def test_capacity_and_equity_constraints_milp(self):
+        capacities = {s.supplier_id: 300 for s in self.suppliers}
+        batch = asyncio.run(self.agents.execute_procurement_batch(
+            self.requests, capacities=capacities, min_equity_share=0.5))
+        self.assertEqual(batch["solver"]["method"], "milp")
+        self._check_constraints(batch, 300, 0.5)
+
+    def test_greedy_respects_capacity(self):
+        optimizer = BatchProcurementOptimizer()
+        pair_request, pair_supplier = np.array([0, 1, 1]), np.array([0, 0, 1])
+        with mock.patch.object(autonomy_engine, "SCIPY_AVAILABLE", False):
+            chosen, _ = optimizer.solve(pair_request, pair_supplier, np.array([0.9, 0.8, 0.1]),
+                                        np.array([5.0, 5.0]), np.array([6.0, np.inf]), np.array([False, False]))
+        self.assertEqual(chosen.tolist(), [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+Tests for the 5DM broadcast engine: batching, rate limits, retries and idempotent sends
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from edge_node.frenasa_engine.broadcast_engine import BroadcastEngine, FakeGateway, TokenBucket
+from edge_node.frenasa_engine.five_dm_bridge import DeliveryChannel, FiveDMBridge
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_reservations_follow_rate_after_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, burst=50, clock=clock)
+        self.assertEqual(bucket.reserve(50), 0.0)
+        self.assertAlmostEqual(bucket.reserve(10), 0.1)
+        self.assertAlmostEqual(bucket.reserve(10), 0.2)  # queued behind the first debt
+        clock.now = 1.0
+        self.assertEqual(bucket.reserve(20), 0.0)
+
+
+class TestBroadcastEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ledger_path = os.path.join(self.tmp.name, "ledger.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fan_out_retries_until_every_recipient_is_delivered_once(self):
+        sms = FakeGateway("sms", latency=0.001, failure_rate=0.3, seed=1)
+        whatsapp = FakeGateway("whatsapp", latency=0.001, outage_rate=0.3, seed=2)
+        engine = BroadcastEngine({"sms": sms, "whatsapp": whatsapp}, self.ledger_path, batch_size=50,
+                                 workers_per_gateway=4, max_attempts=20, backoff_base=0.001, seed=3)
+        recipients = [f"+2547{i:08d}" for i in range(1000)]
+        recipients += [(f"+2557{i:08d}", "whatsapp") for i in range(300)]
+        recipients.append(recipients[0])
+
+        report = asyncio.run(engine.broadcast("ALERT-1", "Cholera alert", recipients, default_gateway="sms"))
+        self.assertEqual(report.status, "DELIVERED")
+        self.assertEqual((report.requested, report.delivered, report.skipped), (1301, 1300, 1))
+        self.assertGreater(report.retries, 0)
+        self.assertEqual(len(sms.delivered), 1000)
+        self.assertEqual(len(whatsapp.delivered), 300)
+        self.assertEqual(engine.ledger.counts("ALERT-1"), {"DELIVERED": 1300})
+        self.assertLessEqual(sms.max_concurrency, 4)
+
+    def test_rebroadcast_and_resume_are_idempotent(self):
+        flaky = FakeGateway("sms", latency=0.0, failure_rate=1.0, seed=4)
+        engine = BroadcastEngine({"sms": flaky}, self.ledger_path, max_attempts=2, backoff_base=0.001)
+        recipients = [f"+2547{i:08d}" for i in range(200)]
+        asyncio.run(engine.broadcast("ALERT-2", "Measles alert", recipients[:100], default_gateway="sms"))
+        self.assertEqual(engine.ledger.counts("ALERT-2"), {"FAILED": 100})
+
+        # Interrupted broadcast: 100 recipients left in the persistent retry queue
+        engine.ledger.update("ALERT-2", "sms", recipients[100:], "RETRY", 1, next_attempt=time.time())
+        engine.close()
+
+        gateway = FakeGateway("sms", latency=0.0)
+        restarted = BroadcastEngine({"sms": gateway}, self.ledger_path)
+        report = asyncio.run(restarted.resume("ALERT-2"))
+        self.assertEqual((report.requested, report.delivered), (100, 100))
+
+        report = asyncio.run(restarted.broadcast("ALERT-2", "Measles alert", recipients, default_gateway="sms"))
+        self.assertEqual((report.skipped, report.delivered), (100, 100))
+        again = asyncio.run(restarted.broadcast("ALERT-2", "Measles alert", recipients, default_gateway="sms"))
+        self.assertEqual((again.skipped, again.delivered, gateway.calls), (200, 0, 2))
+        self.assertEqual(gateway.duplicates, 0)
+
+    def test_resume_reaches_recipients_never_attempted(self):
+        engine = BroadcastEngine({"sms": FakeGateway("sms", latency=0.01)}, self.ledger_path,
+                                 batch_size=10, workers_per_gateway=1)
+        recipients = [f"+2547{i:08d}" for i in range(100)]
+
+        async def interrupted():
+            task = asyncio.ensure_future(engine.broadcast("ALERT-5", "Flood alert", recipients, default_gateway="sms"))
+            await asyncio.sleep(0.035)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(interrupted())
+        counts = engine.ledger.counts("ALERT-5")
+        self.assertEqual(sum(counts.values()), 100)
+        self.assertGreater(counts.get("PENDING", 0), 0)
+        engine.close()
+
+        gateway = FakeGateway("sms", latency=0.0)
+        restarted = BroadcastEngine({"sms": gateway}, self.ledger_path, batch_size=10)
+        report = asyncio.run(restarted.resume("ALERT-5"))
+        self.assertEqual(restarted.ledger.counts("ALERT-5"), {"DELIVERED": 100})
+        self.assertEqual(report.delivered, 100 - counts.get("DELIVERED", 0))
+        restarted.close()
+
+    def test_gateway_rate_limit_is_respected(self):
+        gateway = FakeGateway("sms", latency=0.0)
+        engine = BroadcastEngine({"sms": gateway}, self.ledger_path, rate_limits={"sms": (2000, 100)},
+                                 batch_size=50, workers_per_gateway=8)
+        recipients = [f"+2547{i:08d}" for i in range(500)]
+        report = asyncio.run(engine.broadcast("ALERT-3", "Flood alert", recipients, default_gateway="sms"))
+        # 100 burst tokens, then 400 more at 2000/s
+        self.assertGreaterEqual(report.seconds, 0.19)
+        self.assertEqual(report.delivered, 500)
+
+
+class TestBridgeFanOut(unittest.TestCase):
+
+    def test_broadcast_alert_with_recipients_uses_engine(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bridge = FiveDMBridge(
+                api_key="TEST",
+                gateways={"sms": FakeGateway("sms", latency=0.0)},
+                delivery_ledger_path=os.path.join(tmp, "ledger.sqlite"),
+            )
+            recipients = [f"+2547{i:08d}" for i in range(300)]
+            message = bridge.broadcast_alert("Cholera alert", "MOMBASA_COUNTY", channel=DeliveryChannel.SMS,
+                                             recipients=recipients, alert_id="ALERT-4")
+            self.assertEqual(message.delivery_status, "DELIVERED")
+            self.assertEqual(message.recipient_count, 300)
+            self.assertEqual(bridge.delivery_stats["sms"], 300)
+            self.assertEqual(message.metadata["delivery_report"]["delivered"], 300)
+            bridge.engine.close()
+
+    def test_sync_broadcast_inside_event_loop_points_to_async(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bridge = FiveDMBridge(
+                api_key="TEST",
+                gateways={"sms": FakeGateway("sms", latency=0.0)},
+                delivery_ledger_path=os.path.join(tmp, "ledger.sqlite"),
+            )
+
+            async def handler():
+                with self.assertRaisesRegex(RuntimeError, "broadcast_alert_async"):
+                    bridge.broadcast_alert("Cholera alert", "MOMBASA_COUNTY", recipients=["+254700000001"])
+                return await bridge.broadcast_alert_async("Cholera alert", "MOMBASA_COUNTY", ["+254700000001"])
+
+            self.assertEqual(asyncio.run(handler()).delivery_status, "DELIVERED")
+            bridge.engine.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
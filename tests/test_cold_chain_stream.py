@@ -0,0 +1,191 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the streaming cold-chain anomaly detector
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pharma_supply.cold_chain_stream import _FLOAT_FIELDS, _INT_FIELDS, StreamingColdChainDetector
+
+
+class TestVectorizedIngest(unittest.TestCase):
+
+    def _readings(self, sensors=20, per_sensor=6, seed=7):
+        rng = np.random.default_rng(seed)
+        sensor_ids = [f"FRIDGE-{i}" for i in range(sensors) for _ in range(per_sensor)]
+        timestamps = np.tile(np.arange(per_sensor) * 300.0, sensors) + rng.uniform(0, 10, len(sensor_ids))
+        temperatures = rng.normal(6.0, 3.0, len(sensor_ids))
+        humidities = rng.uniform(40, 80, len(sensor_ids))
+        return sensor_ids, timestamps, temperatures, humidities
+
+    def test_batch_matches_one_reading_at_a_time(self):
+        sensor_ids, ts, temp, hum = self._readings()
+        shuffled = np.random.default_rng(1).permutation(len(sensor_ids))
+
+        batched = StreamingColdChainDetector(initial_capacity=4)
+        batched.ingest([sensor_ids[i] for i in shuffled], ts[shuffled], temp[shuffled], hum[shuffled])
+
+        sequential = StreamingColdChainDetector(initial_capacity=4)
+        for i in np.argsort(ts, kind='stable'):
+            sequential.ingest([sensor_ids[i]], [ts[i]], [temp[i]], [hum[i]])
+
+        self.assertEqual(len(batched), 20)
+        for sensor_id in sequential.sensor_ids:
+            expected = sequential.sensor_state(sensor_id)
+            actual = batched.sensor_state(sensor_id)
+            for name, value in expected.items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(actual[name], value, places=9, msg=f"{sensor_id}.{name}")
+                else:
+                    self.assertEqual(actual[name], value, msg=f"{sensor_id}.{name}")
+
+    def test_result_covers_only_touched_sensors(self):
+        detector = StreamingColdChainDetector()
+        detector.ingest(['A', 'B', 'C'], [0, 0, 0], [5, 5, 5], [50, 50, 50])
+        result = detector.ingest(['B', 'B'], [60, 120], [5, 5], [50, 50])
+        self.assertEqual(result['sensor_ids'], ['B'])
+        self.assertEqual(result['readings_ingested_sensors'], 1)
+
+    def test_empty_batch(self):
+        result = StreamingColdChainDetector().ingest([], [], [], [])
+        self.assertEqual(result['sensor_ids'], [])
+        self.assertEqual(result['alerts'], [])
+
+
+class TestRollingStatistics(unittest.TestCase):
+
+    def test_ewma_and_welford_match_reference(self):
+        temps = [5.0, 10.0, 10.0, 3.0, 7.5]
+        detector = StreamingColdChainDetector(ewma_alpha=0.2)
+        detector.ingest(['S'] * len(temps), np.arange(len(temps)) * 60.0, temps, [50.0] * len(temps))
+
+        ewma = temps[0]
+        for value in temps[1:]:
+            ewma = 0.2 * value + 0.8 * ewma
+
+        state = detector.sensor_state('S')
+        self.assertAlmostEqual(state['ewma_temp'], ewma)
+        self.assertAlmostEqual(state['temp_mean'], np.mean(temps))
+        self.assertAlmostEqual(state['temp_variance'], np.var(temps, ddof=1))
+        self.assertEqual(state['count'], len(temps))
+
+    def test_exposure_capped_across_offline_gap(self):
+        detector = StreamingColdChainDetector(max_gap_seconds=600.0)
+        detector.ingest(['S'], [0.0], [10.0], [50.0])
+        detector.ingest(['S'], [7200.0], [5.0], [50.0])
+
+        state = detector.sensor_state('S')
+        self.assertEqual(state['offline_gaps'], 1)
+        self.assertAlmostEqual(state['seconds_above'], 600.0)
+        self.assertAlmostEqual(state['heat_degree_minutes'], 2.0 * 600.0 / 60.0)
+
+
+class TestAlertThresholds(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = StreamingColdChainDetector(ewma_alpha=0.5)
+
+    def _ingest(self, ts, temp, humidity=50.0):
+        return self.detector.ingest(['S'], [ts], [temp], [humidity])
+
+    def test_alerts_only_when_status_worsens(self):
+        self.assertEqual(self._ingest(0, 5.0)['alerts'], [])
+
+        # EWMA 8.5 leaves the 2-8 range: warning
+        alerts = self._ingest(60, 12.0)['alerts']
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0]['severity'], 'warning')
+        self.assertEqual(alerts[0]['previous_status'], 'optimal')
+
+        # EWMA 10.25 is more than 2 degrees out: critical
+        alerts = self._ingest(120, 12.0)['alerts']
+        self.assertEqual([a['severity'] for a in alerts], ['critical'])
+
+        # Recovering back to warning is not alerted
+        result = self._ingest(180, 9.0)
+        self.assertEqual(result['alerts'], [])
+        self.assertEqual(list(result['status']), ['warning'])
+
+    def test_humidity_raises_warning(self):
+        self._ingest(0, 5.0)
+        alerts = self._ingest(60, 5.0, humidity=90.0)['alerts']
+        self.assertEqual([a['severity'] for a in alerts], ['warning'])
+
+    def test_freezing_is_breach(self):
+        self._ingest(0, -1.0)
+        result = self._ingest(60, 4.0)
+        self.assertEqual(list(result['status']), ['breached'])
+        self.assertGreaterEqual(result['spoilage_probability'][0], 0.9)
+
+    def test_heat_budget_exhaustion_is_breach(self):
+        detector = StreamingColdChainDetector(heat_budget_degree_minutes=10.0)
+        detector.ingest(['S'], [0.0], [20.0], [50.0])
+        result = detector.ingest(['S'], [600.0], [20.0], [50.0])
+        self.assertEqual(list(result['status']), ['breached'])
+        self.assertEqual(detector.fleet_summary()['status_counts']['breached'], 1)
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state", "cold_chain.npz")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_preserves_state(self):
+        detector = StreamingColdChainDetector(initial_capacity=2)
+        sensors = [f"BOX-{i}" for i in range(5)]
+        detector.ingest(sensors, [0.0] * 5, [3.0, 9.5, 12.0, 1.0, -0.5], [50.0] * 5)
+        detector.ingest(sensors, [300.0] * 5, [4.0, 9.0, 11.0, 2.5, 1.0], [70.0] * 5)
+        detector.checkpoint(self.path)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+        restored = StreamingColdChainDetector.restore(self.path, initial_capacity=2)
+        self.assertEqual(restored.sensor_ids, sensors)
+        for sensor_id in sensors:
+            self.assertEqual(restored.sensor_state(sensor_id), detector.sensor_state(sensor_id))
+
+        # Both continue identically after the restore
+        batch = (sensors, [600.0] * 5, [5.0] * 5, [50.0] * 5)
+        expected = detector.ingest(*batch)
+        actual = restored.ingest(*batch)
+        np.testing.assert_array_equal(actual['status'], expected['status'])
+        np.testing.assert_allclose(actual['spoilage_probability'], expected['spoilage_probability'])
+        self.assertEqual(actual['alerts'], expected['alerts'])
+
+    def test_restore_grows_for_new_sensors(self):
+        detector = StreamingColdChainDetector()
+        detector.ingest(['A'], [0.0], [5.0], [50.0])
+        detector.checkpoint(self.path)
+
+        restored = StreamingColdChainDetector.restore(self.path, initial_capacity=1)
+        restored.ingest([f"N{i}" for i in range(10)], [0.0] * 10, [5.0] * 10, [50.0] * 10)
+        self.assertEqual(len(restored), 11)
+        self.assertEqual(restored.sensor_state('A')['count'], 1)
+        for name in _FLOAT_FIELDS + _INT_FIELDS:
+            self.assertGreaterEqual(len(restored._state[name]), 11)
+
+    def test_missing_checkpoint_gives_fresh_detector(self):
+        restored = StreamingColdChainDetector.restore(self.path, temp_max=7.0)
+        self.assertEqual(len(restored), 0)
+        self.assertEqual(restored.temp_max, 7.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
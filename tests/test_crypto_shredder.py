@@ -0,0 +1,111 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the streaming Crypto Shredder and its key catalog
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from edge_node.crypto_shredder import KeyCatalog, StreamingShredder
+
+
+class TestStreamingShredder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.catalog = KeyCatalog(os.path.join(self.tmp.name, "catalog.db"), kek=os.urandom(32))
+        self.shredder = StreamingShredder(self.catalog, segment_size=1024)
+
+    def tearDown(self):
+        self.catalog.close()
+        self.tmp.cleanup()
+
+    def _seal(self, object_id, data, subject_id=None):
+        sealed = io.BytesIO()
+        self.shredder.encrypt_stream(object_id, io.BytesIO(data), sealed, subject_id)
+        return sealed.getvalue()
+
+    def _open(self, object_id, sealed):
+        out = io.BytesIO()
+        self.shredder.decrypt_stream(object_id, io.BytesIO(sealed), out)
+        return out.getvalue()
+
+    def test_round_trip_segment_boundaries(self):
+        for size in (0, 1, 1023, 1024, 1025, 4096, 5000):
+            data = os.urandom(size)
+            sealed = self._seal(f"obj-{size}", data)
+            self.assertEqual(self._open(f"obj-{size}", sealed), data)
+
+    def test_truncation_and_reorder_detected(self):
+        data = os.urandom(4096)
+        sealed = self._seal("mri-1", data)
+        header = StreamingShredder.HEADER.size
+        segment = 1024 + StreamingShredder.TAG_SIZE
+        with self.assertRaises(Exception):
+            self._open("mri-1", sealed[:header + 2 * segment])
+        swapped = (sealed[:header] + sealed[header + segment:header + 2 * segment]
+                   + sealed[header:header + segment] + sealed[header + 2 * segment:])
+        with self.assertRaises(Exception):
+            self._open("mri-1", swapped)
+
+    def test_shred_object_and_subject(self):
+        sealed = self._seal("genome-1", b"ACGT" * 600, subject_id="patient-7")
+        self._seal("genome-2", b"TTAG" * 600, subject_id="patient-7")
+        self._seal("xray-9", b"\x00" * 10, subject_id="patient-8")
+
+        self.assertEqual(self.shredder.shred_subject("patient-7"), 2)
+        with self.assertRaises(KeyError):
+            self._open("genome-1", sealed)
+        self.assertIn("xray-9", self.catalog)
+        self.assertTrue(self.shredder.shred("xray-9"))
+        self.assertFalse(self.shredder.shred("xray-9"))
+
+    def test_catalog_persists_across_reopen(self):
+        path = os.path.join(self.tmp.name, "persist.db")
+        kek = os.urandom(32)
+        catalog = KeyCatalog(path, kek=kek)
+        dek = catalog.create_key("ct-scan")
+        catalog.close()
+        reopened = KeyCatalog(path, kek=kek)
+        self.assertEqual(reopened.get_key("ct-scan"), dek)
+        reopened.close()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["catalog.db", "persist.db"])
+
+    def test_shredded_key_bytes_leave_the_database(self):
+        path = os.path.join(self.tmp.name, "wiped.db")
+        catalog = KeyCatalog(path, kek=os.urandom(32))
+        catalog.create_key("pet-scan")
+        wrapped = catalog._conn.execute("SELECT wrapped_dek FROM object_keys").fetchone()[0]
+        self.assertIn(wrapped, open(path, "rb").read())
+        catalog.shred("pet-scan")
+        catalog.close()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["catalog.db", "wiped.db"])
+        self.assertNotIn(wrapped, open(path, "rb").read())
+
+    def test_short_reads_do_not_end_the_stream(self):
+        class Trickle(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 100) if size and size > 0 else size)
+
+        data = os.urandom(5000)
+        sealed = io.BytesIO()
+        self.shredder.encrypt_stream("trickle", Trickle(data), sealed)
+        out = io.BytesIO()
+        self.shredder.decrypt_stream("trickle", Trickle(sealed.getvalue()), out)
+        self.assertEqual(out.getvalue(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the segmented sync event log
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from core.sync.event_log import EventLog
+
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _log(self):
+        return EventLog(self.directory, segment_bytes=2048, index_interval=4)
+
+    def test_replay_from_offset_across_segments(self):
+        log = self._log()
+        for i in range(300):
+            log.append("STATE_CHANGE", {"key": f"k{i % 10}", "value": i})
+        self.assertGreater(log.stats()["segments"], 3)
+        self.assertEqual([e["payload"]["value"] for e in log.replay(123)], list(range(123, 300)))
+        log.close()
+
+    def test_appends_survive_process_crash(self):
+        script = textwrap.dedent("""
+            import os, sys
+            from core.sync.event_log import EventLog
+            log = EventLog(sys.argv[1])
+            for i in range(5):
+                log.append("ALERT", {"n": i})
+            os._exit(1)
+        """)
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        crashed = subprocess.run([sys.executable, "-c", script, str(self.directory)], cwd=repo_root)
+        self.assertEqual(crashed.returncode, 1)
+
+        log = self._log()
+        self.assertEqual([e["payload"]["n"] for e in log.replay()], list(range(5)))
+        log.close()
+
+    def test_torn_tail_is_truncated_on_reopen(self):
+        log = self._log()
+        for i in range(20):
+            log.append("ALERT", {"n": i})
+        log.close()
+        with open(sorted(self.directory.glob("*.seg"))[-1], "ab") as f:
+            f.write(b"\x00\x00\x00\x40\x00\x00\x00\x00partial")
+
+        log = self._log()
+        self.assertEqual(log.next_offset, 20)
+        self.assertEqual(log.append("ALERT", {"n": 20})["offset"], 20)
+        self.assertEqual([e["payload"]["n"] for e in log.replay()], list(range(21)))
+        log.close()
+
+    def test_compaction_keeps_latest_per_key_and_unkeyed_events(self):
+        log = self._log()
+        for i in range(200):
+            log.append("STATE_CHANGE", {"key": f"k{i % 5}", "value": i})
+            if i % 50 == 0:
+                log.append("ALERT", {"n": i})
+        before = [e["offset"] for e in log.replay()]
+
+        result = log.compact()
+        self.assertGreater(result["records_dropped"], 0)
+        events = list(log.replay())
+        self.assertEqual(sum(e["type"] == "ALERT" for e in events), 4)
+        latest = {}
+        for event in events:
+            if event["type"] == "STATE_CHANGE":
+                latest[event["payload"]["key"]] = event["payload"]["value"]
+        self.assertEqual(latest, {f"k{j}": 195 + j for j in range(5)})
+        self.assertTrue(set(e["offset"] for e in events) <= set(before))
+        log.close()
+
+    def test_legacy_event_files_are_imported(self):
+        for i, ts in enumerate(["2025-01-02T00:00:00", "2025-01-01T00:00:00"]):
+            with open(self.directory / f"legacy-{i}.json", "w") as f:
+                json.dump({"event_id": str(i), "type": "STATE_CHANGE", "timestamp": ts,
+                           "payload": {"key": "mode", "value": i}}, f)
+        log = self._log()
+        self.assertEqual([e["payload"]["value"] for e in log.replay()], [1, 0])
+        self.assertEqual(list(self.directory.glob("*.json")), [])
+        log.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
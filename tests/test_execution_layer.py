@@ -0,0 +1,230 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the backend request execution layer
+"""
+
+import asyncio
+import threading
+import unittest
+
+from app.backend.execution import ExecutionLayer, RouteSaturated
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+async def _wait_until(condition, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.005)
+
+
+class TestRouteLimits(unittest.TestCase):
+
+    def setUp(self):
+        self.execution = ExecutionLayer(route_limits={"/slow": (1, 1)}, thread_workers=4)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.execution.shutdown()
+
+    def _blocking(self, value):
+        self.release.wait(5)
+        return value
+
+    def test_full_queue_is_rejected(self):
+        async def scenario():
+            limiter = self.execution.limiter("/slow")
+            running = asyncio.ensure_future(self.execution.run("/slow", self._blocking, "a"))
+            queued = asyncio.ensure_future(self.execution.run("/slow", self._blocking, "b"))
+            await _wait_until(lambda: limiter.in_flight == 1 and limiter.waiting == 1)
+
+            with self.assertRaises(RouteSaturated) as ctx:
+                await self.execution.run("/slow", self._blocking, "c")
+            self.assertEqual(ctx.exception.route, "/slow")
+            self.assertEqual(ctx.exception.retry_after, 1)
+
+            self.release.set()
+            return await asyncio.gather(running, queued)
+
+        self.assertEqual(asyncio.run(scenario()), ["a", "b"])
+        self.assertEqual(self.execution.rejected, {"/slow": 1})
+        limiter = self.execution.limiters["/slow"]
+        self.assertEqual((limiter.in_flight, limiter.waiting), (0, 0))
+
+    def test_routes_are_limited_independently(self):
+        async def scenario():
+            limiter = self.execution.limiter("/slow")
+            held = [asyncio.ensure_future(self.execution.run("/slow", self._blocking, i)) for i in range(2)]
+            await _wait_until(lambda: limiter.in_flight == 1 and limiter.waiting == 1)
+            other = await self.execution.run("/fast", len, "abc")
+            self.release.set()
+            await asyncio.gather(*held)
+            return other
+
+        self.assertEqual(asyncio.run(scenario()), 3)
+        self.assertEqual(self.execution.rejected, {})
+
+
+class TestCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.execution = ExecutionLayer(thread_workers=4)
+        self.release = threading.Event()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def tearDown(self):
+        self.release.set()
+        self.execution.shutdown()
+
+    def _compute(self, country):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        return {"country": country}
+
+    def test_identical_requests_share_one_call(self):
+        async def scenario():
+            first = asyncio.ensure_future(self.execution.run("/map", self._compute, "Kenya", coalesce_key=("Kenya",)))
+            await _wait_until(lambda: self.calls == 1)
+            rest = [asyncio.ensure_future(self.execution.run("/map", self._compute, "Kenya", coalesce_key=("Kenya",)))
+                    for _ in range(4)]
+            other = asyncio.ensure_future(self.execution.run("/map", self._compute, "Uganda", coalesce_key=("Uganda",)))
+            await _wait_until(lambda: self.calls == 2)
+            self.release.set()
+            return await asyncio.gather(first, *rest), await other
+
+        shared, other = asyncio.run(scenario())
+        self.assertEqual(shared, [{"country": "Kenya"}] * 5)
+        self.assertEqual(other, {"country": "Uganda"})
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.execution.coalesced, {"/map": 4})
+        self.assertEqual(self.execution._inflight, {})
+
+    def test_failure_reaches_every_waiter_and_is_not_cached(self):
+        def failing():
+            self.release.wait(5)
+            raise ValueError("model unavailable")
+
+        async def scenario():
+            waiters = [asyncio.ensure_future(self.execution.run("/map", failing, coalesce_key="k")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            self.release.set()
+            outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+            retry = await self.execution.run("/map", len, "ok", coalesce_key="k")
+            return outcomes, retry
+
+        outcomes, retry = asyncio.run(scenario())
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+        self.assertEqual(retry, 2)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.execution = ExecutionLayer()
+
+    def tearDown(self):
+        self.execution.shutdown()
+
+    def test_timed_records_status_and_latency(self):
+        async def ok():
+            return _Response(200)
+
+        async def saturated():
+            return _Response(503)
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def scenario():
+            await self.execution.timed("/predict", ok)
+            await self.execution.timed("/predict", saturated)
+            with self.assertRaises(RuntimeError):
+                await self.execution.timed("/predict", broken)
+
+        asyncio.run(scenario())
+        self.assertEqual(self.execution.responses, {("/predict", 200): 1, ("/predict", 503): 1, ("/predict", 500): 1})
+        self.assertEqual(self.execution.histograms["/predict"].count, 3)
+
+    def test_render_prometheus(self):
+        self.execution.observe("/a", 200, 0.003)
+        self.execution.observe("/a", 200, 0.2)
+        self.execution.observe("/a", 503, 20.0)
+        self.execution.limiter("/a")
+        self.execution.rejected["/a"] = 2
+        self.execution.coalesced["/a"] = 5
+
+        lines = self.execution.render_prometheus().splitlines()
+        self.assertIn('iluminara_http_request_duration_seconds_bucket{route="/a",le="0.005"} 1', lines)
+        self.assertIn('iluminara_http_request_duration_seconds_bucket{route="/a",le="0.25"} 2', lines)
+        self.assertIn('iluminara_http_request_duration_seconds_bucket{route="/a",le="10.0"} 2', lines)
+        self.assertIn('iluminara_http_request_duration_seconds_bucket{route="/a",le="+Inf"} 3', lines)
+        self.assertIn('iluminara_http_request_duration_seconds_count{route="/a"} 3', lines)
+        self.assertIn('iluminara_http_responses_total{route="/a",status="200"} 2', lines)
+        self.assertIn('iluminara_http_responses_total{route="/a",status="503"} 1', lines)
+        self.assertIn('iluminara_route_in_flight{route="/a"} 0', lines)
+        self.assertIn('iluminara_route_queue_depth{route="/a"} 0', lines)
+        self.assertIn('iluminara_route_rejected_total{route="/a"} 2', lines)
+        self.assertIn('iluminara_route_coalesced_total{route="/a"} 5', lines)
+        self.assertIn("# TYPE iluminara_route_rejected_total counter", lines)
+
+    def test_rejections_show_up_in_metrics(self):
+        execution = ExecutionLayer(route_limits={"/r": (1, 0)}, thread_workers=2)
+        release = threading.Event()
+
+        async def scenario():
+            held = asyncio.ensure_future(execution.run("/r", release.wait, 5))
+            await _wait_until(lambda: execution.limiter("/r").in_flight == 1)
+            with self.assertRaises(RouteSaturated):
+                await execution.run("/r", len, "x")
+            release.set()
+            await held
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            release.set()
+            execution.shutdown()
+        self.assertIn('iluminara_route_rejected_total{route="/r"} 1', execution.render_prometheus().splitlines())
+
+
+def _square(value):
+    return value * value
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def test_process_pool_does_not_fork_threaded_server(self):
+        execution = ExecutionLayer(process_workers=1)
+        try:
+            pool = execution.process_pool
+            self.assertIn(pool._mp_context.get_start_method(), ("forkserver", "spawn"))
+
+            async def scenario():
+                return await execution.run("/cpu", _square, 7, cpu_bound=True)
+
+            self.assertEqual(asyncio.run(scenario()), 49)
+        finally:
+            execution.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
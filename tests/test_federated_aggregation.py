@@ -0,0 +1,140 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the streaming federated aggregation engine and the aggregators built on it
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from edge_node.ai_agents.federated_client import SecureAggregation
+from ml_ops.federated.aggregation_engine import MaskingClient, StreamingAggregator
+from ml_ops.federated.secure_aggregator import SecureAggregator
+from ml_ops.federated_learning.sovereign_aggregator import SovereignAggregator
+
+
+class TestStreamingAggregation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.updates = [rng.normal(size=10_007).astype(np.float32) for _ in range(6)]
+        self.weights = [float(w) for w in rng.integers(1, 1000, size=6)]
+        self.expected = np.average(np.stack(self.updates).astype(np.float64), axis=0, weights=self.weights)
+
+    def test_weighted_mean_from_arrays_files_and_memmap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "client0.npy"
+            np.save(path, self.updates[0])
+            aggregator = StreamingAggregator(chunk_size=1000, accumulator_path=str(Path(tmp) / "sum.npy"))
+            aggregator.add(str(path), self.weights[0])
+            aggregator.add_many(self.updates[1:], self.weights[1:])
+            np.testing.assert_allclose(aggregator.result(), self.expected, rtol=1e-12)
+            with self.assertRaises(ValueError):
+                aggregator.add(self.updates[0][:-1])
+
+    def test_add_many_rejects_mismatched_weights(self):
+        with self.assertRaises(ValueError):
+            StreamingAggregator().add_many(self.updates[:3], self.weights[:2])
+        with self.assertRaises(ValueError):
+            StreamingAggregator().add_many(self.updates[:2], self.weights[:3])
+
+    def test_aggregators_share_engine(self):
+        sovereign = SovereignAggregator().aggregate_updates(iter(self.updates), self.weights)
+        np.testing.assert_allclose(sovereign, self.expected, rtol=1e-12)
+        unweighted = SecureAggregator().aggregate_gradients(self.updates)
+        np.testing.assert_allclose(unweighted, np.mean(np.stack(self.updates).astype(np.float64), axis=0))
+
+        edge = SecureAggregation()
+        for i, (update, weight) in enumerate(zip(self.updates, self.weights)):
+            edge.add_contribution(f"hospital_{i}", {"gradients": update.tolist(), "round": 1}, weight)
+        aggregated = edge.aggregate()
+        self.assertEqual(aggregated["num_contributors"], 6)
+        np.testing.assert_allclose(aggregated["parameters"]["gradients"], self.expected, rtol=1e-12)
+
+    def test_result_keeps_update_shape(self):
+        updates = [np.arange(12, dtype=np.float64).reshape(3, 4) * (i + 1) for i in range(3)]
+        expected = np.mean(np.stack(updates), axis=0)
+        for result in (SecureAggregator().aggregate_gradients(updates),
+                       SovereignAggregator().aggregate_updates(iter(updates))):
+            self.assertEqual(result.shape, (3, 4))
+            np.testing.assert_allclose(result, expected)
+
+        aggregator = StreamingAggregator(chunk_size=5)
+        aggregator.add(updates[0])
+        with self.assertRaises(ValueError):
+            aggregator.add(updates[1].reshape(4, 3))
+        out = np.empty((3, 4))
+        self.assertIs(aggregator.result(out=out), out)
+        np.testing.assert_allclose(out, updates[0])
+
+    def test_edge_contribution_requires_gradients(self):
+        edge = SecureAggregation()
+        with self.assertRaisesRegex(ValueError, "hospital_0.*gradients"):
+            edge.add_contribution("hospital_0", {"parameters": [1.0, 2.0], "round": 1})
+        self.assertEqual(edge.contributions, [])
+
+
+class TestPairwiseMasking(unittest.TestCase):
+
+    def _run_round(self, mask_degree, survivors):
+        rng = np.random.default_rng(11)
+        ids = [f"clinic_{i}" for i in range(10)]
+        updates = {cid: rng.normal(size=5_000) for cid in ids}
+        weights = {cid: float(rng.integers(1, 100)) for cid in ids}
+
+        round_ = SecureAggregator().open_round("r7", ids, 5_000, mask_degree=mask_degree)
+        clients = {cid: MaskingClient(cid, "r7", chunk_size=1024 + i) for i, cid in enumerate(ids)}
+        keys = {cid: client.public_key() for cid, client in clients.items()}
+        for cid, client in clients.items():
+            client.agree(keys, round_.graph[cid])
+
+        masked = list(clients[ids[0]].mask(updates[ids[0]], weights[ids[0]]))
+        encoded = np.rint(updates[ids[0]] * weights[ids[0]] * 2 ** 32).astype(np.int64).view(np.uint64)
+        self.assertFalse(np.array_equal(np.concatenate(masked), encoded))
+
+        for cid in survivors(ids):
+            round_.submit(cid, clients[cid].mask(updates[cid], weights[cid]), weights[cid])
+        for cid in survivors(ids):
+            round_.recover(cid, clients[cid].reveal(round_.dropped()))
+        kept = survivors(ids)
+        expected = sum(weights[c] * updates[c] for c in kept) / sum(weights[c] for c in kept)
+        np.testing.assert_allclose(round_.result(), expected, atol=1e-8)
+
+    def test_masks_cancel_with_full_cohort(self):
+        self._run_round(None, lambda ids: ids)
+
+    def test_stragglers_dropped_without_restart(self):
+        self._run_round(None, lambda ids: ids[:7])
+        self._run_round(4, lambda ids: ids[2:])
+
+    def test_reveal_refuses_to_unmask_a_client(self):
+        ids = ["clinic_a", "clinic_b", "clinic_c"]
+        clients = {cid: MaskingClient(cid, "r8") for cid in ids}
+        keys = {cid: client.public_key() for cid, client in clients.items()}
+        for cid, client in clients.items():
+            client.agree(keys, [peer for peer in ids if peer != cid])
+
+        client = clients["clinic_a"]
+        with self.assertRaises(ValueError):
+            client.reveal({"clinic_a", "clinic_b"})
+        revealed = client.reveal({"clinic_b"})
+        self.assertEqual(set(revealed), {"self", "clinic_b"})
+        self.assertEqual(client.reveal({"clinic_b"}), revealed)
+        with self.assertRaises(ValueError):
+            client.reveal({"clinic_b", "clinic_c"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for InternalAuditorAgent scheduling, check execution and findings store
+"""
+
+import asyncio
+import datetime
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from certification.internal_auditor_agent import (
+    AuditFinding,
+    AuditScheduler,
+    AuditSeverity,
+    InternalAuditorAgent,
+    RemediationStatus,
+)
+
+
+class TestAuditScheduler(unittest.TestCase):
+
+    def test_next_fire_times(self):
+        now = datetime.datetime(2026, 3, 31, 10, 0)  # Tuesday
+        self.assertEqual(AuditScheduler.next_run_after("daily", now), datetime.datetime(2026, 4, 1, 6))
+        self.assertEqual(AuditScheduler.next_run_after("weekly", now), datetime.datetime(2026, 4, 6, 7))
+        self.assertEqual(AuditScheduler.next_run_after("quarterly", datetime.datetime(2026, 12, 5)),
+                         datetime.datetime(2027, 1, 1, 9))
+
+    def test_pop_due_reschedules(self):
+        now = datetime.datetime(2026, 3, 31, 10, 0)
+        scheduler = AuditScheduler(["daily", "continuous"], now)
+        self.assertEqual(scheduler.pop_due(now + datetime.timedelta(minutes=6)), ["continuous"])
+        self.assertEqual(scheduler.upcoming()[0], (datetime.datetime(2026, 3, 31, 10, 11), "continuous"))
+
+    def test_continuous_runs_immediately(self):
+        now = datetime.datetime(2026, 3, 31, 10, 0)
+        scheduler = AuditScheduler(["daily", "continuous"], now)
+        self.assertEqual(scheduler.seconds_until_next(now), 0.0)
+        self.assertEqual(scheduler.pop_due(now), ["continuous"])
+        self.assertEqual(scheduler.pop_due(now + datetime.timedelta(minutes=4)), [])
+
+
+class TestAuditExecution(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "certification").mkdir()
+        (self.root / "certification" / "SoA.csv").write_text("control\n")
+        self.auditor = InternalAuditorAgent(self.root)
+
+    def tearDown(self):
+        self.auditor.findings_db.close()
+        shutil.rmtree(self.root)
+
+    def test_unchanged_inputs_reuse_findings(self):
+        first = asyncio.run(self.auditor.run_audit("Test", ["iso_27001_compliance"]))
+        second = asyncio.run(self.auditor.run_audit("Test", ["iso_27001_compliance"]))
+        self.assertEqual([f.finding_id for f in first.findings], [f.finding_id for f in second.findings])
+        self.assertEqual(self.auditor.check_stats["iso_27001_compliance"]["cache_hits"], 1)
+
+        (self.root / "certification" / "SoA.csv").write_text("control\n" * 100)
+        third = asyncio.run(self.auditor.run_audit("Test", ["iso_27001_compliance"]))
+        self.assertEqual(third.findings_count, 0)
+
+    def test_check_timeout_becomes_finding(self):
+        async def stuck_check():
+            time.sleep(1)
+            return []
+
+        self.auditor.compliance_rules["stuck"] = {"check_function": stuck_check, "timeout": 0.1}
+        report = asyncio.run(self.auditor.run_audit("Test", ["stuck", "access_controls"]))
+        self.assertEqual(report.findings[0].title, "Check Execution Error: stuck")
+        self.assertEqual(report.findings_count, 3)
+
+    def test_hung_checks_get_fresh_workers_and_are_bounded(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        async def hung_check():
+            release.wait(5)
+            return []
+
+        self.auditor.max_workers = 2
+        self.auditor.compliance_rules["hung"] = {"check_function": hung_check, "timeout": 0.05}
+        for _ in range(2):
+            report = asyncio.run(self.auditor.run_audit("Test", ["hung"]))
+            self.assertIn("timed out", report.findings[0].description)
+        self.assertEqual(len(self.auditor._hung_checks), 2)
+
+        # Two workers are stuck; further checks are refused instead of queueing behind them
+        report = asyncio.run(self.auditor.run_audit("Test", ["hung", "access_controls"]))
+        self.assertTrue(all("still hung" in f.description for f in report.findings
+                            if f.title.startswith("Check Execution Error")))
+        self.assertEqual(self.auditor.check_stats["hung"]["timeouts"], 2)
+
+        release.set()
+        for future in self.auditor._hung_checks:
+            future.result(timeout=5)
+        report = asyncio.run(self.auditor.run_audit("Test", ["access_controls"]))
+        self.assertFalse(any(f.title.startswith("Check Execution Error") for f in report.findings))
+
+    def test_findings_store_preserves_status(self):
+        report = asyncio.run(self.auditor.run_audit("Test", ["access_controls"]))
+        asyncio.run(self.auditor._trigger_remediation(report))
+        finding_id = report.findings[0].finding_id
+        self.auditor.findings_db.update_status(finding_id, RemediationStatus.COMPLETED)
+
+        asyncio.run(self.auditor._trigger_remediation(report))
+        self.assertEqual(self.auditor.findings_db.get(finding_id).remediation_status, RemediationStatus.COMPLETED)
+        self.assertEqual(len(self.auditor.get_active_findings([AuditSeverity.MEDIUM])), 1)
+
+    def test_active_findings_default_to_critical(self):
+        report = asyncio.run(self.auditor.run_audit("Test", ["access_controls"]))
+        critical = AuditFinding.from_dict(dict(report.findings[0].to_dict(), finding_id="CRIT-1",
+                                               severity=AuditSeverity.CRITICAL.value))
+        report.findings.append(critical)
+        asyncio.run(self.auditor._trigger_remediation(report))
+
+        self.assertEqual([f.finding_id for f in self.auditor.get_active_findings()], ["CRIT-1"])
+        self.assertEqual(len(self.auditor.get_active_findings(None)), len(report.findings))
+
+    def test_findings_db_is_dict_compatible(self):
+        report = asyncio.run(self.auditor.run_audit("Test", ["access_controls"]))
+        findings_db = self.auditor.findings_db
+        finding = report.findings[0]
+        findings_db[finding.finding_id] = finding
+        self.assertIn(finding.finding_id, findings_db)
+        self.assertEqual(len(findings_db), 1)
+        self.assertIsInstance(findings_db[finding.finding_id], AuditFinding)
+
+        finding.remediation_status = RemediationStatus.IN_PROGRESS
+        findings_db[finding.finding_id] = finding
+        self.assertEqual([(k, v.remediation_status) for k, v in findings_db.items()],
+                         [(finding.finding_id, RemediationStatus.IN_PROGRESS)])
+        del findings_db[finding.finding_id]
+        self.assertIsNone(findings_db.get(finding.finding_id))
+        with self.assertRaises(KeyError):
+            findings_db["missing"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for incremental evidence collection in the Living Evidence Engine
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from certification.living_evidence import LivingEvidenceEngine
+
+
+class TestIncrementalCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, "logs"))
+        os.makedirs(os.path.join(self.root, ".git", "objects"))
+        for i in range(5):
+            self._write(f"logs/service{i}.log", "2025-01-01 10:00:00 started\n")
+        self._write(".git/objects/audit.json", "{}")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, relative, content, mode="w"):
+        with open(os.path.join(self.root, relative), mode) as f:
+            f.write(content)
+
+    def _collect(self, engine):
+        asyncio.run(engine._collect_evidence_artifacts())
+        return engine.collection_stats
+
+    def test_only_changed_files_are_rehashed(self):
+        engine = LivingEvidenceEngine(self.root)
+        first = self._collect(engine)
+        self.assertEqual((first["files_matched"], first["files_hashed"]), (5, 5))
+        self.assertEqual(self._collect(engine)["files_hashed"], 0)
+
+        self._write("logs/service1.log", "2025-01-01 10:05:00 error\n", mode="a")
+        stats = self._collect(engine)
+        self.assertEqual((stats["files_hashed"], stats["artifacts_changed"]), (1, 1))
+        self.assertEqual(engine.evidence_cache["logs/service1.log", "system_logs"].content_hash,
+                         engine.manifest.hash_for("logs/service1.log"))
+        engine.stop_living_collection()
+
+    def test_manifest_survives_restart_and_tracks_removals(self):
+        engine = LivingEvidenceEngine(self.root)
+        self._collect(engine)
+        engine.stop_living_collection()
+
+        os.remove(os.path.join(self.root, "logs", "service0.log"))
+        restarted = LivingEvidenceEngine(self.root)
+        stats = self._collect(restarted)
+        # Unchanged files are re-read once to rebuild the in-memory artifacts
+        self.assertEqual((stats["files_rebuilt"], stats["files_removed"]), (4, 1))
+        self.assertNotIn("logs/service0.log", restarted.manifest.entries)
+        self.assertEqual(self._collect(restarted)["files_hashed"], 0)
+        restarted.stop_living_collection()
+
+    def test_bundles_are_populated_after_restart(self):
+        engine = LivingEvidenceEngine(self.root)
+        self._collect(engine)
+        engine.stop_living_collection()
+
+        restarted = LivingEvidenceEngine(self.root)
+
+        async def cycle():
+            bundle_id = await restarted.create_living_bundle(["ISO 27001"])
+            await restarted._collect_evidence_artifacts()
+            await restarted._update_living_bundles()
+            late_id = await restarted.create_living_bundle(["ISO 27701"], bundle_type="late")
+            return restarted.active_bundles[bundle_id], restarted.active_bundles[late_id]
+
+        bundle, late = asyncio.run(cycle())
+        self.assertEqual(len(bundle.evidence_artifacts), 5)
+        self.assertEqual(len(late.evidence_artifacts), 5)
+        restarted.stop_living_collection()
+
+    def test_evicted_artifacts_are_rebuilt(self):
+        engine = LivingEvidenceEngine(self.root, max_cached_artifacts=3)
+        self._collect(engine)
+        self.assertEqual(len(engine.evidence_cache), 3)
+        stats = self._collect(engine)
+        self.assertEqual(stats["files_rebuilt"], 2)
+        engine.stop_living_collection()
+
+    def test_file_matching_several_patterns_yields_each(self):
+        self._write("logs/incident_audit.json", '{"status": "closed"}')
+        engine = LivingEvidenceEngine(self.root)
+        self._collect(engine)
+        self.assertIn(("logs/incident_audit.json", "audit_trails"), engine.evidence_cache)
+        self.assertIn(("logs/incident_audit.json", "incident_reports"), engine.evidence_cache)
+        self.assertEqual(engine.manifest.entries["logs/incident_audit.json"][3], "audit_trails,incident_reports")
+        engine.stop_living_collection()
+
+    def test_json_export_hash_covers_written_document(self):
+        engine = LivingEvidenceEngine(self.root)
+
+        async def build():
+            bundle_id = await engine.create_living_bundle(["ISO 27001"])
+            await engine._collect_evidence_artifacts()
+            await engine._update_living_bundles()
+            return bundle_id
+
+        bundle_id = asyncio.run(build())
+        path = os.path.join(self.root, "package.json")
+        digest = engine.export_audit_package(bundle_id, path, export_timestamp="2026-01-01T00:00:00")
+        engine.stop_living_collection()
+
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(len(data["evidence_inventory"]), 5)
+        self.assertEqual(data["audit_package"].pop("export_integrity_hash"), digest)
+        self.assertEqual(hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest(), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
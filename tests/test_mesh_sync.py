@@ -0,0 +1,81 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the content-addressed bundle store and anti-entropy handshake in
+infrastructure.offline_mesh.mesh_sync
+"""
+
+import hashlib
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from infrastructure.offline_mesh.mesh_sync import BundleSummary, MeshNode
+
+
+class TestMeshAntiEntropy(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _node(self, name, **kwargs):
+        return MeshNode(name, store_path=str(Path(self.tmp.name) / f"{name}.sqlite"), **kwargs)
+
+    def test_handshake_transfers_only_missing_bundles(self):
+        clinic, courier = self._node("clinic"), self._node("courier")
+        shared = [clinic.bundle_for_transport({"case": i}) for i in range(50)]
+        courier.receive_bundles(shared)
+        clinic.bundle_for_transport({"case": "new"})
+        courier.bundle_for_transport({"case": "courier-note"})
+
+        stats = clinic.sync_with(courier)
+        self.assertEqual((stats["bundles_sent"], stats["bundles_received"]), (1, 1))
+        self.assertEqual(set(clinic.store.hashes()), set(courier.store.hashes()))
+        # Converged nodes exchange summaries only
+        stats = clinic.sync_with(courier)
+        self.assertEqual(stats["bundle_bytes"], 0)
+
+    def test_duplicates_and_corruption(self):
+        clinic_a, clinic_b, courier = self._node("a"), self._node("b"), self._node("courier")
+        bundle = clinic_a.bundle_for_transport({"case": 1})
+        clinic_b.receive_bundles([bundle])
+        self.assertEqual(courier.receive_bundles([bundle, bundle]), (1, 1, 0))
+        courier.sync_with(clinic_b)
+        self.assertEqual(len(courier.store), 1)
+
+        forged = dict(clinic_a.bundle_for_transport({"case": 2}), payload='{"case": 3}')
+        self.assertEqual(courier.receive_bundles([forged]), (0, 0, 1))
+
+    def test_ttl_and_hop_limit_eviction(self):
+        clinic, courier = self._node("clinic"), self._node("courier", ttl_seconds=60, max_hops=1)
+        fresh = clinic.bundle_for_transport({"case": "fresh"})
+        stale = dict(clinic.bundle_for_transport({"case": "stale"}), timestamp=time.time() - 120)
+        courier.receive_bundles([fresh, stale])
+        self.assertEqual(courier.store.hashes(), [fresh["integrity_hash"]])
+
+        relay = self._node("relay")
+        self.assertEqual(courier.bundles_missing_from(relay.summary()), [])  # already at the hop limit
+
+    def test_summary_false_positive_rate(self):
+        digests = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(30_000)]
+        summary = BundleSummary(10_000, false_positive_rate=0.01)
+        summary.add_many(digests[:10_000])
+        self.assertTrue(all(summary.contains_many(digests[:10_000])))
+        self.assertTrue(all(d in summary for d in digests[:10_000:97]))
+        false_positives = sum(summary.contains_many(digests[10_000:]))
+        self.assertLess(false_positives / 20_000, 0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
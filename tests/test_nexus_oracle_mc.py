@@ -0,0 +1,68 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+
+"""
+Tests for the Monte Carlo scenario engine in nexus_oracle
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from risk_mitigation.nexus_oracle import MonteCarloScenarioEngine, _simulate_monte_carlo_shard
+
+
+class TestMonteCarloScenarioEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = MonteCarloScenarioEngine(shard_size=2_000, max_workers=1)
+        self.params = {cat: {'probability': 0.2, 'impact': 0.4} for cat in self.engine.categories}
+
+    def test_same_seed_same_result_for_any_worker_count(self):
+        serial = self.engine.simulate(self.params, n_samples=9_000, seed=42)
+        pooled = MonteCarloScenarioEngine(shard_size=2_000, max_workers=3).simulate(
+            self.params, n_samples=9_000, seed=42)
+        self.assertEqual(serial, pooled)
+        self.assertNotEqual(serial, self.engine.simulate(self.params, n_samples=9_000, seed=43))
+
+    def test_marginals_and_correlation_within_tolerance(self):
+        n_categories = len(self.engine.categories)
+        rho = 0.6
+        cholesky = self.engine._cholesky(np.full((n_categories, n_categories), rho) + np.eye(n_categories) * (1 - rho))
+        probabilities = np.full(n_categories, 0.5)
+        impacts = np.full(n_categories, 0.4)
+        sigma = np.full(n_categories, self.engine.severity_sigma)
+        log_mu = np.log(impacts) - 0.5 * sigma ** 2
+
+        losses, occurrences = _simulate_monte_carlo_shard(
+            np.random.SeedSequence(7), 200_000, cholesky, np.zeros(n_categories), log_mu, sigma,
+            np.eye(n_categories))
+        np.testing.assert_allclose(occurrences.mean(axis=0), probabilities, atol=0.01)
+        # Lognormal severities are calibrated so their mean equals the impact
+        severity_mean = losses.sum(axis=0) / occurrences.sum(axis=0)
+        np.testing.assert_allclose(severity_mean, impacts, rtol=0.02)
+        # For thresholds at 0, P(both occur) = 1/4 + asin(rho) / (2 pi)
+        joint = (occurrences[:, 0] & occurrences[:, 1]).mean()
+        self.assertAlmostEqual(joint, 0.25 + math.asin(rho) / (2 * math.pi), delta=0.01)
+
+        result = self.engine.simulate(self.params, n_samples=50_000, seed=1)
+        for frequency in result['category_event_frequency'].values():
+            self.assertAlmostEqual(frequency, 0.2, delta=0.01)
+
+    def test_rejects_empty_simulation(self):
+        with self.assertRaises(ValueError):
+            self.engine.simulate(self.params, n_samples=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
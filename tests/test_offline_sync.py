@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Multi-node convergence tests for the delta-state CRDT in core.sync.offline_sync
+"""
+
+import random
+import unittest
+
+from core.sync.offline_sync import DeltaCRDTStore, sync_pair
+
+
+class FakeClock:
+    """Skewed wall clock so nodes disagree on physical time."""
+
+    def __init__(self, offset):
+        self.t = 1_700_000_000.0 + offset
+
+    def __call__(self):
+        self.t += 0.0005
+        return self.t
+
+
+class TestDeltaCRDTConvergence(unittest.TestCase):
+
+    def _nodes(self, count):
+        return [DeltaCRDTStore(f"node_{i}", FakeClock(offset=i * 3)) for i in range(count)]
+
+    def _converge(self, nodes):
+        for _ in range(2):
+            for a in nodes:
+                for b in nodes:
+                    if a is not b:
+                        sync_pair(a, b)
+
+    def test_random_partitions_converge(self):
+        rng = random.Random(7)
+        nodes = self._nodes(4)
+        for step in range(3000):
+            node = rng.choice(nodes)
+            action = rng.random()
+            if action < 0.5:
+                node.set(f"k{rng.randrange(200)}", step)
+            elif action < 0.6:
+                node.delete(f"k{rng.randrange(200)}")
+            elif action < 0.8:
+                node.add(f"set{rng.randrange(5)}", rng.randrange(30))
+            elif action < 0.9:
+                node.remove(f"set{rng.randrange(5)}", rng.randrange(30))
+            else:
+                a, b = rng.sample(nodes, 2)
+                sync_pair(a, b)
+        self._converge(nodes)
+        expected = nodes[0].to_dict()
+        self.assertTrue(expected)
+        for node in nodes[1:]:
+            self.assertEqual(node.to_dict(), expected)
+            self.assertEqual(node.version_vector(), nodes[0].version_vector())
+
+    def test_concurrent_add_survives_remove(self):
+        a, b = self._nodes(2)
+        a.add("alerts", "cholera")
+        sync_pair(a, b)
+        a.remove("alerts", "cholera")
+        b.add("alerts", "cholera")  # concurrent re-add is not observed by a's remove
+        sync_pair(a, b)
+        self.assertEqual(a.members("alerts"), ["cholera"])
+        self.assertEqual(b.members("alerts"), ["cholera"])
+
+    def test_delta_size_tracks_changes_not_state(self):
+        sizes = []
+        for keys in (1_000, 20_000):
+            a, b = self._nodes(2)
+            for i in range(keys):
+                a.set(f"facility_{i}", i)
+            sync_pair(a, b)
+            for i in range(100):
+                a.set(f"facility_{i}", -i)
+            delta = a.delta_since(b.version_vector())
+            self.assertEqual(len(delta["ops"]), 100)
+            sizes.append(sync_pair(a, b))
+            self.assertEqual(b.get("facility_99"), -99)
+        self.assertLess(abs(sizes[0] - sizes[1]), 0.1 * sizes[0])
+        self.assertEqual(len(a.delta_since(b.version_vector())["ops"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
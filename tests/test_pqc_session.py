@@ -0,0 +1,93 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the session-based hybrid PQC channel
+"""
+
+import hashlib
+import hmac
+import os
+import unittest
+
+from crypto.post_quantum.pqc_session import PQCSessionManager, RekeyPolicy
+
+
+class FakeKEM:
+    """Symmetric stand-in for ML-KEM (pk == sk) so tests skip pure-Python kyber."""
+
+    def __init__(self):
+        self.encapsulations = 0
+
+    def encapsulate(self, pk):
+        self.encapsulations += 1
+        ct = os.urandom(32)
+        return ct, hmac.new(pk, ct, hashlib.sha256).digest()
+
+    def decapsulate(self, sk, ct):
+        return hmac.new(sk, ct, hashlib.sha256).digest()
+
+
+class TestPQCSession(unittest.TestCase):
+
+    def setUp(self):
+        self.key = os.urandom(32)
+        self.kem = FakeKEM()
+        self.sender = PQCSessionManager(kem=self.kem, policy=RekeyPolicy(max_bytes=1000))
+        self.receiver = PQCSessionManager(kem=self.kem)
+
+    def test_batch_round_trip_reuses_handshake(self):
+        messages = [f"homa {i}".encode() for i in range(50)]
+        handshake, buffer = self.sender.seal_many("dadaab", self.key, messages)
+        self.receiver.accept("nairobi", self.key, handshake)
+        self.assertEqual(self.receiver.open_many(buffer), messages)
+
+        handshake, buffer = self.sender.seal_many("dadaab", self.key, messages[:5])
+        self.assertIsNone(handshake)
+        self.assertEqual(self.receiver.open_many(buffer), messages[:5])
+        self.assertEqual(self.kem.encapsulations, 1)
+
+    def test_rekey_on_byte_budget(self):
+        handshake, _ = self.sender.seal_many("dadaab", self.key, [b"x" * 600])
+        self.assertIsNotNone(handshake)
+        handshake, _ = self.sender.seal_many("dadaab", self.key, [b"x" * 600])
+        self.assertIsNotNone(handshake)
+        self.assertEqual(self.sender.handshakes, 2)
+
+    def test_rekey_on_age(self):
+        now = [0.0]
+        sender = PQCSessionManager(kem=self.kem, policy=RekeyPolicy(max_age_seconds=60), clock=lambda: now[0])
+        sender.seal_many("dadaab", self.key, [b"a"])
+        now[0] = 61.0
+        handshake, _ = sender.seal_many("dadaab", self.key, [b"b"])
+        self.assertIsNotNone(handshake)
+
+    def test_replay_and_tamper_rejected(self):
+        handshake, buffer = self.sender.seal_many("dadaab", self.key, [b"vitals"])
+        self.receiver.accept("nairobi", self.key, handshake)
+        self.receiver.open_many(buffer)
+        with self.assertRaises(ValueError):
+            self.receiver.open_many(buffer)
+
+        _, buffer = self.sender.seal_many("dadaab", self.key, [b"vitals"])
+        tampered = buffer[:-1] + bytes([buffer[-1] ^ 1])
+        with self.assertRaises(Exception):
+            self.receiver.open_many(tampered)
+
+    def test_bidirectional_frames(self):
+        handshake, _ = self.sender.seal_many("dadaab", self.key, [b"ping"])
+        responder = self.receiver.accept("nairobi", self.key, handshake)
+        initiator, _ = self.sender.session_for("dadaab", self.key)
+        self.assertEqual(initiator.open(responder.seal(b"pong")), b"pong")
+
+
+if __name__ == "__main__":
+    unittest.main()
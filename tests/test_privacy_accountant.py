@@ -0,0 +1,122 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the Rényi-DP accountant and vectorized Gaussian mechanism in
+edge_node.ai_agents.federated_client
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from edge_node.ai_agents.federated_client import (
+    DifferentialPrivacy,
+    FederatedLearningClient,
+    PrivacyBudgetExhausted,
+    RDPAccountant,
+)
+
+
+class TestRDPAccountant(unittest.TestCase):
+
+    def test_gaussian_closed_forms(self):
+        accountant = RDPAccountant()
+        sigma, steps = 1.3, 40
+        accountant.record_gaussian(sigma, steps=steps)
+        # Full-batch Gaussian: RDP(alpha) = T * alpha / (2 sigma^2)
+        np.testing.assert_allclose(accountant._rdp[("local", "default")],
+                                   steps * accountant.orders / (2 * sigma ** 2))
+        # Subsampled, alpha = 2: log(1 + q^2 (e^{1/sigma^2} - 1))
+        q = 0.02
+        rdp = accountant.gaussian_rdp(sigma, q)
+        alpha2 = list(accountant.orders).index(2.0)
+        self.assertAlmostEqual(rdp[alpha2], math.log1p(q ** 2 * math.expm1(1 / sigma ** 2)), places=12)
+        np.testing.assert_allclose(accountant.gaussian_rdp(sigma, 1.0), accountant.orders / (2 * sigma ** 2))
+
+    def test_epsilon_against_classic_bound(self):
+        sigma, steps, delta = 4.0, 200, 1e-5
+        accountant = RDPAccountant(orders=np.linspace(1.05, 200, 4000))
+        accountant.record_gaussian(sigma, steps=steps)
+        # Optimising T*alpha/(2 sigma^2) + log(1/delta)/(alpha-1) over alpha in closed form
+        classic = steps / (2 * sigma ** 2) + math.sqrt(2 * steps * math.log(1 / delta)) / sigma
+        epsilon = accountant.get_epsilon(delta)
+        self.assertLessEqual(epsilon, classic)
+        self.assertGreater(epsilon, 0.85 * classic)
+
+    def test_laplace_basic_composition_and_ledger_keys(self):
+        accountant = RDPAccountant()
+        accountant.record_laplace(1.0, steps=3, client_id="a", dataset_id="malaria")
+        accountant.record_gaussian(2.0, sample_rate=0.01, steps=100, client_id="b", dataset_id="malaria")
+        accountant.record_gaussian(2.0, sample_rate=0.01, steps=100, client_id="b", dataset_id="tb")
+        self.assertEqual(accountant.get_epsilon(1e-5, client_id="a"), 3.0)
+        by_client = accountant.get_epsilon(1e-5, client_id="b")
+        by_pair = accountant.get_epsilon(1e-5, client_id="b", dataset_id="tb")
+        self.assertLess(by_pair, by_client)
+        self.assertGreater(accountant.get_epsilon(1e-5, dataset_id="malaria"), 3.0 - 1e-9)
+        self.assertEqual(accountant.releases(dataset_id="malaria"), 103)
+
+
+class TestGaussianMechanism(unittest.TestCase):
+
+    def test_per_layer_clipping_bounds_total_norm(self):
+        privacy = DifferentialPrivacy(noise_multiplier=0.0)
+        flat = np.concatenate([np.full(400, 3.0), np.full(100, 0.001), np.full(12, -5.0)]).astype(np.float32)
+        factors = privacy.clip_per_layer(flat, [400, 100, 12], max_norm=1.0)
+        self.assertEqual(factors[1], 1.0)
+        self.assertLessEqual(np.linalg.norm(flat), 1.0 + 1e-6)
+        with self.assertRaises(ValueError):
+            privacy.clip_per_layer(flat, [400, 100], max_norm=1.0)
+
+        noised = DifferentialPrivacy(noise_multiplier=2.0).privatize(
+            np.zeros(200_000, dtype=np.float32), max_norm=0.5, rng=np.random.default_rng(0))
+        self.assertEqual(noised.dtype, np.float32)
+        self.assertAlmostEqual(float(noised.std()), 1.0, places=2)
+
+    def test_early_stop_when_budget_exhausted(self):
+        client = FederatedLearningClient(name="FL Budget Client", noise_multiplier=4.0, privacy_budget=3.0)
+        halted = []
+        client.privacy.on_budget_exhausted(halted.append)
+        rounds = 0
+        with self.assertRaises(PrivacyBudgetExhausted):
+            while True:
+                client.train_local_model([{"features": [1], "label": 0}])
+                client.get_model_update(apply_privacy=True)
+                rounds += 1
+        spent = client.compute_privacy_spent()
+        self.assertGreater(rounds, 1)
+        self.assertTrue(spent["privacy_budget_exhausted"])
+        self.assertLessEqual(spent["total_epsilon_spent"], 3.0)
+        self.assertEqual(spent["releases"], rounds)
+        self.assertEqual(len(halted), 1)
+
+    def test_rounds_stop_after_default_budget(self):
+        client = FederatedLearningClient(name="FL Default Budget Client")
+        for _ in range(10):
+            client.train_local_model([{"features": [1], "label": 0}])
+            client.get_model_update(apply_privacy=True)
+        client.train_local_model([{"features": [1], "label": 0}])
+        with self.assertRaises(PrivacyBudgetExhausted):
+            client.get_model_update(apply_privacy=True)
+        self.assertTrue(client.rounds_halted)
+
+        # Halted clients skip training and refuse further updates without another release
+        result = client.train_local_model([{"features": [1], "label": 0}])
+        self.assertTrue(result["halted"])
+        self.assertEqual(client.training_rounds, 11)
+        with self.assertRaises(PrivacyBudgetExhausted):
+            client.get_model_update(apply_privacy=False)
+        self.assertEqual(client.compute_privacy_spent()["releases"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
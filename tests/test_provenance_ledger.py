@@ -0,0 +1,114 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the pharmaceutical provenance ledger
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from pharma_supply.provenance_ledger import LedgerIntegrityError, ProvenanceLedger, _entry_hash
+
+
+class TestProvenanceLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "ledger.jsonl")
+        self.ledger = ProvenanceLedger(self.path)
+
+    def tearDown(self):
+        self.ledger.close()
+        self.tmp.cleanup()
+
+    def _events(self, count):
+        return [{
+            'serial_number': f"SN{i % 3}",
+            'batch_number': f"B{i % 2}",
+            'gtin': "06141410000001",
+            'transaction_type': 'ship',
+            'from_entity': f"depot_{i}",
+            'to_entity': f"depot_{i + 1}",
+        } for i in range(count)]
+
+    def test_indexes_and_provenance_chain(self):
+        self.ledger.append_batch(self._events(9))
+        chain = self.ledger.provenance_chain("SN1")
+        self.assertEqual([e['seq'] for e in chain], [1, 4, 7])
+        self.assertEqual(len(self.ledger.entries_for_batch("B0")), 5)
+        self.assertEqual(len(self.ledger.entries_for_gtin("06141410000001", limit=2)), 2)
+        self.assertEqual(self.ledger.validate_chain(chain)['status'], 'valid')
+
+    def test_incremental_validation(self):
+        self.ledger.append_batch(self._events(5))
+        self.assertEqual(self.ledger.validate_new()['validated'], 5)
+        self.ledger.append({'serial_number': "SN0"})
+        result = self.ledger.validate_new()
+        self.assertEqual(result['status'], 'valid')
+        self.assertEqual(result['validated'], 1)
+
+    def _rewrite(self, seq, **changes):
+        with open(self.path) as f:
+            lines = f.readlines()
+        entry = json.loads(lines[seq])
+        entry.update(changes)
+        lines[seq] = json.dumps(entry) + "\n"
+        with open(self.path, "w") as f:
+            f.writelines(lines)
+
+    def test_reload_verifies_chain(self):
+        self.ledger.append_batch(self._events(6))
+        self.ledger.close()
+
+        self.ledger = ProvenanceLedger(self.path)
+        self.assertEqual(len(self.ledger), 6)
+        result = self.ledger.validate_chain(self.ledger.provenance_chain("SN0"))
+        self.assertEqual(result['status'], 'valid')
+
+    def test_tampered_entry_rejected_on_load(self):
+        self.ledger.append_batch(self._events(6))
+        self.ledger.close()
+        self._rewrite(3, to_entity="unlicensed_vendor")
+
+        with self.assertRaises(LedgerIntegrityError) as ctx:
+            ProvenanceLedger(self.path)
+        self.assertEqual(ctx.exception.seq, 3)
+
+    def test_rehashed_entry_breaks_link_on_load(self):
+        self.ledger.append_batch(self._events(6))
+        self.ledger.close()
+        # Recomputing the tampered entry's own hash still breaks the next entry's previous_hash
+        with open(self.path) as f:
+            entry = json.loads(f.readlines()[2])
+        entry['to_entity'] = "unlicensed_vendor"
+        entry.pop('hash')
+        self._rewrite(2, to_entity="unlicensed_vendor", hash=_entry_hash(entry))
+
+        with self.assertRaises(LedgerIntegrityError) as ctx:
+            ProvenanceLedger(self.path)
+        self.assertEqual(ctx.exception.seq, 3)
+
+    def test_partial_record_truncated_on_open(self):
+        self.ledger.append_batch(self._events(2))
+        self.ledger.close()
+        with open(self.path, "ab") as f:
+            f.write(b'{"seq": 2, "ser')
+        self.ledger = ProvenanceLedger(self.path)
+        self.assertEqual(len(self.ledger), 2)
+        self.ledger.append({'serial_number': "SN9"})
+        self.assertEqual(self.ledger.validate_new()['status'], 'valid')
+
+
+if __name__ == "__main__":
+    unittest.main()
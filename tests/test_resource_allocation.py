@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the One Health resource allocation engine
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from one_health import allocation
+from one_health.allocation import AllocationEngine, allocation_targets
+
+
+class TestAllocationTargets(unittest.TestCase):
+
+    def test_proportional_rounding_preserves_totals(self):
+        rng = np.random.default_rng(3)
+        weights = rng.random((20, 50))
+        caps = rng.integers(0, 40, (20, 50)).astype(float)
+        supply = rng.integers(0, 1500, 20).astype(float)
+        targets = allocation_targets(weights, caps, supply)
+        np.testing.assert_array_equal(targets.sum(axis=1), np.minimum(supply, caps.sum(axis=1)))
+        self.assertTrue((targets <= caps).all())
+
+    def test_priority_fills_in_weight_order(self):
+        targets = allocation_targets(np.array([[2.0, 5.0, 0.0]]), np.array([[3.0, 2.0, 4.0]]), np.array([6.0]),
+                                     policy='priority')
+        self.assertEqual(targets.tolist(), [[3, 2, 1]])
+
+
+class TestAllocationEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.locations = ["a", "b", "c"]
+        self.routes = [("x", "a", 100, 1.0, True), ("x", "b", 5000, 1.0, True), ("y", "b", np.inf, 2.0, True),
+                       ("y", "c", np.inf, 1.0, False)]
+        self.need = np.array([800.0, 5000.0, 166.0])
+
+    def _check(self, engine, result, supply):
+        self.assertEqual(result.total_allocated + result.unallocated.sum(), sum(supply.values()))
+        self.assertTrue((result.flows <= engine.route_capacity).all())
+        self.assertTrue((result.allocated <= self.need).all())
+
+    def test_network_respects_route_and_cold_chain_limits(self):
+        engine = AllocationEngine(self.locations, ["x", "y"], self.routes, cold_chain=True)
+        supply = {"x": 1000, "y": 700}
+        result = engine.solve(supply, self.need)
+        self._check(engine, result, supply)
+        self.assertEqual(result.allocated.tolist(), [100, 1600, 0])
+        self.assertEqual(result.methods, {"min_cost_flow" if allocation.SCIPY_AVAILABLE else "greedy": 1})
+
+        with mock.patch.object(allocation, "SCIPY_AVAILABLE", False):
+            greedy = AllocationEngine(self.locations, ["x", "y"], self.routes, cold_chain=True).solve(supply, self.need)
+        self._check(engine, greedy, supply)
+
+    def test_reoptimize_and_scenarios_match_fresh_solves(self):
+        routes = self.routes + [("z", "c", 50, 1.0, True)]
+        engine = AllocationEngine(self.locations, ["x", "y", "z"], routes)
+        supply = {"x": 900, "y": 400, "z": 80}
+        engine.solve(supply, self.need)
+        updated = self.need * np.array([1.0, 0.1, 1.0])
+        warm = engine.reoptimize(need=updated)
+        fresh = AllocationEngine(self.locations, ["x", "y", "z"], routes).solve(supply, updated)
+        np.testing.assert_array_equal(warm.allocated, fresh.allocated)
+
+        scenarios = engine.solve_scenarios(supply, np.stack([self.need, updated]))
+        np.testing.assert_array_equal(scenarios[1].allocated, fresh.allocated)
+        for result in scenarios:
+            self._check(engine, result, supply)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the SovereignSync durable cache and batched flush engine
+"""
+
+import os
+import tempfile
+import unittest
+
+from edge_node.sync_protocol.sovereign_sync import ConnectivityProbe, LocalFileSink, SovereignSync, SyncSink
+
+
+class ScriptedProbe(ConnectivityProbe):
+    """Probe whose socket checks return scripted results."""
+
+    def __init__(self, results, **kwargs):
+        self.now = 0.0
+        super().__init__(clock=lambda: self.now, **kwargs)
+        self.results = list(results)
+
+    def _probe(self):
+        return self.results.pop(0)
+
+
+class FailingSink(SyncSink):
+    def write_batch(self, collection, records):
+        raise IOError("uplink dropped")
+
+
+class TestConnectivityProbe(unittest.TestCase):
+
+    def test_ttl_and_backoff(self):
+        probe = ScriptedProbe([False, False, True], ttl=30, initial_backoff=5, max_backoff=8)
+        self.assertFalse(probe.is_online())
+        probe.now = 4
+        self.assertFalse(probe.is_online())     # inside the 5 s backoff, no new probe
+        probe.now = 5
+        self.assertFalse(probe.is_online())     # second failure doubles the backoff (capped at 8)
+        probe.now = 12
+        self.assertFalse(probe.is_online())
+        probe.now = 13
+        self.assertTrue(probe.is_online())
+        probe.now = 40
+        self.assertTrue(probe.is_online())      # cached for the 30 s TTL
+        self.assertEqual(probe.probes, 3)
+
+
+class TestSovereignSyncFlush(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "cache.sqlite")
+        self.sink = LocalFileSink(os.path.join(self.tmp.name, "sink.sqlite"), is_cloud=True)
+
+    def tearDown(self):
+        self.sink.close()
+        self.tmp.cleanup()
+
+    def _offline_sync(self, records=25, **kwargs):
+        sync = SovereignSync(self.cache_path, sink=self.sink, probe=ScriptedProbe([False]), **kwargs)
+        for i in range(records):
+            self.assertEqual(sync.sync_with_edge_fallback({"patient_id": f"P{i}"}, "Dadaab_Clinic"),
+                             "edge_stored_with_hsml")
+        return sync
+
+    def test_cache_is_durable_and_flushes_in_batches(self):
+        self._offline_sync().local_cache.close()
+
+        sync = SovereignSync(self.cache_path, sink=self.sink, probe=ScriptedProbe([True]), batch_size=10)
+        status = sync.get_cache_status()
+        self.assertEqual((status["total_entries"], status["pending_sync"]), (25, 25))
+        self.assertEqual(sync.verify_cache_integrity()["valid_entries"], 25)
+
+        stats = sync.batch_sync_when_connected()
+        self.assertEqual((stats["synced_count"], stats["batches"], stats["remaining_count"]), (25, 3, 0))
+        self.assertEqual(self.sink.count("field_data"), 25)
+        self.assertEqual(sync.get_cache_status()["counters"]["connectivity_probes"], 1)
+
+    def test_failed_batch_keeps_entries_and_backs_off(self):
+        sync = self._offline_sync(records=5)
+        sync.sink = FailingSink()
+        sync.probe.results = [True]
+        sync.probe.now = 60
+
+        stats = sync.batch_sync_when_connected()
+        self.assertEqual((stats["synced_count"], stats["failed_count"], stats["remaining_count"]), (0, 5, 5))
+        self.assertFalse(sync.probe.is_online())
+
+    def test_entry_rewritten_during_flush_is_kept(self):
+        sync = self._offline_sync(records=3)
+        cache = sync.local_cache
+        first_key = next(iter(cache))
+        write_batch = self.sink.write_batch
+
+        def rewrite_then_write(collection, records):
+            entry = cache[first_key]
+            entry['data'] = {"patient_id": "P0", "diagnosis": "cholera"}
+            cache[first_key] = entry
+            write_batch(collection, records)
+
+        self.sink.write_batch = rewrite_then_write
+        sync.probe.results = [True]
+        sync.probe.now = 60
+        stats = sync.batch_sync_when_connected()
+        self.assertEqual((stats["synced_count"], stats["remaining_count"]), (2, 1))
+        self.assertEqual(cache[first_key]['data']["diagnosis"], "cholera")
+
+        self.sink.write_batch = write_batch
+        stats = sync.batch_sync_when_connected()
+        self.assertEqual((stats["synced_count"], stats["remaining_count"]), (1, 0))
+
+
+class TestStandInSink(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sink = LocalFileSink(os.path.join(self.tmp.name, "standin.sqlite"))
+        self.sync = SovereignSync(os.path.join(self.tmp.name, "cache.sqlite"), sink=self.sink,
+                                  probe=ScriptedProbe([True]))
+
+    def tearDown(self):
+        self.sync.local_cache.close()
+        self.sink.close()
+        self.tmp.cleanup()
+
+    def test_online_write_stays_on_edge(self):
+        self.assertEqual(self.sync.sync_with_edge_fallback({"patient_id": "P1"}, "Dadaab_Clinic"),
+                         "edge_stored_with_hsml")
+        self.assertEqual(self.sync.counters["cloud_synced"], 0)
+        self.assertEqual(len(self.sync.local_cache), 1)
+        self.assertEqual(self.sink.count(), 0)
+
+    def test_flush_mirrors_without_deleting(self):
+        for i in range(4):
+            self.sync.sync_with_edge_fallback({"patient_id": f"P{i}"}, "Dadaab_Clinic")
+        stats = self.sync.batch_sync_when_connected()
+        self.assertEqual((stats["synced_count"], stats["mirrored_count"], stats["remaining_count"]), (0, 4, 4))
+        self.assertEqual(self.sink.count("field_data"), 4)
+        self.assertEqual(self.sync.get_cache_status()["pending_sync"], 4)
+
+
+class TestDefaultPaths(unittest.TestCase):
+
+    def test_defaults_do_not_depend_on_cwd(self):
+        from edge_node.sync_protocol import sovereign_sync
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(sovereign_sync.DEFAULT_CACHE_PATH,
+                         os.path.join(repo_root, "data", "sync", "sovereign_cache.sqlite"))
+        self.assertEqual(os.path.dirname(sovereign_sync.DEFAULT_STANDIN_PATH),
+                         os.path.dirname(sovereign_sync.DEFAULT_CACHE_PATH))
+
+
+if __name__ == "__main__":
+    unittest.main()
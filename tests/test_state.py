@@ -1,9 +1,96 @@
+import json
+import shutil
+import tempfile
 import unittest
-from core.state.sovereign_bus import bus
+from pathlib import Path
+from unittest import mock
+from core.state import sovereign_bus
+from core.state.sovereign_bus import SovereignBus, bus
 
 class TestState(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "state.json"
+        patcher = mock.patch.multiple(sovereign_bus, STATE_FILE=self.path, _default_bus=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
     def test_state_mutation(self):
         bus.set("test_key","test_val")
         self.assertEqual(bus.get("test_key"),"test_val")
+        with bus:
+            pass
+        self.assertEqual(json.loads(self.path.read_text())["test_key"], "test_val")
+
+    def test_default_bus_is_created_on_first_use(self):
+        self.assertIsNone(sovereign_bus._default_bus)
+        bus.get("status")
+        self.assertIs(sovereign_bus.get_bus(), sovereign_bus._default_bus)
+        self.assertEqual(sovereign_bus._default_bus.state_file, self.path)
+
+class TestWriteBehind(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "state.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_updates_coalesce_into_one_atomic_write(self):
+        state = SovereignBus(self.path, debounce=60, journal=False)
+        flushes = state.stats["flushes"]
+        for i in range(1000):
+            state.set("counter", i)
+        self.assertFalse(self.path.exists())
+        with state:
+            state.set("mode", "SURGE")
+        self.assertEqual(state.stats["flushes"], flushes + 1)
+        saved = json.loads(self.path.read_text())
+        self.assertEqual((saved["counter"], saved["mode"]), (999, "SURGE"))
+
+    def test_journal_recovers_unflushed_changes(self):
+        state = SovereignBus(self.path, debounce=60, journal=True)
+        state.set("status", "ACTIVE")
+        state.set("status", "DEGRADED")
+        # Simulate a crash before the window closes: no snapshot is ever written
+        state._cancel_timer()
+        state._dirty = False
+        with open(state.journal_file, "a") as f:
+            f.write('{"k": "torn')
+
+        recovered = SovereignBus(self.path, debounce=60, journal=True)
+        self.assertEqual(recovered.get("status"), "DEGRADED")
+        self.assertEqual(json.loads(self.path.read_text())["status"], "DEGRADED")
+        self.assertFalse(recovered.journal_file.exists())
+
+    def test_journal_is_fsynced_on_every_set(self):
+        state = SovereignBus(self.path, debounce=60, journal=True)
+        with mock.patch.object(sovereign_bus.os, "fsync", wraps=sovereign_bus.os.fsync) as fsync:
+            state.set("a", 1)
+            state.set("b", 2)
+        self.assertEqual(fsync.call_count, 2)
+        state._cancel_timer()
+        state._journal.close()
+
+    def test_journal_is_opt_in(self):
+        state = SovereignBus(self.path, debounce=60)
+        with mock.patch.object(sovereign_bus.os, "fsync") as fsync:
+            state.set("a", 1)
+        fsync.assert_not_called()
+        self.assertIsNone(state.journal_file)
+        state._cancel_timer()
+
+    def test_exit_flush_skips_removed_directory(self):
+        state_dir = Path(self.tmp.name) / "gone"
+        state_dir.mkdir()
+        state = SovereignBus(state_dir / "state.json", debounce=60, journal=False)
+        state.set("status", "ACTIVE")
+        shutil.rmtree(state_dir, ignore_errors=True)
+        state._flush_at_exit()
+        self.assertFalse(state_dir.exists())
+        state._cancel_timer()
 
 if __name__=="__main__": unittest.main()
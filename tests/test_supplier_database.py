@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the indexed supplier catalog in the agentic supply chain engine
+"""
+
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from supply_chain.agentic.autonomy_engine import (
+    AutonomousProcurementAgents,
+    NegotiationResult,
+    ProcurementRequest,
+    SupplierDatabase,
+    SupplierTier,
+)
+
+
+FIELDS = ["supplier_id", "name", "tier", "location", "reliability_score", "price_competitiveness",
+          "delivery_speed", "quality_rating", "equity_score", "certifications", "items"]
+
+
+class TestSupplierDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, "suppliers.csv")
+        rows = [
+            ["s1", "Mombasa MSME", "local_msme", "Kenya", 0.9, 0.7, 5, 0.8, 0.95, "GMP", "ors;zinc"],
+            ["s2", "Lagos Regional", "regional", "Nigeria", 0.8, 0.9, 10, 0.9, 0.6, "GMP;WHO-PQ", "ors"],
+            ["s3", "Global Pharma", "global", "Germany", 0.99, 0.5, 3, 0.95, 0.2, "WHO-PQ", "ors"],
+        ]
+        with open(self.csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(rows)
+        self.database = SupplierDatabase(seed_defaults=False)
+        self.assertEqual(asyncio.run(self.database.bulk_import(self.csv_path)), 3)
+
+    def tearDown(self):
+        self.database.close()
+        self.tmp.cleanup()
+
+    def test_find_candidates_filters_and_orders(self):
+        ids = lambda profiles: [p.supplier_id for p in profiles]
+        self.assertEqual(ids(self.database.find_candidates("ors", 30)), ["s1", "s2", "s3"])
+        self.assertEqual(ids(self.database.find_candidates("ors", 8, required_certifications=["WHO-PQ"])), ["s3"])
+        self.assertEqual(ids(self.database.find_candidates("ors", 30, min_quality=0.85, limit=1)), ["s2"])
+        self.assertEqual(self.database.find_candidates("amoxicillin", 30), [])
+        self.assertEqual(ids(self.database.query(item_type="ors", tier=SupplierTier.LOCAL_MSME)), ["s1"])
+        self.assertEqual(ids(self.database.query(location="kenya", certification="GMP")), ["s1"])
+
+    def test_changes_invalidate_caches(self):
+        agents = AutonomousProcurementAgents()
+        agents.supplier_database = self.database
+        self.database.subscribe(agents._on_supplier_change)
+        request = ProcurementRequest(
+            request_id="r1", item_type="ors", quantity=10, urgency="high", budget_limit=1000.0,
+            required_by=datetime.now() + timedelta(days=20), destination="Nairobi", specifications={})
+        negotiation = NegotiationResult(
+            negotiation_id="n1", supplier_id="s1", final_price=500.0,
+            delivery_date=datetime.now() + timedelta(days=5), terms={}, confidence_score=0.9, equity_bonus=0.1)
+
+        before = agents._calculate_supplier_score(negotiation, request)
+        profile = self.database.get_supplier_by_id("s1")
+        self.assertIs(self.database.get_supplier_by_id("s1"), profile)
+
+        profile.quality_rating = 0.1
+        self.database.upsert_suppliers([(profile, ["ors"])])
+        self.assertEqual(self.database.get_supplier_by_id("s1").quality_rating, 0.1)
+        self.assertLess(agents._calculate_supplier_score(negotiation, request), before)
+        self.assertEqual([p.supplier_id for p in self.database.find_candidates("zinc", 30)], [])
+
+    def test_unknown_id_gets_placeholder_profile(self):
+        profile = self.database.get_supplier_by_id("not-in-catalog")
+        self.assertEqual(profile.supplier_id, "not-in-catalog")
+        self.assertEqual((profile.quality_rating, profile.reliability_score), (0.75, 0.8))
+        self.assertNotIn("not-in-catalog", self.database._profile_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
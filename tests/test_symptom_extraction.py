@@ -0,0 +1,72 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the FRENASA rule-mode lexicon automaton
+"""
+
+import unittest
+
+from edge_node.frenasa_engine.symptom_extraction import (
+    AhoCorasickMatcher,
+    FRENASASymptomExtractor,
+    get_lexicon_matcher,
+)
+
+
+class TestAhoCorasickMatcher(unittest.TestCase):
+
+    def test_overlapping_matches_with_offsets(self):
+        matcher = AhoCorasickMatcher([("he", 1), ("she", 2), ("hers", 3), ("his", 4)])
+        hits = [(start, end, keyword) for start, end, keyword, _ in matcher.find_all("ushers")]
+        self.assertEqual(hits, [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")])
+
+    def test_shared_keyword_keeps_all_payloads(self):
+        matcher = AhoCorasickMatcher([("mtoto", "<5"), ("mtoto", "5-14")])
+        (_, _, keyword, payloads), = matcher.find_all("mtoto ana homa")
+        self.assertEqual(keyword, "mtoto")
+        self.assertEqual(payloads, ["<5", "5-14"])
+
+    def test_matcher_built_once_per_pattern_set(self):
+        patterns = [("homa", "fever"), ("kali", "severe")]
+        self.assertIs(get_lexicon_matcher(patterns), get_lexicon_matcher(list(patterns)))
+
+
+class TestRuleModeExtraction(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = FRENASASymptomExtractor()
+
+    def test_severity_window_and_duration(self):
+        result = self.extractor.extract_symptoms("Mgonjwa ana homa kali na kikohozi kidogo tangu siku tatu")
+        by_name = {s.symptom_name: s for s in result.symptoms}
+        self.assertEqual(by_name["fever"].severity, "severe")
+        self.assertEqual(by_name["fever"].duration, "siku tatu")
+        # "kali" is inside the 30-character window around "kikohozi", so it wins over "kidogo"
+        self.assertEqual(by_name["cough"].severity, "severe")
+
+    def test_demographics(self):
+        result = self.extractor.extract_symptoms("Mwanamke mjamzito ana maumivu ya tumbo")
+        self.assertEqual(result.demographics.gender, "female")
+        self.assertTrue(result.demographics.pregnant)
+        self.assertEqual([s.symptom_name for s in result.symptoms], ["abdominal_pain"])
+
+    def test_extract_symptoms_many_preserves_order(self):
+        texts = ["Mzee ana kikohozi", "Habari yako", "Mtoto ana kuharisha maji na kutapika"]
+        results = self.extractor.extract_symptoms_many(texts, locations=["A", "B", "C"])
+        self.assertEqual([r.location for r in results], ["A", "B", "C"])
+        self.assertEqual([len(r.symptoms) for r in results], [1, 0, 2])
+        with self.assertRaises(ValueError):
+            self.extractor.extract_symptoms_many(texts, locations=["A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
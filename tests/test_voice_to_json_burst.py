@@ -0,0 +1,134 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025 iLuminara (VISENDI56). All Rights Reserved.
+# Licensed under the Polyform Shield License 1.0.0.
+#
+# COMPETITOR EXCLUSION: Commercial use by entities offering Sovereign/Health OS
+# solutions is STRICTLY PROHIBITED without a commercial license.
+#
+# The Sovereign Immune System (Omni-Law) and JEPA-MPC Architecture are
+# proprietary inventions of iLuminara.
+# ------------------------------------------------------------------------------
+
+"""
+Tests for the Voice-to-JSON burst mode (process_many / stream)
+"""
+
+import random
+import threading
+import time
+import unittest
+
+from edge_node.frenasa_engine.voice_to_json import VoiceToJSONPipeline
+
+
+def _pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("v2j-")]
+
+
+class TestVoiceToJSONBurst(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = VoiceToJSONPipeline(enable_logging=False)
+        transcribe = self.pipeline.transcriber.transcribe_audio
+        jitter = random.Random(3)
+
+        def slow_transcribe(*args, **kwargs):
+            # Uneven latency so completion order differs from input order
+            time.sleep(jitter.uniform(0, 0.004))
+            return transcribe(*args, **kwargs)
+
+        self.pipeline.transcriber.transcribe_audio = slow_transcribe
+        self.consumed = 0
+
+    def tearDown(self):
+        for thread in _pipeline_threads():
+            thread.join(timeout=5)
+
+    def _notes(self, count):
+        for i in range(count):
+            self.consumed += 1
+            yield {"audio_data": b"\x00" * (100 + i), "patient_id": f"P{i}", "location": "Dadaab"}
+
+    def test_process_many_returns_input_order(self):
+        results = self.pipeline.process_many(self._notes(30), transcription_workers=4,
+                                             queue_size=4, batch_size=5)
+        self.assertEqual(len(results), 30)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual([r.audio_metadata["patient_id"] for r in results], [f"P{i}" for i in range(30)])
+        self.assertEqual(self.pipeline.get_statistics()["total_processed"], 30)
+
+    def test_stream_yields_every_index_once(self):
+        indices = [index for index, _ in self.pipeline.stream(self._notes(25), transcription_workers=3)]
+        self.assertEqual(sorted(indices), list(range(25)))
+        self.assertEqual(_pipeline_threads(), [])
+
+    def test_slow_consumer_applies_backpressure(self):
+        stream = self.pipeline.stream(self._notes(200), transcription_workers=1, queue_size=2, batch_size=1)
+        next(stream)
+        time.sleep(0.3)
+
+        # Every queue is full; the feeder must not have read far ahead
+        self.assertLess(self.consumed, 15)
+        depths = self.pipeline.get_stage_metrics()["queue_depths"]
+        self.assertTrue(all(depth <= 2 for depth in depths.values()))
+        stream.close()
+
+    def test_early_close_stops_workers(self):
+        stream = self.pipeline.stream(self._notes(500), transcription_workers=4, queue_size=4)
+        for _ in range(3):
+            next(stream)
+        stream.close()
+
+        self.assertEqual(_pipeline_threads(), [])
+        consumed = self.consumed
+        time.sleep(0.1)
+        self.assertEqual(self.consumed, consumed)
+        self.assertLess(consumed, 500)
+
+    def test_concurrent_streams_have_their_own_queues(self):
+        first = self.pipeline.stream(self._notes(40), transcription_workers=1, queue_size=2, batch_size=1)
+        second = self.pipeline.stream(self._notes(40), transcription_workers=1, queue_size=2, batch_size=1)
+        next(first)
+        next(second)
+        time.sleep(0.2)
+
+        metrics = self.pipeline.get_stage_metrics()
+        self.assertEqual(metrics["active_streams"], 2)
+        # Each stream's queues are bounded separately, so two full streams hold at most twice the capacity
+        self.assertTrue(all(depth <= 4 for depth in metrics["queue_depths"].values()))
+
+        self.assertEqual(1 + sum(1 for _ in first), 40)
+        self.assertEqual(self.pipeline.get_stage_metrics()["active_streams"], 1)
+        self.assertEqual(sorted(index for index, _ in second), list(range(1, 40)))
+        self.assertEqual(self.pipeline.get_stage_metrics()["active_streams"], 0)
+
+    def test_extraction_runs_per_batch(self):
+        extractor = self.pipeline.extractor
+        extract_many = extractor.extract_symptoms_many
+        batch_sizes = []
+
+        def recording_extract_many(texts, **kwargs):
+            batch_sizes.append(len(texts))
+            return extract_many(texts, **kwargs)
+
+        extractor.extract_symptoms_many = recording_extract_many
+        # Transcription finishes before extraction starts, so the batch stage sees full batches
+        release = threading.Event()
+        transcribe = self.pipeline.transcriber.transcribe_audio
+
+        def gated_transcribe(*args, **kwargs):
+            release.wait(5)
+            return transcribe(*args, **kwargs)
+
+        self.pipeline.transcriber.transcribe_audio = gated_transcribe
+        threading.Timer(0.2, release.set).start()
+
+        results = self.pipeline.process_many(self._notes(24), transcription_workers=24, queue_size=64, batch_size=8)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sum(batch_sizes), 24)
+        self.assertLess(len(batch_sizes), 24)
+        self.assertLessEqual(max(batch_sizes), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()